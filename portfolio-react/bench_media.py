@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Image Optimizer Benchmark
+Runs each optimization profile (media_profiles.json, the same engine
+optimize.py and the optimize_*.py presets use) over a reproducible
+synthetic corpus and reports files/sec, encodes per file, peak RSS (and
+how much the profile itself added), output vs input bytes, and files
+skipped or failed, side by side.
+- Corpus is generated offline from a seed, in its own process:
+  photographic-noise JPEGs, grainy flat-color RGBA PNGs (opaque and truly
+  transparent, MB-sized like real exports) and 6000px sources
+- Every profile runs in its own child process on a fresh copy of the
+  corpus, in place (profiles with an output folder too), so peak RSS and
+  out/in are per profile
+- --profiles FILE benchmarks candidate settings before they go into the
+  shared file
+- Results are saved as JSON under bench_results/ and compared against
+  the previous run
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import random
+import resource
+import shutil
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from PIL import Image, ImageDraw
+import PIL
+
+from media_engine import PROFILES_FILE, load_profiles, optimize_file
+
+ROOT = Path(__file__).parent
+CORPUS_DIR = ROOT / ".cache" / "bench-corpus"
+RESULTS_DIR = ROOT / "bench_results"
+DEFAULT_SEED = 1234
+# Bump when the generators change so an old cached corpus isn't reused
+CORPUS_VERSION = 2
+# Export grain on the flat graphics - keeps them MB-sized like real design exports,
+# so they clear every profile's min_kb and the PNG paths get measured
+GRAIN = 0.06
+
+
+def photo_image(rng, width, height):
+    """
+    Photo-like content: smooth low-frequency color fields with fine sensor
+    noise on top. Built from seeded bytes so the corpus is reproducible.
+    """
+    coarse = Image.frombytes('RGB', (width // 16, height // 16), rng.randbytes((width // 16) * (height // 16) * 3))
+    base = coarse.resize((width, height), Image.Resampling.BICUBIC)
+    noise = Image.frombytes('L', (width, height), rng.randbytes(width * height)).convert('RGB')
+    return Image.blend(base, noise, 0.12)
+
+
+def flat_image(rng, width, height, transparent):
+    """Logo/flat-graphic content: a few grainy solid shapes, optionally on a transparent canvas."""
+    background = (0, 0, 0, 0) if transparent else (*[rng.randrange(256) for _ in range(3)], 255)
+    img = Image.new('RGBA', (width, height), background)
+    draw = ImageDraw.Draw(img)
+    for _ in range(12):
+        x0, y0 = rng.randrange(width), rng.randrange(height)
+        x1, y1 = min(width, x0 + rng.randrange(width // 2)), min(height, y0 + rng.randrange(height // 2))
+        fill = (*[rng.randrange(256) for _ in range(3)], 255)
+        if rng.random() < 0.5:
+            draw.rectangle((x0, y0, x1, y1), fill=fill)
+        else:
+            draw.ellipse((x0, y0, x1, y1), fill=fill)
+    grain = Image.frombytes('L', (width, height), rng.randbytes(width * height))
+    grainy = Image.blend(img.convert('RGB'), Image.merge('RGB', (grain, grain, grain)), GRAIN)
+    grainy.putalpha(img.getchannel('A'))
+    return grainy
+
+
+def build_corpus(seed, count):
+    """Generate the corpus into .cache/bench-corpus/<seed>-<count>-v<version> (once per seed/count)."""
+    corpus = CORPUS_DIR / f"{seed}-{count}-v{CORPUS_VERSION}"
+    if corpus.exists():
+        return corpus
+
+    rng = random.Random(seed)
+    tmp = corpus.with_suffix('.tmp')
+    shutil.rmtree(tmp, ignore_errors=True)
+    (tmp / "Bench").mkdir(parents=True)
+    for i in range(count):
+        photo_image(rng, 3000, 2000).save(tmp / "Bench" / f"photo_{i}.jpg", 'JPEG', quality=97)
+        flat_image(rng, 2400, 2400, transparent=False).save(tmp / "Bench" / f"flat_opaque_{i}.png")
+        flat_image(rng, 2400, 2400, transparent=True).save(tmp / "Bench" / f"flat_alpha_{i}.png")
+    # Camera/agency-export sized sources are the expensive case - keep a couple regardless of count
+    for i in range(max(1, count // 2)):
+        photo_image(rng, 6000, 4000).save(tmp / "Bench" / f"huge_{i}.jpg", 'JPEG', quality=95)
+    tmp.rename(corpus)
+    return corpus
+
+
+def prepare_corpus(seed, count):
+    """
+    build_corpus() in a child process. Linux starts a spawned child's peak
+    RSS at the parent's resident size, so generating 6000px sources here
+    would set every benchmark's peak.
+    """
+    with multiprocessing.get_context('spawn').Pool(1) as pool:
+        return pool.apply(build_corpus, (seed, count))
+
+
+def dir_bytes(path):
+    return sum(f.stat().st_size for f in Path(path).rglob('*') if f.is_file() and not f.name.startswith('.'))
+
+
+def _run_profile(name, profiles_file, corpus, queue):
+    """Child process: run one profile over a private copy of the corpus."""
+    profile = load_profiles(profiles_file)[name]
+
+    with tempfile.TemporaryDirectory(prefix=f"bench-{name}-") as work:
+        work_dir = Path(work) / "images"
+        shutil.copytree(corpus, work_dir)
+        files = sorted(p for p in work_dir.rglob('*') if p.is_file())
+        input_bytes = dir_bytes(work_dir)
+        baseline_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+        encodes = 0
+        skipped = 0
+        errors = []
+        started = time.perf_counter()
+        for path in files:
+            result = optimize_file(path, profile)
+            if result is None:
+                # Under the profile's min_kb - left alone
+                skipped += 1
+            elif 'error' in result:
+                errors.append(f"{path.name}: {result['error']}")
+            else:
+                encodes += result['encodes']
+        elapsed = time.perf_counter() - started
+        peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+        queue.put({
+            'files': len(files),
+            'seconds': round(elapsed, 3),
+            'files_per_sec': round(len(files) / elapsed, 3) if elapsed else None,
+            'encodes': encodes,
+            'encodes_per_file': round(encodes / len(files), 3) if files else 0,
+            'skipped': skipped,
+            'errors': errors,
+            # ru_maxrss is KB on Linux; the growth is what the profile itself added
+            'peak_rss_mb': round(peak_rss / 1024, 1),
+            'baseline_rss_mb': round(baseline_rss / 1024, 1),
+            'rss_growth_mb': round((peak_rss - baseline_rss) / 1024, 1),
+            'input_bytes': input_bytes,
+            'output_bytes': dir_bytes(work_dir),
+        })
+
+
+def run_benchmark(name, profiles_file, corpus):
+    # spawn gives every profile a clean process so RSS isn't inherited from the parent
+    ctx = multiprocessing.get_context('spawn')
+    queue = ctx.Queue()
+    proc = ctx.Process(target=_run_profile, args=(name, profiles_file, corpus, queue))
+    proc.start()
+    result = queue.get()
+    proc.join()
+    return result
+
+
+def latest_result():
+    if not RESULTS_DIR.exists():
+        return None
+    runs = sorted(RESULTS_DIR.glob('*.json'))
+    if not runs:
+        return None
+    with open(runs[-1]) as f:
+        return json.load(f)
+
+
+def print_results(results, previous=None):
+    print(f"{'profile':<14}{'files/s':>9}{'enc/file':>10}{'peak RSS':>11}{'growth':>10}"
+          f"{'out/in':>9}{'skipped':>9}{'errors':>8}")
+    for name, r in results.items():
+        ratio = r['output_bytes'] / r['input_bytes'] if r['input_bytes'] else 0
+        line = (f"{name:<14}{r['files_per_sec']:>9.2f}{r['encodes_per_file']:>10.2f}"
+                f"{r['peak_rss_mb']:>9.0f}MB{r['rss_growth_mb']:>8.0f}MB{ratio:>9.1%}"
+                f"{r['skipped']:>9}{len(r['errors']):>8}")
+        old = (previous or {}).get('results', {}).get(name)
+        if old and old.get('files_per_sec'):
+            line += f"   ({(r['files_per_sec'] / old['files_per_sec'] - 1) * 100:+.0f}% speed vs last run)"
+        print(line)
+    for name, r in results.items():
+        for error in r['errors']:
+            print(f"  ✗ {name}: {error}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the image optimizers on a synthetic corpus.")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help='corpus seed (same seed, same files)')
+    parser.add_argument('--count', type=int, default=4, help='images of each kind in the corpus')
+    parser.add_argument('--profiles', type=Path, default=PROFILES_FILE,
+                        help=f'profiles file to benchmark (default: {PROFILES_FILE.name})')
+    parser.add_argument('--only', action='append', metavar='PROFILE', help='benchmark just these profiles')
+    parser.add_argument('--no-save', action='store_true', help="don't write a results file")
+    args = parser.parse_args()
+    profiles = load_profiles(args.profiles)
+    unknown = set(args.only or ()) - set(profiles)
+    if unknown:
+        parser.error(f"unknown profile(s): {', '.join(sorted(unknown))} (have: {', '.join(profiles)})")
+
+    print("=" * 60)
+    print("IMAGE OPTIMIZER BENCHMARK")
+    print("=" * 60)
+
+    corpus = prepare_corpus(args.seed, args.count)
+    print(f"Corpus: {corpus} ({dir_bytes(corpus) / (1024 * 1024):.1f}MB, "
+          f"{sum(1 for _ in corpus.rglob('*.*'))} files)")
+
+    previous = latest_result()
+    results = {}
+    for name in args.only or profiles:
+        print(f"  running {name}...")
+        results[name] = run_benchmark(name, args.profiles, corpus)
+
+    print("-" * 60)
+    print_results(results, previous)
+
+    if not args.no_save:
+        RESULTS_DIR.mkdir(exist_ok=True)
+        stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        out = RESULTS_DIR / f"{stamp}.json"
+        with open(out, 'w') as f:
+            json.dump({
+                'timestamp': stamp,
+                'seed': args.seed,
+                'count': args.count,
+                'python': platform.python_version(),
+                'pillow': PIL.__version__,
+                'cpus': os.cpu_count(),
+                'profiles': {name: profiles[name] for name in results},
+                'results': results,
+            }, f, indent=2)
+        print(f"\nSaved: {out}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
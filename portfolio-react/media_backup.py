@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+Content-Addressed Backup Store
+Keeps the originals the optimizers overwrite, without a full second copy
+of the images tree:
+- Objects live at originals_backup/objects/<ab>/<sha256>; a file that
+  appears in several folders is stored once
+- index.jsonl maps each image path to the object of its first-seen
+  original (appended and fsynced, like the manifest), and records the
+  file an original was converted into (A1.png -> A1.jpg), so a restore
+  only ever removes that file
+- Objects are made with a reflink (FICLONE) where the filesystem has
+  copy-on-write, else os.copy_file_range, else a plain copy. Never a
+  hardlink: not every tool here replaces files atomically (the .cjs
+  optimizers write in place), and an in-place write through a shared
+  inode would rewrite the backup too
+- Full copies left by older runs in originals_backup/<folder>/ can be
+  folded into the store with `import-legacy`
+
+Usage: python media_backup.py restore McCafe Aveeno
+       python media_backup.py restore --all
+       python media_backup.py status
+"""
+
+import argparse
+import json
+import os
+import shutil
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+from media_io import fsync_dir, replace_file, temp_path_for
+from media_manifest import Manifest, file_hash
+
+# Configuration
+IMAGES_DIR = Path(__file__).parent / "images"
+BACKUP_DIR = Path(__file__).parent / "originals_backup"
+FICLONE = 0x40049409  # from <linux/fs.h>
+
+
+def clone_file(src, dst):
+    """
+    Copy src to dst as cheaply as the filesystem allows, always as an
+    independent file. Returns the method used: 'reflink',
+    'copy_file_range' or 'copy'.
+    """
+    if fcntl is not None:
+        with open(src, 'rb') as fin, open(dst, 'wb') as fout:
+            try:
+                fcntl.ioctl(fout.fileno(), FICLONE, fin.fileno())
+                return 'reflink'
+            except OSError:
+                pass
+        os.remove(dst)
+
+    with open(src, 'rb') as fin, open(dst, 'wb') as fout:
+        remaining = os.fstat(fin.fileno()).st_size
+        if hasattr(os, 'copy_file_range'):
+            try:
+                while remaining > 0:
+                    copied = os.copy_file_range(fin.fileno(), fout.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+                if remaining == 0:
+                    return 'copy_file_range'
+            except OSError:
+                fin.seek(0)
+                fout.seek(0)
+                fout.truncate()
+        shutil.copyfileobj(fin, fout)
+    return 'copy'
+
+
+class BackupStore:
+    def __init__(self, root=BACKUP_DIR, images_dir=IMAGES_DIR):
+        self.root = Path(root)
+        self.images_dir = Path(images_dir)
+        self._images_abs = os.path.abspath(images_dir)
+        self.objects = self.root / "objects"
+        self.index_path = self.root / "index.jsonl"
+        self.index = {}
+        self.converted = {}  # original's key -> key of the file it was converted into
+        self._file = None
+        self.load()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def key(self, path):
+        return Path(os.path.relpath(os.path.abspath(path), self._images_abs)).as_posix()
+
+    def object_path(self, sha256):
+        return self.objects / sha256[:2] / sha256
+
+    def load(self):
+        if not self.index_path.exists():
+            return
+        with open(self.index_path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if 'converted_to' in record:
+                    self.converted[record['path']] = record['converted_to']
+                    continue
+                # First original seen for a path wins - later versions are our own output
+                self.index.setdefault(record['path'], record)
+
+    def _append(self, record):
+        if self._file is None:
+            self.root.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.index_path, 'a', encoding='utf-8')
+        self._file.write(json.dumps(record) + '\n')
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def has(self, path):
+        return self.key(path) in self.index
+
+    def add_object(self, src, sha256=None, move=False):
+        """Put src's content into the store (once per hash). Returns (sha256, method or None if already stored)."""
+        sha256 = sha256 or file_hash(src)
+        target = self.object_path(sha256)
+        if target.exists():
+            return sha256, None
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = temp_path_for(target)
+        if move:
+            os.replace(src, tmp_path)
+            method = 'move'
+        else:
+            method = clone_file(src, tmp_path)
+        os.replace(tmp_path, target)
+        fsync_dir(str(target.parent))
+        return sha256, method
+
+    def backup(self, path, sha256=None):
+        """
+        Back up path unless an original for it is already stored.
+        Returns the method used, or None if nothing had to be written.
+        """
+        key = self.key(path)
+        if key in self.index:
+            return None
+        legacy = self.root / key
+        if legacy.is_file():
+            # An older run already kept a full copy - that is the real original
+            sha256, method = self.add_object(legacy, move=True)
+            if method is None:
+                os.remove(legacy)
+            method = 'legacy'
+        else:
+            sha256, method = self.add_object(path, sha256)
+        record = {'path': key, 'sha256': sha256, 'size': os.path.getsize(self.object_path(sha256))}
+        self.index[key] = record
+        self._append(record)
+        return method or 'dedup'
+
+    def record_conversion(self, path, new_path):
+        """Note that the backed-up path was replaced by new_path (a PNG turned into a JPG)."""
+        key, new_key = self.key(path), self.key(new_path)
+        if key in self.index and key != new_key and self.converted.get(key) != new_key:
+            self.converted[key] = new_key
+            self._append({'path': key, 'converted_to': new_key})
+
+    def stray_sibling(self, key):
+        """
+        A .jpg next to a restored original that the store never saw being
+        made from it (e.g. an unrelated A1.jpg beside A1.png). Left alone.
+        """
+        sibling = (self.images_dir / key).with_suffix('.jpg')
+        if self.key(sibling) in (key, self.converted.get(key)) or self.key(sibling) in self.index:
+            return None
+        return sibling if sibling.exists() else None
+
+    def restore(self, key, dry_run=False):
+        """
+        Bring one original back into the images tree. Returns True if the
+        file was (or would be) restored, False if it is already identical.
+        The file it was converted into, if any, is removed.
+        """
+        record = self.index[key]
+        dest = self.images_dir / key
+        if dest.exists() and dest.stat().st_size == record['size'] and file_hash(dest) == record['sha256']:
+            return False
+        if dry_run:
+            return True
+
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = temp_path_for(dest)
+        source = self.object_path(record['sha256'])
+        # Always a real copy (or reflink) - a hardlink back would let later edits reach the store
+        with open(source, 'rb') as fin, open(tmp_path, 'wb') as fout:
+            try:
+                fcntl.ioctl(fout.fileno(), FICLONE, fin.fileno())
+            except (OSError, AttributeError):
+                shutil.copyfileobj(fin, fout)
+        replace_file(tmp_path, dest)
+
+        # A PNG the optimizers turned into a JPG - drop the converted copy
+        converted_key = self.converted.get(key)
+        if converted_key and converted_key not in self.index:
+            converted = self.images_dir / converted_key
+            if converted.exists():
+                os.remove(converted)
+        return True
+
+
+def import_legacy(store):
+    """Fold full copies in originals_backup/<folder>/ into the object store."""
+    imported = reclaimed = 0
+    for folder in sorted(store.root.iterdir()):
+        if not folder.is_dir() or folder == store.objects:
+            continue
+        for path in sorted(folder.rglob('*')):
+            if not path.is_file():
+                continue
+            key = path.relative_to(store.root).as_posix()
+            size = path.stat().st_size
+            sha256, method = store.add_object(path, move=True)
+            if method is None:
+                os.remove(path)
+                reclaimed += size
+            if key not in store.index:
+                record = {'path': key, 'sha256': sha256, 'size': size}
+                store.index[key] = record
+                store._append(record)
+            imported += 1
+        # Remove the emptied legacy folders
+        for sub in sorted(folder.rglob('*'), reverse=True):
+            if sub.is_dir() and not any(sub.iterdir()):
+                sub.rmdir()
+        if not any(folder.iterdir()):
+            folder.rmdir()
+    return imported, reclaimed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Restore or inspect backed-up original images.")
+    parser.add_argument('--images', default=str(IMAGES_DIR), help=f'images tree (default: {IMAGES_DIR})')
+    parser.add_argument('--backup', default=str(BACKUP_DIR), help=f'backup store (default: {BACKUP_DIR})')
+    sub = parser.add_subparsers(dest='command', required=True)
+    restore = sub.add_parser('restore', help='put originals back')
+    restore.add_argument('projects', nargs='*', help='project folders to restore')
+    restore.add_argument('--all', action='store_true', help='restore the whole tree')
+    restore.add_argument('--dry-run', action='store_true', help='list what would be restored')
+    sub.add_parser('status', help='summarize the store')
+    sub.add_parser('import-legacy', help='move old full-copy backups into the store')
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("ORIGINALS BACKUP STORE")
+    print("=" * 60)
+
+    with BackupStore(args.backup, args.images) as store:
+        if args.command == 'status':
+            objects = {record['sha256']: record['size'] for record in store.index.values()}
+            logical = sum(record['size'] for record in store.index.values())
+            print(f"Files backed up: {len(store.index)} ({logical / (1024 * 1024):.1f}MB)")
+            print(f"Unique objects:  {len(objects)} ({sum(objects.values()) / (1024 * 1024):.1f}MB)")
+
+        elif args.command == 'import-legacy':
+            imported, reclaimed = import_legacy(store)
+            print(f"Imported {imported} legacy copies, reclaimed {reclaimed / (1024 * 1024):.1f}MB of duplicates")
+
+        elif args.command == 'restore':
+            if not args.all and not args.projects:
+                parser.error('give project folders to restore, or --all')
+            prefixes = tuple(f"{p.rstrip('/')}/" for p in args.projects)
+            keys = sorted(k for k in store.index if args.all or k.startswith(prefixes))
+            if not keys:
+                print("Nothing backed up for that selection.")
+            restored = 0
+            manifest = Manifest(store.images_dir)
+            for key in keys:
+                if store.restore(key, args.dry_run):
+                    restored += 1
+                    print(f"  {'would restore' if args.dry_run else '↩️ restored'} {key}")
+                    if not args.dry_run:
+                        # The optimizers should look at restored originals again
+                        manifest.forget(store.images_dir / key)
+                        if key in store.converted:
+                            manifest.forget(store.images_dir / store.converted[key])
+                    stray = store.stray_sibling(key)
+                    if stray:
+                        print(f"    left {store.key(stray)} in place - not known to be converted from {key}")
+            manifest.save()
+            print(f"\n{restored} of {len(keys)} files {'to restore' if args.dry_run else 'restored'} "
+                  f"({len(keys) - restored} already match their original)")
+
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Project Byte-Budget Planner
+Fits a whole project folder into a download budget instead of capping
+each file on its own - what matters is the bytes a visitor pulls when
+opening one project modal.
+- Each image's quality/size curve is estimated from a handful of trial
+  encodes on a small proxy (plus the distortion each quality costs)
+- Qualities are handed out greedily: starting from the best quality,
+  the step that loses the least quality per byte saved is taken until
+  the folder fits the budget
+- Final encodes run in parallel; the curves are then rescaled by the
+  real sizes and replanned, re-encoding only files whose quality moved
+- Folders already within budget are left alone; otherwise every file's
+  current bytes are the top of its curve, and a file is only replaced by
+  a smaller encode at a quality the plan stepped down to
+- Subfolders count (media_scan); originals go to the backup store first
+- Transparent PNGs keep their alpha and count against the budget as-is,
+  as does a PNG whose .jpg name is already taken; files that can't be
+  read are reported and left alone
+
+Usage: python media_budget.py McCafe Aveeno --budget-mb 8
+       python media_budget.py --all --budget-mb 8
+"""
+
+import argparse
+import io
+import os
+import statistics
+from pathlib import Path
+
+from PIL import Image, ImageChops, ImageStat
+
+from media_backup import BACKUP_DIR, BackupStore
+from media_decode import fit_size, open_scaled
+from media_encode import encode_bytes
+from media_io import atomic_write_bytes
+from media_manifest import Manifest, profile_id
+from media_png import has_transparency
+from media_pool import add_jobs_argument, map_jobs
+from media_scan import scan
+from media_variants import flatten
+
+# Configuration
+IMAGES_DIR = Path(__file__).parent / "public" / "images"
+IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.webp'}
+MAX_WIDTH = 1800
+PROXY_WIDTH = 480
+QUALITIES = [40, 50, 60, 70, 78, 85]
+MAX_ROUNDS = 3
+
+
+def profile_image(path, size, max_width=MAX_WIDTH):
+    """
+    Estimate bytes and distortion at every quality in QUALITIES from trial
+    encodes of a PROXY_WIDTH proxy, topped by keeping the file as it is
+    (size bytes, no added error). The curve is None for images that keep
+    alpha; unreadable files get an 'error' instead.
+    """
+    try:
+        with open_scaled(path, max_width) as img:
+            if has_transparency(img):
+                return {'curve': None}
+            full = flatten(img)
+    except Exception as e:
+        return {'error': str(e)}
+    proxy = full.resize(fit_size(full.size, PROXY_WIDTH), Image.Resampling.BOX)
+    scale = (full.width * full.height) / (proxy.width * proxy.height)
+
+    curve = []
+    for quality in QUALITIES:
+        data = encode_bytes(proxy, 'JPEG', quality=quality, optimize=True)
+        with Image.open(io.BytesIO(data)) as decoded:
+            diff = ImageChops.difference(proxy, decoded.convert('RGB'))
+        mse = sum(ImageStat.Stat(diff).sum2) / (3 * proxy.width * proxy.height)
+        # Total squared error over the full-size image, so big images weigh more
+        curve.append({'quality': quality, 'bytes': len(data) * scale, 'error': mse * full.width * full.height})
+    curve.append(keep_point(size))
+    return {'pixels': full.width * full.height, 'curve': curve}
+
+
+def keep_point(size):
+    """The top of every curve: the file as it is on disk."""
+    return {'quality': None, 'bytes': size, 'error': 0.0}
+
+
+def plan_qualities(curves, budget):
+    """
+    Pick one curve point per image so total bytes fit the budget.
+
+    Greedy on marginal cost: everything starts at the top of its curve (the
+    file as it is), then the single step down with the smallest error added
+    per byte saved is taken until the total fits (or everything is at the
+    lowest quality). Encodes estimated at or above the file's own size are
+    skipped - stepping onto one would only grow the file.
+    Returns a list of indexes into each curve.
+    """
+    steps = [[i for i, point in enumerate(curve) if i == len(curve) - 1 or point['bytes'] < curve[-1]['bytes']]
+             for curve in curves]
+    choice = [len(s) - 1 for s in steps]
+    total = sum(curve[-1]['bytes'] for curve in curves)
+
+    while total > budget:
+        best = None
+        for i, curve in enumerate(curves):
+            if choice[i] == 0:
+                continue
+            here, lower = curve[steps[i][choice[i]]], curve[steps[i][choice[i] - 1]]
+            saved = here['bytes'] - lower['bytes']
+            if saved <= 0:
+                # Both below the file's size, the lower one no bigger - take it for free
+                best = (0.0, i, saved)
+                break
+            cost = (lower['error'] - here['error']) / saved
+            if best is None or cost < best[0]:
+                best = (cost, i, saved)
+        if best is None:
+            break
+        _, i, saved = best
+        choice[i] -= 1
+        total -= saved
+
+    return [s[c] for s, c in zip(steps, choice)]
+
+
+def encode_planned(path, quality, max_width=MAX_WIDTH):
+    """Final encode of one planned image, returned as JPEG bytes (written once the plan settles)."""
+    with open_scaled(path, max_width) as img:
+        return encode_bytes(flatten(img), 'JPEG', quality=quality, optimize=True, progressive=True)
+
+
+def plan_folder(folder, budget, jobs, manifest, backups, dry_run=False):
+    """Plan and encode one project folder. Returns (bytes before, bytes after, errors)."""
+    profile = profile_id('media_budget', budget=budget, max_width=MAX_WIDTH, qualities=QUALITIES)
+    sizes = {entry.path: entry.size for entry in scan(folder, IMAGE_EXTENSIONS)}
+    paths = list(sizes)
+    before = sum(sizes.values())
+
+    if before <= budget:
+        print(f"  Already within budget ({before / (1024 * 1024):.1f}MB) - nothing to do")
+        return before, before, 0
+    if paths and all(manifest.is_current(p, profile) for p in paths):
+        print(f"  Unchanged since last run ({before / (1024 * 1024):.1f}MB)")
+        return before, before, 0
+
+    profiles = map_jobs(profile_image, [(p, sizes[p]) for p in paths], jobs)
+    errors = 0
+    for path, prof in zip(paths, profiles):
+        if prof is None or 'error' in prof:
+            errors += 1
+            print(f"  ✗ {path.relative_to(folder)}: {prof['error'] if prof else 'could not be profiled'} - left as is")
+    for path, prof in zip(paths, profiles):
+        converted = path.with_suffix('.jpg')
+        if prof and prof.get('curve') and converted != path and converted.exists():
+            # The JPEG would take the name of a different file - leave this one as it is
+            print(f"  {path.relative_to(folder)}: left as is ({converted.name} already exists)")
+            prof['curve'] = None
+    fixed = sum(sizes[p] for p, prof in zip(paths, profiles) if not prof or prof.get('curve') is None)
+    planned = [(p, prof['curve']) for p, prof in zip(paths, profiles) if prof and prof.get('curve')]
+    if not planned:
+        print("  Nothing to plan (only transparent or unreadable images)")
+        return before, before, errors
+
+    curves = [curve for _, curve in planned]
+    encoded = {}
+    measured = set()
+    borrowed = {}  # path -> median ratio already applied to a curve with no encode of its own
+    for round_no in range(1, MAX_ROUNDS + 1):
+        choice = plan_qualities(curves, budget - fixed)
+        qualities = [curve[c]['quality'] for curve, c in zip(curves, choice)]
+        lowered = [q for q in qualities if q is not None]
+        estimate = fixed + sum(curve[c]['bytes'] for curve, c in zip(curves, choice))
+        print(f"  Round {round_no}: {len(lowered)} of {len(qualities)} images lowered"
+              + (f" to q{min(lowered)}-{max(lowered)}" if lowered else "")
+              + f", estimated {estimate / (1024 * 1024):.1f}MB")
+        if dry_run:
+            return before, estimate, errors
+
+        # Only encode files the plan stepped down and whose quality changed since the previous round
+        tasks = [(path, q) for (path, _), q in zip(planned, qualities)
+                 if q is not None and encoded.get(path, (None,))[0] != q]
+        for (path, q), data in zip(tasks, map_jobs(encode_planned, tasks, jobs)):
+            if data:
+                encoded[path] = (q, data)
+        for (path, curve), q in zip(planned, qualities):
+            if q is None:
+                encoded.pop(path, None)
+            elif path in encoded and len(encoded[path][1]) >= sizes[path]:
+                # No smaller than the file on disk - it stays, and only lower qualities are still worth trying
+                del encoded[path]
+                curve[:] = [point for point in curve if point['quality'] is None or point['quality'] < q]
+
+        after = fixed + sum(len(encoded[p][1]) if p in encoded else sizes[p] for p, _ in planned)
+        # Proxies misjudge full-size bytes (usually high) - rescale each curve by
+        # what the real encode measured and replan; stop once the plan settles.
+        # Files without an encode yet borrow the folder's median error, so an
+        # overestimate can't hide every step below the file's own size.
+        ratios = {}
+        for (path, curve), c in zip(planned, choice):
+            if path in encoded and c < len(curve) and curve[c]['quality'] is not None:
+                ratios[path] = len(encoded[path][1]) / curve[c]['bytes']
+                measured.add(path)
+        typical = statistics.median(ratios.values()) if ratios else None
+        for path, curve in planned:
+            ratio = ratios.get(path)
+            if ratio is None and typical and path not in measured:
+                ratio = typical / borrowed.get(path, 1.0)
+                borrowed[path] = typical
+            for point in curve:
+                if ratio and point['quality'] is not None:
+                    point['bytes'] *= ratio
+        if plan_qualities(curves, budget - fixed) == choice:
+            break
+
+    for path, prof in zip(paths, profiles):
+        if prof and 'error' not in prof and path not in encoded:
+            manifest.record(path, profile)
+    for path, (quality, data) in encoded.items():
+        # Backup before replacing (content-addressed, no full copy)
+        backups.backup(path)
+        new_path = path.with_suffix('.jpg')
+        atomic_write_bytes(new_path, data)
+        if new_path != path:
+            os.remove(path)
+            manifest.forget(path)
+            backups.record_conversion(path, new_path)
+        manifest.record(new_path, profile, quality=quality)
+    return before, after, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fit each project folder into a total byte budget.")
+    parser.add_argument('folders', nargs='*', help='project folders under public/images (or paths)')
+    parser.add_argument('--all', action='store_true', help='plan every project folder')
+    parser.add_argument('--budget-mb', type=float, required=True, help='total image bytes allowed per project')
+    parser.add_argument('--dry-run', action='store_true', help='print the plan without writing files')
+    add_jobs_argument(parser)
+    args = parser.parse_args()
+
+    if args.all:
+        folders = sorted(d for d in IMAGES_DIR.iterdir() if d.is_dir() and not d.name.startswith(('.', '_')))
+    else:
+        folders = [Path(f) if Path(f).is_dir() else IMAGES_DIR / f for f in args.folders]
+    if not folders:
+        parser.error('give one or more project folders, or --all')
+
+    budget = int(args.budget_mb * 1024 * 1024)
+
+    print("=" * 60)
+    print("PROJECT BYTE-BUDGET PLANNER")
+    print(f"Budget: {args.budget_mb}MB per project | Max width: {MAX_WIDTH}px | Jobs: {args.jobs}")
+    print("=" * 60)
+
+    total_before = total_after = total_errors = 0
+    with Manifest(IMAGES_DIR) as manifest, BackupStore(BACKUP_DIR, IMAGES_DIR) as backups:
+        for folder in folders:
+            if not folder.is_dir():
+                print(f"\n📁 {folder.name}: not found")
+                continue
+            print(f"\n📁 {folder.name}")
+            before, after, errors = plan_folder(folder, budget, args.jobs, manifest, backups, args.dry_run)
+            total_before += before
+            total_after += after
+            total_errors += errors
+            status = "✓" if after <= budget else "⚠️ over budget"
+            print(f"  {before / (1024 * 1024):.1f}MB -> {after / (1024 * 1024):.1f}MB {status}")
+
+    print("\n" + "=" * 60)
+    print(f"Total: {total_before / (1024 * 1024):.1f}MB -> {total_after / (1024 * 1024):.1f}MB")
+    if total_errors:
+        print(f"Errors (left as is): {total_errors}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Cheap decode + downscale for oversized sources.
+Camera and agency exports come in at 6000-8000px and every optimizer
+throws most of those pixels away. Instead of decoding at full size and
+running LANCZOS over all of it:
+- JPEGs are decoded with draft(), letting libjpeg scale the DCT by 1/2,
+  1/4 or 1/8 so the full-size bitmap is never allocated
+- Anything still much larger is box-reduced with Image.reduce()
+- Both stop at 1.5-2x the target, then a single LANCZOS resample
+  produces the final size, so quality matches the old full-size resize
+- Palette and 1-bit images are expanded first (P to RGB/RGBA, 1 to L):
+  Pillow can only resize those with NEAREST, which drops colors and edges
+"""
+
+from PIL import Image
+
+# Fast stages stop at this multiple of the target; LANCZOS does the rest.
+# 1.5 rather than 2 so a 6000px export still gets a 1/2 DCT decode for 1800px.
+OVERSAMPLE = 1.5
+
+
+def fit_size(size, max_width=None, max_height=None):
+    """Size that fits inside max_width x max_height keeping aspect ratio (never upscales)."""
+    width, height = size
+    ratio = 1.0
+    if max_width and width > max_width:
+        ratio = max_width / width
+    if max_height and height * ratio > max_height:
+        ratio = max_height / height
+    if ratio >= 1.0:
+        return size
+    return max(1, int(width * ratio)), max(1, int(height * ratio))
+
+
+def resizable(img):
+    """img in a mode Pillow can filter (reduce/LANCZOS) instead of silently falling back to NEAREST."""
+    if img.mode == '1':
+        return img.convert('L')
+    if img.mode == 'PA' or (img.mode == 'P' and 'transparency' in img.info):
+        return img.convert('RGBA')
+    if img.mode == 'P':
+        return img.convert('RGB')
+    return img
+
+
+def decode_scaled(img, max_width=None, max_height=None, resample=Image.Resampling.LANCZOS):
+    """
+    Decode an opened image straight to (at most) max_width x max_height.
+    Must be called before img.load() so the JPEG draft can take effect.
+    """
+    target = fit_size(img.size, max_width, max_height)
+    if target == img.size:
+        img.load()
+        return img
+
+    floor = (int(target[0] * OVERSAMPLE), int(target[1] * OVERSAMPLE))
+    if img.format == 'JPEG':
+        img.draft(None, floor)
+    img.load()
+    img = resizable(img)
+
+    factor = min(img.width // floor[0], img.height // floor[1])
+    if factor >= 2:
+        img = img.reduce(factor)
+
+    return img.resize(target, resample)
+
+
+def open_scaled(path, max_width=None, max_height=None, resample=Image.Resampling.LANCZOS):
+    """
+    Image.open() + decode_scaled(). The source file is closed once decoded,
+    and the result can still be used as a context manager like Image.open().
+    """
+    img = Image.open(path)
+    try:
+        scaled = decode_scaled(img, max_width, max_height, resample)
+    except Exception:
+        img.close()
+        raise
+    if scaled is not img:
+        scaled.format = img.format
+        img.close()
+    return scaled
@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+Duplicate Image Finder
+Finds artwork exported twice or reused across client folders (Mcdo and
+McCafe, ...) so visitors and deploys stop paying for every copy.
+- Exact duplicates: files are grouped by size first and only size
+  collisions are SHA-256 hashed (reusing manifest hashes when current)
+- Near duplicates: 64-bit dHash, computed for the whole corpus at once
+  with NumPy and indexed in a BK-tree, so lookups don't compare every
+  pair
+- --collapse moves each exact-duplicate group into one content-addressed
+  file under public/images/_shared/ and records the old paths in
+  _shared/aliases.json, which update_projects.py maps back into each
+  project
+"""
+
+import argparse
+import json
+import os
+from collections import defaultdict
+from pathlib import Path
+
+from PIL import Image
+
+from media_io import atomic_write_bytes
+from media_manifest import Manifest, file_hash
+from media_scan import scan
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Configuration
+IMAGES_DIR = Path(__file__).parent / "public" / "images"
+SHARED_DIRNAME = "_shared"
+SHARED_DIR = IMAGES_DIR / SHARED_DIRNAME
+ALIASES_FILE = SHARED_DIR / "aliases.json"
+HASH_CACHE = Path(__file__).parent / ".cache" / "dedup-hashes.json"
+IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.webp', '.gif'}
+NEAR_DISTANCE = 6  # differing dHash bits (of 64) still counted as the same artwork
+
+
+def web_path(path):
+    return '/images/' + path.relative_to(IMAGES_DIR).as_posix()
+
+
+def find_images():
+    """Every image under public/images, including _shared/ (other dot/underscore folders are skipped)."""
+    return [entry.path for entry in scan(IMAGES_DIR, IMAGE_EXTENSIONS, include=(SHARED_DIRNAME,))]
+
+
+def load_hash_cache():
+    try:
+        with open(HASH_CACHE) as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def save_hash_cache(cache):
+    HASH_CACHE.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write_bytes(HASH_CACHE, json.dumps(cache, sort_keys=True).encode('utf-8'))
+
+
+def dhash_thumb(path):
+    """9x8 grayscale thumbnail for dHash (JPEGs decode at 1/8 scale via draft)."""
+    with Image.open(path) as img:
+        if img.format == 'JPEG':
+            img.draft('L', (64, 64))
+        if img.mode == 'P':
+            img = img.convert('RGBA')
+        return img.convert('L').resize((9, 8), Image.Resampling.BOX).tobytes()
+
+
+def dhashes(thumbs):
+    """64-bit difference hashes for a list of 9x8 thumbnails, all in one go with NumPy."""
+    if not thumbs:
+        return []
+    if np is None:
+        hashes = []
+        for thumb in thumbs:
+            value = 0
+            for row in range(8):
+                for col in range(8):
+                    value = (value << 1) | (thumb[row * 9 + col + 1] > thumb[row * 9 + col])
+            hashes.append(value)
+        return hashes
+
+    pixels = np.frombuffer(b''.join(thumbs), dtype=np.uint8).reshape(len(thumbs), 8, 9)
+    bits = (pixels[:, :, 1:] > pixels[:, :, :-1]).reshape(len(thumbs), 64)
+    packed = np.packbits(bits, axis=1)
+    return [int(h) for h in packed.view('>u8').ravel()]
+
+
+def hamming(a, b):
+    return bin(a ^ b).count('1')
+
+
+class BKTree:
+    """Burkhard-Keller tree over Hamming distance - radius queries visit a small part of the corpus."""
+
+    def __init__(self):
+        self.root = None
+
+    def add(self, value, item):
+        if self.root is None:
+            self.root = (value, [item], {})
+            return
+        node = self.root
+        while True:
+            distance = hamming(value, node[0])
+            if distance == 0:
+                node[1].append(item)
+                return
+            child = node[2].get(distance)
+            if child is None:
+                node[2][distance] = (value, [item], {})
+                return
+            node = child
+
+    def query(self, value, radius):
+        """Yield (distance, item) for everything within radius of value."""
+        stack = [self.root] if self.root else []
+        while stack:
+            node = stack.pop()
+            distance = hamming(value, node[0])
+            if distance <= radius:
+                for item in node[1]:
+                    yield distance, item
+            for d, child in node[2].items():
+                if distance - radius <= d <= distance + radius:
+                    stack.append(child)
+
+
+def hash_corpus(paths, manifest):
+    """
+    Returns {path: {'size', 'sha256' (only for size collisions), 'dhash'}}.
+    Unchanged files come from the hash cache.
+    """
+    cache = load_hash_cache()
+    info = {}
+    by_size = defaultdict(list)
+    for path in paths:
+        st = path.stat()
+        key = web_path(path)
+        cached = cache.get(key)
+        if not cached or cached['mtime_ns'] != st.st_mtime_ns or cached['size'] != st.st_size:
+            cached = {'mtime_ns': st.st_mtime_ns, 'size': st.st_size}
+        info[path] = cached
+        by_size[st.st_size].append(path)
+
+    # Content hashes only where two files share a size
+    for group in by_size.values():
+        if len(group) < 2:
+            continue
+        for path in group:
+            if 'sha256' not in info[path]:
+                record = manifest.get(path)
+                current = record and record['mtime_ns'] == info[path]['mtime_ns'] and record['size'] == info[path]['size']
+                info[path]['sha256'] = record['sha256'] if current else file_hash(path)
+
+    missing = [path for path in paths if 'dhash' not in info[path]]
+    thumbs = []
+    readable = []
+    for path in missing:
+        try:
+            thumbs.append(dhash_thumb(path))
+            readable.append(path)
+        except Exception as e:
+            print(f"  Could not read {path.relative_to(IMAGES_DIR)}: {e}")
+    for path, value in zip(readable, dhashes(thumbs)):
+        info[path]['dhash'] = value
+
+    save_hash_cache({web_path(path): entry for path, entry in info.items()})
+    return info
+
+
+def exact_clusters(info):
+    groups = defaultdict(list)
+    for path, entry in info.items():
+        if 'sha256' in entry:
+            groups[entry['sha256']].append(path)
+    return [sorted(group) for group in groups.values() if len(group) > 1]
+
+
+def near_clusters(info, radius=NEAR_DISTANCE):
+    """Groups of visually near-identical images that aren't already exact duplicates."""
+    tree = BKTree()
+    hashed = [path for path in sorted(info) if 'dhash' in info[path]]
+    for path in hashed:
+        tree.add(info[path]['dhash'], path)
+
+    # Union-find over every pair the tree reports within radius
+    parent = {path: path for path in hashed}
+
+    def find(path):
+        while parent[path] != path:
+            parent[path] = parent[parent[path]]
+            path = parent[path]
+        return path
+
+    for path in hashed:
+        for _, other in tree.query(info[path]['dhash'], radius):
+            parent[find(other)] = find(path)
+
+    groups = defaultdict(list)
+    for path in hashed:
+        groups[find(path)].append(path)
+
+    clusters = []
+    for group in groups.values():
+        digests = {info[path].get('sha256') or path for path in group}
+        if len(group) > 1 and len(digests) > 1:
+            clusters.append(sorted(group))
+    return clusters
+
+
+def load_aliases():
+    try:
+        with open(ALIASES_FILE) as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def collapse(clusters, info, manifest):
+    """Move each exact-duplicate group to one _shared/<sha256[:16]><ext> file. Returns bytes freed."""
+    aliases = load_aliases()
+    SHARED_DIR.mkdir(parents=True, exist_ok=True)
+    freed = 0
+
+    for group in clusters:
+        sha = info[group[0]]['sha256']
+        shared = [path for path in group if path.parent == SHARED_DIR]
+        target = shared[0] if shared else SHARED_DIR / f"{sha[:16]}{group[0].suffix.lower()}"
+        record = next((manifest.get(path) for path in group if manifest.get(path)), None)
+
+        for path in group:
+            if path == target:
+                continue
+            if not target.exists():
+                os.replace(path, target)
+            else:
+                freed += path.stat().st_size
+                os.remove(path)
+            manifest.forget(path)
+            aliases[web_path(path)] = web_path(target)
+
+        if record:
+            manifest.record(target, record['profile'])
+
+    atomic_write_bytes(ALIASES_FILE, json.dumps(aliases, indent=1, sort_keys=True).encode('utf-8'))
+    return freed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Find duplicate and near-duplicate portfolio images.")
+    parser.add_argument('--collapse', action='store_true',
+                        help='merge exact duplicates into content-addressed files under _shared/')
+    parser.add_argument('--distance', type=int, default=NEAR_DISTANCE,
+                        help=f'max differing dHash bits for near duplicates (default {NEAR_DISTANCE})')
+    args = parser.parse_args()
+
+    if not IMAGES_DIR.exists():
+        print(f"Images directory not found: {IMAGES_DIR}")
+        return
+
+    print("=" * 60)
+    print("DUPLICATE IMAGE FINDER")
+    print("=" * 60)
+
+    manifest = Manifest(IMAGES_DIR)
+    paths = find_images()
+    info = hash_corpus(paths, manifest)
+    exact = exact_clusters(info)
+    near = near_clusters(info, args.distance)
+
+    wasted = sum(info[path]['size'] for group in exact for path in group[1:])
+    print(f"Scanned {len(paths)} images")
+
+    if exact:
+        print(f"\n🔁 Exact duplicates: {len(exact)} groups, {wasted / (1024 * 1024):.1f}MB of extra copies")
+        for group in exact:
+            print(f"  {info[group[0]]['size'] // 1024}KB x{len(group)}")
+            for path in group:
+                print(f"    {path.relative_to(IMAGES_DIR)}")
+
+    if near:
+        print(f"\n👯 Near duplicates (dHash within {args.distance} bits): {len(near)} groups")
+        for group in near:
+            first = info[group[0]]['dhash']
+            for path in group:
+                print(f"    {path.relative_to(IMAGES_DIR)}  ({hamming(first, info[path]['dhash'])} bits from first)")
+            print()
+
+    if not exact and not near:
+        print("\nNo duplicates found.")
+
+    if exact and args.collapse:
+        freed = collapse(exact, info, manifest)
+        print(f"\nCollapsed {len(exact)} groups into {SHARED_DIR.relative_to(IMAGES_DIR.parent)}/ "
+              f"({freed / (1024 * 1024):.1f}MB freed)")
+        print("Run update_projects.py to point the projects at the shared files.")
+    elif exact:
+        print("\nRun with --collapse to merge exact duplicates into _shared/.")
+
+    manifest.save()
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Shared size- and quality-targeted encoding for the media optimization
+scripts. Encodes into memory, binary-searches the quality setting and
+writes the winning buffer to disk once (atomically, via media_io).
+"""
+
+import io
+
+from media_io import atomic_write_bytes
+
+MIN_QUALITY = 40
+MAX_QUALITY = 85
+
+
+def encode_bytes(img, fmt='JPEG', **save_kwargs):
+    """Encode img into memory and return the raw bytes."""
+    buffer = io.BytesIO()
+    img.save(buffer, fmt, **save_kwargs)
+    return buffer.getvalue()
+
+
+def search_quality(img, max_bytes, fmt='JPEG', min_quality=MIN_QUALITY,
+                   max_quality=MAX_QUALITY, **save_kwargs):
+    """
+    Find the highest quality in [min_quality, max_quality] whose encode fits
+    in max_bytes. Tries max_quality first since most files fit straight
+    away, then bisects the rest of the range.
+
+    Returns (quality, data, encodes). When nothing fits, the min_quality
+    encode is returned so the caller still gets the smallest file.
+    """
+    encodes = 0
+
+    def encode(quality):
+        nonlocal encodes
+        encodes += 1
+        return encode_bytes(img, fmt, quality=quality, **save_kwargs)
+
+    data = encode(max_quality)
+    if len(data) <= max_bytes:
+        return max_quality, data, encodes
+
+    best = None
+    smallest = (max_quality, data)
+    lo, hi = min_quality, max_quality - 1
+    while lo <= hi:
+        quality = (lo + hi) // 2
+        data = encode(quality)
+        if len(data) <= max_bytes:
+            best = (quality, data)
+            lo = quality + 1
+        else:
+            if len(data) < len(smallest[1]):
+                smallest = (quality, data)
+            hi = quality - 1
+
+    quality, data = best or smallest
+    return quality, data, encodes
+
+
+def search_score(img, min_score, fmt='JPEG', min_quality=MIN_QUALITY,
+                 max_quality=MAX_QUALITY, **save_kwargs):
+    """
+    Find the lowest quality in [min_quality, max_quality] whose encode still
+    scores at least min_score (SSIM, see media_quality). Bisects on the
+    assumption that the score rises with quality.
+
+    Returns (quality, data, encodes, score). When even max_quality misses the
+    threshold, that encode is returned.
+    """
+    from media_quality import make_scorer
+
+    score = make_scorer(img)
+    encodes = 0
+    best = None
+    lo, hi = min_quality, max_quality
+    while lo <= hi:
+        quality = (lo + hi) // 2
+        data = encode_bytes(img, fmt, quality=quality, **save_kwargs)
+        encodes += 1
+        value = score(data)
+        if value >= min_score:
+            best = (quality, data, value)
+            hi = quality - 1
+        else:
+            lo = quality + 1
+
+    if best is None:
+        data = encode_bytes(img, fmt, quality=max_quality, **save_kwargs)
+        best = (max_quality, data, score(data))
+        encodes += 1
+    quality, data, value = best
+    return quality, data, encodes, value
+
+
+def search_target(img, max_bytes, fmt='JPEG', min_quality=MIN_QUALITY,
+                  max_quality=MAX_QUALITY, min_score=None, **save_kwargs):
+    """
+    The in-memory half of encode_to_target(): the highest quality that fits
+    in max_bytes, or with min_score the smallest encode scoring at least
+    min_score (SSIM) with max_bytes still capping the result.
+
+    Returns (quality, data, encodes, score); score is None unless min_score
+    was given and met.
+    """
+    save_kwargs.setdefault('optimize', True)
+    value = None
+    if min_score is not None:
+        quality, data, encodes, value = search_score(
+            img, min_score, fmt, min_quality, max_quality, **save_kwargs
+        )
+        if len(data) > max_bytes:
+            # Size cap wins - look for the best quality below the SSIM pick
+            quality, data, more = search_quality(
+                img, max_bytes, fmt, min_quality, max(min_quality, quality - 1), **save_kwargs
+            )
+            encodes += more
+            value = None
+    else:
+        quality, data, encodes = search_quality(
+            img, max_bytes, fmt, min_quality, max_quality, **save_kwargs
+        )
+    return quality, data, encodes, value
+
+
+def encode_to_target(img, dest_path, max_bytes, fmt='JPEG', min_quality=MIN_QUALITY,
+                     max_quality=MAX_QUALITY, min_score=None, **save_kwargs):
+    """
+    Save img to dest_path at the highest quality that fits in max_bytes.
+
+    With min_score, the smallest encode scoring at least min_score (SSIM)
+    is used instead, so flat graphics stay clean and noisy photos shrink
+    further; max_bytes still caps the result.
+
+    Returns a dict with the chosen 'quality', the written 'size' in bytes,
+    the number of 'encodes' it took, whether the size target was met
+    ('fits') and the SSIM 'score' when min_score was given.
+    """
+    quality, data, encodes, value = search_target(
+        img, max_bytes, fmt, min_quality, max_quality, min_score, **save_kwargs
+    )
+
+    atomic_write_bytes(dest_path, data)
+
+    return {
+        'quality': quality,
+        'size': len(data),
+        'encodes': encodes,
+        'fits': len(data) <= max_bytes,
+        'score': value,
+    }
@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+"""
+Profile-driven image optimization engine behind optimize.py and the
+optimize_*.py presets.
+- Profiles are declarative (media_profiles.json): display size, which
+  files to touch, quality range and size target, what happens to PNGs,
+  backups and where the output goes
+- One worker for every profile (optimize_file): decoded straight to the
+  display size, size-targeted in memory, written once and only if it
+  beats the file already there
+- One driver for the bookkeeping (ProfileRun): manifest skips and
+  journaling, backups, progress lines and totals. Scripts that also
+  handle video feed it from their own scan
+"""
+
+import argparse
+import json
+import os
+from pathlib import Path
+
+from media_backup import BackupStore
+from media_decode import open_scaled
+from media_encode import encode_bytes, search_target
+from media_io import atomic_write_bytes
+from media_manifest import Manifest, profile_id
+from media_png import TRUECOLOR_COMPRESS_LEVEL, TRUECOLOR_COMPRESS_TYPE, encode_png, has_transparency
+from media_pool import add_jobs_argument, map_jobs
+from media_quality import add_ssim_argument, check_ssim
+from media_scan import SHARED_DIR, scan
+from media_variants import flatten
+
+ROOT = Path(__file__).parent
+IMAGES_DIR = ROOT / "images"
+BACKUP_DIR = ROOT / "originals_backup"
+PROFILES_FILE = ROOT / "media_profiles.json"
+
+# Every setting a profile can have, with its default
+DEFAULTS = {
+    'description': '',
+    'extensions': ['.jpg', '.jpeg', '.png', '.webp'],
+    'max_width': None,
+    'max_height': None,
+    'min_kb': 0,
+    'target_kb': None,
+    'quality': [85, 85],
+    'png': 'auto',
+    'png_jpeg_min_kb': 0,
+    'png_jpeg_max_ratio': None,
+    'ssim': None,
+    'backup': False,
+    'output': None,
+}
+PNG_POLICIES = ('lossless', 'auto', 'jpeg')
+JPEG_SUFFIXES = ('.jpg', '.jpeg')
+
+
+def load_profiles(path=PROFILES_FILE):
+    """Read the profiles file and fill in defaults. Keys starting with '_' are notes, not profiles."""
+    with open(path, encoding='utf-8') as f:
+        raw = json.load(f)
+
+    profiles = {}
+    for name, settings in raw.items():
+        if name.startswith('_'):
+            continue
+        unknown = set(settings) - set(DEFAULTS)
+        if unknown:
+            raise ValueError(f"{path}: profile '{name}' has unknown settings: {', '.join(sorted(unknown))}")
+        profile = {**DEFAULTS, **settings, 'name': name}
+        if profile['png'] not in PNG_POLICIES:
+            raise ValueError(f"{path}: profile '{name}' png must be one of {', '.join(PNG_POLICIES)}")
+        low, high = profile['quality']
+        if not 1 <= low <= high <= 100:
+            raise ValueError(f"{path}: profile '{name}' quality must be [min, max] within 1-100")
+        profile['extensions'] = [ext.lower() for ext in profile['extensions']]
+        profiles[name] = profile
+    return profiles
+
+
+def get_profile(name, path=PROFILES_FILE):
+    profiles = load_profiles(path)
+    if name not in profiles:
+        raise ValueError(f"Unknown profile '{name}' (have: {', '.join(profiles)})")
+    return profiles[name]
+
+
+def profile_key(profile, min_ssim=None):
+    """Manifest profile id - changes whenever a setting that shapes the output does."""
+    settings = {k: profile[k] for k in DEFAULTS if k not in ('description', 'ssim')}
+    key = profile_id(profile['name'], **settings)
+    return profile_id(key, ssim=min_ssim) if min_ssim else key
+
+
+def describe(profile):
+    """One-line summary of a profile's settings, for banners and --list."""
+    width, height = profile['max_width'], profile['max_height']
+    parts = []
+    if width and height:
+        parts.append(f"max {width}x{height}px")
+    elif width or height:
+        parts.append(f"max {width or height}px {'wide' if width else 'tall'}")
+    low, high = profile['quality']
+    parts.append(f"q{high}" if low == high else f"q{low}-{high}")
+    if profile['target_kb']:
+        parts.append(f"target {profile['target_kb']}KB")
+    if profile['min_kb']:
+        parts.append(f"files over {profile['min_kb']}KB")
+    parts.append(f"PNG: {profile['png']}")
+    if profile['png'] == 'auto' and profile['png_jpeg_min_kb']:
+        parts.append(f"opaque PNGs → JPEG over {profile['png_jpeg_min_kb']}KB")
+    if profile['png'] == 'auto' and profile['png_jpeg_max_ratio'] is not None:
+        parts.append(f"JPEG kept under {profile['png_jpeg_max_ratio']:.0%} of the PNG")
+    if profile['backup']:
+        parts.append("backed up")
+    if profile['output']:
+        parts.append(f"→ {profile['output']}")
+    return ', '.join(parts)
+
+
+def format_size(size):
+    return f"{size / (1024 * 1024):.2f}MB" if size >= 1024 * 1024 else f"{size / 1024:.0f}KB"
+
+
+def to_rgb(img):
+    """JPEG has no alpha - palette and transparent images are composited onto white."""
+    if img.mode == 'RGB':
+        return img
+    if img.mode in ('P', 'PA'):
+        img = img.convert('RGBA')
+    return flatten(img)
+
+
+def png_result(png, encodes=0):
+    """encode_image() return value for a media_png encode."""
+    return png['data'], '.png', {'action': f"PNG {png['colors']} colors" if png['colors'] else "PNG truecolor",
+                                 'quality': None, 'encodes': encodes + png['encodes'], 'score': None}
+
+
+def encode_image(img, path, profile, min_ssim=None, original_size=None):
+    """
+    Encode an already-scaled img the way profile says, entirely in memory.
+    original_size (bytes) is what the png_jpeg_* thresholds compare against.
+    Returns (data, suffix, info) where info holds the 'action' label,
+    'quality', 'encodes' and SSIM 'score'.
+    """
+    suffix = path.suffix.lower()
+    max_bytes = profile['target_kb'] * 1024 if profile['target_kb'] else None
+    keep_png = False  # an opaque PNG under auto that may stay PNG if the JPEG doesn't pay
+
+    if suffix == '.png' and profile['png'] == 'lossless':
+        data = encode_bytes(img, 'PNG', compress_level=TRUECOLOR_COMPRESS_LEVEL,
+                            compress_type=TRUECOLOR_COMPRESS_TYPE)
+        return data, '.png', {'action': 'PNG', 'quality': None, 'encodes': 1, 'score': None}
+
+    if suffix == '.png' and profile['png'] == 'auto' and has_transparency(img):
+        # Images that really use transparency stay PNG (palette-quantized where
+        # that holds up) even over target_kb - flattening would lose the alpha
+        return png_result(encode_png(img))
+    elif suffix == '.png' and profile['png'] == 'auto' and original_size is not None:
+        # Opaque PNGs only become JPEG when they are big and the JPEG is clearly smaller
+        if original_size <= profile['png_jpeg_min_kb'] * 1024:
+            return png_result(encode_png(img))
+        keep_png = profile['png_jpeg_max_ratio'] is not None
+
+    if suffix == '.webp':
+        fmt, new_suffix = 'WEBP', suffix
+    else:
+        img = to_rgb(img)
+        fmt, new_suffix = 'JPEG', suffix if suffix in JPEG_SUFFIXES else '.jpg'
+
+    # No target: an unbounded cap makes the search stop at the top quality (or the SSIM pick)
+    low, high = profile['quality']
+    quality, data, more, score = search_target(img, max_bytes or float('inf'), fmt,
+                                               min_quality=low, max_quality=high, min_score=min_ssim)
+    if keep_png and len(data) >= original_size * profile['png_jpeg_max_ratio']:
+        return png_result(encode_png(img), more)
+    action = f"{suffix} → {new_suffix}, q={quality}" if new_suffix != suffix else f"q={quality}"
+    if score:
+        action += f", SSIM {score:.3f}"
+    return data, new_suffix, {'action': action, 'quality': quality, 'encodes': more, 'score': score}
+
+
+def optimize_file(path, profile, min_ssim=None, original_size=None, out_path=None):
+    """
+    Optimize one image under profile - in place, or into out_path (suffix
+    swapped if the format changes) when given. original_size (bytes)
+    saves a stat when the caller has it.
+
+    Returns None for files the profile leaves alone (at or under min_kb),
+    otherwise a dict with the final 'path', the 'original' and 'new' sizes
+    in bytes and encode_image()'s info. A file that can't be decoded or
+    encoded gets an 'error' instead.
+    """
+    path = Path(path)
+    try:
+        if original_size is None:
+            original_size = os.path.getsize(path)
+        if out_path is None and original_size <= profile['min_kb'] * 1024:
+            return None
+
+        # Decoded straight to the display size (JPEG draft + reduce, then LANCZOS)
+        with open_scaled(path, profile['max_width'], profile['max_height']) as img:
+            data, suffix, info = encode_image(img, path, profile, min_ssim, original_size)
+
+        dest = Path(out_path) if out_path else path
+        if dest.suffix.lower() != suffix:
+            dest = dest.with_suffix(suffix)
+
+        if not out_path and dest != path and dest.exists():
+            # A1.png -> A1.jpg would overwrite a different file that already has that name
+            return {**info, 'path': path, 'original': original_size, 'new': original_size,
+                    'action': f"kept ({dest.name} already exists)"}
+
+        if dest == path and len(data) >= original_size:
+            # Re-encoding would only grow the file (and cost a generation of quality)
+            return {**info, 'path': path, 'original': original_size, 'new': original_size,
+                    'action': "kept (re-encode not smaller)"}
+
+        if out_path:
+            dest.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_bytes(dest, data)
+        # Remove a converted original only once its replacement is safely on disk
+        if not out_path and dest != path:
+            os.remove(path)
+        return {**info, 'path': dest, 'original': original_size, 'new': len(data)}
+    except Exception as e:
+        return {'path': path, 'error': str(e)}
+
+
+def output_is_fresh(out_path, st):
+    """True if a copy of the source (under either suffix it can get) is newer than the source."""
+    for candidate in (out_path, out_path.with_suffix('.jpg')):
+        try:
+            if os.stat(candidate).st_mtime_ns >= st.st_mtime_ns:
+                return True
+        except FileNotFoundError:
+            continue
+    return False
+
+
+class ProfileRun:
+    """
+    Bookkeeping for one pass of a profile over an images tree: job_for()
+    picks the files that need work, report() journals and prints each
+    result, stats keeps the totals. Pass manifest/backups to share them
+    with a caller that also records videos.
+    """
+
+    def __init__(self, profile, root=IMAGES_DIR, min_ssim=None, out_dir=None, manifest=None, backups=None):
+        self.profile = profile
+        self.root = Path(root)
+        self.min_ssim = min_ssim if min_ssim is not None else profile['ssim']
+        self.key = profile_key(profile, self.min_ssim)
+        self.extensions = set(profile['extensions'])
+        if out_dir is None and profile['output']:
+            out_dir = ROOT / profile['output']
+        self.out_dir = Path(out_dir) if out_dir else None
+
+        self._own_manifest = manifest is None
+        self.manifest = Manifest(self.root) if manifest is None else manifest
+        self._own_backups = backups is None and profile['backup'] and not self.out_dir
+        self.backups = BackupStore(BACKUP_DIR, self.root) if self._own_backups else backups
+
+        self.stats = {'optimized': 0, 'kept': 0, 'small': 0, 'unchanged': 0, 'errors': 0,
+                      'original': 0, 'new': 0, 'encodes': 0}
+
+    def job_for(self, path, st=None):
+        """The optimize_file() arguments for path, or None if it can be skipped."""
+        st = st or os.stat(path)
+        if self.out_dir:
+            out_path = self.out_dir / os.path.relpath(path, self.root)
+            if output_is_fresh(out_path, st):
+                self.stats['unchanged'] += 1
+                return None
+            return (Path(path), self.profile, self.min_ssim, st.st_size, out_path)
+
+        # Already handled with these settings and untouched since
+        if self.manifest.is_current(path, self.key, st):
+            self.stats['unchanged'] += 1
+            return None
+        if st.st_size <= self.profile['min_kb'] * 1024:
+            self.stats['small'] += 1
+            return None
+
+        # Backup before the worker touches it (content-addressed, no full copy)
+        if self.backups:
+            self.backups.backup(path)
+        return (Path(path), self.profile, self.min_ssim, st.st_size)
+
+    def report(self, done, total, job, result):
+        """media_pool.map_jobs on_result: journal the file the moment it lands and print one line."""
+        path = job[0]
+        name = os.path.relpath(path, self.root)
+        if not result:
+            print(f"  [{done}/{total}] - {name}: unchanged")
+            return
+        if 'error' in result:
+            self.stats['errors'] += 1
+            print(f"  [{done}/{total}] ✗ {name}: {result['error']}")
+            return
+
+        # Journaled at once so an interrupted run resumes here
+        if not self.out_dir:
+            if result['path'] != path:
+                self.manifest.forget(path)
+                if self.backups:
+                    self.backups.record_conversion(path, result['path'])
+            self.manifest.record(result['path'], self.key)
+
+        self.stats['original'] += result['original']
+        self.stats['new'] += result['new']
+        self.stats['encodes'] += result['encodes']
+        if result['new'] < result['original']:
+            self.stats['optimized'] += 1
+            print(f"  [{done}/{total}] ✓ {name}: {format_size(result['original'])} → "
+                  f"{format_size(result['new'])} ({result['action']})")
+        else:
+            self.stats['kept'] += 1
+            print(f"  [{done}/{total}] ~ {name}: {result['action']}")
+
+    def run(self, jobs=1):
+        """Scan the tree and optimize everything that needs it across jobs processes."""
+        # Streamed - the first image is optimized while the rest of the tree is still being read
+        entries = scan(self.root, self.extensions, include=(SHARED_DIR,))
+        tasks = (job for job in (self.job_for(e.path, e.stat()) for e in entries) if job)
+        return map_jobs(optimize_file, tasks, jobs, self.report)
+
+    def close(self):
+        if self._own_manifest:
+            self.manifest.save()
+        if self._own_backups:
+            self.backups.close()
+
+    def summary_lines(self):
+        s = self.stats
+        lines = [f"Optimized: {s['optimized']} images ({s['encodes']} encodes)"]
+        if s['kept']:
+            lines.append(f"Kept (re-encode not smaller): {s['kept']} images")
+        if s['small']:
+            lines.append(f"Skipped (already under {self.profile['min_kb']}KB): {s['small']} images")
+        lines.append(f"Skipped (unchanged since last run): {s['unchanged']} images")
+        if s['errors']:
+            lines.append(f"Errors: {s['errors']}")
+        if s['original']:
+            saved = s['original'] - s['new']
+            lines.append(f"Total size: {format_size(s['original'])} → {format_size(s['new'])} "
+                         f"(saved {format_size(saved)}, {saved / s['original'] * 100:.0f}%)")
+        return lines
+
+
+def run_profile(profile, root=IMAGES_DIR, jobs=1, min_ssim=None, out_dir=None, title=None):
+    """Optimize root under profile with the standard banner and summary. Returns the ProfileRun."""
+    root = Path(root)
+    if not root.exists():
+        print(f"Images directory not found: {root}")
+        return None
+
+    run = ProfileRun(profile, root, min_ssim, out_dir)
+    print("=" * 60)
+    print(title or f"IMAGE OPTIMIZATION - '{profile['name']}' PROFILE")
+    print("=" * 60)
+    print(describe(profile) + (f", SSIM >= {run.min_ssim}" if run.min_ssim else ""))
+    print(f"Source: {root}" + (f" | Output: {run.out_dir}" if run.out_dir else "") + f" | Jobs: {jobs}")
+    print("=" * 60)
+
+    try:
+        run.run(jobs)
+    finally:
+        run.close()
+
+    print("\n" + "=" * 60)
+    print("SUMMARY")
+    print("=" * 60)
+    for line in run.summary_lines():
+        print(line)
+    if run.backups:
+        print(f"Originals backed up to: {BACKUP_DIR}")
+    print("=" * 60)
+    return run
+
+
+def add_profile_arguments(parser):
+    """The options every profile run takes: --jobs, --ssim and --dir."""
+    add_jobs_argument(parser)
+    add_ssim_argument(parser)
+    parser.add_argument('--dir', type=Path, default=IMAGES_DIR,
+                        help=f'images tree to optimize (default: {IMAGES_DIR})')
+    return parser
+
+
+def preset_main(name, title=None, description=None):
+    """main() for the optimize_*.py presets: run one named profile with the shared options."""
+    parser = argparse.ArgumentParser(description=description or f"Optimize images with the '{name}' profile.")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+    run_profile(get_profile(name), args.dir, args.jobs, check_ssim(args.ssim), title=title)
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Content-Hashed Asset Publisher
+Gives every file the generated project data points at a URL that changes
+when (and only when) its bytes do, so browsers can cache it forever:
+- /images/Avene/A1.jpg -> /hashed/Avene/A1.3f9c2a1b.jpg
+- A srcset ladder shares one hash over all its files:
+  /variants/Avene/A1.jpg-400.webp -> /hashed/_variants/Avene/A1.jpg-400.<hash>.webp
+- An HLS package is hashed as a whole, so its relative playlist
+  references keep working: /hashed/Avene/reel.<hash>.hls/master.m3u8
+- update_projects.py only works the hashes out: they go into the project
+  data, and hashed_assets.json lists which file each hashed URL names.
+  Nothing is copied in public/ - the dev server keeps serving plain URLs
+- The build moves each listed file in dist/ to its hashed name, so the
+  deploy carries every file once. Hashed text files (SVG, playlists) get
+  .br/.gz siblings; netlify.toml / vercel.json mark /hashed/* immutable
+- Hashes are cached by path + mtime/size
+
+npm run build publishes automatically. By hand:
+    python media_fingerprint.py publish dist
+    python media_fingerprint.py precompress dist
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import sys
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+from media_backup import clone_file
+from media_io import atomic_write_bytes
+from media_manifest import file_hash
+
+# Configuration
+PUBLIC_DIR = Path(__file__).parent / "public"
+CACHE_FILE = Path(__file__).parent / ".cache" / "fingerprints.json"
+# Hashed URL -> the public URL of the file it names; read by `publish` at build time
+ASSETS_FILE = Path(__file__).parent / "hashed_assets.json"
+HASH_LENGTH = 8
+TEXT_EXTENSIONS = {'.svg', '.m3u8', '.json', '.js', '.mjs', '.css', '.html', '.txt', '.xml'}
+MIN_COMPRESS_BYTES = 1024
+
+# Public URL prefix -> where its hashed copies live
+PREFIXES = {'/images/': '/hashed/', '/variants/': '/hashed/_variants/'}
+
+
+def with_hash(name, digest):
+    """'A1.jpg' -> 'A1.3f9c2a1b.jpg', 'reel.hls' -> 'reel.3f9c2a1b.hls'."""
+    stem, ext = os.path.splitext(name)
+    return f"{stem}.{digest}{ext}"
+
+
+def hashed_url(url, digest):
+    """'/images/Avene/A1.jpg' -> '/hashed/Avene/A1.<digest>.jpg' (see PREFIXES)."""
+    for prefix, target in PREFIXES.items():
+        if url.startswith(prefix):
+            directory, name = os.path.split(url[len(prefix):])
+            return target + '/'.join(part for part in (directory, with_hash(name, digest)) if part)
+    raise ValueError(f"Not a publishable URL: {url}")
+
+
+def compress_siblings(path):
+    """
+    Write path.gz (and path.br with the brotli module) next to a text file,
+    unless they exist already or wouldn't be smaller. Returns the paths kept.
+    """
+    path = Path(path)
+    data = None
+    kept = []
+    encoders = [('.gz', lambda raw: gzip.compress(raw, 9, mtime=0))]
+    if brotli is not None:
+        encoders.append(('.br', lambda raw: brotli.compress(raw, quality=11)))
+    for suffix, encode in encoders:
+        target = path.with_name(path.name + suffix)
+        if not target.exists():
+            if data is None:
+                data = path.read_bytes()
+                if len(data) < MIN_COMPRESS_BYTES:
+                    return kept
+            packed = encode(data)
+            if len(packed) >= len(data):
+                continue
+            atomic_write_bytes(target, packed)
+        kept.append(target)
+    return kept
+
+
+def precompress_tree(root):
+    """.br/.gz siblings for every text file under root (e.g. a Vite dist/). Returns how many files were packed."""
+    packed = 0
+    for directory, dirs, files in os.walk(root):
+        for filename in files:
+            if os.path.splitext(filename)[1].lower() in TEXT_EXTENSIONS:
+                source = Path(directory) / filename
+                stale = [source.with_name(filename + suffix) for suffix in ('.gz', '.br')]
+                # A build rewrites files in place under the same name - never trust old siblings
+                for sibling in stale:
+                    if sibling.exists() and sibling.stat().st_mtime_ns < source.stat().st_mtime_ns:
+                        sibling.unlink()
+                packed += bool(compress_siblings(source))
+    return packed
+
+
+class Publisher:
+    """Works out the hashed URL of every file the project data links to (copies are made by publish_build)."""
+
+    def __init__(self, public_dir=PUBLIC_DIR, cache_file=CACHE_FILE, assets_file=ASSETS_FILE):
+        self.public_dir = Path(public_dir)
+        # Earlier versions kept hashed copies here - Vite would ship them twice
+        self.legacy_dir = self.public_dir / "hashed"
+        self.cache_file = Path(cache_file)
+        self.assets_file = Path(assets_file)
+        self.cache = {}
+        self.used = {}
+        self.assets = {}
+        try:
+            with open(self.cache_file, encoding='utf-8') as f:
+                self.cache = json.load(f)
+        except (FileNotFoundError, ValueError):
+            pass
+
+    def local(self, url):
+        return self.public_dir / url.lstrip('/')
+
+    def digest(self, path):
+        """SHA-256 of path, reused while its mtime and size are unchanged."""
+        st = path.stat()
+        key = path.relative_to(self.public_dir).as_posix()
+        entry = self.cache.get(key)
+        if not entry or entry['mtime_ns'] != st.st_mtime_ns or entry['size'] != st.st_size:
+            entry = {'mtime_ns': st.st_mtime_ns, 'size': st.st_size, 'sha256': file_hash(path)}
+            self.cache[key] = entry
+        self.used[key] = entry
+        return entry['sha256']
+
+    def publish(self, url):
+        """Hash one file. Returns its short hash, or None if the file is missing."""
+        source = self.local(url)
+        if not source.is_file():
+            return None
+        digest = self.digest(source)[:HASH_LENGTH]
+        self.assets[hashed_url(url, digest)] = url
+        return digest
+
+    def publish_group(self, urls):
+        """Hash files that are fetched together (a srcset ladder) under one hash of them all."""
+        sources = [self.local(url) for url in urls]
+        if not sources or not all(source.is_file() for source in sources):
+            return None
+        combined = '\n'.join(f"{url} {self.digest(source)}" for url, source in zip(urls, sources))
+        digest = text_digest(combined)[:HASH_LENGTH]
+        for url in urls:
+            self.assets[hashed_url(url, digest)] = url
+        return digest
+
+    def publish_dir(self, url, entry):
+        """
+        Hash a directory that is fetched through relative links (an HLS
+        package) as a whole. url is the directory, entry the file inside it
+        that is linked to. Returns the short hash, or None if entry is missing.
+        """
+        source_dir = self.local(url)
+        if not (source_dir / entry).is_file():
+            return None
+        files = sorted(p for p in source_dir.rglob('*') if p.is_file() and not p.name.startswith('.'))
+        combined = '\n'.join(f"{p.relative_to(source_dir).as_posix()} {self.digest(p)}" for p in files)
+        digest = text_digest(combined)[:HASH_LENGTH]
+        target = hashed_url(url, digest)
+        for p in files:
+            name = p.relative_to(source_dir).as_posix()
+            self.assets[f"{target}/{name}"] = f"{url}/{name}"
+        return digest
+
+    def finish(self):
+        """
+        Write hashed_assets.json and the hash cache, and drop hashed copies
+        left in public/ by earlier versions. Returns (assets, changed).
+        """
+        data = json.dumps(self.assets, indent=1, sort_keys=True) + '\n'
+        changed = write_if_changed(self.assets_file, data.encode('utf-8'))
+        if self.legacy_dir.is_dir():
+            shutil.rmtree(self.legacy_dir)
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        write_if_changed(self.cache_file, json.dumps(self.used, sort_keys=True).encode('utf-8'))
+        return len(self.assets), changed
+
+
+def publish_build(root, assets_file=ASSETS_FILE):
+    """
+    Move every file hashed_assets.json lists to its hashed name inside a
+    build (dist/), so it is deployed once, under the URL the data uses.
+    Returns (moved, missing).
+    """
+    root = Path(root)
+    with open(assets_file, encoding='utf-8') as f:
+        assets = json.load(f)
+
+    moved = missing = 0
+    placed = {}  # source URL -> where it went, for a file listed under two hashed names
+    for url, source_url in sorted(assets.items()):
+        source = root / source_url.lstrip('/')
+        target = root / url.lstrip('/')
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if source.is_file():
+            os.replace(source, target)
+            placed[source_url] = target
+            moved += 1
+        elif source_url in placed:
+            clone_file(placed[source_url], target)
+        else:
+            missing += 1
+            continue
+        if target.suffix.lower() in TEXT_EXTENSIONS:
+            compress_siblings(target)
+    return moved, missing
+
+
+def text_digest(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def write_if_changed(path, data):
+    try:
+        if Path(path).read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    atomic_write_bytes(path, data)
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Content-hashed asset tools.")
+    sub = parser.add_subparsers(dest='command', required=True)
+    pub = sub.add_parser('publish', help='move the files hashed_assets.json lists to their hashed names in a build')
+    pub.add_argument('root', help='build output, e.g. dist')
+    pre = sub.add_parser('precompress', help='write .br/.gz siblings for the text files under a directory')
+    pre.add_argument('root', help='directory to precompress, e.g. dist')
+    args = parser.parse_args()
+
+    if args.command == 'publish':
+        if not os.path.isdir(args.root):
+            sys.exit(f"Error: {args.root} is not a directory")
+        if not ASSETS_FILE.exists():
+            print(f"No {ASSETS_FILE.name} - run update_projects.py first. Nothing to publish.")
+            return
+        moved, missing = publish_build(args.root)
+        print(f"Published {moved} hashed file(s) under {os.path.join(args.root, 'hashed')}"
+              + (f" ({missing} listed file(s) missing from the build)" if missing else ""))
+    elif args.command == 'precompress':
+        if not os.path.isdir(args.root):
+            print(f"Error: {args.root} is not a directory")
+            return
+        packed = precompress_tree(args.root)
+        print(f"Precompressed {packed} text file(s) under {args.root} "
+              f"({'brotli + gzip' if brotli is not None else 'gzip only - pip install brotli for .br'})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Crash-safe file writes for the media scripts.
+Everything is written to a temp file in the destination's directory,
+fsynced, then moved over the target with os.replace(). A run killed at
+any point leaves either the old file or the new one - never a truncated
+JPEG.
+"""
+
+import io
+import os
+
+
+def temp_path_for(path):
+    """Hidden temp file next to path (same filesystem, so os.replace is atomic)."""
+    path = os.fspath(path)
+    directory, name = os.path.split(path)
+    return os.path.join(directory, f".{name}.{os.getpid()}.tmp")
+
+
+def fsync_dir(directory):
+    """Persist a rename by syncing the directory entry (no-op where unsupported)."""
+    try:
+        fd = os.open(directory or '.', os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def replace_file(tmp_path, path):
+    """fsync tmp_path and atomically move it over path."""
+    fd = os.open(tmp_path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+    fsync_dir(os.path.dirname(os.fspath(path)))
+
+
+def atomic_write_bytes(path, data):
+    """Write data to path via temp file + fsync + os.replace."""
+    tmp_path = temp_path_for(path)
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    fsync_dir(os.path.dirname(os.fspath(path)))
+    return len(data)
+
+
+def atomic_save(img, path, fmt=None, **save_kwargs):
+    """Image.save() that never leaves a partial file at path. Returns the bytes written."""
+    buffer = io.BytesIO()
+    img.save(buffer, fmt or img.format or _format_for(path), **save_kwargs)
+    return atomic_write_bytes(path, buffer.getvalue())
+
+
+def _format_for(path):
+    from PIL import Image
+    Image.init()
+    return Image.EXTENSION[os.path.splitext(os.fspath(path))[1].lower()]
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Persistent manifest of media files the optimizers have already handled.
+Each entry is keyed by path and stores the mtime, size and SHA-256 of the
+file as it was written, plus the settings profile that produced it. A file
+whose stat and profile still match is skipped without being opened.
+
+The manifest is a JSON-lines file under the images root and doubles as
+the job journal: each record is appended and fsynced as its file
+finishes, so a run killed part-way resumes where it stopped instead of
+starting over. save() compacts it down to one line per file.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from media_io import atomic_write_bytes
+
+MANIFEST_NAME = '.media-manifest.jsonl'
+HASH_CHUNK = 1024 * 1024
+
+
+def file_hash(path):
+    """SHA-256 of a file's content, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def profile_id(name, **settings):
+    """Short stable id for a script's settings, e.g. profile_id('media', max_width=1800)."""
+    payload = json.dumps({'name': name, **settings}, sort_keys=True)
+    return f"{name}-{hashlib.sha1(payload.encode()).hexdigest()[:10]}"
+
+
+class Manifest:
+    def __init__(self, root):
+        self.root = Path(root)
+        self.path = self.root / MANIFEST_NAME
+        self._root_abs = os.path.abspath(root)
+        self.entries = {}
+        self._lines = 0
+        self._file = None
+        self.load()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.save()
+
+    def key(self, path):
+        # Pure string work - resolve() would cost extra syscalls per file
+        return Path(os.path.relpath(os.path.abspath(path), self._root_abs)).as_posix()
+
+    def load(self):
+        if not self.path.exists():
+            return
+        with open(self.path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # A run killed mid-write can leave a partial last line
+                    continue
+                self._lines += 1
+                if record.get('deleted'):
+                    self.entries.pop(record['path'], None)
+                else:
+                    self.entries[record['path']] = record
+
+    def _append(self, record):
+        if self._file is None:
+            self._file = open(self.path, 'a', encoding='utf-8')
+        self._file.write(json.dumps(record) + '\n')
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._lines += 1
+
+    def get(self, path):
+        return self.entries.get(self.key(path))
+
+    def is_current(self, path, profile, st=None):
+        """
+        True if path was last written under this profile and hasn't changed
+        since. Costs one stat (or none if the caller passes st); the file
+        is only hashed when its mtime moved but its size did not.
+        """
+        record = self.entries.get(self.key(path))
+        if not record or record['profile'] != profile:
+            return False
+
+        try:
+            st = st or os.stat(path)
+        except OSError:
+            return False
+
+        if st.st_size != record['size']:
+            return False
+        if st.st_mtime_ns == record['mtime_ns']:
+            return True
+
+        # Touched or copied but byte-identical - refresh the stored mtime
+        if file_hash(path) == record['sha256']:
+            self.record(path, profile, st=st, sha256=record['sha256'])
+            return True
+        return False
+
+    def record(self, path, profile, st=None, sha256=None, **extra):
+        """
+        Remember path as handled under profile. Extra fields are stored
+        as-is; facts cached by remember() are kept while the content is
+        the same bytes, and dropped once it changes.
+        """
+        st = st or os.stat(path)
+        sha256 = sha256 or file_hash(path)
+        previous = self.entries.get(self.key(path))
+        kept = previous if previous and previous['sha256'] == sha256 else {}
+        record = {
+            **kept,
+            'path': self.key(path),
+            'mtime_ns': st.st_mtime_ns,
+            'size': st.st_size,
+            'sha256': sha256,
+            'profile': profile,
+            **extra,
+        }
+        self.entries[record['path']] = record
+        self._append(record)
+        return record
+
+    def facts(self, path, kind, st=None):
+        """
+        Facts stored under kind (e.g. 'probe') for path's current content,
+        or None if there are none or the file changed since.
+        """
+        record = self.entries.get(self.key(path))
+        if not record or kind not in record:
+            return None
+        try:
+            st = st or os.stat(path)
+        except OSError:
+            return None
+        if st.st_size != record['size']:
+            return None
+        if st.st_mtime_ns != record['mtime_ns'] and file_hash(path) != record['sha256']:
+            return None
+        return record[kind]
+
+    def remember(self, path, kind, value, st=None):
+        """Store facts about path's current content, keeping its profile if the record is current."""
+        st = st or os.stat(path)
+        record = self.entries.get(self.key(path))
+        if record and record['size'] == st.st_size and record['mtime_ns'] == st.st_mtime_ns:
+            record = {**record, kind: value}
+            self.entries[record['path']] = record
+            self._append(record)
+            return record
+        # New or changed file - nothing has been done to it under any profile yet
+        return self.record(path, None, st=st, **{kind: value})
+
+    def forget(self, path):
+        """Drop a file that was removed or replaced (e.g. a PNG converted to JPG)."""
+        key = self.key(path)
+        if self.entries.pop(key, None) is not None:
+            self._append({'path': key, 'deleted': True})
+
+    def save(self):
+        """Compact the manifest to one line per file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._lines == len(self.entries):
+            return
+
+        lines = ''.join(json.dumps(self.entries[key]) + '\n' for key in sorted(self.entries))
+        atomic_write_bytes(self.path, lines.encode('utf-8'))
+        self._lines = len(self.entries)
@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+"""
+PDF Thumbnail Renderer
+Gives PDF-only projects a real card image instead of the generic icon:
+- Page 1 of every PDF under public/images is rendered to a JPEG in
+  public/images/_pdf/<sha256[:16]>.jpg (pdftoppm, else Ghostscript)
+- Without either tool, a pure-Python fallback pulls the largest image
+  drawn on page 1 (most exported decks are one big raster per page) -
+  text or vector art on top of it is not drawn
+- Page counts come from pdfinfo when available, else from the page tree
+- Results are keyed by content hash in _pdf/pdfs.json: unchanged PDFs
+  are not reopened, identical PDFs share one thumbnail
+- media_variants.py builds srcset widths for _pdf/ like any other image,
+  and update_projects.py picks the thumbnails and page counts up
+"""
+
+import argparse
+import io
+import json
+import re
+import subprocess
+import zlib
+from pathlib import Path
+
+from PIL import Image
+
+from media_decode import decode_scaled
+from media_encode import encode_bytes
+from media_io import atomic_write_bytes
+from media_manifest import file_hash
+from media_pool import add_jobs_argument, map_jobs
+from media_probe import have
+from media_scan import scan
+from media_variants import flatten
+
+# Configuration
+IMAGES_DIR = Path(__file__).parent / "public" / "images"
+THUMBS_DIRNAME = "_pdf"
+THUMBS_DIR = IMAGES_DIR / THUMBS_DIRNAME
+INDEX_FILE = THUMBS_DIR / "pdfs.json"
+THUMB_WIDTH = 1200
+THUMB_QUALITY = 82
+RENDER_DPI = 150  # Ghostscript renders at a fixed resolution, then it's scaled to THUMB_WIDTH
+
+OBJ_RE = re.compile(rb'(\d+)\s+\d+\s+obj\b')
+STREAM_RE = re.compile(rb'stream\r?\n')
+REF_RE = re.compile(rb'(\d+)\s+\d+\s+R')
+
+
+def web_path(path):
+    return '/images/' + path.relative_to(IMAGES_DIR).as_posix()
+
+
+# --- External renderers -------------------------------------------------
+
+def render_pdftoppm(pdf_path):
+    result = subprocess.run(
+        ['pdftoppm', '-f', '1', '-l', '1', '-singlefile', '-png',
+         '-scale-to-x', str(THUMB_WIDTH), '-scale-to-y', '-1', str(pdf_path)],
+        capture_output=True
+    )
+    return Image.open(io.BytesIO(result.stdout)) if result.returncode == 0 and result.stdout else None
+
+
+def render_ghostscript(pdf_path):
+    result = subprocess.run(
+        ['gs', '-q', '-dSAFER', '-dBATCH', '-dNOPAUSE', '-dFirstPage=1', '-dLastPage=1',
+         '-sDEVICE=png16m', f'-r{RENDER_DPI}', '-dTextAlphaBits=4', '-dGraphicsAlphaBits=4',
+         '-sOutputFile=-', str(pdf_path)],
+        capture_output=True
+    )
+    return Image.open(io.BytesIO(result.stdout)) if result.returncode == 0 and result.stdout else None
+
+
+def pdfinfo_pages(pdf_path):
+    result = subprocess.run(['pdfinfo', str(pdf_path)], capture_output=True, text=True)
+    match = re.search(r'^Pages:\s+(\d+)', result.stdout, re.MULTILINE)
+    return int(match.group(1)) if match else None
+
+
+# --- Pure-Python fallback -----------------------------------------------
+
+def stream_length(data, head, start):
+    """
+    A stream's /Length - given directly, or by reference to an integer
+    object ('/Length 12 0 R') - if the stream really ends there, else None.
+    """
+    length = re.search(rb'/Length\s+(\d+)\b(?!\s+\d+\s+R)', head)
+    if length:
+        length = int(length.group(1))
+    else:
+        ref = re.search(rb'/Length\s+(\d+)\s+(\d+)\s+R', head)
+        target = ref and re.search(rb'(?<!\d)' + ref.group(1) + rb'\s+' + ref.group(2)
+                                   + rb'\s+obj\s*(\d+)\s*endobj', data)
+        if not target:
+            return None
+        length = int(target.group(1))
+    if not re.match(rb'\s*endstream', data[start + length:start + length + 32]):
+        return None
+    return length
+
+
+def read_objects(data):
+    """
+    {object number: (dictionary bytes, raw stream bytes or None)} for every
+    object in the file, including those packed in compressed object streams.
+    Later definitions (incremental updates) win.
+    """
+    objects = {}
+    pos = 0
+    while True:
+        match = OBJ_RE.search(data, pos)
+        if not match:
+            break
+        start = match.end()
+        end = data.find(b'endobj', start)
+        if end < 0:
+            break
+        head, stream = data[start:end], None
+        found = STREAM_RE.search(data, start, end)
+        if found:
+            head = data[start:found.start()]
+            length = stream_length(data, head, found.end())
+            if length is not None:
+                stream = data[found.end():found.end() + length]
+                # Skip the stream body so binary data is never parsed as objects
+                end = max(end, data.find(b'endobj', found.end() + length))
+            else:
+                stream = data[found.end():data.rfind(b'endstream', found.end(), end)].rstrip(b'\r\n')
+        objects[int(match.group(1))] = (head, stream)
+        pos = end + len(b'endobj')
+
+    # PDF 1.5+ packs most dictionaries into FlateDecode object streams
+    for head, stream in list(objects.values()):
+        if stream is None or not re.search(rb'/Type\s*/ObjStm', head):
+            continue
+        try:
+            body = zlib.decompress(stream)
+            count = int(re.search(rb'/N\s+(\d+)', head).group(1))
+            first = int(re.search(rb'/First\s+(\d+)', head).group(1))
+        except (zlib.error, AttributeError):
+            continue
+        numbers = [int(n) for n in body[:first].split()]
+        offsets = [(numbers[i], numbers[i + 1]) for i in range(0, min(len(numbers), count * 2), 2)]
+        for i, (num, offset) in enumerate(offsets):
+            stop = offsets[i + 1][1] if i + 1 < len(offsets) else len(body) - first
+            objects.setdefault(num, (body[first + offset:first + stop], None))
+    return objects
+
+
+def dict_value(objects, head, key):
+    """The value of /key in a dictionary: an inline << ... >>, or the referenced object's dictionary."""
+    match = re.search(rb'/' + key + rb'(?![A-Za-z])\s*', head)
+    if not match:
+        return None
+    rest = head[match.end():]
+    if rest.startswith(b'<<'):
+        depth = 0
+        for i in range(len(rest) - 1):
+            if rest[i:i + 2] == b'<<':
+                depth += 1
+            elif rest[i:i + 2] == b'>>':
+                depth -= 1
+                if depth == 0:
+                    return rest[2:i]
+        return None
+    ref = re.match(rb'(\d+)\s+\d+\s+R', rest)
+    if ref and int(ref.group(1)) in objects:
+        return objects[int(ref.group(1))][0]
+    return None
+
+
+def first_page(objects):
+    """(page dictionary, page count) from the catalog's page tree, or (None, None)."""
+    catalog = next((head for head, _ in objects.values() if re.search(rb'/Type\s*/Catalog', head)), None)
+    if catalog is None:
+        return None, None
+    node = dict_value(objects, catalog, b'Pages')
+    count = re.search(rb'/Count\s+(\d+)', node or b'')
+    pages = int(count.group(1)) if count else None
+    for _ in range(32):
+        if node is None:
+            return None, pages
+        if re.search(rb'/Type\s*/Page(?!s)', node):
+            return node, pages
+        kids = re.search(rb'/Kids\s*\[\s*(\d+)\s+\d+\s+R', node)
+        node = objects.get(int(kids.group(1)), (None,))[0] if kids else None
+    return None, pages
+
+
+def page_images(objects, resources, depth=0):
+    """Object numbers of the images a resource dictionary draws, looking inside form XObjects too."""
+    xobjects = dict_value(objects, resources or b'', b'XObject')
+    found = []
+    for ref in REF_RE.findall(xobjects or b''):
+        num = int(ref)
+        head = objects.get(num, (b'',))[0]
+        if re.search(rb'/Subtype\s*/Image', head):
+            found.append(num)
+        elif re.search(rb'/Subtype\s*/Form', head) and depth < 3:
+            found.extend(page_images(objects, dict_value(objects, head, b'Resources'), depth + 1))
+    return found
+
+
+def decode_image(head, stream):
+    """PIL image for a JPEG, JPEG 2000 or plain 8-bit Flate image XObject, else None."""
+    if stream is None:
+        return None
+    try:
+        if b'DCTDecode' in head or b'JPXDecode' in head:
+            img = Image.open(io.BytesIO(stream))
+            img.load()
+            return img
+        if b'FlateDecode' in head and b'/Predictor' not in head:
+            width = int(re.search(rb'/Width\s+(\d+)', head).group(1))
+            height = int(re.search(rb'/Height\s+(\d+)', head).group(1))
+            bits = re.search(rb'/BitsPerComponent\s+(\d+)', head)
+            mode = 'RGB' if b'/DeviceRGB' in head else 'L' if b'/DeviceGray' in head else None
+            if mode and bits and bits.group(1) == b'8':
+                return Image.frombytes(mode, (width, height), zlib.decompress(stream))
+    except Exception:
+        return None
+    return None
+
+
+def image_area(head):
+    width = re.search(rb'/Width\s+(\d+)', head)
+    height = re.search(rb'/Height\s+(\d+)', head)
+    return int(width.group(1)) * int(height.group(1)) if width and height else 0
+
+
+def render_fallback(pdf_path):
+    """(largest decodable image on page 1, page count) without any external tool."""
+    with open(pdf_path, 'rb') as f:
+        objects = read_objects(f.read())
+    page, pages = first_page(objects)
+
+    candidates = []
+    if page is not None:
+        resources = dict_value(objects, page, b'Resources')
+        if resources is None:
+            # Resources can be inherited from the parent Pages node
+            resources = dict_value(objects, dict_value(objects, page, b'Parent') or b'', b'Resources')
+        candidates = page_images(objects, resources)
+    if not candidates:
+        # No usable page tree - settle for the largest image anywhere in the file
+        candidates = [num for num, (head, _) in objects.items() if re.search(rb'/Subtype\s*/Image', head)]
+    if pages is None:
+        pages = sum(1 for head, _ in objects.values() if re.search(rb'/Type\s*/Page(?!s)', head)) or None
+
+    for num in sorted(candidates, key=lambda n: image_area(objects[n][0]), reverse=True):
+        img = decode_image(*objects[num])
+        if img is not None:
+            return img, pages
+    return None, pages
+
+
+# --- Stage ------------------------------------------------------------------
+
+def thumb_file(sha256):
+    """Thumbnail path for a PDF's content - shared by every copy of it."""
+    return THUMBS_DIR / f"{sha256[:16]}.jpg"
+
+
+def render_pdf(pdf_path, thumb_path):
+    """
+    Render page 1 of pdf_path to thumb_path (JPEG) and count its pages.
+    Returns {'pages', 'renderer', 'width', 'height'}; renderer is None when
+    no thumbnail could be made.
+    """
+    img = pages = None
+    renderer = None
+    try:
+        if have('pdftoppm'):
+            img, renderer = render_pdftoppm(pdf_path), 'pdftoppm'
+        if img is None and have('gs'):
+            img, renderer = render_ghostscript(pdf_path), 'ghostscript'
+        if have('pdfinfo'):
+            pages = pdfinfo_pages(pdf_path)
+        if img is None or pages is None:
+            fallback_img, fallback_pages = render_fallback(pdf_path)
+            if img is None and fallback_img is not None:
+                img, renderer = fallback_img, 'embedded image'
+            pages = pages or fallback_pages
+    except Exception as e:
+        print(f"  Error reading {pdf_path.name}: {e}")
+
+    if img is None:
+        return {'pages': pages, 'renderer': None, 'width': None, 'height': None}
+
+    img = decode_scaled(flatten(img), THUMB_WIDTH)
+    atomic_write_bytes(thumb_path, encode_bytes(img, 'JPEG', quality=THUMB_QUALITY, optimize=True, progressive=True))
+    return {'pages': pages, 'renderer': renderer, 'width': img.width, 'height': img.height}
+
+
+def load_index():
+    try:
+        with open(INDEX_FILE, encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def save_index(index):
+    THUMBS_DIR.mkdir(parents=True, exist_ok=True)
+    atomic_write_bytes(INDEX_FILE, json.dumps(index, indent=1, sort_keys=True).encode('utf-8'))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render first-page thumbnails and page counts for portfolio PDFs.")
+    parser.add_argument('--force', action='store_true', help='re-render every PDF')
+    add_jobs_argument(parser)
+    args = parser.parse_args()
+
+    if not IMAGES_DIR.exists():
+        print(f"Images directory not found: {IMAGES_DIR}")
+        return
+
+    renderer = 'pdftoppm' if have('pdftoppm') else 'ghostscript' if have('gs') else 'pure-Python fallback'
+    print("=" * 60)
+    print("PDF THUMBNAILS")
+    print(f"Renderer: {renderer} | Width: {THUMB_WIDTH}px | Jobs: {args.jobs}")
+    print("=" * 60)
+
+    THUMBS_DIR.mkdir(parents=True, exist_ok=True)
+    old_index = {} if args.force else load_index()
+    by_hash = {entry['sha256']: entry for entry in old_index.values()}
+    index = {}
+    jobs = []
+    queued = {}  # sha256 -> key of the PDF rendering it this run
+    copies = []
+    reused = 0  # same content as a PDF already rendered, under another name
+    for scanned in scan(IMAGES_DIR, {'.pdf'}):
+        pdf_path = scanned.path
+        key = web_path(pdf_path)
+        st = scanned.stat()
+        entry = old_index.get(key)
+        if (entry and entry['mtime_ns'] == st.st_mtime_ns and entry['size'] == st.st_size
+                and (entry['thumbnail'] is None or thumb_file(entry['sha256']).exists())):
+            index[key] = entry
+            continue
+        sha256 = file_hash(pdf_path)
+        thumb_path = thumb_file(sha256)
+        known = by_hash.get(sha256)
+        if known and (known['thumbnail'] is None or thumb_path.exists()):
+            # Same content as a PDF already rendered (moved, renamed or copied)
+            index[key] = {**known, 'mtime_ns': st.st_mtime_ns, 'size': st.st_size}
+            reused += 1
+            continue
+        index[key] = {'sha256': sha256, 'mtime_ns': st.st_mtime_ns, 'size': st.st_size}
+        if sha256 in queued:
+            copies.append((key, queued[sha256]))
+            reused += 1
+            continue
+        queued[sha256] = key
+        jobs.append((pdf_path, thumb_path))
+
+    def report(done, total, job, result):
+        name = job[0].relative_to(IMAGES_DIR)
+        if result and result['renderer']:
+            print(f"  [{done}/{total}] {name}: {result['pages'] or '?'} pages ({result['renderer']})")
+        else:
+            print(f"  [{done}/{total}] {name}: no thumbnail ({(result or {}).get('pages') or '?'} pages)")
+
+    for (pdf_path, thumb_path), result in zip(jobs, map_jobs(render_pdf, jobs, args.jobs, report)):
+        result = result or {'pages': None, 'renderer': None, 'width': None, 'height': None}
+        index[web_path(pdf_path)].update({
+            'pages': result['pages'],
+            'thumbnail': web_path(thumb_path) if result['renderer'] else None,
+            'width': result['width'],
+            'height': result['height'],
+        })
+
+    for key, rendered in copies:
+        index[key] = {**index[rendered], 'mtime_ns': index[key]['mtime_ns'], 'size': index[key]['size']}
+
+    # Thumbnails no PDF points at any more
+    used = {entry['thumbnail'] for entry in index.values()}
+    for thumb in THUMBS_DIR.glob('*.jpg'):
+        if web_path(thumb) not in used:
+            thumb.unlink()
+
+    save_index(index)
+    print("\n" + "=" * 60)
+    print(f"Rendered: {len(jobs)} | Same content: {reused} | Up to date: {len(index) - len(jobs) - reused}")
+    print("Run media_variants.py for srcset widths, then update_projects.py.")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
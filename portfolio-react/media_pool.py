@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Shared worker pool for the media optimization scripts.
+Runs per-file jobs (optimize_image, optimize_image_to_target, ...) across
+CPU cores with a ProcessPoolExecutor and hands results back in input order.
+Jobs can come from a generator (media_scan.scan): they are submitted as
+they are produced, a few per worker ahead, so work starts on the first
+file while the tree is still being walked.
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from contextlib import contextmanager
+from itertools import chain, islice
+
+# Native libraries Pillow can pull in (libimagequant via OpenMP, BLAS for
+# NumPy helpers) each spin up their own thread pools. With one process per
+# core that oversubscribes the CPU, so every worker gets a small budget.
+# The libraries read these once, when they load - so the variables are set
+# before the workers start, and the workers are spawned (not forked from a
+# parent that already has NumPy loaded) so they load everything fresh.
+THREAD_ENV_VARS = ('OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS')
+WORKER_THREADS = 1
+# Jobs submitted ahead per worker when tasks is a generator
+QUEUE_DEPTH = 2
+
+
+def default_jobs():
+    """Number of worker processes to use when --jobs is not given."""
+    try:
+        return max(1, len(os.sched_getaffinity(0)))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def add_jobs_argument(parser):
+    """Add the shared --jobs option to an argparse parser."""
+    parser.add_argument(
+        '-j', '--jobs', type=int, default=default_jobs(),
+        help=f'worker processes to run in parallel (default: {default_jobs()})'
+    )
+    return parser
+
+
+@contextmanager
+def worker_env(threads=WORKER_THREADS):
+    """Cap the native thread pools of processes started inside the block."""
+    saved = {name: os.environ.get(name) for name in THREAD_ENV_VARS}
+    os.environ.update({name: str(threads) for name in THREAD_ENV_VARS})
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+def _call(func, args):
+    return func(*args)
+
+
+def map_jobs(func, tasks, jobs=1, on_result=None):
+    """
+    Run func(*args) for every args tuple in tasks (a list or any iterable,
+    including a generator) and return the results in the same order.
+
+    on_result(done, total, args, result) is called in the parent process as
+    each job finishes, so callers can print progress without the workers
+    interleaving their output. For a generator, total is the number of jobs
+    seen so far until it runs out. With jobs <= 1 everything runs in-process.
+    """
+    known_total = len(tasks) if hasattr(tasks, '__len__') else None
+    tasks = ((args if isinstance(args, tuple) else (args,)) for args in tasks)
+    results = []
+
+    # Peek far enough to know whether a pool is worth starting
+    first = list(islice(tasks, 2))
+    if jobs <= 1 or len(first) <= 1:
+        for i, args in enumerate(chain(first, tasks)):
+            results.append(_call(func, args))
+            if on_result:
+                on_result(i + 1, known_total or max(i + 1, len(first)), args, results[i])
+        return results
+
+    # Workers start on demand while jobs are submitted, so the caps stay set for the whole run
+    with worker_env(), ProcessPoolExecutor(max_workers=jobs, mp_context=multiprocessing.get_context('spawn')) as pool:
+        pending = {}
+        submitted = 0
+        done = 0
+        source = chain(first, tasks)
+
+        def fill():
+            nonlocal submitted
+            for args in islice(source, jobs * QUEUE_DEPTH - len(pending)):
+                pending[pool.submit(_call, func, args)] = (submitted, args)
+                results.append(None)
+                submitted += 1
+
+        fill()
+        while pending:
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                i, args = pending.pop(future)
+                try:
+                    results[i] = future.result()
+                except Exception as e:
+                    print(f"    Error: {e}")
+                    results[i] = None
+                done += 1
+                if on_result:
+                    on_result(done, known_total or submitted, args, results[i])
+            fill()
+
+    return results
+
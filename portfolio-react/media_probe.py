@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Video metadata for the optimizers, without a subprocess per question.
+- ffmpeg/ffprobe are looked up on PATH once per process
+- One JSON ffprobe call returns duration, resolution, codecs, bitrate,
+  audio and rotation together
+- Results are stored on the file's manifest record (next to its mtime,
+  size and SHA-256), so a rerun over unchanged reels runs no ffprobe at all
+"""
+
+import json
+import shutil
+import subprocess
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def have(tool):
+    """True if tool (ffmpeg, ffprobe, ...) is on PATH - checked once per process."""
+    return shutil.which(tool) is not None
+
+
+def _rotation(stream):
+    rotate = stream.get('tags', {}).get('rotate')
+    if rotate is None:
+        for side_data in stream.get('side_data_list', []):
+            if 'rotation' in side_data:
+                rotate = side_data['rotation']
+                break
+    try:
+        return int(float(rotate or 0)) % 360
+    except ValueError:
+        return 0
+
+
+def _number(value, kind=float):
+    try:
+        return kind(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def run_ffprobe(path):
+    """
+    Probe path with a single ffprobe call. Returns a dict of facts, or None
+    if ffprobe is missing or can't read the file. 'width'/'height' are as
+    displayed (swapped for 90/270 degree rotation).
+    """
+    if not have('ffprobe'):
+        return None
+    result = subprocess.run(
+        ['ffprobe', '-v', 'error', '-print_format', 'json', '-show_format', '-show_streams', str(path)],
+        capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        return None
+    try:
+        data = json.loads(result.stdout)
+    except ValueError:
+        return None
+
+    fmt = data.get('format', {})
+    streams = data.get('streams', [])
+    video = next((s for s in streams if s.get('codec_type') == 'video'), None)
+    audio = next((s for s in streams if s.get('codec_type') == 'audio'), None)
+    rotation = _rotation(video) if video else 0
+    width, height = (video.get('width'), video.get('height')) if video else (None, None)
+    if rotation in (90, 270):
+        width, height = height, width
+
+    duration = _number(fmt.get('duration')) or _number(video.get('duration') if video else None)
+    return {
+        'duration': duration if duration and duration > 0 else None,
+        'width': width,
+        'height': height,
+        'rotation': rotation,
+        'video_codec': video.get('codec_name') if video else None,
+        'audio_codec': audio.get('codec_name') if audio else None,
+        'bitrate': _number(fmt.get('bit_rate'), int),
+    }
+
+
+def probe(path, manifest=None, st=None):
+    """
+    Facts for path, from the manifest when its content hasn't changed,
+    otherwise from ffprobe (and then stored in the manifest).
+    """
+    if manifest is not None:
+        facts = manifest.facts(path, 'probe', st)
+        if facts is not None:
+            return facts
+    facts = run_ffprobe(path)
+    if facts is not None and manifest is not None:
+        manifest.remember(path, 'probe', facts, st)
+    return facts
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Perceptual quality scoring for the encoders.
+SSIM on luma, vectorized with NumPy. Downscaling the whole image would
+blur away the very JPEG artifacts being measured, so the comparison runs
+at native resolution on a sparse grid of tiles instead:
+- Up to GRID x GRID tiles of TILE px, aligned to the 8px JPEG blocks
+- The reference tiles are cut once per image
+- Candidates are decoded luma-only (JPEG draft skips chroma upsampling)
+- Statistics are taken over 8x8 windows - on the block grid and shifted
+  by half a block - of every tile at once, with reshapes instead of a
+  sliding window
+
+NumPy is optional - available() tells callers whether SSIM mode can run.
+"""
+
+import io
+
+from PIL import Image
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+DEFAULT_MIN_SSIM = 0.98
+TILE = 128
+GRID = 6
+WINDOW = 8
+C1 = (0.01 * 255) ** 2
+C2 = (0.03 * 255) ** 2
+
+
+def available():
+    return np is not None
+
+
+def tile_boxes(size, tile=TILE, grid=GRID):
+    """Crop boxes for an evenly spread grid of block-aligned tiles."""
+    width, height = size
+    if width <= tile or height <= tile:
+        # Small image: one tile, trimmed to whole blocks
+        return [(0, 0, max(WINDOW, width // WINDOW * WINDOW), max(WINDOW, height // WINDOW * WINDOW))]
+
+    def starts(extent):
+        count = min(grid, extent // tile)
+        step = (extent - tile) / max(1, count - 1)
+        return sorted({int(i * step) // 8 * 8 for i in range(count)})
+
+    return [(x, y, x + tile, y + tile) for y in starts(height) for x in starts(width)]
+
+
+def luma_tiles(img, boxes):
+    """Luma of every box in img, stacked into one (tiles, h, w) float64 array."""
+    if img.mode != 'L':
+        img = img.convert('L')
+    return np.stack([np.asarray(img.crop(box), dtype=np.float64) for box in boxes])
+
+
+def _block_means(a, window=WINDOW):
+    """Mean of every non-overlapping window x window block of each tile."""
+    n, h, w = a.shape
+    return a.reshape(n, h // window, window, w // window, window).mean(axis=(2, 4))
+
+
+def _ssim_blocks(a, b, window):
+    mu_a, mu_b = _block_means(a, window), _block_means(b, window)
+    var_a = _block_means(a * a, window) - mu_a * mu_a
+    var_b = _block_means(b * b, window) - mu_b * mu_b
+    cov = _block_means(a * b, window) - mu_a * mu_b
+    return ((2 * mu_a * mu_b + C1) * (2 * cov + C2)) / ((mu_a ** 2 + mu_b ** 2 + C1) * (var_a + var_b + C2))
+
+
+def ssim(a, b, window=WINDOW):
+    """
+    Mean SSIM between two equally shaped stacks of luma tiles (1.0 = identical).
+    Windows are taken on the block grid and again shifted by half a block,
+    so the seams where JPEG blocking shows up are measured too.
+    """
+    half = window // 2
+    aligned = _ssim_blocks(a, b, window)
+    if a.shape[1] <= window or a.shape[2] <= window:
+        return float(aligned.mean())
+    shifted = _ssim_blocks(a[:, half:-half, half:-half], b[:, half:-half, half:-half], window)
+    return float((aligned.sum() + shifted.sum()) / (aligned.size + shifted.size))
+
+
+def make_scorer(img):
+    """
+    Return score(data) -> SSIM of the encoded bytes against img.
+    The reference tiles are cut once and reused for every candidate.
+    """
+    boxes = tile_boxes(img.size)
+    reference = luma_tiles(img, boxes)
+
+    def score(data):
+        with Image.open(io.BytesIO(data)) as candidate:
+            if candidate.format == 'JPEG':
+                candidate.draft('L', None)
+            return ssim(reference, luma_tiles(candidate, boxes))
+
+    return score
+
+
+def add_ssim_argument(parser):
+    """Add the shared --ssim option (perceptual target instead of size-only) to a parser."""
+    parser.add_argument(
+        '--ssim', type=float, nargs='?', const=DEFAULT_MIN_SSIM, metavar='SCORE',
+        help=f'pick the smallest encode with luma SSIM >= SCORE (default {DEFAULT_MIN_SSIM}); '
+             'the size cap still applies'
+    )
+    return parser
+
+
+def check_ssim(min_ssim):
+    """min_ssim if SSIM mode can run here, else None (with a warning)."""
+    if min_ssim is not None and not available():
+        print("⚠️ --ssim needs NumPy (pip install numpy) - using size targets only")
+        return None
+    return min_ssim
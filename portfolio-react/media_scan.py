@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Streaming Directory Scanner
+The one walker every media script uses, built on os.scandir:
+- A generator: pass it (or a generator over it) straight to
+  media_pool.map_jobs and the first file is being optimized while the
+  rest of the tree is still being read
+- Yields ScanEntry records; their stat comes from the DirEntry and is
+  cached, so checking size, mtime and the manifest costs one stat per file
+- Skip rules are applied while walking, so skipped trees are never
+  listed: dotfiles and dot folders, backup folders (originals_backup,
+  images_backup_<date>, ...), '_' service folders (_shared, _pdf) unless
+  asked for, plus any extra names
+- Package folders (<video>.hls) are never descended into - they are
+  yielded as one entry when their suffix is asked for
+- Order is deterministic: sorted by name per folder, files before subfolders
+Memory is bounded by the largest single folder, not the tree.
+"""
+
+import os
+from pathlib import Path
+
+BACKUP_MARKER = '_backup'
+PACKAGE_SUFFIXES = ('.hls',)
+# The one '_' folder holding real media (media_dedup.py's collapsed copies) - optimizers walk it too
+SHARED_DIR = '_shared'
+
+
+class ScanEntry:
+    __slots__ = ('entry', 'root')
+
+    def __init__(self, entry, root):
+        self.entry = entry
+        self.root = root
+
+    def __repr__(self):
+        return f"ScanEntry({self.entry.path!r})"
+
+    def __fspath__(self):
+        return self.entry.path
+
+    @property
+    def name(self):
+        return self.entry.name
+
+    @property
+    def path(self):
+        return Path(self.entry.path)
+
+    @property
+    def suffix(self):
+        return os.path.splitext(self.entry.name)[1].lower()
+
+    @property
+    def rel(self):
+        """Path relative to the scanned root, with '/' separators."""
+        return Path(os.path.relpath(self.entry.path, self.root)).as_posix()
+
+    def is_dir(self):
+        return self.entry.is_dir()
+
+    def stat(self):
+        """The DirEntry's stat - cached after the first call (free from the listing on Windows)."""
+        return self.entry.stat()
+
+    @property
+    def size(self):
+        return self.stat().st_size
+
+    @property
+    def mtime_ns(self):
+        return self.stat().st_mtime_ns
+
+
+def skip_dir(name, include=(), skip=()):
+    """True for folders no script should walk into (see the module docstring)."""
+    if name in include:
+        return False
+    return (name.startswith(('.', '_')) or BACKUP_MARKER in name or name in skip)
+
+
+def scan(root, extensions=None, include=(), skip=(), dirs=None):
+    """
+    Yield a ScanEntry for every file under root whose (lowercase) suffix is
+    in extensions (all files if None).
+
+    include: '_' folders to walk anyway (e.g. ('_shared', '_pdf')).
+    skip: extra folder names to leave out.
+    dirs: if a dict, filled with {relative folder: mtime_ns} for every
+        folder walked ('.' is root) - update_projects uses it to tell
+        whether a tree changed.
+    """
+    root = os.fspath(root)
+    stack = [(root, os.stat(root).st_mtime_ns if dirs is not None else None)]
+    while stack:
+        path, mtime_ns = stack.pop()
+        if dirs is not None:
+            dirs[Path(os.path.relpath(path, root)).as_posix()] = mtime_ns
+        try:
+            with os.scandir(path) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+
+        subdirs = []
+        for entry in entries:
+            if entry.name.startswith('.'):
+                continue
+            if entry.is_dir():
+                suffix = os.path.splitext(entry.name)[1].lower()
+                if suffix in PACKAGE_SUFFIXES:
+                    if extensions is not None and suffix in extensions:
+                        yield ScanEntry(entry, root)
+                elif not skip_dir(entry.name, include, skip):
+                    subdirs.append(entry)
+                continue
+            if extensions is None or os.path.splitext(entry.name)[1].lower() in extensions:
+                yield ScanEntry(entry, root)
+
+        # Reversed onto the stack so subfolders come out in name order
+        for entry in reversed(subdirs):
+            stack.append((entry.path, entry.stat().st_mtime_ns if dirs is not None else None))
+
+
+def scan_folders(root, include=(), skip=()):
+    """Top-level folders of root that scan() would walk into, sorted (the client folders)."""
+    with os.scandir(root) as it:
+        return sorted((e for e in it if e.is_dir() and not e.name.startswith('.')
+                       and not e.name.endswith(PACKAGE_SUFFIXES) and not skip_dir(e.name, include, skip)),
+                      key=lambda e: e.name)
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Content-based card thumbnail scoring for update_projects.py.
+Ranks a project's images by what they look like instead of their
+filenames, from statistics of a small (ANALYSIS_SIZE px) copy:
+- Sharpness: variance of the Laplacian of the luma
+- Colorfulness: Hasler & Suesstrunk's opponent-color metric
+- Text: share of pixels on a strong edge, weighted by how much of the
+  rest is flat - lettering on a plain background (hiring posts, copy
+  slides) scores high here and is pushed down; busy photos don't
+- Fit: how far the aspect ratio is from the 4:5 card crop
+Features are cached by content hash, so only new artwork is decoded.
+NumPy is optional - PIL filters stand in for it when it's missing.
+"""
+
+import math
+
+from PIL import Image, ImageFilter, ImageStat
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+ANALYSIS_SIZE = 256
+CARD_ASPECT = 4 / 5  # .project-thumbnail aspect-ratio in styles.css
+EDGE_THRESHOLD = 48  # gradient magnitude (0-255 luma) counted as a strong edge
+FLAT_THRESHOLD = 4  # ...and as flat
+SHARPNESS_REF = 1500.0  # Laplacian variance treated as fully sharp
+COLORFUL_REF = 80.0  # colorfulness treated as fully colorful
+TEXT_LIMIT = 0.02  # text score product shots on a plain background stay under
+WEIGHTS = {'sharpness': 1.0, 'color': 1.0, 'text': 10.0, 'fit': 0.5}
+
+
+def analysis_copy(img):
+    """RGB copy no larger than ANALYSIS_SIZE, transparent areas on white (as the card shows them)."""
+    if img.mode in ('RGBA', 'LA', 'PA') or (img.mode == 'P' and 'transparency' in img.info):
+        img = img.convert('RGBA')
+        background = Image.new('RGB', img.size, (255, 255, 255))
+        background.paste(img, mask=img.getchannel('A'))
+        img = background
+    else:
+        img = img.convert('RGB')
+    img.thumbnail((ANALYSIS_SIZE, ANALYSIS_SIZE), Image.Resampling.BOX)
+    return img
+
+
+def _features_numpy(small):
+    rgb = np.asarray(small, dtype=np.float32)
+    r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+    luma = 0.299 * r + 0.587 * g + 0.114 * b
+
+    lap = (luma[:-2, 1:-1] + luma[2:, 1:-1] + luma[1:-1, :-2] + luma[1:-1, 2:] - 4 * luma[1:-1, 1:-1])
+    gx = np.abs(luma[1:-1, 2:] - luma[1:-1, :-2])
+    gy = np.abs(luma[2:, 1:-1] - luma[:-2, 1:-1])
+    gradient = (gx + gy) / 2
+
+    rg = r - g
+    yb = 0.5 * (r + g) - b
+    colorfulness = math.hypot(rg.std(), yb.std()) + 0.3 * math.hypot(rg.mean(), yb.mean())
+    return (float(lap.var()), float(colorfulness),
+            float((gradient > EDGE_THRESHOLD).mean()), float((gradient < FLAT_THRESHOLD).mean()))
+
+
+def _features_pil(small):
+    gray = small.convert('L')
+    sharpness = ImageStat.Stat(gray.filter(ImageFilter.Kernel((3, 3), [0, 1, 0, 1, -4, 1, 0, 1, 0], 1, 128))).var[0]
+    # FIND_EDGES is an 8-neighbour Laplacian - roughly twice the central-difference gradient
+    gradient = gray.filter(ImageFilter.FIND_EDGES)
+    edges = gradient.point(lambda v: 255 if v > EDGE_THRESHOLD * 2 else 0)
+    flat = gradient.point(lambda v: 255 if v < FLAT_THRESHOLD * 2 else 0)
+
+    pixels = list(small.resize((64, 64), Image.Resampling.BOX).getdata())
+    rg = [r - g for r, g, b in pixels]
+    yb = [0.5 * (r + g) - b for r, g, b in pixels]
+
+    def mean_std(values):
+        mean = sum(values) / len(values)
+        return mean, math.sqrt(sum((v - mean) ** 2 for v in values) / len(values))
+
+    (rg_mean, rg_std), (yb_mean, yb_std) = mean_std(rg), mean_std(yb)
+    colorfulness = math.hypot(rg_std, yb_std) + 0.3 * math.hypot(rg_mean, yb_mean)
+    return sharpness, colorfulness, ImageStat.Stat(edges).mean[0] / 255, ImageStat.Stat(flat).mean[0] / 255
+
+
+def image_features(img):
+    """Scoring features for img (any size or mode - JPEGs can arrive draft-decoded)."""
+    aspect = img.width / img.height
+    small = analysis_copy(img)
+    if small.width < 3 or small.height < 3:
+        return {'sharpness': 0.0, 'colorfulness': 0.0, 'edges': 0.0, 'flat': 1.0, 'aspect': aspect}
+    sharpness, colorfulness, edges, flat = (_features_numpy if np is not None else _features_pil)(small)
+    return {
+        'sharpness': round(sharpness, 2),
+        'colorfulness': round(colorfulness, 2),
+        'edges': round(edges, 4),
+        'flat': round(flat, 4),
+        'aspect': round(aspect, 4),
+    }
+
+
+def thumbnail_score(features):
+    """Higher is a better card image: sharp and colorful, little text, close to the card's shape."""
+    sharp = min(1.0, math.log1p(features['sharpness']) / math.log1p(SHARPNESS_REF))
+    color = min(1.0, features['colorfulness'] / COLORFUL_REF)
+    text = max(0.0, features['edges'] * features['flat'] - TEXT_LIMIT)
+    fit = abs(math.log(features['aspect'] / CARD_ASPECT))
+    return (WEIGHTS['sharpness'] * sharp + WEIGHTS['color'] * color
+            - WEIGHTS['text'] * text - WEIGHTS['fit'] * fit)
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Responsive Variant Generator
+Builds a width ladder of every portfolio image for srcset:
+- Widths: 400 / 800 / 1200 / 1800px (never upscaled)
+- Formats: AVIF (when Pillow has it), WebP and a JPEG fallback
+- Each source is decoded once, straight to the largest rung (see
+  media_decode), and every width is resized from the previous one
+- Output goes to public/variants/<Client>/<file>-<width>.<ext> (the full
+  source name, so A1.jpg and A1.png don't share files) with an index
+  (variants.json) that update_projects.py reads; files no source
+  produces any more are removed
+"""
+
+import argparse
+import json
+import os
+from pathlib import Path
+
+from PIL import Image, features
+
+from media_decode import decode_scaled
+from media_io import atomic_save
+from media_pool import add_jobs_argument, map_jobs
+from media_scan import scan
+
+# Configuration
+IMAGES_DIR = Path(__file__).parent / "public" / "images"
+VARIANTS_DIR = Path(__file__).parent / "public" / "variants"
+INDEX_FILE = VARIANTS_DIR / "variants.json"
+WIDTHS = [400, 800, 1200, 1800]
+IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.webp'}
+
+# Encoder settings per output format, best first (matches <source> order)
+FORMATS = {
+    'avif': {'format': 'AVIF', 'quality': 55, 'speed': 6},
+    'webp': {'format': 'WEBP', 'quality': 78, 'method': 4},
+    'jpg': {'format': 'JPEG', 'quality': 80, 'optimize': True, 'progressive': True},
+}
+
+
+def available_formats():
+    """Output formats this Pillow build can write."""
+    formats = list(FORMATS)
+    if not features.check('avif'):
+        formats.remove('avif')
+    return formats
+
+
+def web_path(path, root):
+    return '/' + path.relative_to(root.parent).as_posix()
+
+
+def variant_name(source_name, width, ext):
+    """'A1.jpg', 400, 'webp' -> 'A1.jpg-400.webp'."""
+    return f"{source_name}-{width}.{ext}"
+
+
+def ladder(source_width, widths=WIDTHS):
+    """Widths to emit for a source, largest first. Small sources get one variant at their own width."""
+    fitting = sorted((w for w in widths if w <= source_width), reverse=True)
+    return fitting or [source_width]
+
+
+def flatten(img):
+    """JPEG has no alpha - composite transparent images onto white."""
+    if img.mode in ('RGBA', 'LA'):
+        background = Image.new('RGB', img.size, (255, 255, 255))
+        background.paste(img, mask=img.getchannel('A'))
+        return background
+    return img.convert('RGB')
+
+
+def generate_variants(src_path, out_dir, formats):
+    """Write every width/format variant of src_path into out_dir and return its index entry."""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    st = src_path.stat()
+
+    try:
+        with Image.open(src_path) as img:
+            source_size = img.size
+            widths = ladder(img.width)
+            has_alpha = img.mode in ('RGBA', 'LA') or (img.mode == 'P' and 'transparency' in img.info)
+            # Only decode as much as the largest rung needs
+            current = decode_scaled(img, widths[0]).convert('RGBA' if has_alpha else 'RGB')
+    except Exception as e:
+        print(f"  Error reading {src_path}: {e}")
+        return None
+
+    written = 0
+    smallest = 0
+
+    for width in widths:
+        if width < current.width:
+            height = max(1, round(current.height * width / current.width))
+            # Resize from the previous rung, not the full-size decode
+            current = current.resize((width, height), Image.Resampling.LANCZOS)
+
+        for ext in formats:
+            options = dict(FORMATS[ext])
+            fmt = options.pop('format')
+            target = out_dir / variant_name(src_path.name, width, ext)
+            frame = flatten(current) if fmt == 'JPEG' else current
+            # Atomic, so a half-written variant is never served or hashed (media_fingerprint)
+            atomic_save(frame, target, fmt, **options)
+            size = target.stat().st_size
+            written += size
+            if width == widths[-1] and ext == formats[0]:
+                smallest = size
+
+    return {
+        'width': source_size[0],
+        'height': source_size[1],
+        'widths': sorted(widths),
+        'formats': formats,
+        'mtime_ns': st.st_mtime_ns,
+        'size': st.st_size,
+        'bytes': written,
+        'smallest': smallest,
+    }
+
+
+def load_index():
+    if INDEX_FILE.exists():
+        with open(INDEX_FILE, encoding='utf-8') as f:
+            return json.load(f)
+    return {}
+
+
+def save_index(index):
+    VARIANTS_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = INDEX_FILE.with_suffix('.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, INDEX_FILE)
+
+
+def prune_variants(index):
+    """Delete variant files no index entry accounts for (removed sources, older naming). Returns how many."""
+    expected = {INDEX_FILE}
+    for key, entry in index.items():
+        source = Path(key)
+        out_dir = VARIANTS_DIR / source.parent.relative_to('/' + IMAGES_DIR.name)
+        expected.update(out_dir / variant_name(source.name, width, ext)
+                        for width in entry['widths'] for ext in entry['formats'])
+
+    pruned = 0
+    for directory, dirs, files in os.walk(VARIANTS_DIR, topdown=False):
+        for filename in files:
+            path = Path(directory) / filename
+            if path not in expected:
+                path.unlink()
+                pruned += 1
+        if directory != str(VARIANTS_DIR) and not os.listdir(directory):
+            os.rmdir(directory)
+    return pruned
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate responsive srcset variants for portfolio images.")
+    parser.add_argument('--force', action='store_true', help='rebuild variants even if the source is unchanged')
+    add_jobs_argument(parser)
+    args = parser.parse_args()
+
+    if not IMAGES_DIR.exists():
+        print(f"Images directory not found: {IMAGES_DIR}")
+        return
+
+    formats = available_formats()
+    index = {} if args.force else load_index()
+
+    print("=" * 60)
+    print("RESPONSIVE VARIANTS")
+    print(f"Widths: {WIDTHS} | Formats: {', '.join(formats)} | Jobs: {args.jobs}")
+    print("=" * 60)
+
+    jobs = []
+    seen = set()
+
+    def find_jobs():
+        """Streamed to the pool - the first variants are encoding while the tree is still being read."""
+        # _shared/ holds files media_dedup.py collapsed and _pdf/ the PDF thumbnails
+        # from media_pdf.py - they need variants too
+        for scanned in scan(IMAGES_DIR, IMAGE_EXTENSIONS, include=('_shared', '_pdf')):
+            src_path = scanned.path
+            key = web_path(src_path, IMAGES_DIR)
+            seen.add(key)
+            entry = index.get(key)
+            st = scanned.stat()
+            out_dir = VARIANTS_DIR / src_path.parent.relative_to(IMAGES_DIR)
+            if (entry and entry['mtime_ns'] == st.st_mtime_ns and entry['size'] == st.st_size
+                    and entry['formats'] == formats
+                    and (out_dir / variant_name(src_path.name, entry['widths'][0], formats[0])).exists()):
+                continue
+
+            jobs.append((src_path, out_dir, formats))
+            yield jobs[-1]
+
+    def report(done, total, job, entry):
+        name = job[0].relative_to(IMAGES_DIR)
+        if entry:
+            print(f"  [{done}/{total}] {name}: {len(entry['widths'])} widths, {entry['bytes'] / 1024:.0f}KB")
+        else:
+            print(f"  [{done}/{total}] {name}: failed")
+
+    results = map_jobs(generate_variants, find_jobs(), args.jobs, report)
+    for (src_path, _, _), entry in zip(jobs, results):
+        if entry:
+            index[web_path(src_path, IMAGES_DIR)] = entry
+
+    # Drop entries whose source image is gone
+    for key in set(index) - seen:
+        del index[key]
+
+    save_index(index)
+    pruned = prune_variants(index)
+
+    source_bytes = sum(entry['size'] for entry in index.values())
+    smallest_bytes = sum(entry['smallest'] for entry in index.values())
+
+    print("\n" + "=" * 60)
+    print(f"Generated: {len(jobs)} | Up to date: {len(index) - len(jobs)} | Stale files removed: {pruned}")
+    if source_bytes:
+        print(f"Full-size sources: {source_bytes / (1024 * 1024):.1f}MB | "
+              f"Smallest {formats[0]} rung: {smallest_bytes / (1024 * 1024):.1f}MB")
+    print(f"Index: {INDEX_FILE}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Video outputs shared by the optimizers.
+Names the <stem>.poster.jpg / <stem>.preview.mp4 pair optimize_media.py
+writes for the project grid, and packages videos as HLS with fMP4
+segments next to the source:
+- <stem>.hls/master.m3u8 lists a small bitrate ladder (1080p / 720p /
+  480p, never upscaled past the source), each rung in v<N>/ with its own
+  index.m3u8, init.mp4 and 4s .m4s segments
+- All rungs come out of one ffmpeg run (decode once, split, scale), with
+  keyframes forced every segment so players can switch at any boundary
+- The package is built in a hidden temp folder and swapped in whole
+- Several reels encode at once, each with a share of the cores
+  (thread_budget), instead of each ffmpeg grabbing every core
+
+Size-targeted MP4 encodes (encode_to_size) go through the same scheduler:
+capped CRF by default (-crf with -maxrate/-bufsize from the size target,
+so easy footage comes out smaller and nothing overshoots) or two-pass
+ABR, with throughput read from ffmpeg's -progress output.
+"""
+
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+from media_io import fsync_dir, replace_file, temp_path_for
+from media_probe import probe
+
+POSTER_SUFFIX = '.poster.jpg'
+PREVIEW_SUFFIX = '.preview.mp4'
+HLS_SUFFIX = '.hls'
+HLS_MASTER = 'master.m3u8'
+SEGMENT_SECONDS = 4
+# (max height, video kbps) - top rung first
+HLS_LADDER = [
+    (1080, 4500),
+    (720, 2500),
+    (480, 1000),
+]
+AUDIO_KBPS = 128
+MIN_THREADS_PER_ENCODE = 4  # x264 scales well up to a handful of threads per stream
+CRF = 23
+MIN_VIDEO_KBPS = 500
+SIZE_HEADROOM = 0.95  # share of the size target left for video + audio after container overhead
+PROGRESS_INTERVAL = 5.0  # seconds between throughput lines per encode
+
+
+def is_video_artifact(path):
+    """Posters and previews written next to a video, not source media."""
+    return Path(path).name.endswith((POSTER_SUFFIX, PREVIEW_SUFFIX))
+
+
+def hls_dir(src_path):
+    src_path = Path(src_path)
+    return src_path.with_name(src_path.stem + HLS_SUFFIX)
+
+
+def needs_hls(src_path):
+    """True if the master playlist is missing or older than the video."""
+    master = hls_dir(src_path) / HLS_MASTER
+    return not master.exists() or os.path.getmtime(master) < os.path.getmtime(src_path)
+
+
+def ladder_for(height, ladder=HLS_LADDER):
+    """
+    The rungs worth encoding for a source of the given height: nothing
+    above it except one rung that carries the native resolution.
+    """
+    if not height:
+        return ladder
+    rungs = [rung for rung in ladder if rung[0] <= height]
+    if len(rungs) < len(ladder) and (not rungs or rungs[0][0] < height):
+        rungs.insert(0, ladder[len(ladder) - len(rungs) - 1])
+    return rungs
+
+
+def thread_budget(jobs, total):
+    """
+    Split jobs cores between concurrent encodes. Returns (encodes at once,
+    threads per encode) so encodes x threads never exceeds the cores.
+    """
+    workers = max(1, min(total, jobs // MIN_THREADS_PER_ENCODE))
+    return workers, max(1, jobs // workers)
+
+
+def video_kbps_for(max_bytes, duration, audio=True):
+    """Video bitrate that lands a file of this duration under max_bytes."""
+    total = max_bytes * 8 / duration / 1000 * SIZE_HEADROOM
+    return max(MIN_VIDEO_KBPS, int(total - (AUDIO_KBPS if audio else 0)))
+
+
+def run_ffmpeg(cmd, duration=None, label=None):
+    """
+    Run an ffmpeg command with -progress on stdout. Every PROGRESS_INTERVAL
+    seconds prints '<label>: <percent>, <fps> fps' (if label is given).
+    Returns (ok, stderr, average fps).
+    """
+    cmd = cmd[:1] + ['-progress', 'pipe:1', '-nostats'] + cmd[1:]
+    started = last = time.monotonic()
+    frames = 0
+    block = {}
+    # -v error keeps stderr to a few lines, so reading it at the end can't stall ffmpeg
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    for line in proc.stdout:
+        key, _, value = line.strip().partition('=')
+        block[key] = value
+        if key != 'progress':
+            continue
+        if block.get('frame', '').isdigit():
+            frames = int(block['frame'])
+        now = time.monotonic()
+        if label and value == 'continue' and now - last >= PROGRESS_INTERVAL:
+            last = now
+            # out_time_us (out_time_ms in older ffmpeg, also microseconds)
+            out_us = block.get('out_time_us') or block.get('out_time_ms') or ''
+            done = f"{int(out_us) / 1e6 / duration * 100:.0f}%, " if duration and out_us.isdigit() else ''
+            print(f"    {label}: {done}{frames / (now - started):.0f} fps")
+        block = {}
+    stderr = proc.stderr.read()
+    proc.wait()
+    elapsed = time.monotonic() - started
+    return proc.returncode == 0, stderr, frames / elapsed if elapsed > 0 else 0.0
+
+
+def encode_to_size(src_path, max_bytes, facts, threads=None, two_pass=False, label=None):
+    """
+    Re-encode src_path (H.264/AAC MP4) in place so it lands under max_bytes.
+    facts are media_probe.probe() results and must include the duration.
+
+    Capped CRF by default: quality-driven, with the size target as the VBV
+    ceiling. two_pass runs a classic two-pass ABR at the target bitrate.
+    Returns a dict with the new 'size', the video 'kbps' target, average
+    'fps' and whether it 'fits', or None if ffmpeg failed.
+    """
+    src_path = Path(src_path)
+    duration = facts['duration']
+    audio = bool(facts.get('audio_codec'))
+    kbps = video_kbps_for(max_bytes, duration, audio)
+    temp_path = temp_path_for(src_path)
+
+    head = ['ffmpeg', '-y', '-v', 'error', '-i', str(src_path),
+            '-c:v', 'libx264', '-preset', 'medium', '-pix_fmt', 'yuv420p']
+    if threads:
+        head += ['-threads', str(threads)]
+    tail = (['-c:a', 'aac', '-b:a', f'{AUDIO_KBPS}k'] if audio else ['-an']) + \
+        ['-movflags', '+faststart', '-f', 'mp4', temp_path]
+
+    with tempfile.TemporaryDirectory() as log_dir:
+        if two_pass:
+            passlog = os.path.join(log_dir, 'x264')
+            first = head + ['-b:v', f'{kbps}k', '-pass', '1', '-passlogfile', passlog, '-an', '-f', 'null', os.devnull]
+            ok, stderr, _ = run_ffmpeg(first, duration, label and f"{label} (pass 1)")
+            if ok:
+                second = head + ['-b:v', f'{kbps}k', '-pass', '2', '-passlogfile', passlog] + tail
+                ok, stderr, fps = run_ffmpeg(second, duration, label and f"{label} (pass 2)")
+        else:
+            capped = head + ['-crf', str(CRF), '-maxrate', f'{kbps}k', '-bufsize', f'{kbps * 2}k'] + tail
+            ok, stderr, fps = run_ffmpeg(capped, duration, label)
+
+    if not ok or not os.path.exists(temp_path):
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        print(f"  ffmpeg error: {stderr[:100] if stderr else 'unknown'}")
+        return None
+
+    # Atomic swap - a killed run never leaves a half-written video in place
+    size = os.path.getsize(temp_path)
+    replace_file(temp_path, src_path)
+    return {'size': size, 'kbps': kbps, 'fps': fps, 'fits': size <= max_bytes}
+
+
+def hls_command(src_path, out_dir, threads, audio=True, ladder=HLS_LADDER):
+    """ffmpeg arguments for the whole ladder in one pass."""
+    rungs = len(ladder)
+    split = f"[0:v]split={rungs}" + ''.join(f"[s{i}]" for i in range(rungs))
+    scales = [f"[s{i}]scale=-2:'min({height},ih)'[v{i}]" for i, (height, _) in enumerate(ladder)]
+    cmd = [
+        'ffmpeg', '-y', '-v', 'error', '-i', str(src_path),
+        '-filter_complex', ';'.join([split] + scales),
+    ]
+    stream_map = []
+    for i, (_, kbps) in enumerate(ladder):
+        cmd += [
+            '-map', f'[v{i}]', f'-c:v:{i}', 'libx264', f'-b:v:{i}', f'{kbps}k',
+            f'-maxrate:v:{i}', f'{int(kbps * 1.1)}k', f'-bufsize:v:{i}', f'{kbps * 2}k',
+        ]
+        if audio:
+            cmd += ['-map', 'a:0', f'-c:a:{i}', 'aac', f'-b:a:{i}', f'{AUDIO_KBPS}k']
+            stream_map.append(f'v:{i},a:{i}')
+        else:
+            stream_map.append(f'v:{i}')
+    cmd += [
+        '-preset', 'medium', '-pix_fmt', 'yuv420p', '-threads', str(max(1, threads // rungs)),
+        # Aligned keyframes on every segment boundary, so rungs can switch cleanly
+        '-force_key_frames', f'expr:gte(t,n_forced*{SEGMENT_SECONDS})', '-sc_threshold', '0',
+        '-f', 'hls', '-hls_time', str(SEGMENT_SECONDS), '-hls_playlist_type', 'vod',
+        '-hls_segment_type', 'fmp4', '-hls_fmp4_init_filename', 'init.mp4',
+        '-hls_segment_filename', str(out_dir / 'v%v' / 'seg_%05d.m4s'),
+        '-master_pl_name', HLS_MASTER,
+        '-var_stream_map', ' '.join(stream_map),
+        str(out_dir / 'v%v' / 'index.m3u8'),
+    ]
+    return cmd
+
+
+def package_hls(src_path, facts=None, threads=MIN_THREADS_PER_ENCODE):
+    """
+    Encode src_path into <stem>.hls/. facts are media_probe.probe() results
+    (probed here if not given). Returns a dict with the 'master' playlist
+    path and total 'size' in bytes, or None if ffmpeg failed.
+    """
+    src_path = Path(src_path)
+    facts = facts or probe(src_path) or {}
+    final_dir = hls_dir(src_path)
+    work_dir = final_dir.with_name(f".{final_dir.name}.{os.getpid()}.tmp")
+    shutil.rmtree(work_dir, ignore_errors=True)
+    work_dir.mkdir()
+    try:
+        cmd = hls_command(src_path, work_dir, threads, audio=bool(facts.get('audio_codec')),
+                          ladder=ladder_for(facts.get('height')))
+        ok, stderr, _ = run_ffmpeg(cmd, facts.get('duration'), label=src_path.name)
+        if not ok or not (work_dir / HLS_MASTER).exists():
+            print(f"  ffmpeg error: {stderr[:100] if stderr else 'unknown'}")
+            shutil.rmtree(work_dir, ignore_errors=True)
+            return None
+
+        # Swap the finished package in; the old one is only removed once the new one is complete
+        old_dir = final_dir.with_name(f".{final_dir.name}.{os.getpid()}.old")
+        if final_dir.exists():
+            os.replace(final_dir, old_dir)
+        os.replace(work_dir, final_dir)
+        fsync_dir(str(final_dir.parent))
+        shutil.rmtree(old_dir, ignore_errors=True)
+    except BaseException:
+        shutil.rmtree(work_dir, ignore_errors=True)
+        raise
+
+    size = sum(f.stat().st_size for f in final_dir.rglob('*') if f.is_file())
+    return {'master': final_dir / HLS_MASTER, 'size': size}
+
+
+def add_two_pass_argument(parser):
+    """Add the shared --two-pass option (two-pass ABR instead of capped CRF for size-targeted videos)."""
+    parser.add_argument(
+        '--two-pass', action='store_true',
+        help='encode oversized videos with two-pass ABR instead of capped CRF (slower, fills the size target)'
+    )
+    return parser
+
+
+def run_video_jobs(func, tasks, jobs, on_result=None):
+    """
+    Run func(*args, threads=...) for every args tuple in tasks, several
+    ffmpeg-driving jobs at once with the cores split between them (see
+    thread_budget). on_result(done, total, args, result) is called in this
+    thread as each finishes. Returns the results in input order.
+    """
+    tasks = [args if isinstance(args, tuple) else (args,) for args in tasks]
+    results = [None] * len(tasks)
+    if not tasks:
+        return results
+    workers, threads = thread_budget(jobs, len(tasks))
+    # ffmpeg does the work - threads are enough to keep several processes going
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(func, *args, threads=threads): i for i, args in enumerate(tasks)}
+        for done, future in enumerate(as_completed(futures), 1):
+            i = futures[future]
+            try:
+                results[i] = future.result()
+            except Exception as e:
+                print(f"    Error: {e}")
+            if on_result:
+                on_result(done, len(tasks), tasks[i], results[i])
+    return results
+
+
+def add_hls_argument(parser):
+    """Add the shared --hls option (adaptive streaming output alongside the MP4) to a parser."""
+    parser.add_argument(
+        '--hls', action='store_true',
+        help=f'also package each video as HLS (fMP4 segments, {len(HLS_LADDER)}-rung ladder) in <name>{HLS_SUFFIX}/'
+    )
+    return parser
+
+
+def package_all(paths, jobs, on_result=None, facts=None):
+    """
+    Package every video in paths through run_video_jobs. facts maps paths
+    to their probe results (probed in the workers if missing).
+    on_result(done, total, path, result) runs as each one finishes.
+    Returns the results in input order.
+    """
+    facts = facts or {}
+    report = (lambda done, total, args, result: on_result(done, total, args[0], result)) if on_result else None
+    return run_video_jobs(package_hls, [(path, facts.get(path)) for path in paths], jobs, report)
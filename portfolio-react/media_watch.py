@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+File watching for the images tree.
+Uses Linux inotify (through ctypes, no extra packages) when available and
+falls back to polling with a stat diff elsewhere. Bursts of events - a
+designer dropping a whole folder - are debounced into a single callback
+with the set of paths that changed.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import time
+
+DEBOUNCE_SECONDS = 0.75
+POLL_INTERVAL = 1.0
+
+# inotify constants from <sys/inotify.h>
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+EVENT_HEADER = struct.Struct('iIII')
+
+
+def is_ignored(path):
+    """Dotfiles (the manifest, editor swap files) and our own temp files."""
+    name = os.path.basename(path)
+    return name.startswith('.') or name.endswith(('.tmp', '.temp.mp4'))
+
+
+def walk_dirs(root):
+    stack = [root]
+    while stack:
+        path = stack.pop()
+        yield path
+        try:
+            with os.scandir(path) as entries:
+                stack.extend(e.path for e in entries if e.is_dir() and not e.name.startswith('.'))
+        except OSError:
+            continue
+
+
+def walk_files(root):
+    for path in walk_dirs(root):
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_file() and not is_ignored(entry.path):
+                        yield entry
+        except OSError:
+            continue
+
+
+class InotifyWatcher:
+    """Recursive watcher on top of the raw inotify syscalls."""
+
+    def __init__(self, root):
+        libc_name = ctypes.util.find_library('c')
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        self.root = root
+        self._dirs = {}
+        for path in walk_dirs(root):
+            self._add_watch(path)
+
+    def _add_watch(self, path):
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), WATCH_MASK)
+        if wd >= 0:
+            self._dirs[wd] = path
+
+    def poll(self, timeout):
+        """Wait up to timeout seconds; return the set of paths that changed."""
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return set()
+
+        changed = set()
+        data = os.read(self._fd, 64 * 1024)
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b'\0').decode('utf-8', 'surrogateescape')
+            offset += length
+
+            if mask & IN_Q_OVERFLOW:
+                # Kernel queue overflowed - report everything so nothing is missed
+                changed.update(entry.path for entry in walk_files(self.root))
+                continue
+            if mask & IN_IGNORED:
+                self._dirs.pop(wd, None)
+                continue
+
+            parent = self._dirs.get(wd)
+            if parent is None:
+                continue
+            path = os.path.join(parent, name)
+
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    # New folder: watch it, and pick up files copied in before the watch existed
+                    for sub in walk_dirs(path):
+                        self._add_watch(sub)
+                    changed.update(entry.path for entry in walk_files(path))
+                continue
+            # IN_CREATE alone means the file is still being written; wait for CLOSE_WRITE
+            if mask & (IN_CLOSE_WRITE | IN_MOVED_TO | IN_MOVED_FROM | IN_DELETE) and not is_ignored(path):
+                changed.add(path)
+        return changed
+
+    def close(self):
+        os.close(self._fd)
+
+
+class PollingWatcher:
+    """Portable fallback: re-stats the tree every interval and diffs (mtime, size)."""
+
+    def __init__(self, root, interval=POLL_INTERVAL):
+        self.root = root
+        self.interval = interval
+        self._snapshot = self._scan()
+
+    def _scan(self):
+        snapshot = {}
+        for entry in walk_files(self.root):
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            snapshot[entry.path] = (st.st_mtime_ns, st.st_size)
+        return snapshot
+
+    def poll(self, timeout):
+        time.sleep(min(timeout, self.interval) if timeout is not None else self.interval)
+        current = self._scan()
+        previous, self._snapshot = self._snapshot, current
+        return {path for path in current.keys() | previous.keys() if current.get(path) != previous.get(path)}
+
+    def close(self):
+        pass
+
+
+def make_watcher(root):
+    """inotify where the kernel supports it, polling everywhere else."""
+    try:
+        return InotifyWatcher(root)
+    except (OSError, AttributeError, TypeError):
+        return PollingWatcher(root)
+
+
+def watch(root, on_change, debounce=DEBOUNCE_SECONDS):
+    """
+    Call on_change(paths) after each burst of changes under root has been
+    quiet for debounce seconds. Runs until interrupted with Ctrl+C.
+    """
+    watcher = make_watcher(str(root))
+    kind = 'inotify' if isinstance(watcher, InotifyWatcher) else 'polling'
+    print(f"Watching {root} ({kind}) - press Ctrl+C to stop")
+
+    pending = set()
+    last_event = 0.0
+    try:
+        while True:
+            changed = watcher.poll(debounce if pending else POLL_INTERVAL)
+            if changed:
+                pending |= changed
+                last_event = time.monotonic()
+                continue
+            if pending and time.monotonic() - last_event >= debounce:
+                batch, pending = pending, set()
+                on_change(batch)
+    except KeyboardInterrupt:
+        print("\nStopped watching.")
+    finally:
+        watcher.close()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Image Optimizer - one entry point for every profile
+Runs a named profile from media_profiles.json through the shared engine
+(media_engine.py): parallel workers, manifest skips and in-memory size
+targeting, whichever profile is picked.
+- python optimize.py --list          show the profiles and their settings
+- python optimize.py web             optimize images/ in place
+- python optimize.py thumb --dir X   profiles with an output folder write copies there
+- --profiles FILE                    try out settings without touching the shared file
+The optimize_*.py scripts are presets for the same profiles.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from media_engine import PROFILES_FILE, add_profile_arguments, describe, load_profiles, run_profile
+from media_quality import check_ssim
+
+
+def print_profiles(profiles):
+    print("=" * 60)
+    print("OPTIMIZATION PROFILES")
+    print("=" * 60)
+    for name, profile in profiles.items():
+        print(f"\n{name}")
+        if profile['description']:
+            print(f"  {profile['description']}")
+        print(f"  {describe(profile)}")
+    print("\n" + "=" * 60)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Optimize portfolio images with a named profile.")
+    parser.add_argument('profile', nargs='?', help='profile name (see --list)')
+    parser.add_argument('--list', action='store_true', help='list the available profiles and exit')
+    parser.add_argument('--profiles', type=Path, default=PROFILES_FILE,
+                        help=f'profiles file (default: {PROFILES_FILE.name})')
+    parser.add_argument('--out', type=Path, help="write copies here instead of the profile's own output")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+
+    try:
+        profiles = load_profiles(args.profiles)
+    except (OSError, ValueError) as e:
+        sys.exit(f"Could not load profiles: {e}")
+
+    if args.list or not args.profile:
+        print_profiles(profiles)
+        return
+    if args.profile not in profiles:
+        sys.exit(f"Unknown profile '{args.profile}' (have: {', '.join(profiles)})")
+
+    run_profile(profiles[args.profile], args.dir, args.jobs, check_ssim(args.ssim), args.out)
+
+
+if __name__ == "__main__":
+    main()
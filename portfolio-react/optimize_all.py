@@ -2,139 +2,155 @@
 """
 Media Optimization Script - Full Recursive
 Compresses ALL images to max 2.5MB and videos to max 10MB
+(--hls also packages each video as an adaptive HLS ladder)
+Images go through the 'media' profile in media_profiles.json (media_engine.py)
 """
 
 import os
-import subprocess
-import shutil
+import argparse
 from pathlib import Path
-from PIL import Image
+
+from media_engine import ProfileRun, describe, get_profile, optimize_file
+from media_manifest import Manifest, profile_id
+from media_pool import add_jobs_argument, map_jobs
+from media_probe import have, probe
+from media_scan import SHARED_DIR, scan
+from media_video import (add_hls_argument, add_two_pass_argument, encode_to_size, is_video_artifact,
+                         needs_hls, package_all, run_video_jobs, video_kbps_for)
 
 IMAGES_DIR = Path(__file__).parent / "images"
 BACKUP_DIR = Path(__file__).parent / "originals_backup"
-MAX_IMAGE_SIZE_MB = 2.5
+IMAGE_PROFILE = 'media'
 MAX_VIDEO_SIZE_MB = 10
-MAX_WIDTH = 1800
+PROFILE = profile_id('optimize_all', max_video_mb=MAX_VIDEO_SIZE_MB)
 
 def get_file_size_mb(path):
     return os.path.getsize(path) / (1024 * 1024)
 
-def optimize_image(src_path, max_size_mb=2.5):
-    """Compress image to be under max_size_mb."""
+def compress_video(src_path, max_size_mb=10, facts=None, two_pass=False, threads=None):
+    """Compress video using ffmpeg. facts are media_probe.probe() results, probed here if not given."""
     try:
         original_size = get_file_size_mb(src_path)
         if original_size <= max_size_mb:
             return None
         
-        with Image.open(src_path) as img:
-            # Resize if too wide
-            if img.width > MAX_WIDTH:
-                ratio = MAX_WIDTH / img.width
-                new_height = int(img.height * ratio)
-                img = img.resize((MAX_WIDTH, new_height), Image.Resampling.LANCZOS)
-            
-            # Convert to RGB if needed
-            if img.mode == 'RGBA':
-                img = img.convert('RGB')
-            elif img.mode != 'RGB':
-                img = img.convert('RGB')
-            
-            # Save as JPG with reducing quality until under limit
-            new_path = src_path.with_suffix('.jpg')
-            quality = 85
-            
-            while quality >= 40:
-                img.save(new_path, 'JPEG', quality=quality, optimize=True)
-                if get_file_size_mb(new_path) <= max_size_mb:
-                    break
-                quality -= 5
-            
-            # Remove original if different
-            if new_path != src_path and src_path.exists():
-                os.remove(src_path)
-            
-            new_size = get_file_size_mb(new_path)
-            return {'original': original_size, 'new': new_size, 'quality': quality}
-    except Exception as e:
-        print(f"    Error: {e}")
-        return None
-
-def compress_video(src_path, max_size_mb=10):
-    """Compress video using ffmpeg."""
-    try:
-        original_size = get_file_size_mb(src_path)
-        if original_size <= max_size_mb:
+        # Get duration (one cached ffprobe) - no guessing if it can't be read
+        facts = facts or probe(src_path)
+        if not facts or not facts['duration']:
+            print("    Could not read the duration, skipping")
             return None
         
-        # Get duration
-        probe = subprocess.run(
-            ['ffprobe', '-v', 'error', '-show_entries', 'format=duration', '-of', 'default=noprint_wrappers=1:nokey=1', str(src_path)],
-            capture_output=True, text=True
-        )
-        duration = float(probe.stdout.strip()) if probe.stdout.strip() else 10
-        
         # Calculate bitrate
-        target_bitrate = int((max_size_mb * 1024 * 1024 * 8) / duration / 1000 * 0.85)
-        target_bitrate = max(target_bitrate, 500)
-        
-        temp_path = src_path.with_suffix('.temp.mp4')
-        
-        subprocess.run([
-            'ffmpeg', '-y', '-i', str(src_path),
-            '-c:v', 'libx264', '-preset', 'medium', '-b:v', f'{target_bitrate}k',
-            '-c:a', 'aac', '-b:a', '128k', '-movflags', '+faststart',
-            str(temp_path)
-        ], capture_output=True)
+        max_bytes = max_size_mb * 1024 * 1024
+        target_bitrate = video_kbps_for(max_bytes, facts['duration'], bool(facts['audio_codec']))
+        if facts['bitrate'] and facts['bitrate'] <= target_bitrate * 1000:
+            # Already at the floor bitrate - nothing to gain
+            return None
         
-        if temp_path.exists():
-            os.remove(src_path)
-            shutil.move(temp_path, src_path)
-            return {'original': original_size, 'new': get_file_size_mb(src_path)}
+        result = encode_to_size(src_path, max_bytes, facts, threads, two_pass, label=src_path.name)
+        if result:
+            return {'original': original_size, 'new': get_file_size_mb(src_path), 'fps': result['fps']}
         return None
     except Exception as e:
         print(f"    Error: {e}")
         return None
 
 def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    add_jobs_argument(parser)
+    add_hls_argument(parser)
+    add_two_pass_argument(parser)
+    args = parser.parse_args()
+    
+    manifest = Manifest(IMAGES_DIR)
+    images = ProfileRun(get_profile(IMAGE_PROFILE), IMAGES_DIR, manifest=manifest)
+
     print("=" * 60)
     print("FULL RECURSIVE MEDIA OPTIMIZATION")
-    print(f"Max image: {MAX_IMAGE_SIZE_MB}MB | Max video: {MAX_VIDEO_SIZE_MB}MB")
+    print(f"Images: {describe(images.profile)}")
+    print(f"Max video: {MAX_VIDEO_SIZE_MB}MB | Jobs: {args.jobs}")
     print("=" * 60)
     
-    image_ext = {'.jpg', '.jpeg', '.png', '.webp'}
+    image_ext = images.extensions
     video_ext = {'.mp4', '.mov', '.webm'}
     
-    images_done = 0
     videos_done = 0
     saved = 0
     
-    # Walk through ALL subdirectories
-    for root, dirs, files in os.walk(IMAGES_DIR):
-        root_path = Path(root)
-        
-        for filename in sorted(files):
-            file_path = root_path / filename
-            ext = file_path.suffix.lower()
-            size = get_file_size_mb(file_path)
-            
-            if ext in image_ext and size > MAX_IMAGE_SIZE_MB:
-                print(f"📷 {file_path.relative_to(IMAGES_DIR)} ({size:.1f}MB)")
-                result = optimize_image(file_path, MAX_IMAGE_SIZE_MB)
-                if result:
-                    saved += result['original'] - result['new']
-                    images_done += 1
-                    print(f"   → {result['new']:.2f}MB (q={result['quality']})")
+    video_jobs = []
+    hls_jobs = []
+    skipped = 0
+    
+    def image_jobs():
+        """
+        Walk ALL subdirectories in one stream: image jobs go to the pool as
+        they're found, videos are collected for the passes after it.
+        """
+        nonlocal skipped
+        # HLS packages are output, not media to optimize - scan() never enters them
+        for entry in scan(IMAGES_DIR, image_ext | video_ext, include=(SHARED_DIR,)):
+            file_path = entry.path
+            ext = entry.suffix
+            st = entry.stat()
+            if ext in image_ext:
+                # Manifest, size and backup checks are the profile's
+                job = images.job_for(file_path, st)
+                if job:
+                    yield job
+                continue
+            if args.hls and not is_video_artifact(file_path) and needs_hls(file_path):
+                hls_jobs.append(file_path)
             
-            elif ext in video_ext and size > MAX_VIDEO_SIZE_MB:
-                print(f"🎬 {file_path.relative_to(IMAGES_DIR)} ({size:.1f}MB)")
-                result = compress_video(file_path, MAX_VIDEO_SIZE_MB)
-                if result:
-                    saved += result['original'] - result['new']
-                    videos_done += 1
-                    print(f"   → {result['new']:.2f}MB")
+            # Already handled with these settings and untouched since
+            if manifest.is_current(file_path, PROFILE, st):
+                skipped += 1
+                continue
+            if st.st_size / (1024 * 1024) > MAX_VIDEO_SIZE_MB:
+                video_jobs.append((file_path, MAX_VIDEO_SIZE_MB, probe(file_path, manifest, st), args.two_pass))
+    
+    # Images fan out across cores through the shared engine; each one is
+    # journaled in the manifest as it lands
+    try:
+        map_jobs(optimize_file, image_jobs(), args.jobs, images.report)
+    finally:
+        images.close()
+    saved += (images.stats['original'] - images.stats['new']) / (1024 * 1024)
+    
+    def report_video(done, total, job, result):
+        file_path = job[0]
+        if result:
+            manifest.record(file_path, PROFILE)
+            print(f"[{done}/{total}] 🎬 {file_path.relative_to(IMAGES_DIR)}: "
+                  f"{result['original']:.1f}MB → {result['new']:.2f}MB ({result['fps']:.0f} fps)")
+        else:
+            print(f"[{done}/{total}] 🎬 {file_path.relative_to(IMAGES_DIR)}: unchanged")
+    
+    # Videos run several at a time too, with the cores split between the ffmpeg processes
+    for result in run_video_jobs(compress_video, video_jobs, args.jobs, report_video):
+        if result:
+            saved += result['original'] - result['new']
+            videos_done += 1
+    
+    # Packaged after compression, so the ladder is cut from the final video
+    streams_done = 0
+    if hls_jobs and not have('ffmpeg'):
+        print("ffmpeg not installed, skipping HLS packaging")
+    elif hls_jobs:
+        def report_hls(done, total, file_path, result):
+            status = f"{result['size'] / (1024 * 1024):.1f}MB ladder" if result else "failed"
+            print(f"[{done}/{total}] 📡 {file_path.relative_to(IMAGES_DIR)}: {status}")
+        
+        facts = {file_path: probe(file_path, manifest) for file_path in hls_jobs}
+        streams_done = sum(1 for result in package_all(hls_jobs, args.jobs, report_hls, facts) if result)
+    
+    manifest.save()
     
     print("\n" + "=" * 60)
-    print(f"Done! Images: {images_done} | Videos: {videos_done} | Saved: {saved:.1f}MB")
+    print(f"Done! Images: {images.stats['optimized']} ({images.stats['encodes']} encodes) | "
+          f"Videos: {videos_done} | Saved: {saved:.1f}MB")
+    print(f"Unchanged since last run: {skipped + images.stats['unchanged']}")
+    if args.hls:
+        print(f"HLS packages: {streams_done}")
     print("=" * 60)
 
 if __name__ == "__main__":
@@ -1,117 +1,151 @@
 #!/usr/bin/env python3
 """
 Media Optimization Script for Portfolio
-- Images: Max 2.5MB, progressively reduces quality until target is met
-- Videos: Compressed using ffmpeg
+- Images: Max 2.5MB, binary-searches JPEG quality until target is met
+  (or, with --ssim, the smallest encode above a perceptual score) - the
+  'media' profile in media_profiles.json, run by media_engine.py
+- Videos: Compressed using ffmpeg (capped CRF, or --two-pass), several at
+  once with the cores split between them
+- Every video gets a sibling <name>.poster.jpg (the sharpest of a few
+  sampled frames, ~50KB) and a short muted <name>.preview.mp4 loop, so
+  the project grid never has to fetch the full video
+- --hls: also packages each video as an HLS bitrate ladder (media_video)
 """
 
 import os
+import argparse
 import subprocess
-import shutil
+import io
 from pathlib import Path
-from PIL import Image
+
+from PIL import Image, ImageFilter, ImageStat
+
+from media_backup import BackupStore
+from media_decode import decode_scaled
+from media_encode import encode_to_target
+from media_engine import ProfileRun, describe, get_profile, optimize_file
+from media_io import replace_file, temp_path_for
+from media_manifest import Manifest, profile_id
+from media_pool import add_jobs_argument, map_jobs
+from media_probe import have, probe
+from media_quality import add_ssim_argument, check_ssim
+from media_scan import SHARED_DIR, scan
+from media_video import (POSTER_SUFFIX, PREVIEW_SUFFIX, add_hls_argument, add_two_pass_argument,
+                         encode_to_size, is_video_artifact, needs_hls, package_all, run_video_jobs,
+                         video_kbps_for)
 
 # Configuration
 IMAGES_DIR = Path(__file__).parent / "images"
 BACKUP_DIR = Path(__file__).parent / "originals_backup"
-MAX_IMAGE_SIZE_MB = 2.5
+IMAGE_PROFILE = 'media'  # media_profiles.json
 MAX_VIDEO_SIZE_MB = 10  # Target for videos
-MAX_WIDTH = 1800
-INITIAL_JPG_QUALITY = 85
+VIDEO_EXTENSIONS = {'.mp4', '.mov', '.webm'}
+POSTER_WIDTH = 960
+POSTER_MAX_KB = 60
+POSTER_CANDIDATES = 8  # frames sampled across the video when picking the poster
+PREVIEW_SECONDS = 4
+PREVIEW_WIDTH = 480
+PREVIEW_CRF = 30
+PROFILE = profile_id('optimize_media', max_video_mb=MAX_VIDEO_SIZE_MB)
 
 def get_file_size_mb(path):
     return os.path.getsize(path) / (1024 * 1024)
 
-def optimize_image_to_target(src_path, max_size_mb=2.5):
-    """Optimize image, progressively reducing quality until under target size."""
+def video_artifact_paths(src_path):
+    return src_path.with_name(src_path.stem + POSTER_SUFFIX), src_path.with_name(src_path.stem + PREVIEW_SUFFIX)
+
+def needs_video_artifacts(src_path):
+    """True if the poster or preview is missing or older than the video."""
+    mtime = os.path.getmtime(src_path)
+    return any(not p.exists() or os.path.getmtime(p) < mtime for p in video_artifact_paths(src_path))
+
+def grab_frame(src_path, seconds, width=None):
+    """Decode the frame at seconds (fast input seek) into a PIL image, scaled to width if given."""
+    cmd = ['ffmpeg', '-v', 'error', '-ss', f'{seconds:.3f}', '-i', str(src_path), '-frames:v', '1']
+    if width:
+        cmd += ['-vf', f'scale={width}:-2']
+    cmd += ['-f', 'image2pipe', '-c:v', 'png', '-']
+    result = subprocess.run(cmd, capture_output=True)
+    if result.returncode != 0 or not result.stdout:
+        return None
+    return Image.open(io.BytesIO(result.stdout))
+
+def frame_sharpness(img):
+    """
+    Variance of the Laplacian of the luma - high for crisp, detailed frames,
+    low for motion blur, cross-fades and blank title cards.
+    """
+    edges = img.convert('L').filter(ImageFilter.FIND_EDGES)
+    return ImageStat.Stat(edges).var[0]
+
+def pick_poster_time(src_path, duration):
+    """Sample POSTER_CANDIDATES small frames across the video and return the time of the sharpest."""
+    if not duration:
+        return 0.0
+    best_time, best_score = 0.0, -1.0
+    for i in range(POSTER_CANDIDATES):
+        # Midpoints of equal slices - skips the very first and last frames (often black)
+        seconds = duration * (i + 0.5) / POSTER_CANDIDATES
+        frame = grab_frame(src_path, seconds, width=320)
+        if frame is None:
+            continue
+        score = frame_sharpness(frame)
+        if score > best_score:
+            best_time, best_score = seconds, score
+    return best_time
+
+def extract_video_artifacts(src_path, facts=None):
+    """
+    Write <stem>.poster.jpg and <stem>.preview.mp4 next to a video.
+    The preview is a muted PREVIEW_SECONDS loop centered on the poster frame.
+    """
     try:
-        original_size = get_file_size_mb(src_path)
+        poster_path, preview_path = video_artifact_paths(src_path)
+        facts = facts or probe(src_path)
+        duration = facts['duration'] if facts else None
+        seconds = pick_poster_time(src_path, duration)
         
-        # If already under target, skip
-        if original_size <= max_size_mb:
+        frame = grab_frame(src_path, seconds)
+        if frame is None:
+            print(f"  Could not decode a frame from {src_path.name}")
             return None
+        frame = decode_scaled(frame.convert('RGB'), POSTER_WIDTH)
+        poster = encode_to_target(frame, poster_path, POSTER_MAX_KB * 1024, progressive=True)
         
-        with Image.open(src_path) as img:
-            # Convert RGBA to RGB for JPG
-            if img.mode == 'RGBA' and src_path.suffix.lower() in ['.jpg', '.jpeg']:
-                img = img.convert('RGB')
-            
-            # Resize if too wide
-            if img.width > MAX_WIDTH:
-                ratio = MAX_WIDTH / img.width
-                new_height = int(img.height * ratio)
-                img = img.resize((MAX_WIDTH, new_height), Image.Resampling.LANCZOS)
-            
-            # For PNG files that are too big, convert to JPG
-            if src_path.suffix.lower() == '.png' and original_size > max_size_mb:
-                # Try saving as optimized PNG first
-                temp_path = src_path.with_suffix('.tmp.png')
-                if img.mode == 'RGBA':
-                    # Check if image actually uses transparency
-                    if img.split()[3].getextrema()[0] < 255:
-                        # Has transparency, keep as PNG but optimize more
-                        img.save(temp_path, 'PNG', optimize=True)
-                        if get_file_size_mb(temp_path) <= max_size_mb:
-                            shutil.move(temp_path, src_path)
-                            new_size = get_file_size_mb(src_path)
-                            return {'original': original_size, 'new': new_size, 'reduction': ((original_size - new_size) / original_size) * 100}
-                        os.remove(temp_path)
-                    
-                    # No real transparency or still too big, convert to RGB
-                    img = img.convert('RGB')
-                
-                # Save as JPG with progressive quality reduction
-                new_path = src_path.with_suffix('.jpg')
-                quality = INITIAL_JPG_QUALITY
-                
-                while quality >= 50:
-                    img.save(new_path, 'JPEG', quality=quality, optimize=True)
-                    if get_file_size_mb(new_path) <= max_size_mb:
-                        break
-                    quality -= 5
-                
-                # Remove original PNG, keep JPG
-                if new_path != src_path:
-                    os.remove(src_path)
-                
-                new_size = get_file_size_mb(new_path)
-                return {
-                    'original': original_size, 
-                    'new': new_size, 
-                    'reduction': ((original_size - new_size) / original_size) * 100,
-                    'converted': f'{src_path.suffix} → .jpg'
-                }
-            
-            # For JPG, progressively reduce quality
-            elif src_path.suffix.lower() in ['.jpg', '.jpeg']:
-                quality = INITIAL_JPG_QUALITY
-                
-                while quality >= 50:
-                    img.save(src_path, 'JPEG', quality=quality, optimize=True)
-                    if get_file_size_mb(src_path) <= max_size_mb:
-                        break
-                    quality -= 5
-                
-                new_size = get_file_size_mb(src_path)
-                return {
-                    'original': original_size, 
-                    'new': new_size, 
-                    'reduction': ((original_size - new_size) / original_size) * 100,
-                    'quality': quality
-                }
-            
-            else:
-                # Other formats - just resize
-                img.save(src_path)
-                new_size = get_file_size_mb(src_path)
-                return {'original': original_size, 'new': new_size, 'reduction': ((original_size - new_size) / original_size) * 100}
-                
+        start = 0.0
+        if duration:
+            start = max(0.0, min(seconds - PREVIEW_SECONDS / 2, duration - PREVIEW_SECONDS))
+        temp_path = temp_path_for(preview_path)
+        cmd = [
+            'ffmpeg', '-y', '-v', 'error', '-ss', f'{start:.3f}', '-i', str(src_path),
+            '-t', str(PREVIEW_SECONDS), '-an',
+            '-vf', f"scale='min({PREVIEW_WIDTH},iw)':-2",
+            '-c:v', 'libx264', '-preset', 'slow', '-crf', str(PREVIEW_CRF), '-pix_fmt', 'yuv420p',
+            '-movflags', '+faststart', '-f', 'mp4', temp_path
+        ]
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        if result.returncode != 0:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            print(f"  ffmpeg error: {result.stderr[:100] if result.stderr else 'unknown'}")
+            return None
+        replace_file(temp_path, preview_path)
+        
+        return {
+            'time': seconds,
+            'poster_kb': poster['size'] / 1024,
+            'preview_kb': os.path.getsize(preview_path) / 1024
+        }
+    
     except Exception as e:
         print(f"  Error: {e}")
         return None
 
-def compress_video(src_path, max_size_mb=10):
-    """Compress video using ffmpeg."""
+def compress_video(src_path, max_size_mb=10, facts=None, two_pass=False, threads=None):
+    """
+    Compress video using ffmpeg (capped CRF, or two-pass ABR) via media_video.
+    facts are media_probe.probe() results, probed here if not given.
+    """
     try:
         original_size = get_file_size_mb(src_path)
         
@@ -120,139 +154,173 @@ def compress_video(src_path, max_size_mb=10):
             return None
         
         # Check if ffmpeg is available
-        result = subprocess.run(['which', 'ffmpeg'], capture_output=True)
-        if result.returncode != 0:
+        if not have('ffmpeg'):
             print("  ffmpeg not installed, skipping video compression")
             return None
         
-        # Calculate target bitrate
-        # Get video duration
-        probe_cmd = [
-            'ffprobe', '-v', 'error', '-show_entries', 'format=duration',
-            '-of', 'default=noprint_wrappers=1:nokey=1', str(src_path)
-        ]
-        result = subprocess.run(probe_cmd, capture_output=True, text=True)
-        duration = float(result.stdout.strip()) if result.stdout.strip() else 10
-        
-        # Target bitrate in kbps (target_size_bytes * 8 / duration_seconds / 1000)
-        target_bitrate = int((max_size_mb * 1024 * 1024 * 8) / duration / 1000 * 0.9)  # 90% to ensure under limit
-        target_bitrate = max(target_bitrate, 500)  # Minimum 500kbps
-        
-        temp_path = src_path.with_suffix('.temp.mp4')
-        
-        cmd = [
-            'ffmpeg', '-y', '-i', str(src_path),
-            '-c:v', 'libx264', '-preset', 'medium',
-            '-b:v', f'{target_bitrate}k',
-            '-c:a', 'aac', '-b:a', '128k',
-            '-movflags', '+faststart',
-            str(temp_path)
-        ]
+        # Calculate target bitrate - never from a guessed duration
+        facts = facts or probe(src_path)
+        if not facts or not facts['duration']:
+            print("  Could not read the duration, skipping (the bitrate would be a guess)")
+            return None
+        max_bytes = max_size_mb * 1024 * 1024
         
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        # Long reel already at the floor bitrate - re-encoding would only lose quality
+        target_bitrate = video_kbps_for(max_bytes, facts['duration'], bool(facts['audio_codec']))
+        if facts['bitrate'] and facts['bitrate'] <= target_bitrate * 1000:
+            print(f"  Already at {facts['bitrate'] // 1000}kbps (target {target_bitrate}kbps), skipping")
+            return None
         
-        if result.returncode == 0 and temp_path.exists():
-            # Replace original with compressed
-            os.remove(src_path)
-            shutil.move(temp_path, src_path)
-            new_size = get_file_size_mb(src_path)
-            return {
-                'original': original_size,
-                'new': new_size,
-                'reduction': ((original_size - new_size) / original_size) * 100
-            }
-        else:
-            if temp_path.exists():
-                os.remove(temp_path)
-            print(f"  ffmpeg error: {result.stderr[:100] if result.stderr else 'unknown'}")
+        result = encode_to_size(src_path, max_bytes, facts, threads, two_pass, label=src_path.name)
+        if not result:
             return None
+        new_size = get_file_size_mb(src_path)
+        return {
+            'original': original_size,
+            'new': new_size,
+            'reduction': ((original_size - new_size) / original_size) * 100,
+            'fps': result['fps']
+        }
             
     except Exception as e:
         print(f"  Error: {e}")
         return None
 
 def main():
+    parser = argparse.ArgumentParser(description="Compress portfolio images and videos to their size targets.")
+    add_jobs_argument(parser)
+    add_ssim_argument(parser)
+    add_hls_argument(parser)
+    add_two_pass_argument(parser)
+    args = parser.parse_args()
+    min_ssim = check_ssim(args.ssim)
+
     if not IMAGES_DIR.exists():
         print(f"Images directory not found: {IMAGES_DIR}")
         return
     
-    BACKUP_DIR.mkdir(exist_ok=True)
+    manifest = Manifest(IMAGES_DIR)
+    backups = BackupStore(BACKUP_DIR, IMAGES_DIR)
+    images = ProfileRun(get_profile(IMAGE_PROFILE), IMAGES_DIR, min_ssim, manifest=manifest, backups=backups)
     
     print("=" * 60)
     print("MEDIA OPTIMIZATION - MAX 2.5MB PER IMAGE")
+    print(f"Images: {describe(images.profile)}")
+    print(f"Jobs: {args.jobs}" + (f" | SSIM >= {min_ssim}" if min_ssim else "") + (" | HLS" if args.hls else ""))
     print("=" * 60)
     
-    image_extensions = {'.jpg', '.jpeg', '.png', '.webp'}
-    video_extensions = {'.mp4', '.mov', '.webm'}
+    image_extensions = images.extensions
+    video_extensions = VIDEO_EXTENSIONS
     
     total_original = 0
     total_new = 0
-    processed = 0
     videos_processed = 0
     
-    for folder in sorted(IMAGES_DIR.iterdir()):
-        if not folder.is_dir():
-            continue
-        
-        # Check if any files need processing
-        needs_processing = False
-        for f in folder.iterdir():
-            if f.suffix.lower() in image_extensions and get_file_size_mb(f) > MAX_IMAGE_SIZE_MB:
-                needs_processing = True
-                break
-            if f.suffix.lower() in video_extensions and get_file_size_mb(f) > MAX_VIDEO_SIZE_MB:
-                needs_processing = True
-                break
-        
-        if not needs_processing:
-            continue
+    video_jobs = []
+    videos = []
+    
+    def image_jobs():
+        """
+        One streamed walk: yields image jobs as they're found (the pool starts
+        on the first while the tree is still being read) and collects videos
+        for the passes below. One stat per file, shared with the manifest check.
+        """
+        for entry in scan(IMAGES_DIR, image_extensions | video_extensions, include=(SHARED_DIR,)):
+            file_path = entry.path
+            if is_video_artifact(file_path):
+                continue
+            st = entry.stat()
+            if entry.suffix in image_extensions:
+                # Queued by the profile: manifest and size checks, then backup
+                job = images.job_for(file_path, st)
+                if job:
+                    yield job
+                continue
             
-        print(f"\n📁 {folder.name}")
-        
-        # Ensure backup folder exists
-        backup_folder = BACKUP_DIR / folder.name
-        backup_folder.mkdir(exist_ok=True)
-        
-        for file_path in sorted(folder.iterdir()):
-            # Process images over 2.5MB
-            if file_path.suffix.lower() in image_extensions:
-                size = get_file_size_mb(file_path)
-                if size > MAX_IMAGE_SIZE_MB:
-                    # Backup if not already backed up
-                    backup_path = backup_folder / file_path.name
-                    if not backup_path.exists():
-                        shutil.copy2(file_path, backup_path)
-                    
-                    result = optimize_image_to_target(file_path, MAX_IMAGE_SIZE_MB)
-                    if result:
-                        total_original += result['original']
-                        total_new += result['new']
-                        processed += 1
-                        extra = result.get('converted', f"q={result.get('quality', 'opt')}")
-                        print(f"  ✓ {file_path.name}: {result['original']:.2f}MB → {result['new']:.2f}MB ({extra})")
+            videos.append(file_path)
+            # Already handled with these settings and untouched since
+            if manifest.is_current(file_path, PROFILE, st):
+                continue
             
-            # Process videos over 10MB
-            elif file_path.suffix.lower() in video_extensions:
-                size = get_file_size_mb(file_path)
-                if size > MAX_VIDEO_SIZE_MB:
-                    # Backup if not already backed up
-                    backup_path = backup_folder / file_path.name
-                    if not backup_path.exists():
-                        shutil.copy2(file_path, backup_path)
-                    
-                    print(f"  🎬 Compressing {file_path.name} ({size:.1f}MB)...")
-                    result = compress_video(file_path, MAX_VIDEO_SIZE_MB)
-                    if result:
-                        total_original += result['original']
-                        total_new += result['new']
-                        videos_processed += 1
-                        print(f"     → {result['new']:.2f}MB ({result['reduction']:.0f}% smaller)")
+            # Queue videos over 10MB
+            if st.st_size / (1024 * 1024) > MAX_VIDEO_SIZE_MB:
+                # Backup if not already backed up (content-addressed, no full copy)
+                backups.backup(file_path)
+                video_jobs.append((file_path, MAX_VIDEO_SIZE_MB, probe(file_path, manifest, st), args.two_pass))
+    
+    def report_image(done, total, job, result):
+        if done == 1:
+            print("\n📷 Compressing images")
+        images.report(done, total, job, result)
+    
+    map_jobs(optimize_file, image_jobs(), args.jobs, report_image)
+    total_original += images.stats['original'] / (1024 * 1024)
+    total_new += images.stats['new'] / (1024 * 1024)
+    
+    def report_video(done, total, job, result):
+        file_path = job[0]
+        name = file_path.relative_to(IMAGES_DIR)
+        if result:
+            manifest.record(file_path, PROFILE)
+            print(f"  [{done}/{total}] ✓ {name}: {result['original']:.1f}MB → {result['new']:.2f}MB "
+                  f"({result['reduction']:.0f}% smaller, {result['fps']:.0f} fps)")
+        else:
+            print(f"  [{done}/{total}] - {name}: unchanged")
+    
+    # Several ffmpeg processes at once, each with its share of the cores
+    if video_jobs:
+        print(f"\n🎬 Compressing {len(video_jobs)} videos ({'two-pass' if args.two_pass else 'capped CRF'})")
+    for result in run_video_jobs(compress_video, video_jobs, args.jobs, report_video):
+        if result:
+            total_original += result['original']
+            total_new += result['new']
+            videos_processed += 1
+    
+    # Posters and preview loops - after compression, so they come from the final video
+    artifact_jobs = [file_path for file_path in videos if needs_video_artifacts(file_path)]
+    if artifact_jobs and not have('ffmpeg'):
+        print(f"\nffmpeg not installed, skipping posters for {len(artifact_jobs)} videos")
+        artifact_jobs = []
+    if artifact_jobs:
+        print(f"\n🖼️ Extracting posters and previews for {len(artifact_jobs)} videos")
+    posters_made = 0
+    for file_path in artifact_jobs:
+        result = extract_video_artifacts(file_path, probe(file_path, manifest))
+        if result:
+            posters_made += 1
+            print(f"  ✓ {file_path.relative_to(IMAGES_DIR)}: poster at {result['time']:.1f}s "
+                  f"({result['poster_kb']:.0f}KB), preview {result['preview_kb']:.0f}KB")
+    
+    # Adaptive streaming packages, several reels at once within the core budget
+    hls_jobs = []
+    if args.hls and have('ffmpeg'):
+        hls_jobs = [file_path for file_path in videos if needs_hls(file_path)]
+    elif args.hls:
+        print("\nffmpeg not installed, skipping HLS packaging")
+    
+    def report_hls(done, total, file_path, result):
+        name = file_path.relative_to(IMAGES_DIR)
+        if result:
+            print(f"  [{done}/{total}] ✓ {name}: {result['size'] / (1024 * 1024):.1f}MB ladder")
+        else:
+            print(f"  [{done}/{total}] - {name}: failed")
+    
+    if hls_jobs:
+        print(f"\n📡 Packaging {len(hls_jobs)} videos as HLS")
+    facts = {file_path: probe(file_path, manifest) for file_path in hls_jobs}
+    streams_made = sum(1 for result in package_all(hls_jobs, args.jobs, report_hls, facts) if result)
+    
+    manifest.save()
+    backups.close()
     
     print("\n" + "=" * 60)
     print("SUMMARY")
     print("=" * 60)
-    print(f"Images compressed: {processed}")
+    print(f"Images compressed: {images.stats['optimized']} ({images.stats['encodes']} encodes)")
     print(f"Videos compressed: {videos_processed}")
+    print(f"Posters/previews made: {posters_made}")
+    if args.hls:
+        print(f"HLS packages made: {streams_made}")
     if total_original > 0:
         print(f"Total saved: {total_original - total_new:.2f}MB")
     print("=" * 60)
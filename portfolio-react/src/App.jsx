@@ -7,6 +7,7 @@ import Contact from './components/Contact'
 import Footer from './components/Footer'
 import Modal from './components/Modal'
 import Lightbox from './components/Lightbox'
+import { loadProject } from './data/projects.index'
 
 function App() {
   const [selectedProject, setSelectedProject] = useState(null)
@@ -16,6 +17,17 @@ function App() {
   const [navVisible, setNavVisible] = useState(true)
   const lastScrollRef = useRef(0)
 
+  // Cards only carry index fields - fetch the full project chunk on open
+  const openProject = (card) => {
+    loadProject(card.id)
+      .then(setSelectedProject)
+      .catch((error) => {
+        // Chunk failed to load (offline, or stale after a deploy) - open with the card's fields
+        console.error(`Could not load project "${card.id}"`, error)
+        setSelectedProject(card)
+      })
+  }
+
   // Handle scroll for navbar visibility
   useEffect(() => {
     const handleScroll = () => {
@@ -61,7 +73,7 @@ function App() {
     <>
       <Navbar visible={navVisible} />
       <Hero />
-      <Work onProjectClick={setSelectedProject} />
+      <Work onProjectClick={openProject} />
       <About />
       <Contact />
       <Footer />
@@ -1,4 +1,5 @@
 import { useEffect, useRef, useMemo, useState } from 'react'
+import ResponsiveImage, { assetUrl, placeholderStyle } from './ResponsiveImage'
 
 const sortByFilename = (files) => {
   if (!files) return []
@@ -9,19 +10,34 @@ const sortByFilename = (files) => {
   })
 }
 
+// Safari and iOS play HLS natively; elsewhere the progressive MP4 is used
+const nativeHls = typeof document !== 'undefined' &&
+  document.createElement('video').canPlayType('application/vnd.apple.mpegurl') !== ''
+
+const videoSource = (project, src) => {
+  if (nativeHls && project.streams?.[src]) return assetUrl(project.streams[src], project.hashes)
+  const url = assetUrl(src, project.hashes)
+  return project.posters?.[src] ? url : url + "#t=0.001"
+}
+
 const GalleryItem = ({ src, index, project, onImageClick, allImages }) => {
   const [isLoading, setIsLoading] = useState(true)
 
   return (
     <div
       className={`gallery-item ${isLoading ? 'loading' : ''}`}
-      onClick={() => onImageClick(src, allImages, index)}
+      style={isLoading ? placeholderStyle(project.imageMeta?.[src]) : undefined}
+      onClick={() => onImageClick(allImages[index], allImages, index)}
     >
       <div className="gallery-loader">
         <i className="fas fa-circle-notch fa-spin"></i>
       </div>
-      <img
+      <ResponsiveImage
         src={src}
+        variants={project.variants}
+        imageMeta={project.imageMeta}
+        hashes={project.hashes}
+        sizes="(max-width: 600px) 100vw, (max-width: 1024px) 50vw, 33vw"
         alt={`${project.name} - ${index + 1}`}
         loading={index < 3 ? "eager" : "lazy"}
         fetchpriority={index < 3 ? "high" : "auto"}
@@ -40,6 +56,11 @@ const Modal = ({ project, onClose, onImageClick }) => {
   // Sort images and videos - must be before any conditional returns (Rules of Hooks)
   const sortedImages = useMemo(() => sortByFilename(project?.images), [project?.images])
   const sortedVideos = useMemo(() => sortByFilename(project?.videos), [project?.videos])
+  // The lightbox shows full-size files directly, so hand it the hashed URLs
+  const lightboxImages = useMemo(
+    () => sortedImages.map(src => assetUrl(src, project?.hashes)),
+    [sortedImages, project?.hashes]
+  )
 
   useEffect(() => {
     if (!project && galleryRef.current) {
@@ -74,7 +95,7 @@ const Modal = ({ project, onClose, onImageClick }) => {
               index={index}
               project={project}
               onImageClick={onImageClick}
-              allImages={sortedImages}
+              allImages={lightboxImages}
             />
           ))}
           {sortedVideos.map((src, index) => (
@@ -83,9 +104,10 @@ const Modal = ({ project, onClose, onImageClick }) => {
               className="gallery-item video-item"
             >
               <video
-                src={src + "#t=0.001"}
+                src={videoSource(project, src)}
+                poster={assetUrl(project.posters?.[src], project.hashes)}
                 controls
-                preload="metadata"
+                preload={project.posters?.[src] ? "none" : "metadata"}
                 className="modal-video"
               />
               <div className="video-badge">
@@ -98,13 +120,28 @@ const Modal = ({ project, onClose, onImageClick }) => {
               key={`pdf-${index}`}
               className="gallery-item pdf-item"
             >
-              <a href={src} target="_blank" rel="noopener noreferrer" className="pdf-link">
+              <a href={assetUrl(src, project.hashes)} target="_blank" rel="noopener noreferrer" className="pdf-link">
                 <div className="pdf-preview">
-                  <i className="fas fa-file-pdf"></i>
+                  {project.pdfMeta?.[src]?.thumbnail ? (
+                    <ResponsiveImage
+                      src={project.pdfMeta[src].thumbnail}
+                      variants={project.variants}
+                      imageMeta={project.imageMeta}
+                      hashes={project.hashes}
+                      sizes="(max-width: 600px) 100vw, 33vw"
+                      alt={`${project.name} - ${src.split('/').pop().replace('.pdf', '')}`}
+                      loading="lazy"
+                      decoding="async"
+                    />
+                  ) : (
+                    <i className="fas fa-file-pdf"></i>
+                  )}
                 </div>
                 <div className="pdf-info">
                   <span className="pdf-name">{src.split('/').pop().replace('.pdf', '')}</span>
-                  <span className="pdf-label">Click to view PDF</span>
+                  <span className="pdf-label">
+                    {project.pdfMeta?.[src]?.pages ? `${project.pdfMeta[src].pages} pages · ` : ''}Click to view PDF
+                  </span>
                 </div>
               </a>
             </div>
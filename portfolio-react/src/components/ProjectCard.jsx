@@ -1,15 +1,19 @@
 import { useRef } from 'react'
+import ResponsiveImage, { assetUrl } from './ResponsiveImage'
 
 const ProjectCard = ({ project, index, onClick }) => {
   const videoRef = useRef(null)
-  const imageCount = (project.images?.length || 0) + (project.videos?.length || 0) + (project.pdfs?.length || 0)
-  const hasVideos = project.videos?.length > 0
-  const hasPdfs = project.pdfs?.length > 0
-  const hasOnlyVideos = project.videos?.length > 0 && !project.images?.length
-  const hasOnlyPdfs = hasPdfs && !project.images?.length && !project.videos?.length
+  // Cards come from projects.index.js, which carries counts instead of full asset lists
+  const imageCount = (project.imageCount || 0) + (project.videoCount || 0) + (project.pdfCount || 0)
+  const hasVideos = project.videoCount > 0
+  const hasPdfs = project.pdfCount > 0
+  const hasOnlyVideos = project.videoCount > 0 && !project.imageCount
+  const hasOnlyPdfs = hasPdfs && !project.imageCount && !project.videoCount
 
   const isVideo = (url) => url?.match(/\.(mp4|mov|webm)$/i);
   const isPdfOnly = project.thumbnail === 'pdf' || hasOnlyPdfs;
+  // media_pdf.py rendered the first page - show it like any other image
+  const hasPdfThumbnail = isPdfOnly && !!project.thumbnail && project.thumbnail !== 'pdf';
   const isVideoOnly = hasOnlyVideos;
 
   const handleMouseEnter = () => {
@@ -26,9 +30,7 @@ const ProjectCard = ({ project, index, onClick }) => {
   }
 
   const renderThumbnail = () => {
-    if (isPdfOnly) {
-      // Get PDF filename for display
-      const pdfName = project.pdfs?.[0]?.split('/').pop()?.replace('.pdf', '') || project.name
+    if (isPdfOnly && !hasPdfThumbnail) {
       return (
         <div className="pdf-thumbnail">
           <div className="pdf-icon-wrapper">
@@ -40,24 +42,29 @@ const ProjectCard = ({ project, index, onClick }) => {
       )
     }
     if (hasVideos || isVideo(project.thumbnail)) {
-      const videoSrc = (project.videos?.[0] || project.thumbnail) + "#t=0.001"
-      const posterSrc = !isVideo(project.thumbnail) ? project.thumbnail : undefined
+      const posterSrc = assetUrl(project.poster || (!isVideo(project.thumbnail) ? project.thumbnail : undefined), project.hashes)
+      // With a poster nothing is fetched until hover, and then only the short preview loop
+      const videoSrc = assetUrl(project.preview || project.video || project.thumbnail, project.hashes)
 
       return (
         <video
           ref={videoRef}
-          src={videoSrc}
+          src={posterSrc ? videoSrc : videoSrc + "#t=0.001"}
           poster={posterSrc}
           muted
           loop
           playsInline
-          preload="metadata"
+          preload={posterSrc ? "none" : "metadata"}
         />
       )
     }
     return (
-      <img
+      <ResponsiveImage
         src={project.thumbnail}
+        variants={project.variants}
+        imageMeta={project.imageMeta}
+        hashes={project.hashes}
+        sizes="(max-width: 600px) 100vw, (max-width: 1024px) 50vw, 33vw"
         alt={project.name}
         loading={index < 4 ? "eager" : "lazy"}
         decoding={index < 4 ? "sync" : "async"}
@@ -82,7 +89,12 @@ const ProjectCard = ({ project, index, onClick }) => {
             <i className="fas fa-eye"></i> View Project
           </span>
         </div>
-        {imageCount > 1 && (
+        {hasPdfThumbnail && project.pageCount > 0 ? (
+          <span className="project-count">
+            <i className="fas fa-file-pdf"></i>
+            {project.pageCount} pages
+          </span>
+        ) : imageCount > 1 && (
           <span className="project-count">
             {hasVideos && <i className="fas fa-video"></i>}
             {hasPdfs && !hasVideos && <i className="fas fa-file-pdf"></i>}
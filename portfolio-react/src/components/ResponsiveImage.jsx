@@ -0,0 +1,79 @@
+const MIME_TYPES = { avif: 'image/avif', webp: 'image/webp', jpg: 'image/jpeg' }
+
+// Data paths are raw file paths ("/images/ASH/ASH 1.jpg"). A srcset candidate
+// ends at the first space (and a "#" would start a fragment), so every URL
+// handed to the DOM is percent-encoded segment by segment.
+const encodeUrl = (url) => url && url.split('/').map(encodeURIComponent).join('/')
+
+// Hashed copies only exist in a build (`npm run build` moves files to their
+// hashed names in dist/), so the dev server keeps using the plain URLs.
+const HASHED = !import.meta.env.DEV
+
+// "/images/Avene/A1.jpg" -> "/variants/Avene/A1.jpg-400.webp", or with the ladder's
+// content hash from media_fingerprint.py "/hashed/_variants/Avene/A1.jpg-400.3f9c2a1b.webp".
+// The full file name is kept so A1.jpg and A1.png get separate ladders.
+const variantUrl = (src, width, format, hash) => encodeUrl(HASHED && hash
+  ? src.replace(/^\/images\//, '/hashed/_variants/') + `-${width}.${hash}.${format}`
+  : src.replace(/^\/images\//, '/variants/') + `-${width}.${format}`)
+
+const srcSet = (src, variant, format) =>
+  variant.widths.map(width => `${variantUrl(src, width, format, variant.hash)} ${width}w`).join(', ')
+
+// "/images/Avene/A1.jpg" -> "/hashed/Avene/A1.3f9c2a1b.jpg" when media_fingerprint.py
+// hashed the file (cached as immutable), else the plain URL. An HLS package is
+// hashed as a whole: "/images/Avene/reel.hls/master.m3u8" -> "/hashed/Avene/reel.3f9c2a1b.hls/master.m3u8"
+export const assetUrl = (src, hashes) => {
+  const hash = HASHED && src && hashes?.[src]
+  if (!hash) return encodeUrl(src)
+  const hashed = src.replace(/^\/images\//, '/hashed/')
+  return encodeUrl(/\.hls\/[^/]+$/.test(hashed)
+    ? hashed.replace(/\.hls\/([^/]+)$/, `.${hash}.hls/$1`)
+    : hashed.replace(/(\.[^./]+)$/, `.${hash}$1`))
+}
+
+// Intrinsic size reserves layout space before the file arrives; the dominant
+// color and blurred placeholder paint underneath until it decodes.
+export const placeholderStyle = (meta) => meta && {
+  backgroundColor: meta.color,
+  backgroundImage: `url(${meta.placeholder})`,
+  backgroundSize: 'cover',
+  backgroundPosition: 'center',
+}
+
+// Renders a <picture> with AVIF/WebP/JPEG srcsets when media_variants.py has
+// generated them, otherwise a plain <img> pointing at the original file.
+const ResponsiveImage = ({ src, variants, imageMeta, hashes, sizes, style, ...rest }) => {
+  const variant = variants?.[src]
+  const meta = imageMeta?.[src]
+  const imgProps = {
+    width: meta?.width,
+    height: meta?.height,
+    style: { ...placeholderStyle(meta), ...style },
+    ...rest,
+  }
+
+  if (!variant) {
+    return <img src={assetUrl(src, hashes)} {...imgProps} />
+  }
+
+  return (
+    <picture>
+      {variant.formats.filter(format => format !== 'jpg').map(format => (
+        <source
+          key={format}
+          type={MIME_TYPES[format]}
+          srcSet={srcSet(src, variant, format)}
+          sizes={sizes}
+        />
+      ))}
+      <img
+        src={assetUrl(src, hashes)}
+        srcSet={variant.formats.includes('jpg') ? srcSet(src, variant, 'jpg') : undefined}
+        sizes={sizes}
+        {...imgProps}
+      />
+    </picture>
+  )
+}
+
+export default ResponsiveImage
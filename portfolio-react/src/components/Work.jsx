@@ -1,5 +1,5 @@
 import { useState, useMemo } from 'react'
-import { projects } from '../data/projects'
+import { projects } from '../data/projects.index'
 import ProjectCard from './ProjectCard'
 
 const Work = ({ onProjectClick }) => {
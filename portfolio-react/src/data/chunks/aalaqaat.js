@@ -0,0 +1,44 @@
+// Portfolio Data - Aalaqaat (loaded on demand from projects.index.js)
+export default {
+  id: "aalaqaat",
+  name: "Aalaqaat",
+  type: "Social Media + Branding",
+  description: `I designed the core identity of Alaqaat, a Saudi law firm looking to position itself as a market-leading trustable partner.`,
+  thumbnail: "/images/Aalaqaat/Artboard 5.png",
+  images: [
+    "/images/Aalaqaat/Artboard 1.png",
+    "/images/Aalaqaat/Artboard 10.png",
+    "/images/Aalaqaat/Artboard 2.png",
+    "/images/Aalaqaat/Artboard 3.png",
+    "/images/Aalaqaat/Artboard 4.png",
+    "/images/Aalaqaat/Artboard 5.png",
+    "/images/Aalaqaat/Artboard 6.png",
+    "/images/Aalaqaat/Artboard 7.jpg",
+    "/images/Aalaqaat/Artboard 8.png",
+    "/images/Aalaqaat/Artboard 9.png",
+  ],
+  hashes: {
+    "/images/Aalaqaat/Artboard 1.png": "565c0ee3",
+    "/images/Aalaqaat/Artboard 10.png": "0a9e2377",
+    "/images/Aalaqaat/Artboard 2.png": "37906795",
+    "/images/Aalaqaat/Artboard 3.png": "3de12f7e",
+    "/images/Aalaqaat/Artboard 4.png": "5adec414",
+    "/images/Aalaqaat/Artboard 5.png": "7bb2eeb4",
+    "/images/Aalaqaat/Artboard 6.png": "67e1a960",
+    "/images/Aalaqaat/Artboard 7.jpg": "a6b0fd80",
+    "/images/Aalaqaat/Artboard 8.png": "fc5c2359",
+    "/images/Aalaqaat/Artboard 9.png": "cfd95db0",
+  },
+  imageMeta: {
+    "/images/Aalaqaat/Artboard 1.png": { width: 1920, height: 1080, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRjYAAABXRUJQVlA4ICoAAAAwAQCdASoQAAkABABoJaQAA3AA/vF9nvPD3OJX4+Hg79wKySYsAyV78AA=" },
+    "/images/Aalaqaat/Artboard 10.png": { width: 1920, height: 1080, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRi4AAABXRUJQVlA4ICIAAACQAQCdASoQAAkABABoJaQAAudUwMAA/vYC34CNZdiE8AAA" },
+    "/images/Aalaqaat/Artboard 2.png": { width: 1920, height: 1080, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRkIAAABXRUJQVlA4IDYAAABwAQCdASoQAAkABABoJaQ28AAXQAD+8X2fE2OWN4fFnO0Ks3/s/Ds3Tnv6DGALJOCZGbFAAAA=" },
+    "/images/Aalaqaat/Artboard 3.png": { width: 1920, height: 1080, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRjIAAABXRUJQVlA4ICYAAACwAQCdASoQAAkABABoJaQAAudgks4AAP72Av1mDe8qWnGDwAAAAA==" },
+    "/images/Aalaqaat/Artboard 4.png": { width: 1920, height: 1080, color: "#27245f", placeholder: "data:image/webp;base64,UklGRjgAAABXRUJQVlA4ICwAAACwAQCdASoQAAkABABoJZgAAudgPOwAAP7uhLruNLWQPlTGbZ3/O20Wl8XCAA==" },
+    "/images/Aalaqaat/Artboard 5.png": { width: 1920, height: 1080, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRlYAAABXRUJQVlA4IEoAAAAQAgCdASoQAAkABABoJQBOhxAAJHIlNLHwAP7wprXS3Hcdlncb2zBDW3kyO+YvjhLcesXEGb6UiUKbXsCVb/l9rJ2Xxgz9cw8AAA==" },
+    "/images/Aalaqaat/Artboard 6.png": { width: 1920, height: 1080, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRjIAAABXRUJQVlA4ICYAAACwAQCdASoQAAkABABoJaQAAueETMwAAP701i3iba44zfJthagAAA==" },
+    "/images/Aalaqaat/Artboard 7.jpg": { width: 1920, height: 1080, color: "#616a70", placeholder: "data:image/webp;base64,UklGRkwAAABXRUJQVlA4IEAAAAAQAgCdASoQAAkABABoJQBWACPszq+mrOoAAP114ReOJpzUmGA7qwEjgkeaBWxyUFHLbq0Sf5sLSgbTbOGkQAAA" },
+    "/images/Aalaqaat/Artboard 8.png": { width: 1920, height: 1080, color: "#343535", placeholder: "data:image/webp;base64,UklGRk4AAABXRUJQVlA4IEIAAACwAQCdASoQAAkABABoJaQAAxcYJuUgAP6F/waKUEWmpgovgUCJR/csBGFuP8j7sb1YavD9CKCj0HR6pSvwbAAAAAA=" },
+    "/images/Aalaqaat/Artboard 9.png": { width: 1920, height: 1080, color: "#cfc7bc", placeholder: "data:image/webp;base64,UklGRnAAAABXRUJQVlA4WAoAAAAQAAAADwAACAAAQUxQSA0AAAABD9D/iAjMf0T/YwAAAFZQOCA8AAAA8AEAnQEqEAAJAAQAaCWMAuwBA/2cmxcAAP7ZXBtbTyrdbcxpR9kNPp0j8fD0yfZKB34bwOwue1C6AAAA" },
+  },
+}
@@ -0,0 +1,158 @@
+// Portfolio Data - Al Hawari (loaded on demand from projects.index.js)
+export default {
+  id: "al-hawari",
+  name: "Al Hawari",
+  type: "Social Media + Branding",
+  description: `I was responsible for the full rebranding of Al Hawari's famous juice shop in Beirut. I focused on blending 2 key elements into it; 1st was the old nostalgic Beirut feel as it Al Hawari's history is a big plus against its competitors. 2nd key element was having a very appealing visual style, using strong colors with minimal design to give it an aesthetic sense its target audiences would notice and enjoy.`,
+  thumbnail: "/images/Al Hawari/Artboard 40.jpg",
+  images: [
+    "/images/Al Hawari/Artboard 1.png",
+    "/images/Al Hawari/Artboard 10.png",
+    "/images/Al Hawari/Artboard 11.png",
+    "/images/Al Hawari/Artboard 12.png",
+    "/images/Al Hawari/Artboard 13.jpg",
+    "/images/Al Hawari/Artboard 14.png",
+    "/images/Al Hawari/Artboard 15.jpg",
+    "/images/Al Hawari/Artboard 16.png",
+    "/images/Al Hawari/Artboard 17.jpg",
+    "/images/Al Hawari/Artboard 18.jpg",
+    "/images/Al Hawari/Artboard 19.jpg",
+    "/images/Al Hawari/Artboard 2.jpg",
+    "/images/Al Hawari/Artboard 20.png",
+    "/images/Al Hawari/Artboard 21.jpg",
+    "/images/Al Hawari/Artboard 22.png",
+    "/images/Al Hawari/Artboard 23.png",
+    "/images/Al Hawari/Artboard 24.png",
+    "/images/Al Hawari/Artboard 25.png",
+    "/images/Al Hawari/Artboard 26.png",
+    "/images/Al Hawari/Artboard 27.jpg",
+    "/images/Al Hawari/Artboard 28.png",
+    "/images/Al Hawari/Artboard 29.png",
+    "/images/Al Hawari/Artboard 3.png",
+    "/images/Al Hawari/Artboard 30.jpg",
+    "/images/Al Hawari/Artboard 31.png",
+    "/images/Al Hawari/Artboard 32.png",
+    "/images/Al Hawari/Artboard 33.png",
+    "/images/Al Hawari/Artboard 34.png",
+    "/images/Al Hawari/Artboard 35.png",
+    "/images/Al Hawari/Artboard 36.jpg",
+    "/images/Al Hawari/Artboard 37.jpg",
+    "/images/Al Hawari/Artboard 38.png",
+    "/images/Al Hawari/Artboard 39.png",
+    "/images/Al Hawari/Artboard 4.jpg",
+    "/images/Al Hawari/Artboard 40.jpg",
+    "/images/Al Hawari/Artboard 41.png",
+    "/images/Al Hawari/Artboard 42.jpg",
+    "/images/Al Hawari/Artboard 43.png",
+    "/images/Al Hawari/Artboard 44.jpg",
+    "/images/Al Hawari/Artboard 45.png",
+    "/images/Al Hawari/Artboard 46.png",
+    "/images/Al Hawari/Artboard 47.png",
+    "/images/Al Hawari/Artboard 48.png",
+    "/images/Al Hawari/Artboard 5.jpg",
+    "/images/Al Hawari/Artboard 6.png",
+    "/images/Al Hawari/Artboard 7.png",
+    "/images/Al Hawari/Artboard 8.png",
+    "/images/Al Hawari/Artboard 9.jpg",
+  ],
+  hashes: {
+    "/images/Al Hawari/Artboard 1.png": "ec73ee39",
+    "/images/Al Hawari/Artboard 10.png": "a47e72c1",
+    "/images/Al Hawari/Artboard 11.png": "e9793bc0",
+    "/images/Al Hawari/Artboard 12.png": "faf8b5ef",
+    "/images/Al Hawari/Artboard 13.jpg": "dd495184",
+    "/images/Al Hawari/Artboard 14.png": "16d5ab71",
+    "/images/Al Hawari/Artboard 15.jpg": "5204d897",
+    "/images/Al Hawari/Artboard 16.png": "81af7818",
+    "/images/Al Hawari/Artboard 17.jpg": "73545757",
+    "/images/Al Hawari/Artboard 18.jpg": "d1a7efcf",
+    "/images/Al Hawari/Artboard 19.jpg": "4c8f4be2",
+    "/images/Al Hawari/Artboard 2.jpg": "3038cf67",
+    "/images/Al Hawari/Artboard 20.png": "106d70a1",
+    "/images/Al Hawari/Artboard 21.jpg": "507c0615",
+    "/images/Al Hawari/Artboard 22.png": "3ccc846f",
+    "/images/Al Hawari/Artboard 23.png": "238e21e5",
+    "/images/Al Hawari/Artboard 24.png": "bfe4ebcc",
+    "/images/Al Hawari/Artboard 25.png": "f70fafda",
+    "/images/Al Hawari/Artboard 26.png": "4e748a11",
+    "/images/Al Hawari/Artboard 27.jpg": "3a92ed55",
+    "/images/Al Hawari/Artboard 28.png": "22683ea0",
+    "/images/Al Hawari/Artboard 29.png": "09e8a28c",
+    "/images/Al Hawari/Artboard 3.png": "d48116f9",
+    "/images/Al Hawari/Artboard 30.jpg": "1f0d3fb0",
+    "/images/Al Hawari/Artboard 31.png": "9825acdb",
+    "/images/Al Hawari/Artboard 32.png": "3445007a",
+    "/images/Al Hawari/Artboard 33.png": "7ad18ce9",
+    "/images/Al Hawari/Artboard 34.png": "635761e5",
+    "/images/Al Hawari/Artboard 35.png": "b94443e6",
+    "/images/Al Hawari/Artboard 36.jpg": "b2e30071",
+    "/images/Al Hawari/Artboard 37.jpg": "48decda1",
+    "/images/Al Hawari/Artboard 38.png": "a8576ace",
+    "/images/Al Hawari/Artboard 39.png": "b72b9a41",
+    "/images/Al Hawari/Artboard 4.jpg": "90f142dc",
+    "/images/Al Hawari/Artboard 40.jpg": "b8f64f74",
+    "/images/Al Hawari/Artboard 41.png": "377ea783",
+    "/images/Al Hawari/Artboard 42.jpg": "88bc5ce6",
+    "/images/Al Hawari/Artboard 43.png": "708269da",
+    "/images/Al Hawari/Artboard 44.jpg": "12205ef1",
+    "/images/Al Hawari/Artboard 45.png": "c2340009",
+    "/images/Al Hawari/Artboard 46.png": "973cfb6c",
+    "/images/Al Hawari/Artboard 47.png": "4bcac107",
+    "/images/Al Hawari/Artboard 48.png": "c2052cd8",
+    "/images/Al Hawari/Artboard 5.jpg": "b69ac036",
+    "/images/Al Hawari/Artboard 6.png": "97e877e3",
+    "/images/Al Hawari/Artboard 7.png": "59daa913",
+    "/images/Al Hawari/Artboard 8.png": "19828dd9",
+    "/images/Al Hawari/Artboard 9.jpg": "e5b4787f",
+  },
+  imageMeta: {
+    "/images/Al Hawari/Artboard 1.png": { width: 1920, height: 1080, color: "#81a374", placeholder: "data:image/webp;base64,UklGRjwAAABXRUJQVlA4IDAAAACwAQCdASoQAAkABABoJQBOgB4IeOIAANsaY+UmSCphZtqMDabDEMIz1pjSt4YgAAA=" },
+    "/images/Al Hawari/Artboard 10.png": { width: 1920, height: 1080, color: "#34b5b6", placeholder: "data:image/webp;base64,UklGRkgAAABXRUJQVlA4IDwAAADQAQCdASoQAAkABABoJbACdAEUf/jKAAD+9hDZPAovNbZjjOWySCemPVHmPqPVnneOV5qY7L5/PVOgAAA=" },
+    "/images/Al Hawari/Artboard 11.png": { width: 1920, height: 1080, color: "#34b5b6", placeholder: "data:image/webp;base64,UklGRjQAAABXRUJQVlA4ICgAAABwAQCdASoQAAkABABoJagCdAFAAAD+wbacOzsoE/IP/AfiD+LZfAAA" },
+    "/images/Al Hawari/Artboard 12.png": { width: 1920, height: 1080, color: "#34b5b6", placeholder: "data:image/webp;base64,UklGRjIAAABXRUJQVlA4ICYAAABwAQCdASoQAAkABUBoJagCdAFAAAD+ya8KKvV6Mr/Fv2j/d+DgAA==" },
+    "/images/Al Hawari/Artboard 13.jpg": { width: 1920, height: 1080, color: "#99c286", placeholder: "data:image/webp;base64,UklGRjIAAABXRUJQVlA4ICYAAABwAQCdASoQAAkABABoJYgCdAF1AAD+6UmrpPgnEl04X8IwzrAAAA==" },
+    "/images/Al Hawari/Artboard 14.png": { width: 1920, height: 1080, color: "#5a615b", placeholder: "data:image/webp;base64,UklGRlQAAABXRUJQVlA4IEgAAADwAQCdASoQAAkABABoJYwAAvau1VuJSIAA/sYDP0udSs+0s/8hzJCq1SaPi4Gvu+qQyGivw9LA+IniocyrPVPik4drItvFwAA=" },
+    "/images/Al Hawari/Artboard 15.jpg": { width: 1920, height: 1080, color: "#3a5337", placeholder: "data:image/webp;base64,UklGRlIAAABXRUJQVlA4IEYAAAAQAgCdASoQAAkABABoJZgCdAEerrItP2YAAMtAhEewDR6VTzvW+iHIg3y1wOHHSmFVqH+ZubTi2GzmQv+kumEZ/k/VfAAA" },
+    "/images/Al Hawari/Artboard 16.png": { width: 1920, height: 1080, color: "#212222", placeholder: "data:image/webp;base64,UklGRoYAAABXRUJQVlA4WAoAAAAQAAAADwAACAAAQUxQSBIAAAABD3D//4iIIBBIQt9+hYj+hx5WUDggTgAAABACAJ0BKhAACQAEAGgliAJ0Biy1WJskE0AA+EP7CeTXE8ycBPtYvtlxFKIxoKQ5+fwoT+5pcWGfJSIdxf25JrdJA8txijQGJODuooAAAA==" },
+    "/images/Al Hawari/Artboard 17.jpg": { width: 1920, height: 1080, color: "#c4c4c3", placeholder: "data:image/webp;base64,UklGRkIAAABXRUJQVlA4IDYAAACwAQCdASoQAAkABABoJaQAAp0S++dAAP7h/sYf7CoiBjZdrM/9RHA9+DvbS+tremWDMEAtgAA=" },
+    "/images/Al Hawari/Artboard 18.jpg": { width: 1920, height: 1080, color: "#25241f", placeholder: "data:image/webp;base64,UklGRkgAAABXRUJQVlA4IDwAAAAQAgCdASoQAAkABABoJYwAAxbR7qm2prVAAP7eGHq+zFJAaZAQeKMXcM85vOAmZbBmUG/PRryFONTwAAA=" },
+    "/images/Al Hawari/Artboard 19.jpg": { width: 1920, height: 1080, color: "#d5d9da", placeholder: "data:image/webp;base64,UklGRkgAAABXRUJQVlA4IDwAAADQAQCdASoQAAkABABoJZQAAtq5S9KAAAD+53D0kVtirAE14fVTtOCW8bLmPQdpvr/62tBHUJQS62E0AgA=" },
+    "/images/Al Hawari/Artboard 2.jpg": { width: 1920, height: 1080, color: "#9bcb8a", placeholder: "data:image/webp;base64,UklGRlAAAABXRUJQVlA4IEQAAADQAQCdASoQAAkABABoJZgCdADHdKwwgAD+xX+NzkkHCULCT+ymf7DyCGExVUjfCPTtPKlu5JmsKlF605lLk4HUPYAAAA==" },
+    "/images/Al Hawari/Artboard 20.png": { width: 1920, height: 1080, color: "#d3dedf", placeholder: "data:image/webp;base64,UklGRmoAAABXRUJQVlA4WAoAAAAQAAAADwAACAAAQUxQSBEAAAABD9D/iAgIBJLQt18hov+hBwBWUDggMgAAANABAJ0BKhAACQAEAGgllAACrgnfUCLAAP7qozRsxkVODpEMaC+tY08r13uZblVtgAAA" },
+    "/images/Al Hawari/Artboard 21.jpg": { width: 1920, height: 1080, color: "#7aa2a0", placeholder: "data:image/webp;base64,UklGRkIAAABXRUJQVlA4IDYAAACwAQCdASoQAAkABABoJYgCdAChVMAAANrZ8VPcfRaNDGMFP/wvTkJNoOJ6iqbeCcjYwmkPYAA=" },
+    "/images/Al Hawari/Artboard 22.png": { width: 1920, height: 1080, color: "#6e9896", placeholder: "data:image/webp;base64,UklGRmwAAABXRUJQVlA4WAoAAAAQAAAADwAACAAAQUxQSBEAAAABD9D/iAgIBJLQt18hov+hBwBWUDggNAAAALABAJ0BKhAACQAEAGgliAJ0ALHlsAAA2tnxU9x9Fo0MatDxjfiU9GM+Lgsr1O2OkultcAA=" },
+    "/images/Al Hawari/Artboard 23.png": { width: 1920, height: 1080, color: "#34b5b6", placeholder: "data:image/webp;base64,UklGRkoAAABXRUJQVlA4ID4AAACQAQCdASoQAAkABABoJbACdAEDLGgA9yFiVdCqvDoPfu9SNTi5LrBklsVH5rWUzz5Bfzjx9NuhJn5ynQAAAA==" },
+    "/images/Al Hawari/Artboard 24.png": { width: 1920, height: 1080, color: "#34b5b6", placeholder: "data:image/webp;base64,UklGRkQAAABXRUJQVlA4IDgAAABwAQCdASoQAAkABABoJbACdAAAAAD+a9dIsw9Xv5kk7UodFc8bn3O0e/hq0mkm5/i39kfzlOgAAA==" },
+    "/images/Al Hawari/Artboard 25.png": { width: 1920, height: 1080, color: "#fbdf14", placeholder: "data:image/webp;base64,UklGRnIAAABXRUJQVlA4WAoAAAAQAAAADwAACAAAQUxQSBIAAAABD9D/iAgIBJJQ9hddIaL/6QNWUDggOgAAAHABAJ0BKhAACQAEAGglsAJ0AUAAAP7vQ8sotObccA5jrKDWb/yrcqZfv9+oXmce3/gj0A4ElbZ3YAA=" },
+    "/images/Al Hawari/Artboard 26.png": { width: 1920, height: 1080, color: "#fbdf14", placeholder: "data:image/webp;base64,UklGRnIAAABXRUJQVlA4WAoAAAAQAAAADwAACAAAQUxQSBIAAAABD9D/iAgIBJJQ9hddIaL/6QNWUDggOgAAAHABAJ0BKhAACQAEAGglsAJ0AUAAAP7vHqI6jDW9vhiaux08/+Qa31niYMcv/y6/6x9/u6T9aYsAAAA=" },
+    "/images/Al Hawari/Artboard 27.jpg": { width: 1920, height: 1080, color: "#839c6e", placeholder: "data:image/webp;base64,UklGRjwAAABXRUJQVlA4IDAAAACwAQCdASoQAAkABABoJZACdADglXiAAPyjsX/SVLPOCZ8txOjHbNxhcYTSThdVwAA=" },
+    "/images/Al Hawari/Artboard 28.png": { width: 1920, height: 1080, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRmAAAABXRUJQVlA4IFQAAADQAQCdASoQAAkABABoJaQAAjuE4U7vQAD+8jNJdfYaepda5DfqGbfwxZlaYn8/i9WHqG9tqxOhXEqUVCZKS+3DL/vGp3RZOheP0fffb9kxkoOAAAA=" },
+    "/images/Al Hawari/Artboard 29.png": { width: 1920, height: 1080, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRl4AAABXRUJQVlA4IFIAAACwAQCdASoQAAkABABoJaQAAjuEyEIQAP7yM5Q0H0eAPivODo4jFsHZq44hLvfn1OQilYtwWArcVTlAkvrhN6aO3NY2RSPx/YZtPdMACkIAAAAA" },
+    "/images/Al Hawari/Artboard 3.png": { width: 1920, height: 1080, color: "#d4decb", placeholder: "data:image/webp;base64,UklGRowAAABXRUJQVlA4WAoAAAAQAAAADwAACAAAQUxQSBMAAAABD/D+/4iIIBZM8pfemUJE/7MFAFZQOCBSAAAAEAIAnQEqEAAJAAQAaCWIAnQGKyVHuFTYAADODqW1a/mV6IhwZ+H08j9N0M0EwI9XmMgODdoN1M7kLFKs3TfGmPifY7sex0nUQpOFFyA7kKIAAA==" },
+    "/images/Al Hawari/Artboard 30.jpg": { width: 1920, height: 1080, color: "#8da977", placeholder: "data:image/webp;base64,UklGRkAAAABXRUJQVlA4IDQAAADwAQCdASoQAAkABABoJYgCdADp+4HE7QAA/rWFsWmlsinalX76UpMTKLCUsYTSTntIcaAA" },
+    "/images/Al Hawari/Artboard 31.png": { width: 1920, height: 1080, color: "#000000", placeholder: "data:image/webp;base64,UklGRu4AAABXRUJQVlA4WAoAAAAQAAAADwAACAAAQUxQSGUAAAABcFpr29q8Yc4MkZmBaYEoaKtYoaQBOgFXc1VsV4r6JyjDCBExAfirmbSSWqNjfKJliRckmXtXLybdYogvF7fr7nb5rVvWR2X6MiOnOdkOSGtK8hdYYD1GjUXdEd9wAEdRLAUWAABWUDggYgAAAPABAJ0BKhAACQAEAGglsAJ0OIzBLmjnQADI2ZP9ixBfHNE/C9Y8E55euwICjX+VqLqvvfwz3wgL6anX0YKi28c4S7x6I/wOy/n4/Bv5pxyOvXEwpIuMXn/Gu/Q2gwQ8AAAA" },
+    "/images/Al Hawari/Artboard 32.png": { width: 1920, height: 1080, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRkQAAABXRUJQVlA4IDgAAADQAQCdASoQAAkABABoJQBdgB7HmDTgAAD+9R2X9lZUnP7XeyqvgefeiMQn4M89cZ5KCB1f5QAAAA==" },
+    "/images/Al Hawari/Artboard 33.png": { width: 1920, height: 1080, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRkIAAABXRUJQVlA4IDYAAACwAQCdASoQAAkABABoJaAC7ADwlrAAAP72E5KmD1AkaU0FUlJKy99G3pEB5LuGl35/qlv9QAA=" },
+    "/images/Al Hawari/Artboard 34.png": { width: 1920, height: 1080, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRkwAAABXRUJQVlA4IEAAAADQAQCdASoQAAkABABoJYgC7ADw0KDmAAD+9R2X9SZ9xM5dsMHT4TN5KhOO/WM1ET6MWO4tzCE0tdLWSYtAIAAA" },
+    "/images/Al Hawari/Artboard 35.png": { width: 1920, height: 1080, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRjwAAABXRUJQVlA4IDAAAACwAQCdASoQAAkABABoJZQAApMUJ/JAAP72EzRts15XqMD/G+s7aiHcKxAbdGqkCAA=" },
+    "/images/Al Hawari/Artboard 36.jpg": { width: 1920, height: 1080, color: "#90af7a", placeholder: "data:image/webp;base64,UklGRjgAAABXRUJQVlA4ICwAAADQAQCdASoQAAkABABoJZACdAEOSs8oAAD98iVe6Awius/pvu9y0UiSMM6wAA==" },
+    "/images/Al Hawari/Artboard 37.jpg": { width: 1920, height: 1080, color: "#85ae76", placeholder: "data:image/webp;base64,UklGRi4AAABXRUJQVlA4ICIAAABwAQCdASoQAAkABABoJYgCdAFAAAD+3URYYTBOhMeiYAAA" },
+    "/images/Al Hawari/Artboard 38.png": { width: 1920, height: 1080, color: "#9acb89", placeholder: "data:image/webp;base64,UklGRjwAAABXRUJQVlA4IDAAAABwAQCdASoQAAkABABoJagCdAFAAAD+6qsxZy4XY5l6mMXL8LNsMKmdMJ71pjKYAAA=" },
+    "/images/Al Hawari/Artboard 39.png": { width: 1920, height: 1080, color: "#9acb89", placeholder: "data:image/webp;base64,UklGRlQAAABXRUJQVlA4IEgAAADwAQCdASoQAAkABABoJaACdADcIQDZ3zQA/ltmBk0aPtWQ/kA2a16U5VsJDoBA4WYevk955konR3BFxhNJvNjxJldMHKQAAAA=" },
+    "/images/Al Hawari/Artboard 4.jpg": { width: 1920, height: 1080, color: "#4d4e46", placeholder: "data:image/webp;base64,UklGRl4AAABXRUJQVlA4IFIAAACwAQCdASoQAAkABABoJQBOgBX4p4cAAPkIFZql6xCLOTfQAMgzmnaKy2WFMJRqnAl1jrEA1icRv5UlbEJm1XuZ77ZzDIJPaijYFCyA9TDQgAAA" },
+    "/images/Al Hawari/Artboard 40.jpg": { width: 1920, height: 1080, color: "#c34b3d", placeholder: "data:image/webp;base64,UklGRlgAAABXRUJQVlA4IEwAAACwAQCdASoQAAkABABoJbACdACfs+kAAP0hdlpZ62LZJPxsmLtKs8xZXQ7F7p36SJLnFCupT9NOwqqRCRhFj9eM09RmcFJ2DglIAAAA" },
+    "/images/Al Hawari/Artboard 41.png": { width: 1920, height: 1080, color: "#264747", placeholder: "data:image/webp;base64,UklGRqAAAABXRUJQVlA4WAoAAAAQAAAADwAACAAAQUxQSDcAAAABYBzbVhPiMkOzrCkAs3YWi8n6WoiICdBWeedVVJK85m7op6lvynvaD3BeoQWaoRXKXfmftCAgAFZQOCBCAAAA8AEAnQEqEAAJAAQAaCWQAnQBEQHKtNQAAMtPAs9f0mZsYReM30yMf9tGo6eJudx/T3XiHtHwXP+ywsWysYZe4AAA" },
+    "/images/Al Hawari/Artboard 42.jpg": { width: 1920, height: 1080, color: "#52b4b5", placeholder: "data:image/webp;base64,UklGRlIAAABXRUJQVlA4IEYAAACwAQCdASoQAAkABABoJaACdACXpXeIAP6OHRHSlA+vsKsxFE2S25VnVxaHX1121ukLtE/mHZ8QvAKWrrvHEuRlHTCqAAAA" },
+    "/images/Al Hawari/Artboard 43.png": { width: 1920, height: 1080, color: "#34b5b6", placeholder: "data:image/webp;base64,UklGRkQAAABXRUJQVlA4IDgAAADQAQCdASoQAAkABABoJbACdAECl1yLeAD3K6eMPRRugIF5L64oP+s14pui/mVKj9DdpP/YFiAAAA==" },
+    "/images/Al Hawari/Artboard 44.jpg": { width: 1920, height: 1080, color: "#8eae7a", placeholder: "data:image/webp;base64,UklGRj4AAABXRUJQVlA4IDIAAACQAQCdASoQAAkABABoJYl2ARgAogAA/uTpej2SKB48IwrsbkGDU8JcJ6sMJgnQi7iAAA==" },
+    "/images/Al Hawari/Artboard 45.png": { width: 1920, height: 1080, color: "#f7fbfb", placeholder: "data:image/webp;base64,UklGRiYAAABXRUJQVlA4IBoAAAAwAQCdASoQAAkABABoJaQAA3AA/vH+8CAAAA==" },
+    "/images/Al Hawari/Artboard 46.png": { width: 1920, height: 1080, color: "#cfe6c7", placeholder: "data:image/webp;base64,UklGRjwAAABXRUJQVlA4IDAAAADwAQCdASoQAAkABABoJYwCdAEO+TovvgAA/u1Qc7zM7SyfaC4TOwUtXsc3fknwAAA=" },
+    "/images/Al Hawari/Artboard 47.png": { width: 1920, height: 1080, color: "#3cb7b8", placeholder: "data:image/webp;base64,UklGRjIAAABXRUJQVlA4ICYAAABwAQCdASoQAAkABABoJaACdAFAAAD+yL8GW2xUfxb+yPzXO4AAAA==" },
+    "/images/Al Hawari/Artboard 48.png": { width: 1920, height: 1080, color: "#8aa874", placeholder: "data:image/webp;base64,UklGRnIAAABXRUJQVlA4WAoAAAAQAAAADwAACAAAQUxQSBsAAAABFyAmTfrn3S3WiIhwEJAQfy2Toy5E9D977AEAVlA4IDAAAACQAQCdASoQAAkABABoJZGDrRgAiwAA/uGUY9HdsXk6Ly4TxtkzoxhNJbbyfhUAAAA=" },
+    "/images/Al Hawari/Artboard 5.jpg": { width: 1920, height: 1080, color: "#8ba979", placeholder: "data:image/webp;base64,UklGRjoAAABXRUJQVlA4IC4AAACQAQCdASoQAAkABABoJYmDrRgAiwAA/uGf3FXBCmXdP1N37BWGEwToRhnWAAAA" },
+    "/images/Al Hawari/Artboard 6.png": { width: 1920, height: 1080, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRiwAAABXRUJQVlA4ICAAAAAwAQCdASoQAAkABABoJZwAA3AA/vJPElXxQNslG+rAAA==" },
+    "/images/Al Hawari/Artboard 7.png": { width: 1920, height: 1080, color: "#9acb89", placeholder: "data:image/webp;base64,UklGRjYAAABXRUJQVlA4ICoAAABwAQCdASoQAAkABABoJZgCdAFAAAD+6qzdjDzmFW+eJqo7U3IxhNJHYAA=" },
+    "/images/Al Hawari/Artboard 8.png": { width: 1920, height: 1080, color: "#34b5b6", placeholder: "data:image/webp;base64,UklGRlAAAABXRUJQVlA4IEQAAACQAQCdASoQAAkABABoJbACdADuQAAA/vYT3n9Dd6TcA8wSyrsBLa9j18DxdpCDmlEHIPjt0pf9hrVGe0wk2r85ToAAAA==" },
+    "/images/Al Hawari/Artboard 9.jpg": { width: 1920, height: 1080, color: "#94b282", placeholder: "data:image/webp;base64,UklGRjYAAABXRUJQVlA4ICoAAACwAQCdASoQAAkABABoJZACdADOaNQAAPxdWgiZyJFmMgW9qQ5avCncAAA=" },
+  },
+}
@@ -0,0 +1,32 @@
+// Portfolio Data - ASH (loaded on demand from projects.index.js)
+export default {
+  id: "ash",
+  name: "ASH",
+  type: "Social Media",
+  description: `ASH Vodka is a Lebanese Vodka Brand that is bold, young, elegant and proud.`,
+  thumbnail: "/images/ASH/ASH 4.jpg",
+  images: [
+    "/images/ASH/ASH 1.jpg",
+    "/images/ASH/ASH 2.jpg",
+    "/images/ASH/ASH 3.jpg",
+    "/images/ASH/ASH 4.jpg",
+    "/images/ASH/ASH 5.jpg",
+    "/images/ASH/ASH 6.jpg",
+  ],
+  hashes: {
+    "/images/ASH/ASH 1.jpg": "9673e31b",
+    "/images/ASH/ASH 2.jpg": "0c9d1340",
+    "/images/ASH/ASH 3.jpg": "d8693166",
+    "/images/ASH/ASH 4.jpg": "30a33791",
+    "/images/ASH/ASH 5.jpg": "161bf562",
+    "/images/ASH/ASH 6.jpg": "cfec631b",
+  },
+  imageMeta: {
+    "/images/ASH/ASH 1.jpg": { width: 1080, height: 1350, color: "#010c15", placeholder: "data:image/webp;base64,UklGRmoAAABXRUJQVlA4IF4AAACQAwCdASoQABQAPxFysFAsJqSisAgBgCIJQBOmUABp0BjC8fAgAPyy2PycAj1ZZf024zY+cOw+zJ0U5uA4ATM+dLOjHiYFj4NAbsL9Cb+t9+tVvgBubIg2hnsY7oAA" },
+    "/images/ASH/ASH 2.jpg": { width: 1080, height: 1350, color: "#182826", placeholder: "data:image/webp;base64,UklGRoQAAABXRUJQVlA4IHgAAAAwBACdASoQABQAPxFysFAsJqSisAgBgCIJYgC072pQNciuy+JgEn7NJLAA/uxI2DraL/nv9VPZFF1jMcPk4kCeryS6j8JqJ0bhvQ8HEjo7v8P5d1zeTlqarQssLO2ygI4FfzCOsvpekXxR7nfuiRAa/ZyE474f0AA=" },
+    "/images/ASH/ASH 3.jpg": { width: 1080, height: 1350, color: "#0d0705", placeholder: "data:image/webp;base64,UklGRoQAAABXRUJQVlA4IHgAAAAQBACdASoQABQAPxFysFAsJqSisAgBgCIJQBadBDvg8SJxUvwpyjKFgAD+6SMIxLANHjFRvIw71EQBLllcf25MX2tbf9jyihhXGNrZ5CfIUZTrkF3JUfC/V65Sik+evO570hVZ4oMu3a1QbX8KCtFnrkGZf/QAAAA=" },
+    "/images/ASH/ASH 4.jpg": { width: 1080, height: 1350, color: "#404471", placeholder: "data:image/webp;base64,UklGRnoAAABXRUJQVlA4IG4AAADwAwCdASoQABQAPxFysFAsJqSisAgBgCIJagC7ACLvsJl8sL+oIbUAAP7oJ6nePGQRmdfGXklIqKjHiACxZo1J4b5KuN4sngW649PcNLjyGUiDE5Qq/VZUdxMCgr5cdAtXsUmWTVJgM0V94wDYAA==" },
+    "/images/ASH/ASH 5.jpg": { width: 1080, height: 1350, color: "#2a2a2f", placeholder: "data:image/webp;base64,UklGRmIAAABXRUJQVlA4IFYAAADQAwCdASoQABQAPxFysFAsJqSisAgBgCIJQAAKVjYFINj0Oium6BAA/ujvrPyZPNib5KUdEAx3ScfI/WRmHwGZREmMyr4+NYq97vKonwJYJQ1TjAAAAA==" },
+    "/images/ASH/ASH 6.jpg": { width: 1080, height: 1350, color: "#0c1112", placeholder: "data:image/webp;base64,UklGRoYAAABXRUJQVlA4IHoAAABQAwCdASoQABQAPxFysFAsJqSisAgBgCIJQAAHQzyRmsiIAAD+7IJuFeEbyV3+aaKEHBe+aGTHzuXBe3y+i/nXt/8Drwe/YiEEXSWHPrQzlc/h0/wgjZqwAphL5llfRryCll2oZAsAS+zZzSpH8H1vXkHMG66Jok7AAA==" },
+  },
+}
@@ -0,0 +1,22 @@
+// Portfolio Data - Aveeno (loaded on demand from projects.index.js)
+export default {
+  id: "aveeno",
+  name: "Aveeno",
+  type: "Social Media",
+  thumbnail: "/images/Aveeno/Aveeno-1-Row-Grid_01.jpg",
+  images: [
+    "/images/Aveeno/Aveeno-1-Row-Grid_01.jpg",
+    "/images/Aveeno/Aveeno-1-Row-Grid_02.jpg",
+    "/images/Aveeno/Aveeno-1-Row-Grid_03.jpg",
+  ],
+  hashes: {
+    "/images/Aveeno/Aveeno-1-Row-Grid_01.jpg": "741ee84e",
+    "/images/Aveeno/Aveeno-1-Row-Grid_02.jpg": "405d8496",
+    "/images/Aveeno/Aveeno-1-Row-Grid_03.jpg": "34d4ed5d",
+  },
+  imageMeta: {
+    "/images/Aveeno/Aveeno-1-Row-Grid_01.jpg": { width: 1080, height: 1350, color: "#f8f2e6", placeholder: "data:image/webp;base64,UklGRn4AAABXRUJQVlA4IHIAAADwAwCdASoQABQAPxFysFAsJqSisAgBgCIJYgC06CHKUIbm7GOyhIrgAP7qcKfQs/3sLVWZW7DVWkQDYghmWoM6BAJ53ptFukHQ2KnnpFSXQjcOVB+qwzB52MRNdDz9Y/nxnCeU4dClN3IRm5jfIp3R4AA=" },
+    "/images/Aveeno/Aveeno-1-Row-Grid_02.jpg": { width: 1080, height: 1350, color: "#f8f2e6", placeholder: "data:image/webp;base64,UklGRk4AAABXRUJQVlA4IEIAAABQAwCdASoQABQAPxFysVCsJqSisAgBgCIJZQDG9CHf448xAAD+6mhRO2j75Y+fhgaDatyQ8gmeh1rYwEIPFdPaAAA=" },
+    "/images/Aveeno/Aveeno-1-Row-Grid_03.jpg": { width: 1080, height: 1350, color: "#60753c", placeholder: "data:image/webp;base64,UklGRmAAAABXRUJQVlA4IFQAAAAwAwCdASoQABQAPxFysFAsJqSisAgBgCIJQBadAsZ1kXQAAP0cEZjjQ1ya2Jk25xK2tGt1J3I5P/FD2DvWXGxefJSd7t5I7kRGluvAeFpoLoAAAAA=" },
+  },
+}
@@ -0,0 +1,59 @@
+// Portfolio Data - Avene (loaded on demand from projects.index.js)
+export default {
+  id: "avene",
+  name: "Avene",
+  type: "Art Direction",
+  description: `Directed the visual art direction for Avene's digital presence, focusing on clean, dermatological aesthetics that highlight product purity and efficacy.`,
+  thumbnail: "/images/Avene/C2.jpg",
+  images: [
+    "/images/Avene/A1.jpg",
+    "/images/Avene/A2.jpg",
+    "/images/Avene/A3.jpg",
+    "/images/Avene/A4.jpg",
+    "/images/Avene/A5.jpg",
+    "/images/Avene/A6.jpg",
+    "/images/Avene/B1.jpg",
+    "/images/Avene/B2.jpg",
+    "/images/Avene/B3.jpg",
+    "/images/Avene/B4.jpg",
+    "/images/Avene/B5.jpg",
+    "/images/Avene/B6.jpg",
+    "/images/Avene/C1.jpg",
+    "/images/Avene/C2.jpg",
+    "/images/Avene/C3.jpg",
+  ],
+  hashes: {
+    "/images/Avene/A1.jpg": "37adf3be",
+    "/images/Avene/A2.jpg": "8f643f86",
+    "/images/Avene/A3.jpg": "ebc35240",
+    "/images/Avene/A4.jpg": "489389c6",
+    "/images/Avene/A5.jpg": "b36f2d19",
+    "/images/Avene/A6.jpg": "39353174",
+    "/images/Avene/B1.jpg": "69b6ab38",
+    "/images/Avene/B2.jpg": "ae41c1aa",
+    "/images/Avene/B3.jpg": "ce3318d6",
+    "/images/Avene/B4.jpg": "7b7e3b8f",
+    "/images/Avene/B5.jpg": "cb0479c3",
+    "/images/Avene/B6.jpg": "904140d1",
+    "/images/Avene/C1.jpg": "1f98f438",
+    "/images/Avene/C2.jpg": "b4fc95b8",
+    "/images/Avene/C3.jpg": "20483c4a",
+  },
+  imageMeta: {
+    "/images/Avene/A1.jpg": { width: 1800, height: 2250, color: "#2fc9e6", placeholder: "data:image/webp;base64,UklGRn4AAABXRUJQVlA4IHIAAAAQBACdASoQABQAPxFysFCsJqSisAgBgCIJbACdMoRwACnEcjytojpXUAD9zp15/I9SG2IeAthMKfkXexW2u78bTzlOh6oGY6zFLfwG2YGvN700pKI62T6rKT+EOOSQRT05n0tffCRCOPvyIFPigFsfAAA=" },
+    "/images/Avene/A2.jpg": { width: 1800, height: 2250, color: "#acddf9", placeholder: "data:image/webp;base64,UklGRmIAAABXRUJQVlA4IFYAAADQAwCdASoQABQAPxFysFCsJqSisAgBgCIJagCdMoADTr4xhph0VQAA/t7C1UvXk7MMvmC7ZLzrqN2LaQtC6RjiLfQZHctkprtD/GgMAJGZRa7LJuMgAA==" },
+    "/images/Avene/A3.jpg": { width: 1800, height: 2250, color: "#d1b9a3", placeholder: "data:image/webp;base64,UklGRnAAAABXRUJQVlA4IGQAAACwAwCdASoQABQAPxFysVCsJqSisAgBgCIJbACdMoMYAGHYsA3yAAD+5qoIttPal4+vdzfGFn+oYQIk6q6ovxZYTBOmzDv61dGs7iBJBGJwp7FY6U2pJ8tk2t3sa351NSC2gAAA" },
+    "/images/Avene/A4.jpg": { width: 1800, height: 2250, color: "#2682d4", placeholder: "data:image/webp;base64,UklGRmIAAABXRUJQVlA4IFYAAACwAwCdASoQABQAPxFysFAsJqSisAgBgCIJbACdH8ABHvw1ipOUAAD9Ea0rgRmshUtarbenMft5zZdEV2+IvKrg3OKeiVb5d3rxJjsV0kjRxxik6xtIAA==" },
+    "/images/Avene/A5.jpg": { width: 1800, height: 2250, color: "#afdeff", placeholder: "data:image/webp;base64,UklGRkoAAABXRUJQVlA4ID4AAABwAwCdASoQABQAPxFwsFAsJiSisAgBgCIJYgCdMoAEZgC3XgAA/uxOOcEyaMhNNxhBpwUnisPrnY5dV6wAAA==" },
+    "/images/Avene/A6.jpg": { width: 1800, height: 2250, color: "#a2d5ee", placeholder: "data:image/webp;base64,UklGRnIAAABXRUJQVlA4IGYAAAAQBACdASoQABQAPxFyslCsJqSisAgBgCIJaACdL1AB0cMiDnxHCamyAAD+3qyZf7fmav/K8wW+iKIhxS2ls6fQp8InHG66NcQuaDedZCYyttvrT7vmmFGgOn98FZTCbEJ11gM4AAA=" },
+    "/images/Avene/B1.jpg": { width: 1800, height: 2249, color: "#c0947c", placeholder: "data:image/webp;base64,UklGRnIAAABXRUJQVlA4IGYAAACQAwCdASoQABQAPxFysFAsJqSisAgBgCIJQBOmUAAqmhImG2lwAP5T2Gk21oZ7YRlm95fPOrsoVrH+p1ggFXuQPTem/x0qQfUl9bITo45TcoF7a7Q5XRK84t+k9zxOo0Kx708AAAA=" },
+    "/images/Avene/B2.jpg": { width: 1800, height: 2249, color: "#af7963", placeholder: "data:image/webp;base64,UklGRngAAABXRUJQVlA4IGwAAABwBACdASoQABQAPxFysFAsJqSisAgBgCIJYgCdMoADaYsOHknFAA4CgrLfQAD+jOeyDqQLNt/BMX9EpsUOT1CDgwsFPzv3KYtZ69liKMpSVQmmF/nfmfChPf7ekSN/YwS2edR7nKatKWqo+AA=" },
+    "/images/Avene/B3.jpg": { width: 1800, height: 2250, color: "#bd9275", placeholder: "data:image/webp;base64,UklGRoAAAABXRUJQVlA4IHQAAAAwBACdASoQABQAPxFwsFAsJiSisAgBgCIJYgCdMoADJ5ZuE14kTnwFoUAA/o0r8bkkpgAnga18kvIdRQDIiq1vyXDBUYSoIBfARXoOCkSe2uqdwGONLdXfZ9SX1sHqbz8eYLHClKKTM/3IRb+jDGe3iQAAAA==" },
+    "/images/Avene/B4.jpg": { width: 1800, height: 2250, color: "#cfbfaa", placeholder: "data:image/webp;base64,UklGRnoAAABXRUJQVlA4IG4AAACwAwCdASoQABQAPxFysFAsJqSisAgBgCIJQBYdgyVBZMw7xO2UQAD+YAoSYl6WbJDfM4WGb5Ea8PtDhAvC7JbMHz5VEJgtvZJrn6gQDzUkrHsQZTKbcrq23hSDqznyHxTzT58TEjDzOV6hjiAAAA==" },
+    "/images/Avene/B5.jpg": { width: 1600, height: 2000, color: "#d3997f", placeholder: "data:image/webp;base64,UklGRn4AAABXRUJQVlA4IHIAAADwAwCdASoQABQAPxFysFAsJqSisAgBgCIJZgCdL1yBu/zEv32C7yIAAOICfpPBwhuY+5rIz6rElF8y2OE0YXItfl9el8GPJS+urLSwFBgIC90DLVyvsSajkKxVTcWE48GnT3Ve1M0HYRnvFDPuXC4YQAA=" },
+    "/images/Avene/B6.jpg": { width: 1800, height: 2249, color: "#c9a183", placeholder: "data:image/webp;base64,UklGRnwAAABXRUJQVlA4IHAAAAAQBACdASoQABQAPxFysFAsJqSisAgBgCIJQBOmUBcAAbbVbo3lR6V0XAD+AHmyT0+BIjEW8BHBaMtm3RuPu1JOYaks+IZt43S6DSmk/0WCo0YZZ/NbC6gcSt1GT13GTIbUG8FkGuNvVZEetm2NP8AA" },
+    "/images/Avene/C1.jpg": { width: 1800, height: 2250, color: "#a5c9dc", placeholder: "data:image/webp;base64,UklGRmgAAABXRUJQVlA4IFwAAAAQBACdASoQABQAPxFwsFAsJiSisAgBgCIJbACdACFKy6MaItd8pNw2AAD+w7fdpz7k4Bxdw8Jn9MRKYVD8uMTpqvUs8AD1XPW30sKitwE4s2AhR+WG9WG7TkwAAA==" },
+    "/images/Avene/C2.jpg": { width: 1800, height: 2250, color: "#86c7f7", placeholder: "data:image/webp;base64,UklGRpQAAABXRUJQVlA4IIgAAAAQBACdASoQABQAPxFysFAsJqSisAgBgCIJbACdMoACiH7YdICJ7swEAADOF8bKJMMNg1Y0PRf/TzbTe3oHKPjZWDDUm6vYIaV4m/SVj+bC+wihCE2r/Rn9b42XqDP1wuWmsvwMJ7SI4HVT7UDq1mR+sNyrqZGIgr3griCbSFjkDRhg6gP3AAAA" },
+    "/images/Avene/C3.jpg": { width: 1600, height: 2000, color: "#2a546d", placeholder: "data:image/webp;base64,UklGRlwAAABXRUJQVlA4IFAAAABwAwCdASoQABQAPxFysFAsJqSisAgBgCIJQBYdgdJUyUEVG4AAycb0siF+rnXn0hOD/73b1B8l8rwRcn6ctw3gm6uSGOf6B+AwDjMBiUcAAA==" },
+  },
+}
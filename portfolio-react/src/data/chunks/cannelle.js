@@ -0,0 +1,50 @@
+// Portfolio Data - Cannelle (loaded on demand from projects.index.js)
+export default {
+  id: "cannelle",
+  name: "Cannelle",
+  type: "Others",
+  description: `Product photography and visual content creation for Cannelle, highlighting the texture and quality of their offerings.`,
+  thumbnail: "/images/Cannelle/C3.jpg",
+  images: [
+    "/images/Cannelle/A1.jpg",
+    "/images/Cannelle/A2.jpg",
+    "/images/Cannelle/A3.jpg",
+    "/images/Cannelle/B1.jpg",
+    "/images/Cannelle/B2.jpg",
+    "/images/Cannelle/B3.jpg",
+    "/images/Cannelle/C1.jpg",
+    "/images/Cannelle/C2.jpg",
+    "/images/Cannelle/C3.jpg",
+    "/images/Cannelle/C4.jpg",
+    "/images/Cannelle/C5.jpg",
+    "/images/Cannelle/C6.jpg",
+  ],
+  hashes: {
+    "/images/Cannelle/A1.jpg": "331b1d82",
+    "/images/Cannelle/A2.jpg": "c30b7ecb",
+    "/images/Cannelle/A3.jpg": "d1a4cae7",
+    "/images/Cannelle/B1.jpg": "3032688a",
+    "/images/Cannelle/B2.jpg": "b6073533",
+    "/images/Cannelle/B3.jpg": "d231b594",
+    "/images/Cannelle/C1.jpg": "2b5d09d1",
+    "/images/Cannelle/C2.jpg": "eb08d9e1",
+    "/images/Cannelle/C3.jpg": "c7415b12",
+    "/images/Cannelle/C4.jpg": "4368d8f5",
+    "/images/Cannelle/C5.jpg": "be733a00",
+    "/images/Cannelle/C6.jpg": "5c9629ff",
+  },
+  imageMeta: {
+    "/images/Cannelle/A1.jpg": { width: 1800, height: 2250, color: "#a67553", placeholder: "data:image/webp;base64,UklGRpYAAABXRUJQVlA4IIoAAAAwBACdASoQABQAPxFysFAsJqSisAgBgCIJbACdMoRwABDK291gBnJEjgAA9HGI+dfFlPEs3Aciz+gMQ6K3OX+0cvZvhacqZ+Fd/se9qhS98WB94zBM90mUilweO1hZnWjfuJ3aK7dpkdGIkd2yhisvx5JeEbL6Rfc3EdC10hEVvIXgLu390ac0AAA=" },
+    "/images/Cannelle/A2.jpg": { width: 1800, height: 2250, color: "#987f6f", placeholder: "data:image/webp;base64,UklGRnoAAABXRUJQVlA4IG4AAAAQBACdASoQABQAPxFysFAsJqSisAgBgCIJZgC7Aq/wbLawymL/EzGaAADNoQ/4HXlFH8MrMCwKQyyMmJv7b7wxvXnZqJL5XTowoxm+/lWMsxiN40Fg+NE4MRtKcj7Fsx2c2hfvJnVD0dHMlT2AAA==" },
+    "/images/Cannelle/A3.jpg": { width: 1800, height: 2249, color: "#9d938c", placeholder: "data:image/webp;base64,UklGRoQAAABXRUJQVlA4IHgAAAAwBACdASoQABQAPxFysFAsJqSisAgBgCIJYgCdABxIjigu1CdR2ndp7AAAy/QRS4Vzx4OBK0+UM2Hiv5VUep4/+SMVbykmdxb5ovjV2PL0w3BT6CWwmWizIef8p6j6vbIF/JWtMIm/nlO0zKdIw+812HSoAgmQAAA=" },
+    "/images/Cannelle/B1.jpg": { width: 1800, height: 2400, color: "#6f361d", placeholder: "data:image/webp;base64,UklGRnQAAABXRUJQVlA4IGgAAABwAwCdASoQABUAPxFysFAsJqSisAgBgCIJagCw7BURgrPDbUAA/rnKenbb+zVVDEZqxJQYDJxDYGOykf+WOSPTSHN9Nd0dBgnSnGMxlRb0OETAWJFfXfdA+OXs2N2rFTXcHO65DwAAAA==" },
+    "/images/Cannelle/B2.jpg": { width: 1500, height: 2000, color: "#9e6345", placeholder: "data:image/webp;base64,UklGRm4AAABXRUJQVlA4IGIAAABwAwCdASoQABUAPxF4slEsJ6SisAgBgCIJZgCdMoRwADaUtdgA/rzNt6P6qeZb4DV86WDuJ3MaLqTQjrZMe1295eCMaf+y3MkmG4RCLMUMUF6QfGXpq/HVMF2LozaIaaQAAA==" },
+    "/images/Cannelle/B3.jpg": { width: 1800, height: 2400, color: "#b87a4f", placeholder: "data:image/webp;base64,UklGRnYAAABXRUJQVlA4IGoAAABwAwCdASoQABUAPxFysFAsJqSisAgBgCIJZgCw7A0WMwUZ6wAAkqIkQ5Jl1rXlFpiecTLsK2GR8j3owUBJkjB6sJIkmJF2HJtdfc7VsfZ9TlfqTPqdUeN7obiixFMCjsb3EjPqgLhyyAAA" },
+    "/images/Cannelle/C1.jpg": { width: 1800, height: 1349, color: "#b5a84e", placeholder: "data:image/webp;base64,UklGRlYAAABXRUJQVlA4IEoAAADwAQCdASoQAAwABABoJbACdAECuDn7wgAA/rIJRg8D9wLa7Ncj3H86LV0FEHif+dxO+gHQJGbkPDPNRWvppxv1976vKnrex5dAAA==" },
+    "/images/Cannelle/C2.jpg": { width: 1800, height: 1349, color: "#eac8a4", placeholder: "data:image/webp;base64,UklGRlAAAABXRUJQVlA4IEQAAAAQAgCdASoQAAwABABoJZgCdAEN5YXCYfgAAP7qxeVqWONw+yFvcGDFqspeW4KsW7SbiJNVhhEi/Pxiw8PkVcrVfgAAAA==" },
+    "/images/Cannelle/C3.jpg": { width: 1800, height: 1349, color: "#c92e4e", placeholder: "data:image/webp;base64,UklGRlAAAABXRUJQVlA4IEQAAADwAQCdASoQAAwABABoJbACdAD5gunIo5AAyjY7Vz6RYOiYp+cGI2/Tv1uYH4YMxE6Obh8ElD+G/urFPht4P626vAAAAA==" },
+    "/images/Cannelle/C4.jpg": { width: 1800, height: 1349, color: "#d0713b", placeholder: "data:image/webp;base64,UklGRlQAAABXRUJQVlA4IEgAAAAQAgCdASoQAAwABABoJbACdLoAAacq+O4AAP3su4CtANtJ9K9kZgDVb7sRit5h+nem9oof/MfZLJssE34iEXAbe/JHefavOAA=" },
+    "/images/Cannelle/C5.jpg": { width: 1800, height: 1349, color: "#b3785e", placeholder: "data:image/webp;base64,UklGRlgAAABXRUJQVlA4IEwAAADwAQCdASoQAAwABABoJbACdADp6uLeBAAA/pCgsBauHLjzsT+yzAnShMf3WXozUNFnS4nhiNhPW8sqJBAEQylpSw5Nrr7dJ+qAwAAA" },
+    "/images/Cannelle/C6.jpg": { width: 1800, height: 1349, color: "#c66d3f", placeholder: "data:image/webp;base64,UklGRlYAAABXRUJQVlA4IEoAAADQAQCdASoQAAwABABoJbACdLoAAO8gAAD8paI0eP1/o2iaqvT1Zr6oAUmBGVgelSn0y0/AFn8lhxKquOcRPH68p8VFftswfQWgAA==" },
+  },
+}
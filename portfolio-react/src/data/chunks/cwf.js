@@ -0,0 +1,102 @@
+// Portfolio Data - CwF (loaded on demand from projects.index.js)
+export default {
+  id: "cwf",
+  name: "CwF",
+  type: "Social Media + Branding",
+  description: `I created both the visual identity and the communication style for Crispy w Fahita, adapted to reach all of its potential target audience with a strong persona. Redesigned the logo, adapted poppy colors, directed photoshoots, created new wrapping paper and packaging, store sign, and much more.`,
+  thumbnail: "/images/CwF/3.png",
+  images: [
+    "/images/CwF/1.png",
+    "/images/CwF/10.png",
+    "/images/CwF/11.png",
+    "/images/CwF/12.png",
+    "/images/CwF/13.png",
+    "/images/CwF/14.png",
+    "/images/CwF/15.png",
+    "/images/CwF/16.png",
+    "/images/CwF/17.png",
+    "/images/CwF/18.png",
+    "/images/CwF/19.png",
+    "/images/CwF/2.png",
+    "/images/CwF/20.png",
+    "/images/CwF/21.png",
+    "/images/CwF/22.png",
+    "/images/CwF/23.png",
+    "/images/CwF/24.png",
+    "/images/CwF/25.png",
+    "/images/CwF/27.png",
+    "/images/CwF/28.png",
+    "/images/CwF/29.png",
+    "/images/CwF/3.png",
+    "/images/CwF/4.png",
+    "/images/CwF/5.png",
+    "/images/CwF/6.png",
+    "/images/CwF/7.png",
+    "/images/CwF/8.png",
+    "/images/CwF/9.png",
+  ],
+  videos: [
+    "/images/CwF/R1.mp4",
+  ],
+  hashes: {
+    "/images/CwF/1.png": "1770c795",
+    "/images/CwF/10.png": "d7c930ac",
+    "/images/CwF/11.png": "53c5b412",
+    "/images/CwF/12.png": "54864f0a",
+    "/images/CwF/13.png": "76ec3651",
+    "/images/CwF/14.png": "4016a9ed",
+    "/images/CwF/15.png": "734f03fc",
+    "/images/CwF/16.png": "ec55d345",
+    "/images/CwF/17.png": "5e64bcdb",
+    "/images/CwF/18.png": "0d474551",
+    "/images/CwF/19.png": "55d2e135",
+    "/images/CwF/2.png": "ec606298",
+    "/images/CwF/20.png": "c50ca48d",
+    "/images/CwF/21.png": "a05bacb8",
+    "/images/CwF/22.png": "c8b7857e",
+    "/images/CwF/23.png": "fee45831",
+    "/images/CwF/24.png": "418a20d2",
+    "/images/CwF/25.png": "c975636a",
+    "/images/CwF/27.png": "2ec44f97",
+    "/images/CwF/28.png": "1ef60f82",
+    "/images/CwF/29.png": "539881fd",
+    "/images/CwF/3.png": "4cc0a379",
+    "/images/CwF/4.png": "d2bbc15a",
+    "/images/CwF/5.png": "f7e2b4fc",
+    "/images/CwF/6.png": "c4268eb4",
+    "/images/CwF/7.png": "4a1cadb7",
+    "/images/CwF/8.png": "7789ddf8",
+    "/images/CwF/9.png": "529bdf97",
+    "/images/CwF/R1.mp4": "97359e8a",
+  },
+  imageMeta: {
+    "/images/CwF/1.png": { width: 1080, height: 1350, color: "#e58816", placeholder: "data:image/webp;base64,UklGRmIAAABXRUJQVlA4IFYAAAAwAwCdASoQABQAPxFysFAsJqSjMAgBgCIJaACo9CHfdfYAAP648Y9KEGNi08p+BoTU1g/dZkt+FtpDE6OLVX8GyR5f957E/8bx/TD6WzmFme61n6ugAA==" },
+    "/images/CwF/10.png": { width: 1080, height: 1350, color: "#4475b9", placeholder: "data:image/webp;base64,UklGRnAAAABXRUJQVlA4IGQAAADwAwCdASoQABQAPxFysFAsJqSisAgBgCIJaACdMoR3ABKsvOxER8OwAP0cGsm7/Fy0WBzKvNwzjIHkvspzTs3NwwQ4RiJQnQLsX1nndzxiwoTrdMoc2WYpgXB5eWmSIxpUYwAA" },
+    "/images/CwF/11.png": { width: 1080, height: 1350, color: "#cb3005", placeholder: "data:image/webp;base64,UklGRoAAAABXRUJQVlA4IHQAAAAwBACdASoQABQAPxFysFAsJqSisAgBgCIJbACdMoRwACZgxANZi/lDVOAA/p6kNCLrcuAgA/f5rfFDH3yFIepqIs79tKxJxzM/n81qHhoiWfDUPcJ/1dasMAsitojZoSZ3Gxciwgy8NOqbXMsdHT4LNlFwAA==" },
+    "/images/CwF/12.png": { width: 1080, height: 1350, color: "#dfa008", placeholder: "data:image/webp;base64,UklGRmQAAABXRUJQVlA4IFgAAACQAwCdASoQABQAPxFysFAsJqSisAgBgCIJbACxG1AAiWFMjTsAANNiP3rbRixfvrXNj497Ja/4tyZ2i/pyutVqs3/2oKJRPHRikfvGEIhaS0sI5qJacCAA" },
+    "/images/CwF/13.png": { width: 1080, height: 1350, color: "#e0ac0e", placeholder: "data:image/webp;base64,UklGRqIAAABXRUJQVlA4IJYAAABwBACdASoQABQAPxFysFAsJqSisAgBgCIJbACdMoADYuT2hSkrS8os7iaLAADLS0Bh4HdPwE1YvwAUs82N/tLK+0wKmtYTal77tUQXH/BrxlLVmcfz8Wp5n9Cvl6qQ/hExmCBxVfWZlJnC+pCueHxzUmus56kEMbmeySKz956BaUvwsT2Ml2met8qhd7AS/Lt8NeBFAAA=" },
+    "/images/CwF/14.png": { width: 1080, height: 1350, color: "#798c91", placeholder: "data:image/webp;base64,UklGRooAAABXRUJQVlA4IH4AAACwAwCdASoQABQAPxFysFAsJqSisAgBgCIJbACdAB2Mqb5Pf7o2iAD9RFJOn2c71Eh5rQg5nU5su4fTl3U5nk1OjLANvTUD4vAglIaa3ZR052RIwQU2R/U/2skTOcMu9MLY0A+eQDeoLl6pUWbe3nswahH7l+NVTJXn92NuAAA=" },
+    "/images/CwF/15.png": { width: 1080, height: 1350, color: "#c48d73", placeholder: "data:image/webp;base64,UklGRngAAABXRUJQVlA4IGwAAAAwBACdASoQABQAPxFysFAsJqSisAgBgCIJagCdMoADQIl8+Zmhbw0SH4AA/hDgjlM8YxAjB8DHG+RVnq6U1SbckPPEt+C/q72KiweCnYxDQojfvjgxfbCGO9ETNEtEYCVuIp0p8+/nSnz7gAA=" },
+    "/images/CwF/16.png": { width: 1080, height: 1350, color: "#2e2e2f", placeholder: "data:image/webp;base64,UklGRmAAAABXRUJQVlA4IFQAAABQAwCdASoQABQAPxFysFAsJqSisAgBgCIJZwAAXK5Bs4WgAAD+7D5UH/cCz/EoyyaOxGxCVkprYnZh8WLqoZcQrAYHwSovHR5j7smb9uiehMVRwAA=" },
+    "/images/CwF/17.png": { width: 1080, height: 1350, color: "#eceaea", placeholder: "data:image/webp;base64,UklGRngAAABXRUJQVlA4IGwAAACwAwCdASoQABQAPxFysFAsJqSisAgBgCIJZQDE2Bh34YYaaSY+hAD+50CqqKBL5YTv1ntJXOPdJ5cyAsHqQyuFX4agusQD7s050AjUZSOvmlNo5KaT89L1+tp/+kVFbz3HDVltRBnsqtGAAAA=" },
+    "/images/CwF/18.png": { width: 1080, height: 1350, color: "#cc393f", placeholder: "data:image/webp;base64,UklGRpwAAABXRUJQVlA4IJAAAACQBACdASoQABQAPxFysFAsJqSisAgBgCIJbACdMoRwAdCs6Kpi7O4UWxKaKgAA/p6P1UCIsYyVla06RXUyjL8pAnTOAA0++LXpcu6Ku65DGH+/F60xBgrXWT/sx5kV3PuktZD+0lIPyWWtKsAB/Er1tCbANg3qobvKsXi0YI6euEDccuSX2A47e/vNDRAAAAA=" },
+    "/images/CwF/19.png": { width: 1080, height: 1350, color: "#939394", placeholder: "data:image/webp;base64,UklGRoIAAABXRUJQVlA4IHYAAADQAwCdASoQABQAPxF0sFCsJqSisAgBgCIJQBgbhDvovAQ/IkqIFtgA/t55Gp3SZkjhmhqyZn2dhtzGKwtP/1I/A/dG/qI8Bdz569HwChkjuWj/A5FT9tCQ1vZcca9xNyPclgTQAFwvaaQdz9+ml5aky+oFgAAA" },
+    "/images/CwF/2.png": { width: 500, height: 500, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRlYAAABXRUJQVlA4IEoAAABQAgCdASoQABAABABoJYwC7IExGBsmBpIBowAA/vYFNHiiSAmYav3XRlP+7rGhEZfHQqIfcL74eRbKHl3wGQ+13r1JXw1shoAAAA==" },
+    "/images/CwF/20.png": { width: 1080, height: 1350, color: "#792a01", placeholder: "data:image/webp;base64,UklGRoIAAABXRUJQVlA4IHYAAABwBACdASoQABQAPxFwsFAsJiSisAgBgCIJagCdMoMYAEKRDIF8U8O21W4oxAD+y/Ug7yorGplPE6tYnubpozY+Hj6QbMSob9NiQ3+2CK+uuwp0oFwI0BNIXujv55LQaMYVR07YyN+zo6WJRgSypzSQDRaRcWAA" },
+    "/images/CwF/21.png": { width: 1080, height: 1350, color: "#eec311", placeholder: "data:image/webp;base64,UklGRpIAAABXRUJQVlA4IIYAAABQBACdASoQABQAPxFwsFAsJiSisAgBgCIJbACdMoRwACna0NaAlMBEwoZwAP5YAcvAvgD725dKe9G71edIlbkS+QUnk2fhBNYLT35mOywMqRiWfWPDhNUcKTLQoig/wZg344DbyFwnyRXCXlrMrM8Y44I8UZ5/DWMIBZ2C7dRO6soz0AAAAA==" },
+    "/images/CwF/22.png": { width: 1080, height: 1350, color: "#dedcda", placeholder: "data:image/webp;base64,UklGRk4AAABXRUJQVlA4IEIAAABQAwCdASoQABQAPxFysFAsJqSisAgBgCIJYwDG9CHf6XgXsAD+3nkIZd8QEl+6qEMWwrAyquuAXu4BG+ymEQkQAAA=" },
+    "/images/CwF/23.png": { width: 1080, height: 1350, color: "#c3181f", placeholder: "data:image/webp;base64,UklGRmwAAABXRUJQVlA4IGAAAABwAwCdASoQABQAPxFwsFAsJiSisAgBgCIJZgCdAB3Fc5GzKgAA/p7GfpJ1aDYwGk/XvusjIgSE3lHQvIKy6tq/cJi/aGhyr/EsaC+TuVTY8B94DaX3imJqb6OdO63d4AA=" },
+    "/images/CwF/24.png": { width: 1080, height: 1350, color: "#675c64", placeholder: "data:image/webp;base64,UklGRn4AAABXRUJQVlA4IHIAAADQAwCdASoQABQAPxFysFAsJqSisAgBgCIJbACdMoR3ACm8mwLLRgAA/orwgM5j6rgBaclRbZcIDtKwfpkhhKOQWlX89PJfITpzjXV0q/1BJXCQLP5IwkDmSPXMhgPhNljenA1Fg2yAfXiYlmsDxl0AAAA=" },
+    "/images/CwF/25.png": { width: 1080, height: 1350, color: "#c3191f", placeholder: "data:image/webp;base64,UklGRlYAAABXRUJQVlA4IEoAAABQAwCdASoQABQAPxFysFAsJqSisAgBgCIJZgCdAC0CrotZgAD+5SPy+TKc8lmsEGqIYUF6j/jCaS27+rv4++9ko4E6oawZ0PAAAA==" },
+    "/images/CwF/27.png": { width: 1080, height: 1350, color: "#544e48", placeholder: "data:image/webp;base64,UklGRn4AAABXRUJQVlA4IHIAAADwAwCdASoQABQAPxFysFAsJqSisAgBgCIJYgDE2B6Lbpg4mBZ/lHa4AP3838Q/MoA0O9K0Gm4fTGbo63TwZjNgOpJCL08cAvvYhrhn7XrFl/IDicQB3JQaP07RoIWcznJTuXmCNVnb23UommPFKa8AAAA=" },
+    "/images/CwF/28.png": { width: 1080, height: 1350, color: "#8bbde0", placeholder: "data:image/webp;base64,UklGRmwAAABXRUJQVlA4IGAAAADwAwCdASoQABQAPxFysFAsJqSisAgBgCIJbACdMoRwABBVLQm2IcAAANaGlpWJ3EhefPdKkJXeu+W6XmV4U9ihdbrPhp0f6TZch6Z6lEm0LYrqJobo+btQa6dfhg5gAAA=" },
+    "/images/CwF/29.png": { width: 1702, height: 630, color: "#a7582c", placeholder: "data:image/webp;base64,UklGRk4AAABXRUJQVlA4IEIAAADQAQCdASoQAAYABABoJbACdAC9EsmEoAD+lEmppDpGAvDOnHOyvMq3PQq2jMAFeJplH/4uPrx33q6R4u9ir7gFaAA=" },
+    "/images/CwF/3.png": { width: 1080, height: 1350, color: "#c0490c", placeholder: "data:image/webp;base64,UklGRoYAAABXRUJQVlA4IHoAAABwBACdASoQABQAPxFysFAsJqSisAgBgCIJbACdMoRwN6AARZbiI+IAiK4OAAD9GypFCJ0ylVkWB4/JByb5MveiIE/vKSHKhVqPToIcAq3yAFvTZWz/1KSlYWSDzLQjl954efQMxWT3Ko8UBsIyCvQSVZETG0k/TguAAA==" },
+    "/images/CwF/4.png": { width: 1080, height: 1350, color: "#9a1519", placeholder: "data:image/webp;base64,UklGRnYAAABXRUJQVlA4IGoAAABwBACdASoQABQAPxFysFAsJqSisAgBgCIJbACdMoADAMYTY6HCGZWJb/eUAAD+vBSS+EVXl+2GfyVEcrAkQTdRc4kgQd3rWSPzf2Cb2CUobksM4T/FCxGpJVKFvVhTYxy5ohf9BKACAAAA" },
+    "/images/CwF/5.png": { width: 1080, height: 1350, color: "#376bb9", placeholder: "data:image/webp;base64,UklGRnIAAABXRUJQVlA4IGYAAACQAwCdASoQABQAPxFysFAsJqSisAgBgCIJbACdMoRwACSbqtQwAP5xBczh73Kmc+CRflI5o6hAPJUMDig/owCPxZzu5LU/J6mkC6osVRplDE9O9r9HXmnJlqgulAHvDVJQkC+YAAA=" },
+    "/images/CwF/6.png": { width: 1080, height: 1350, color: "#3c0f01", placeholder: "data:image/webp;base64,UklGRmgAAABXRUJQVlA4IFwAAADQAwCdASoQABQAPxFysFAsJqSisAgBgCIJajcAAwAAr2P4znlgccAA/nFjtpWc/+8KuZaTE8fHbcetScsrd8be0VtY74SfSNJ7JmgjkRmmm6tZ3CnUcqdJBwAAAA==" },
+    "/images/CwF/7.png": { width: 1080, height: 1350, color: "#f0c512", placeholder: "data:image/webp;base64,UklGRmYAAABXRUJQVlA4IFoAAACQAwCdASoQABQAPxFwsFAsJiSisAgBgCIJbACdMoRwACnHNDqAAP6K1zYNDq6SW6P/e6siNNead8rbNSrvD6vaggd5hrnHgKQIKGQZSSMosmdluk3kG6gAAAA=" },
+    "/images/CwF/8.png": { width: 1080, height: 1350, color: "#be4011", placeholder: "data:image/webp;base64,UklGRpIAAABXRUJQVlA4IIYAAACwBACdASoQABQAPxFysFAsJqSisAgBgCIJbACdMoIj/o2ACQhlgXJLCCjtdMEAAPnafkbg99SDg8e4NJt/aVSNpqB9vxzIqHUZevTl7W4K/klohMA5AFhusCn0xpx1hyeCZCR+cnAmTgon16GNjUJfle86i6/QtwBO3BkYy//ct4MjDgcAAA==" },
+    "/images/CwF/9.png": { width: 1080, height: 1350, color: "#bb1f1e", placeholder: "data:image/webp;base64,UklGRoIAAABXRUJQVlA4IHYAAADwAwCdASoQABQAPxFysFAsJqSisAgBgCIJbACdMoRwACnEdz8eTZEAAP5vBcdi6cUkJQuGKkpjr5bNfvYY2usmZ2PTAFU6v8dutaDwDwHD+FGlSaoVghs1x79aZUbbtGftAs+ixXJTncJrgMIIamupNaxaoAAA" },
+  },
+}
@@ -0,0 +1,22 @@
+// Portfolio Data - DermaCare (loaded on demand from projects.index.js)
+export default {
+  id: "dermacare",
+  name: "DermaCare",
+  type: "Social Media",
+  thumbnail: "/images/DermaCare/DermaCare_02.jpg",
+  images: [
+    "/images/DermaCare/DermaCare_01.jpg",
+    "/images/DermaCare/DermaCare_02.jpg",
+    "/images/DermaCare/DermaCare_03.jpg",
+  ],
+  hashes: {
+    "/images/DermaCare/DermaCare_01.jpg": "13424d22",
+    "/images/DermaCare/DermaCare_02.jpg": "363380c2",
+    "/images/DermaCare/DermaCare_03.jpg": "b7b2c426",
+  },
+  imageMeta: {
+    "/images/DermaCare/DermaCare_01.jpg": { width: 1080, height: 1350, color: "#d7b2a9", placeholder: "data:image/webp;base64,UklGRmwAAABXRUJQVlA4IGAAAAAQAwCdASoQABQAPxFysFAsJqSisAgBgCIJYwCdAA3oA0AAyRZ18xiExpvf0uQsRFp0FCe7JhZyr4cGYR5OkZENg/3helpEoJiL+HnlKyd5/Ilc6y6pPXo88J1oOE0gAAA=" },
+    "/images/DermaCare/DermaCare_02.jpg": { width: 1080, height: 1350, color: "#5caaae", placeholder: "data:image/webp;base64,UklGRo4AAABXRUJQVlA4IIIAAAAwBACdASoQABQAPxFwsFAsJiSisAgBgCIJbACdMoR3ABo5qVuMeL4Kd4AA9wQc5mn2sZ5MEUOffhWnMjDqZsT5ttsK6XDSpiBZ2GMjc96jmf/ifW8EwLPiQzEx7yamKE1gyfdi5QM9dzEeeWjO0L8a0WR/dlX27BlgxKB+2Mg24AAA" },
+    "/images/DermaCare/DermaCare_03.jpg": { width: 1080, height: 1350, color: "#76b1b4", placeholder: "data:image/webp;base64,UklGRnAAAABXRUJQVlA4IGQAAADQAwCdASoQABQAPxFysVCsJqSisAgBgCIJYgCsAB6J3l7PicbsWwAA9yumWIAHfFN5eoBsyVdQSYSh2TUy033piwHLb+P7WhUG6QaZuqfQSIlHOWVkX6q0O90GZr93kyNm3AAA" },
+  },
+}
@@ -0,0 +1,125 @@
+// Portfolio Data - DGA (loaded on demand from projects.index.js)
+export default {
+  id: "dga",
+  name: "DGA",
+  type: "Others",
+  description: `DGA is a program by the Saudi Government that aims to digitalize work in all of its branches. I created the PDF that was given to all entities to explain the program (You can find snippets below) as well as designing and directing the main video of it.`,
+  thumbnail: "/images/DGA/Artboard 2.png",
+  images: [
+    "/images/DGA/Artboard 1.png",
+    "/images/DGA/Artboard 10.png",
+    "/images/DGA/Artboard 11.png",
+    "/images/DGA/Artboard 12.png",
+    "/images/DGA/Artboard 13.png",
+    "/images/DGA/Artboard 14.png",
+    "/images/DGA/Artboard 15.png",
+    "/images/DGA/Artboard 16.png",
+    "/images/DGA/Artboard 17.png",
+    "/images/DGA/Artboard 18.png",
+    "/images/DGA/Artboard 19.png",
+    "/images/DGA/Artboard 2.png",
+    "/images/DGA/Artboard 20.png",
+    "/images/DGA/Artboard 21.png",
+    "/images/DGA/Artboard 22.png",
+    "/images/DGA/Artboard 23.png",
+    "/images/DGA/Artboard 24.png",
+    "/images/DGA/Artboard 25.png",
+    "/images/DGA/Artboard 26.png",
+    "/images/DGA/Artboard 27.png",
+    "/images/DGA/Artboard 28.png",
+    "/images/DGA/Artboard 29.png",
+    "/images/DGA/Artboard 3.png",
+    "/images/DGA/Artboard 30.png",
+    "/images/DGA/Artboard 31.png",
+    "/images/DGA/Artboard 32.png",
+    "/images/DGA/Artboard 33.png",
+    "/images/DGA/Artboard 34.png",
+    "/images/DGA/Artboard 35.png",
+    "/images/DGA/Artboard 36.png",
+    "/images/DGA/Artboard 37.png",
+    "/images/DGA/Artboard 4.png",
+    "/images/DGA/Artboard 5.png",
+    "/images/DGA/Artboard 6.png",
+    "/images/DGA/Artboard 7.png",
+    "/images/DGA/Artboard 8.png",
+    "/images/DGA/Artboard 9.png",
+  ],
+  hashes: {
+    "/images/DGA/Artboard 1.png": "b41faaf5",
+    "/images/DGA/Artboard 10.png": "28fdfa2d",
+    "/images/DGA/Artboard 11.png": "961e6bbe",
+    "/images/DGA/Artboard 12.png": "37ccb6d9",
+    "/images/DGA/Artboard 13.png": "85e622a6",
+    "/images/DGA/Artboard 14.png": "b4a9837e",
+    "/images/DGA/Artboard 15.png": "eb1f268f",
+    "/images/DGA/Artboard 16.png": "6dd7e692",
+    "/images/DGA/Artboard 17.png": "a56d23a7",
+    "/images/DGA/Artboard 18.png": "6362ca29",
+    "/images/DGA/Artboard 19.png": "34b4d64d",
+    "/images/DGA/Artboard 2.png": "567cc485",
+    "/images/DGA/Artboard 20.png": "7ea1cda4",
+    "/images/DGA/Artboard 21.png": "d9ca8422",
+    "/images/DGA/Artboard 22.png": "663e6b95",
+    "/images/DGA/Artboard 23.png": "a72cbc1e",
+    "/images/DGA/Artboard 24.png": "488290af",
+    "/images/DGA/Artboard 25.png": "41e53bce",
+    "/images/DGA/Artboard 26.png": "5869095a",
+    "/images/DGA/Artboard 27.png": "94f5ac33",
+    "/images/DGA/Artboard 28.png": "a11161b2",
+    "/images/DGA/Artboard 29.png": "137d7790",
+    "/images/DGA/Artboard 3.png": "bf31ba22",
+    "/images/DGA/Artboard 30.png": "d54e87d8",
+    "/images/DGA/Artboard 31.png": "e5568e2e",
+    "/images/DGA/Artboard 32.png": "9cfabfd7",
+    "/images/DGA/Artboard 33.png": "021d7e69",
+    "/images/DGA/Artboard 34.png": "ba27d7a2",
+    "/images/DGA/Artboard 35.png": "f2fa4e4e",
+    "/images/DGA/Artboard 36.png": "a37e0d43",
+    "/images/DGA/Artboard 37.png": "43f5abf6",
+    "/images/DGA/Artboard 4.png": "7865e5e5",
+    "/images/DGA/Artboard 5.png": "afe3a5d0",
+    "/images/DGA/Artboard 6.png": "0df2e356",
+    "/images/DGA/Artboard 7.png": "b5cb9a7c",
+    "/images/DGA/Artboard 8.png": "cbc5856c",
+    "/images/DGA/Artboard 9.png": "1883a0c8",
+  },
+  imageMeta: {
+    "/images/DGA/Artboard 1.png": { width: 597, height: 843, color: "#2b286a", placeholder: "data:image/webp;base64,UklGRr4AAABXRUJQVlA4WAoAAAAQAAAADwAAFgAAQUxQSB0AAAABJ3D//4iIBTINCJNABpNA/3hud0T/J4CY+imeBQBWUDggegAAANADAJ0BKhAAFwA/EXKyUKwmpKKwCAGAIglmAABcFbwU4cpiR7t8sAD+6GeRo0jcBaJSeol3+DOmQ9S0AFZvyN0b3LcKqgm1OBkgE/R3VskhDRvxkqXM03tLSnFUMLcHsrjU/vJfcisvy4gejmtSwQZD+H7SwVtjusAA" },
+    "/images/DGA/Artboard 10.png": { width: 596, height: 843, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRoAAAABXRUJQVlA4WAoAAAAQAAAADwAAFgAAQUxQSBMAAAABD/D+/4iIIBZM8pfeH0FE/7MVAFZQOCBGAAAAMAMAnQEqEAAXAD8RcrBQLCakorAIAYAiCWcAAFvqA+AFYAD+7UdgSCjeb9kAmJw5hHLG5tr8QSwgN6s9FRV0Y8XS/sIAAA==" },
+    "/images/DGA/Artboard 11.png": { width: 596, height: 843, color: "#fcfcfc", placeholder: "data:image/webp;base64,UklGRnwAAABXRUJQVlA4WAoAAAAQAAAADwAAFgAAQUxQSBcAAAABH3D//4iIBUG2zeZvsqseIKL/IfC5CgBWUDggPgAAALADAJ0BKhAAFwA/EXKwUCwmpKKwCAGAIglpAABcTsXZzJ5wrYQAAP7qfCKxOpiLFV0hO3Pf/0rGPGDAgAAA" },
+    "/images/DGA/Artboard 12.png": { width: 597, height: 843, color: "#e9e9ef", placeholder: "data:image/webp;base64,UklGRpQAAABXRUJQVlA4WAoAAAAQAAAADwAAFgAAQUxQSB0AAAABJ3D//4iIBTINCJNABpNA/3hud0T/J4CY+imeBQBWUDggUAAAAJADAJ0BKhAAFwA/EXKwUCwmpKKwCAGAIglnAABcG/fFp6x1OUAA/up8ClqVjnbANv5PGBYRp2Dibki/HS9JfqoCumljMBnfTvBPh4VAgAAA" },
+    "/images/DGA/Artboard 13.png": { width: 596, height: 843, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRnoAAABXRUJQVlA4WAoAAAAQAAAADwAAFgAAQUxQSBMAAAABD/D+/4iIIBZM8pfeH0FE/7MVAFZQOCBAAAAAUAMAnQEqEAAXAD8RcrFQLCakorAIAYAiCWcAAF3wpd9IncAA/uqF82nZVGo7jZj/UdDtJj43CVUVzstIAQAAAA==" },
+    "/images/DGA/Artboard 14.png": { width: 596, height: 843, color: "#e8eaee", placeholder: "data:image/webp;base64,UklGRowAAABXRUJQVlA4WAoAAAAQAAAADwAAFgAAQUxQSBMAAAABD/D+/4iIIBZM8pfeH0FE/7MVAFZQOCBSAAAAcAMAnQEqEAAXAD8RcrBQLCakorAIAYAiCWUAAFvT1/KiZ5vwAP7neSGVK5qWnvcwe8jUygCnGILbtThOgAeLACqoKgCycKwtuHSG8w6cytEAAA==" },
+    "/images/DGA/Artboard 15.png": { width: 597, height: 842, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRrIAAABXRUJQVlA4WAoAAAAQAAAADwAAFgAAQUxQSBMAAAABF9D/iAgISAhZ5v82AyL6H0JfAFZQOCB4AAAAsAMAnQEqEAAXAD8RcrBQLCakorAIAYAiCWMAAFxN5uNjyc05vgAA/u1O5KlVKuRqgIlWwcGXUyKoAn8OK38iDP0X3PlXqmPGJRBjsEtdFKqn1Wccp/iLcal164dhSvV3O83gcREAej7F7cX03zUYAW0qYFFIaAAA" },
+    "/images/DGA/Artboard 16.png": { width: 596, height: 842, color: "#ebebf0", placeholder: "data:image/webp;base64,UklGRkwAAABXRUJQVlA4IEAAAACQAwCdASoQABcAPxFysFCsJqSisAgBgCIJZwAAW9VP2xSsSCIAAP7qfAZDH8B84+YOge6T1SUPb71AErSYAAAA" },
+    "/images/DGA/Artboard 17.png": { width: 596, height: 842, color: "#f0f0f2", placeholder: "data:image/webp;base64,UklGRkoAAABXRUJQVlA4ID4AAABwAwCdASoQABcAPxFysFAsJqSisAgBgCIJZwAAW+i2aPJEuwAA/ud5GpYqPGt/F4EhX+Oz46/wIpxwwAAAAA==" },
+    "/images/DGA/Artboard 18.png": { width: 597, height: 842, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRnYAAABXRUJQVlA4WAoAAAAQAAAADwAAFgAAQUxQSBQAAAABF3D//4iIQUBC8Nz/DIjofwh9AVZQOCA8AAAAkAMAnQEqEAAXAD8RcrBQLCakorAIAYAiCWcAAFvp/Da8E1ALkAD+53kaldXU8ux+G3jhumURey24QAAA" },
+    "/images/DGA/Artboard 19.png": { width: 596, height: 842, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRm4AAABXRUJQVlA4WAoAAAAQAAAADwAAFgAAQUxQSBEAAAABD9D/iAgIBJLQ558gov+hFwBWUDggNgAAABADAJ0BKhAAFwA/EXKwUCwmpKMwCAGAIglpAABb6WhncAD+53kaliqtkeMHXofyVYx4tsAAAA==" },
+    "/images/DGA/Artboard 2.png": { width: 596, height: 843, color: "#2a2a68", placeholder: "data:image/webp;base64,UklGRnYAAABXRUJQVlA4WAoAAAAQAAAADwAAFgAAQUxQSBMAAAABD3D//4iIIBZM8pfeH0FE/7MVAFZQOCA8AAAA0AIAnQEqEAAXAD8RcrBQLCakorAIAYAiCUAX5wWkgAD+66rUCZH4cFzenJ4KkGW51VTvnsFVWd4QAAAA" },
+    "/images/DGA/Artboard 20.png": { width: 596, height: 842, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRmIAAABXRUJQVlA4IFYAAACwAwCdASoQABcAPxFysFAsJqSisAgBgCIJYwBTAAehvAyri2IvIAD+7T54W88ET4RElRcmSNNzFqK8LPm1BIuVRGpilXHZVZIIrDyeL2muqc7HRAAAAA==" },
+    "/images/DGA/Artboard 21.png": { width: 596, height: 842, color: "#eeeff2", placeholder: "data:image/webp;base64,UklGRlIAAABXRUJQVlA4IEYAAABQAwCdASoQABcAPxFysFAsJqSisAgBgCIJZwAAW9W8sN81AAD+6pjGyxtl2HI/92Qtm8sAsKRqN6qP4ZOYZ8jlVSEGbgIA" },
+    "/images/DGA/Artboard 22.png": { width: 597, height: 842, color: "#eae9ef", placeholder: "data:image/webp;base64,UklGRooAAABXRUJQVlA4WAoAAAAQAAAADwAAFgAAQUxQSBIAAAABD9D/iAgIZJPdPP4IIvofegFWUDggUgAAANADAJ0BKhAAFwA/EXKwUCwmpKKwCAGAIglnAMssIdSrLBLpgWSi5AD+7UgJZglB+TssHcE7MzthZHA4juMl++SESBBw6eLwBWOdmGbYw+GXgAA=" },
+    "/images/DGA/Artboard 23.png": { width: 596, height: 842, color: "#f4f4f7", placeholder: "data:image/webp;base64,UklGRmYAAABXRUJQVlA4IFoAAAAQBACdASoQABcAPxFysFAsJqSisAgBgCIJZQDDNB6W9fEKCKbW8v98AAD+7WGk8C6PI2UINQky0rscNwTL4Dtn04ConPBJsVzEc2BIEst6f2gG2pTxqCEHUAA=" },
+    "/images/DGA/Artboard 24.png": { width: 596, height: 842, color: "#e5e4ec", placeholder: "data:image/webp;base64,UklGRkAAAABXRUJQVlA4IDQAAADQAgCdASoQABcAPxFysFAsJqSisAgBgCIJaQAAifQAAP7vHiBr3gO8w470Zgww6V9SYEAA" },
+    "/images/DGA/Artboard 25.png": { width: 596, height: 842, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRqgAAABXRUJQVlA4WAoAAAAQAAAADwAAFgAAQUxQSBEAAAABD9D/iAgIBJL2N58gov+RFwBWUDggcAAAAJADAJ0BKhAAFwA/EXKwUCwmpKKwCAGAIglnAAPkOdYzE7nwgYAA/uDXk9xdyES6wY+ofoct1T9zXxS62yMl+bmf6rxCc98kbJsLECKAjtnJJHVG2HynO7IdBxLG7w3cwfqtCYbex2LEDcPARefwAAA=" },
+    "/images/DGA/Artboard 26.png": { width: 597, height: 842, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRnIAAABXRUJQVlA4WAoAAAAQAAAADwAAFgAAQUxQSBUAAAABF3D//4iIQUBCyDL/txkQ0f8Q+gIAVlA4IDYAAAAQAwCdASoQABcAPxFysFAsJqSisAgBgCIJZwAAeteaBKAA/u9mgCt9E+G9auuMFjzLRYAAAAA=" },
+    "/images/DGA/Artboard 27.png": { width: 596, height: 842, color: "#ebeef2", placeholder: "data:image/webp;base64,UklGRmQAAABXRUJQVlA4IFgAAAAQBACdASoQABcAPxFysFAsJqSisAgBgCIJZQAAXK+U/p7lnbDOCnlLAAD+4AXvUQYfX95bZcVc3TdvKDNFL48NQeSG6X0A1PNAcowLbc45nhFhDoUmgAAA" },
+    "/images/DGA/Artboard 28.png": { width: 596, height: 842, color: "#e9e8ef", placeholder: "data:image/webp;base64,UklGRl4AAABXRUJQVlA4IFIAAACwAwCdASoQABcAPxFysVAsJqSisAgBgCIJZwABHsvzcsSn6/LgAAD+/H5JnJDrR+te6SUeo1UzTE170yHkzSwI/ULPkygsnVjc1XU78+mGh4AA" },
+    "/images/DGA/Artboard 29.png": { width: 597, height: 842, color: "#e8e7ed", placeholder: "data:image/webp;base64,UklGRn4AAABXRUJQVlA4WAoAAAAQAAAADwAAFgAAQUxQSBQAAAABF3D//4iIQUBC8Nz/DIjofwh9AVZQOCBEAAAAcAMAnQEqEAAXAD8RcrBQrCakorAIAYAiCWcAAFvTWuyBkyrAAP7npvnw5OVlhMpQa/a2RnolZa0pOvQ9yEpkvW44AAA=" },
+    "/images/DGA/Artboard 3.png": { width: 596, height: 843, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRooAAABXRUJQVlA4WAoAAAAQAAAADwAAFgAAQUxQSBMAAAABD/D+/4iIIBZM8pfeH0FE/7MVAFZQOCBQAAAAEAMAnQEqEAAXAD8RcLBQLCYkorAIAYAiCWMAAFG8c6AAAP3h97bah2XS7ZYN0ki/qpWJy0lpXQMjWf4+PpJPzI0brrpbwk0Zu1gwdioAAAA=" },
+    "/images/DGA/Artboard 30.png": { width: 596, height: 842, color: "#e7e7ed", placeholder: "data:image/webp;base64,UklGRnoAAABXRUJQVlA4WAoAAAAQAAAADwAAFgAAQUxQSBEAAAABD9D/iAgIBJLQ558gov+hFwBWUDggQgAAAHADAJ0BKhAAFwA/EXKxUCwmpKKwCAGAIglnAABb6zbmUdyBgAD+53kalgpCjUIn0bsiXOpj9McOAxHKpeSqI4AAAA==" },
+    "/images/DGA/Artboard 31.png": { width: 596, height: 842, color: "#efeff3", placeholder: "data:image/webp;base64,UklGRkYAAABXRUJQVlA4IDoAAACQAwCdASoQABcAPxFysFAsJqSisAgBgCIJZwAAW+n7J3g0o0wAAP7neRqV8h6+O97qsMW/mioAAAAA" },
+    "/images/DGA/Artboard 32.png": { width: 596, height: 842, color: "#ecebef", placeholder: "data:image/webp;base64,UklGRlQAAABXRUJQVlA4IEgAAACQAwCdASoQABcAPxFysFAsJqSisAgBgCIJZQAAW9b218hZZfcAAP7tWrWccEdiUMvfOBrOQx1PQmPwJR58PHhzsS3PjAHAAAA=" },
+    "/images/DGA/Artboard 33.png": { width: 597, height: 842, color: "#ecebf0", placeholder: "data:image/webp;base64,UklGRnoAAABXRUJQVlA4WAoAAAAQAAAADwAAFgAAQUxQSBUAAAABF3D//4iIQUBCyDL/txkQ0f8Q+gIAVlA4ID4AAACQAwCdASoQABcAPxFysVCsJqSisAgBgCIJZwAAW+o9Be6i1W3AAP7neRqWvgKcGzIM84jb8SPrKgfv8AAAAA==" },
+    "/images/DGA/Artboard 34.png": { width: 596, height: 842, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRkAAAABXRUJQVlA4IDQAAABQAwCdASoQABcAPxFysFAsJqSjMAgBgCIJaQAAW+n9nhpQwAD+53kZRgZVALGaEy3OyBAA" },
+    "/images/DGA/Artboard 35.png": { width: 596, height: 842, color: "#e9e9ef", placeholder: "data:image/webp;base64,UklGRmgAAABXRUJQVlA4IFwAAADwAwCdASoQABcAPxFwsFAsJiSisAgBgCIJZQDG9CHnhMMOWZXaAeQAAP7neSGUOgluDAsltlk+CoaXk/VWsKlI+0yWaOg5AI4oAvHSk9Hz+Wnx6jxkgC4GwBAAAA==" },
+    "/images/DGA/Artboard 36.png": { width: 596, height: 842, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRnYAAABXRUJQVlA4WAoAAAAQAAAADwAAFgAAQUxQSBEAAAABD9D/iAgIBJL2N58gov+RFwBWUDggPgAAABADAJ0BKhAAFwA/EXKwUCwmpKMwCAGAIglnAABb6zV3gAD+53kamb+okSCl60DQR9aUS/n6O0AOIXjDRAAA" },
+    "/images/DGA/Artboard 37.png": { width: 596, height: 842, color: "#2a2a68", placeholder: "data:image/webp;base64,UklGRj4AAABXRUJQVlA4IDIAAADQAgCdASoQABcAPxFwsFAsJiSisAgBgCIJQBibBaSAAP7sfG/jhdrCOTBrvSeJmwAAAA==" },
+    "/images/DGA/Artboard 4.png": { width: 597, height: 843, color: "#e9eaef", placeholder: "data:image/webp;base64,UklGRr4AAABXRUJQVlA4WAoAAAAQAAAADwAAFgAAQUxQSDAAAAABL6AgbQPGv+l2x0REpAcKGklxwMlJoDnBv5v2xUBE/yeAqZQVGvkGjXyHRrrwMgFWUDggaAAAADAEAJ0BKhAAFwA/EXKwUCwmpKKwCAGAIgllAFMED/gPJNKsVwUh3N423AD+5+zy+j8hzS5gPgbaiOWTyIelQEFs/obE/BBSIDF17Srf05mROQNy1Hu42B7ZhnEuhMr9jfRg3KzUAAAA" },
+    "/images/DGA/Artboard 5.png": { width: 596, height: 843, color: "#eeedf2", placeholder: "data:image/webp;base64,UklGRqwAAABXRUJQVlA4WAoAAAAQAAAADwAAFgAAQUxQSBwAAAABH3D//4iIBVmAydDiHVoefQFE9H8OgAw2H9QCVlA4IGoAAADQAwCdASoQABcAPxFysFAsJqSisAgBgCIJZQDImCHhZg+EKDqrnQAA/ufs8vo/sVkIHPMCXvsUpsX1NxLmpy1gMLC4QCLkkJ9h9P1h9BFk+QP/2PG3+yAvyFKphjubDVDFCyAHXiIfxIgA" },
+    "/images/DGA/Artboard 6.png": { width: 596, height: 843, color: "#e8e8ee", placeholder: "data:image/webp;base64,UklGRnwAAABXRUJQVlA4WAoAAAAQAAAADwAAFgAAQUxQSBMAAAABD/D+/4iIIBZM8pfeH0FE/7MVAFZQOCBCAAAAMAMAnQEqEAAXAD8RcrBQLCakorAIAYAiCWkAAInrz+ZrAAD+7x39uBcbpqv817B+zrWUQ2M5aClu4a7UMx3H4QAA" },
+    "/images/DGA/Artboard 7.png": { width: 596, height: 843, color: "#ebebf0", placeholder: "data:image/webp;base64,UklGRoAAAABXRUJQVlA4WAoAAAAQAAAADwAAFgAAQUxQSBMAAAABD/D+/4iIIBZM8pfeH0FE/7MVAFZQOCBGAAAAsAMAnQEqEAAXAD8RcrBQLCakorAIAYAiCWkAAFxOxba+V7+8HAAA/up8IrEuq3KMznJyMkQ/Qea+kv6cOXv+GFbZQgAAAA==" },
+    "/images/DGA/Artboard 8.png": { width: 597, height: 843, color: "#eeecf2", placeholder: "data:image/webp;base64,UklGRooAAABXRUJQVlA4WAoAAAAQAAAADwAAFgAAQUxQSBgAAAABH3D//4iIBYEARZ7ZyzNbDIjofwj82WRWUDggTAAAALADAJ0BKhAAFwA/EXSyUKwmpKKwCAGAIgllAABb6M8YEomESbVwAP7tSRsyN+sLsUMPKzAgYqE+fgKv69d1pzsXsseieS9VLoTtCAA=" },
+    "/images/DGA/Artboard 9.png": { width: 596, height: 843, color: "#eaeaee", placeholder: "data:image/webp;base64,UklGRpYAAABXRUJQVlA4WAoAAAAQAAAADwAAFgAAQUxQSBMAAAABD/D+/4iIIBZM8pfeH0FE/7MVAFZQOCBcAAAAsAMAnQEqEAAXAD8RcrBQLCakorAIAYAiCWcAAFvavToeg5eD1qwA/u1Hao5JwoD655u5McFXMsYGgAMcN8bcDqXgc0IJKi4nI0PhzILXZiNmtqk06GVZ/wGEAAA=" },
+  },
+}
@@ -0,0 +1,26 @@
+// Portfolio Data - Ethos (loaded on demand from projects.index.js)
+export default {
+  id: "ethos",
+  name: "Ethos",
+  type: "Social Media",
+  description: `Ethos is a KSA based creative agency I spent over a year working in. I used to create the visuals for the company whether they were needed to be posted on LinkedIn or be sent to the team or clients.`,
+  thumbnail: "/images/Ethos/عيد أضحى مبارك.jpg",
+  images: [
+    "/images/Ethos/Hiring- Digital Account Lead.jpg",
+    "/images/Ethos/عيد  أضحى مبارك.jpg",
+    "/images/Ethos/عيد أضحى مبارك.jpg",
+    "/images/Ethos/فطر سعيد.jpg",
+  ],
+  hashes: {
+    "/images/Ethos/Hiring- Digital Account Lead.jpg": "3ae308fd",
+    "/images/Ethos/عيد  أضحى مبارك.jpg": "a307dc73",
+    "/images/Ethos/عيد أضحى مبارك.jpg": "759c70f9",
+    "/images/Ethos/فطر سعيد.jpg": "d83a919b",
+  },
+  imageMeta: {
+    "/images/Ethos/Hiring- Digital Account Lead.jpg": { width: 1080, height: 1080, color: "#dfbdc4", placeholder: "data:image/webp;base64,UklGRnAAAABXRUJQVlA4IGQAAADwAQCdASoQABAABABoJZAC7AEQNSydwAAA/u3hjMgCtgcw/5Mbn3RSffQVhl6RxVnR+B8nw8RROvMvNT8nlq3kQZ3tn3FLGnR3vMyqaBsmZQd5+d/gyHH3jq9YG920CRkOAAAA" },
+    "/images/Ethos/عيد  أضحى مبارك.jpg": { width: 1080, height: 1080, color: "#d9d4d9", placeholder: "data:image/webp;base64,UklGRlYAAABXRUJQVlA4IEoAAADwAQCdASoQABAABABoJZQAAud+K7oy23QA/uqCkiy+fXQTJzMlxbMJ2L86nz4A/rM9m7yD+c6pBSt0MLlxqE/PrfJlwVpCsAAAAA==" },
+    "/images/Ethos/عيد أضحى مبارك.jpg": { width: 1080, height: 1080, color: "#98b9cf", placeholder: "data:image/webp;base64,UklGRmQAAABXRUJQVlA4IFgAAAAwAgCdASoQABAABABoJbACdH8AF7cbRXfq8AD+9NvJI0TQKJjrMFMpYo0tbxbbiNg/FLEeSwU/S87IioternFxxziYGWG1r4v7A6wFDeM+szwUAMPfGPAA" },
+    "/images/Ethos/فطر سعيد.jpg": { width: 1080, height: 1080, color: "#d39d9f", placeholder: "data:image/webp;base64,UklGRm4AAABXRUJQVlA4IGIAAAAwAgCdASoQABAABABoJbAC7AELlZPMYxcDAAD+83T0Exqat2fcDTdtxH/3Xv9kQc8zVqpkP8qm2kSO+DUiFwlIQHfI5Gx3X2NcAFVeX8TIQTa70alFeuA4330G+xO6YoAAAA==" },
+  },
+}
@@ -0,0 +1,25 @@
+// Portfolio Data - Ferra Rawan (loaded on demand from projects.index.js)
+export default {
+  id: "ferra-rawan",
+  name: "Ferra Rawan",
+  type: "Social Media + Branding",
+  thumbnail: "/images/Ferra Rawan/Artboard 2.png",
+  images: [
+    "/images/Ferra Rawan/Artboard 1.png",
+    "/images/Ferra Rawan/Artboard 2.png",
+    "/images/Ferra Rawan/Artboard 3.png",
+    "/images/Ferra Rawan/Artboard 4.png",
+  ],
+  hashes: {
+    "/images/Ferra Rawan/Artboard 1.png": "f6e2d5e5",
+    "/images/Ferra Rawan/Artboard 2.png": "8bcb1249",
+    "/images/Ferra Rawan/Artboard 3.png": "7b23189b",
+    "/images/Ferra Rawan/Artboard 4.png": "07e0ad90",
+  },
+  imageMeta: {
+    "/images/Ferra Rawan/Artboard 1.png": { width: 1080, height: 1080, color: "#f4f3ee", placeholder: "data:image/webp;base64,UklGRiYAAABXRUJQVlA4IBoAAAAwAQCdASoQABAABABoJZwAA3AA/vESYwgAAA==" },
+    "/images/Ferra Rawan/Artboard 2.png": { width: 1080, height: 1080, color: "#000000", placeholder: "data:image/webp;base64,UklGRugAAABXRUJQVlA4WAoAAAAQAAAADwAADwAAQUxQSFQAAAABcB3bttJs3B367w3inot/xT0FRMQE8H/drHCx8szAKHIdNiIly6aZMxNZwng67WhOJ0FOp+4dh7adsmyaOcu23YIdpxZmlmvgBQBpDIQRkBU3vw5WUDggbgAAALACAJ0BKhAAEAAEAGglmAJ0fwXH+MAA4BkMUNjWAAD+y1js8VVgrVQ21tXllN3EnpLBv/5sgnShjGyFo8fs62PyLiToyunLxQkR3qQ0d3Ft/Rr2T0xxcGmp4EtMytqnZStzr9N8ejMsQUrwCAAA" },
+    "/images/Ferra Rawan/Artboard 3.png": { width: 1080, height: 1080, color: "#000000", placeholder: "data:image/webp;base64,UklGRoIAAABXRUJQVlA4WAoAAAAQAAAADwAADwAAQUxQSEEAAAABuS5E9D/AOpKkVIv9ef5pkBc8d3cJIGICJgDhBx1m1BMmoxY3yewEsKsJEzgvEYMLGnfFoq4IlwCIC0bligffBABWUDggGgAAADABAJ0BKhAAEAAEAGglpAADcAD+8z3WAAAA" },
+    "/images/Ferra Rawan/Artboard 4.png": { width: 1080, height: 1080, color: "#f4f3ee", placeholder: "data:image/webp;base64,UklGRlgAAABXRUJQVlA4IEwAAADwAQCdASoQABAABABoJZwAApMisJJpPrIA/vOCgL4Dkt3+rp60KrLoz9QxhZUz20+/TWOD3LZCe6V/v5kXUu+I82s8SSxuTWQ5PgAA" },
+  },
+}
@@ -0,0 +1,32 @@
+// Portfolio Data - FFF (loaded on demand from projects.index.js)
+export default {
+  id: "fff",
+  name: "FFF",
+  type: "Social Media",
+  description: `Created the social media visual style and opening grids for Frozen Food Factory, a brand selling high level - long lasting frozen meals.`,
+  thumbnail: "/images/FFF/2.png",
+  images: [
+    "/images/FFF/1.png",
+    "/images/FFF/2.png",
+    "/images/FFF/3.png",
+    "/images/FFF/4.png",
+    "/images/FFF/5.png",
+    "/images/FFF/6.png",
+  ],
+  hashes: {
+    "/images/FFF/1.png": "ade52cc5",
+    "/images/FFF/2.png": "5102dcf1",
+    "/images/FFF/3.png": "d8bb3354",
+    "/images/FFF/4.png": "7be67ed2",
+    "/images/FFF/5.png": "86b8374b",
+    "/images/FFF/6.png": "2bcd312a",
+  },
+  imageMeta: {
+    "/images/FFF/1.png": { width: 400, height: 500, color: "#d9e6f0", placeholder: "data:image/webp;base64,UklGRl4AAABXRUJQVlA4IFIAAADQAwCdASoQABQAPxFysFAsJqSisAgBgCIJZQC/OCG+x0jcSVETEgAA/ufCr179ja4EsvHj8LLxIOUYoPHF2th3mwS6OziisIl18OzgJSLh4AAA" },
+    "/images/FFF/2.png": { width: 400, height: 500, color: "#d6e5f1", placeholder: "data:image/webp;base64,UklGRlgAAABXRUJQVlA4IEwAAADQAwCdASoQABQAPxFysFAsJqSisAgBgCIJYwCdACHfLzay6jUfeAAA/t6TKGVDT/UtcTaozL9js1lM0vjg2w0U0z+6GyYqS6IxzgAA" },
+    "/images/FFF/3.png": { width: 400, height: 500, color: "#d9e7f5", placeholder: "data:image/webp;base64,UklGRlgAAABXRUJQVlA4IEwAAACwAwCdASoQABQAPxFysFAsJqSisAgBgCIJZQC7ACHfL2ozDwd/gAD+5yaRdzWIWWJlMaQpCiJhU8xvcutXSkqAI9qg1bUhcYSQAAAA" },
+    "/images/FFF/4.png": { width: 400, height: 500, color: "#493c38", placeholder: "data:image/webp;base64,UklGRnoAAABXRUJQVlA4IG4AAADQAwCdASoQABQAPxFysFAsJqSisAgBgCIJZQAAXqSyS8MGIcy92IAA/ujwydyK7ynXNaysHfY4MXdGmeNIzW+fnvqvMgCnBK9SLJDj6cRLWqvAP+JHh2eQoDw4AA2e8YXHNziRL27HE8Gp+OiAAA==" },
+    "/images/FFF/5.png": { width: 400, height: 500, color: "#22201e", placeholder: "data:image/webp;base64,UklGRmwAAABXRUJQVlA4IGAAAACwAwCdASoQABQAPxFysFAsJqSisAgBgCIJYwAAW+skilQCO6EdwAD+6LnKDKx5FThvRrWXCGXBh+sZ5jGmbWNW703QHApdfq4rN2ycv4bJYRHhvmj+OPyuiaZhbSmgAAA=" },
+    "/images/FFF/6.png": { width: 400, height: 500, color: "#0b0807", placeholder: "data:image/webp;base64,UklGRnYAAABXRUJQVlA4IGoAAACwAwCdASoQABQAPxFysFAsJqSisAgBgCIJQBdgBDvwAkFWItppYAD+7nhVOjQQPyYtz7tHgCfzB9br7Eao6D3zbMydH2eM0vo7ncA5nUPghBTLtrdUoExEV/I1yOFf2q41ZEiK1pXpRywA" },
+  },
+}
@@ -0,0 +1,50 @@
+// Portfolio Data - Freshdays (loaded on demand from projects.index.js)
+export default {
+  id: "freshdays",
+  name: "Freshdays",
+  type: "Social Media + AI Reels",
+  description: `Developed engaging social media content and AI reels for Freshdays, focusing on a fresh and relatable brand voice.`,
+  thumbnail: "/images/Freshdays/A12.jpg",
+  images: [
+    "/images/Freshdays/A1.png",
+    "/images/Freshdays/A10.jpg",
+    "/images/Freshdays/A11.jpg",
+    "/images/Freshdays/A12.jpg",
+    "/images/Freshdays/A2.png",
+    "/images/Freshdays/A3.png",
+    "/images/Freshdays/A4.png",
+    "/images/Freshdays/A5.jpg",
+    "/images/Freshdays/A6.jpg",
+    "/images/Freshdays/A7.jpg",
+    "/images/Freshdays/A8.jpg",
+    "/images/Freshdays/A9.png",
+  ],
+  hashes: {
+    "/images/Freshdays/A1.png": "19140de7",
+    "/images/Freshdays/A10.jpg": "3cef2b3c",
+    "/images/Freshdays/A11.jpg": "7ca42784",
+    "/images/Freshdays/A12.jpg": "ed4f8be8",
+    "/images/Freshdays/A2.png": "3c2c64b2",
+    "/images/Freshdays/A3.png": "9ca3b316",
+    "/images/Freshdays/A4.png": "2d91bd21",
+    "/images/Freshdays/A5.jpg": "bc0c3d8e",
+    "/images/Freshdays/A6.jpg": "4f666a15",
+    "/images/Freshdays/A7.jpg": "c8d1d862",
+    "/images/Freshdays/A8.jpg": "2d7121ff",
+    "/images/Freshdays/A9.png": "d10987d4",
+  },
+  imageMeta: {
+    "/images/Freshdays/A1.png": { width: 1800, height: 2250, color: "#f6f6f6", placeholder: "data:image/webp;base64,UklGRmAAAABXRUJQVlA4IFQAAABQAwCdASoQABQAPxFysFCsJqSisAgBgCIJYgAAXEjlG7gbqAD+6o53NR1lPQHz9a3l5qdfd7/Ypfa7o7G4ow3JNWj4qcMHt77fo9ig6XKhsm2SAAA=" },
+    "/images/Freshdays/A10.jpg": { width: 1500, height: 2000, color: "#deddcf", placeholder: "data:image/webp;base64,UklGRmQAAABXRUJQVlA4IFgAAABwAwCdASoQABUAPxFysFAsJqSisAgBgCIJZwDCgC0bVBpwIAAA/u16kiG29glFXxFcv1m3g6gtXmBkmy4Ls+U0WysK96emwPitmD6mCYG/rQwAeRs7cegA" },
+    "/images/Freshdays/A11.jpg": { width: 1800, height: 2400, color: "#fad5cc", placeholder: "data:image/webp;base64,UklGRmoAAABXRUJQVlA4IF4AAAAQBACdASoQABUAPxFysFAsJqSisAgBgCIJYwCdMoADTidPiedvc7PaAAD+3nbEC0xJRpyo03Pr9UOWSlWFczPkESXWmj7/JsqQvo+4GvI9ZMHbPhbRB11Y+jE4VigA" },
+    "/images/Freshdays/A12.jpg": { width: 1600, height: 2000, color: "#d9a48c", placeholder: "data:image/webp;base64,UklGRogAAABXRUJQVlA4IHwAAABwBACdASoQABQAPxFysFAsJqSisAgBgCIJbACdMoR3ACxAQxF7Lf46RPf5AAD+tABN6KTpJg28g9u/E2NM/28JGolLWz3KuE1vpiTA9r2NYQVRy/LYy0wjuvc1tjRmE01MnGny7rTyYtMFZ2wL2TJ7jqdJN33O2BtUlTAA" },
+    "/images/Freshdays/A2.png": { width: 1800, height: 2250, color: "#f6f6f6", placeholder: "data:image/webp;base64,UklGRnAAAABXRUJQVlA4IGQAAADQAwCdASoQABQAPxFysFAsJqSisAgBgCIJZQAAW+LWaupdilB0C4AA/uqOUKudBbZWyDh6Ms2GCSI68PHWIMQ+N7NiPrl7lgOTJ3GGkyT+3p9GwOFsa3KCdIABv/7lXHf/AAAA" },
+    "/images/Freshdays/A3.png": { width: 1600, height: 2000, color: "#f6f6f6", placeholder: "data:image/webp;base64,UklGRlgAAABXRUJQVlA4IEwAAAAQAwCdASoQABQAPxFysFAsJqSisAgBgCIJY2fkWeATx+AA/u5uDD671bMjooIC+m4cSoDG2SzY7noZHo5jR18P6X0C9B8PlTptgAAA" },
+    "/images/Freshdays/A4.png": { width: 1800, height: 2250, color: "#f6f6f6", placeholder: "data:image/webp;base64,UklGRlgAAABXRUJQVlA4IEwAAABQAwCdASoQABQAPxFwsFAsJiSisAgBgCIJZQAAW/BV3iGXAAD+6o/UWXPz3o7HOhU876thBmfBJt5ThCBkit8rtYeDuYJBN1GPHwAA" },
+    "/images/Freshdays/A5.jpg": { width: 1500, height: 2000, color: "#866a60", placeholder: "data:image/webp;base64,UklGRqYAAABXRUJQVlA4IJoAAABQBACdASoQABUAPxFysFAsJqSisAgBgCIJbACdMoMxgEmbQRawkJBCJfoAAPx/UhIsK/DOi+Y358BHhetT+3qUzVP8d2od3n6hGDV6ruKmZj+CyfjGbESbm0lyetTHV1QRQlBVHCCQD9QcdcAxqvyzyUWcc3xtqWGJdfYz8IuB/Ftrt5G0gTlXKDz97G9Do2oWlNBSvQigEAAA" },
+    "/images/Freshdays/A6.jpg": { width: 1800, height: 2250, color: "#718a81", placeholder: "data:image/webp;base64,UklGRooAAABXRUJQVlA4IH4AAACQAwCdASoQABQAPxFysFAsJqSisAgBgCIJQBAAARC2wtK+rk+AAP7Dh/ZhLiZpUVWBIVNyarXVbBVuZM+0jqvdOCOlR2ZNCZbK11tW4OT/UwSSqsmTspNRqqCCXjD5eN3iRsXWv0YIJqeJWOQEfKNSNI5ySnig1glg/Z11AAA=" },
+    "/images/Freshdays/A7.jpg": { width: 1080, height: 1350, color: "#51593e", placeholder: "data:image/webp;base64,UklGRoIAAABXRUJQVlA4IHYAAAAQBACdASoQABQAPxFysFAsJqSisAgBgCIJQBOgA+napKZDxGCC+0BgAAD8zsfFucr162Hjwcv32wpmH3NtWB+exwj71fTJ9nOqAG2P8MCm3xA+dAZa6x+iNLdHPSv13bbk8JWXQ7lXmE+yLpo84Oefm3zWwAAA" },
+    "/images/Freshdays/A8.jpg": { width: 1500, height: 2000, color: "#827d6c", placeholder: "data:image/webp;base64,UklGRpQAAABXRUJQVlA4IIgAAACwAwCdASoQABUAPxFysFAsJqSisAgBgCIJQAAMNz6FbrcYWQrBwADN+lygyfZF3riZg0o5OTpg6ruXsKTTSrSaLrZxoITHm1KXYYXMnuwQcFVT7073x6QZuqb/iHvmyPLYrZl3sMZO+belf9398PDD2sKW/1p/tPDYHS1mkvtgooNP15ncbgAA" },
+    "/images/Freshdays/A9.png": { width: 1800, height: 2250, color: "#b8c8b7", placeholder: "data:image/webp;base64,UklGRk4AAABXRUJQVlA4IEIAAACwAwCdASoQABQAPxFysFAsJqSisAgBgCIJZwCdAB6uwCmpCnSsAAD+jO3vOFdZAKo6JuQ/Fm9N4eKX+7cUCDQUAAA=" },
+  },
+}
@@ -0,0 +1,41 @@
+// Portfolio Data - Gipsy (loaded on demand from projects.index.js)
+export default {
+  id: "gipsy",
+  name: "Gipsy",
+  type: "Social Media + AI Reels",
+  description: `Created high-energy social media content and AI reels for Gipsy, aligning with their bold brand identity.`,
+  thumbnail: "/images/Gipsy/B3.png",
+  images: [
+    "/images/Gipsy/A1.png",
+    "/images/Gipsy/A2.png",
+    "/images/Gipsy/A3.png",
+    "/images/Gipsy/A4.png",
+    "/images/Gipsy/B1.png",
+    "/images/Gipsy/B2.png",
+    "/images/Gipsy/B3.png",
+    "/images/Gipsy/B4.png",
+    "/images/Gipsy/C1.jpg",
+  ],
+  hashes: {
+    "/images/Gipsy/A1.png": "e68b22bc",
+    "/images/Gipsy/A2.png": "3402d3be",
+    "/images/Gipsy/A3.png": "5408286b",
+    "/images/Gipsy/A4.png": "ca8a59b8",
+    "/images/Gipsy/B1.png": "9308caac",
+    "/images/Gipsy/B2.png": "d2e6fe5b",
+    "/images/Gipsy/B3.png": "d2ef1247",
+    "/images/Gipsy/B4.png": "e7a30f96",
+    "/images/Gipsy/C1.jpg": "7e844c0a",
+  },
+  imageMeta: {
+    "/images/Gipsy/A1.png": { width: 1080, height: 1350, color: "#0a261b", placeholder: "data:image/webp;base64,UklGRoIAAABXRUJQVlA4IHYAAACQAwCdASoQABQAPxFysFAsJqSisAgBgCIJbACsMoAC5bw3dQ9AAP7o7+rj4/Z0zFuy6cR5GIAikR2/PKRsCTPdOzgP1ST/uCINQwm7lbrNPZZqV6SeAgKIj9HQtsOHruax2PvZXJYRpnkEoWjebCMi8qcyAAAA" },
+    "/images/Gipsy/A2.png": { width: 1080, height: 1350, color: "#3f6241", placeholder: "data:image/webp;base64,UklGRnIAAABXRUJQVlA4IGYAAABwBACdASoQABQAPxFysVCsJqSisAgBgCIJbACdMoAC8c3SfDr6Kxj94zq0AADrcds4MSCwdek6djN6PJ2sRwbbcp+Pwvy/KHPO61FwBybMJ9SCPrZHG6hTJYSH1b+K3Dth2RAwAAA=" },
+    "/images/Gipsy/A3.png": { width: 1080, height: 1350, color: "#486347", placeholder: "data:image/webp;base64,UklGRm4AAABXRUJQVlA4IGIAAACQAwCdASoQABQAPxFysVAsJqSisAgBgCIJbACdABB5phD6ak0AANYb4Yf/9nuhBNm1spRKHPD1R3cZ+B2HyEKzqwWcV/2T2rreylkUtk5j12+pAlj3xs8V3PcfHj/vdddAAA==" },
+    "/images/Gipsy/A4.png": { width: 1080, height: 1350, color: "#56a673", placeholder: "data:image/webp;base64,UklGRoYAAABXRUJQVlA4IHoAAADwAwCdASoQABQAPxFysFAsJqSisAgBgCIJbACdMoABo8Fuz9UW0dYAANX4TIYQfPDhwGso0sakyVNQdTYEP4qhBCptC6Kc4ESpBKeEZdFtnyQjsvZcDsFLiRttlEa5CkNOEXsyglRYNqI/sDlX0gWlRnN5nbSXsCFAAA==" },
+    "/images/Gipsy/B1.png": { width: 1080, height: 1350, color: "#399362", placeholder: "data:image/webp;base64,UklGRnAAAABXRUJQVlA4IGQAAACQAwCdASoQABQAPxFysFAsJqSisAgBgCIJbACdMoABX+zQtPfwAF8aVQcdUeT3WAvif9wgWtwYGZOKCcdTFOch2oxqxYk5zRb7Ex0FK8l+anbg6Sgvr2zM26eZUQ7OCn6oAAAA" },
+    "/images/Gipsy/B2.png": { width: 1080, height: 1350, color: "#4773d8", placeholder: "data:image/webp;base64,UklGRmYAAABXRUJQVlA4IFoAAADQAwCdASoQABQAPxFysFAsJqSisAgBgCIJagCdLwABmRMyTocJdYAA7pNO1NL68UWZAqF+Lg9yZSFiPk262+nABgB/Yuia6782vVntp9bom9Ld8rGEdaZ5EAA=" },
+    "/images/Gipsy/B3.png": { width: 1080, height: 1350, color: "#de372a", placeholder: "data:image/webp;base64,UklGRnAAAABXRUJQVlA4IGQAAACwAwCdASoQABQAPxFysFAsJqSisAgBgCIJbAC7ABPGbjcfQlP6cABbg2rk5KXiw557U+zh1H4jf8SmQIMuBMejjd7UaM+nFHT0YvMcrxnPE7d84hZVdtfqdGcpiwnJ/+VEAAAA" },
+    "/images/Gipsy/B4.png": { width: 1080, height: 1350, color: "#3c8c60", placeholder: "data:image/webp;base64,UklGRngAAABXRUJQVlA4IGwAAADQAwCdASoQABQAPxFysFAsJqSisAgBgCIJZgCdAYsEmm3F0Ku0IAAAx7Ia44obVZQxBs+RzkKV/aw/gEK0ke646N6VTxFAtSimGQaIKBFt9KJztJmj6OAzYBI2FY6zl3JkYpr9IFJUbNxdgAA=" },
+    "/images/Gipsy/C1.jpg": { width: 1080, height: 1350, color: "#7c614d", placeholder: "data:image/webp;base64,UklGRoYAAABXRUJQVlA4IHoAAAAQBACdASoQABQAPxFwsFAsJiSisAgBgCIJZgCw7B4bX49YwluUWtm7LAD+09tfLACL3PDIn2gbBPPul3nb5rUfBt2oAa+1XA9nrCD2VehZyYZtV/lZ++HOYkI6hxiLLgx7IOUJed1yadgPo5FrNKtLcerjQKyz6K4AAA==" },
+  },
+}
@@ -0,0 +1,32 @@
+// Portfolio Data - Handy (loaded on demand from projects.index.js)
+export default {
+  id: "handy",
+  name: "Handy",
+  type: "Social Media + AI Reels",
+  description: `Managed social media visuals and AI reels for Handy, ensuring a clean and professional aesthetic.`,
+  thumbnail: "/images/Handy/A3.png",
+  images: [
+    "/images/Handy/A1.png",
+    "/images/Handy/A2.png",
+    "/images/Handy/A3.png",
+    "/images/Handy/A4.png",
+    "/images/Handy/A5.jpg",
+    "/images/Handy/A6.jpg",
+  ],
+  hashes: {
+    "/images/Handy/A1.png": "7714da0c",
+    "/images/Handy/A2.png": "81369059",
+    "/images/Handy/A3.png": "b612013c",
+    "/images/Handy/A4.png": "130b1d03",
+    "/images/Handy/A5.jpg": "e66efe1f",
+    "/images/Handy/A6.jpg": "ff68b870",
+  },
+  imageMeta: {
+    "/images/Handy/A1.png": { width: 1080, height: 1350, color: "#5a4b40", placeholder: "data:image/webp;base64,UklGRoAAAABXRUJQVlA4IHQAAAAQBACdASoQABQAPxFysFAsJqSisAgBgCIJYwCw7B4mjLt6PDRMCnwtcAD+3NSm8Vktpfqc7W/W8Wl5YOWEnRPQtb2CF/dIPxnZp0Q4YhGN89Z4liL5hYYP8hbH/ArJJocKnaAjKS63CKygwUp3TOHlSSwAAA==" },
+    "/images/Handy/A2.png": { width: 1080, height: 1350, color: "#b1a291", placeholder: "data:image/webp;base64,UklGRloAAABXRUJQVlA4IE4AAADQAwCdASoQABQAPxF0slCsJqSisAgBgCIJZQC06CG/NXU3bhoHDMAA/sO/zY6hvd1r1l2ATVOHgEUVzy5M8s2aLxrVaGeniXzcY4lkAAA=" },
+    "/images/Handy/A3.png": { width: 1080, height: 1350, color: "#233010", placeholder: "data:image/webp;base64,UklGRnwAAABXRUJQVlA4IHAAAACwAwCdASoQABQAPxFysFAsJqSisAgBgCIJbAC7LwABGjbVrAn3wAD+dt8YZxvApMyE1foxhpQ++2DDP4BLg1nVK0rq8Ee4z+DAAVhVOCbzldac7/vymGwh68oy8D2Ib9PyrtxVQgreNlgVt2U41oAA" },
+    "/images/Handy/A4.png": { width: 1080, height: 1350, color: "#846953", placeholder: "data:image/webp;base64,UklGRoQAAABXRUJQVlA4IHgAAADQAwCdASoQABQAPxFwsFAsJiSisAgBgCIJaACdACKjxsypf1F8lbAA/s4B0XWfaWGsP5mXxSil7v4uNsrIzQfhjKoDRBcp9OZMdKWSHEdxJRrJZW2Z3/27fAOC/JPMdhPq/xSbC2AohThJ5TuRML5uOmWg9S4AAAA=" },
+    "/images/Handy/A5.jpg": { width: 1080, height: 1350, color: "#a39a8b", placeholder: "data:image/webp;base64,UklGRmYAAABXRUJQVlA4IFoAAAAQBACdASoQABQAPxFysFAsJqSisAgBgCIJaAAAV6b/FCJVJjOYtCDMGAD+jG9JKUeY8qqK/9YcSndwiTk4RX+NWvx/32ss+5C97M/XX5YvJ2EomZPncglUgAA=" },
+    "/images/Handy/A6.jpg": { width: 1080, height: 1920, color: "#183c67", placeholder: "data:image/webp;base64,UklGRowAAABXRUJQVlA4IIAAAABwBACdASoQABwAPxF0sFCsJqSisAgBgCIJaACdMoAKRtWHPcQvGa08y6p2AAD++uzTjPAUNhj9IZLJ1YgmWq68dSNfIY8y6ytskU93gLyZd0Td6N79vLENRkgIBXaUHzOqfx5AduER7F4cWnAS//+phjIcggh2eyrprin4J8uoAA==" },
+  },
+}
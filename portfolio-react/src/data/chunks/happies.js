@@ -0,0 +1,13 @@
+// Portfolio Data - Happies (loaded on demand from projects.index.js)
+export default {
+  id: "happies",
+  name: "Happies",
+  type: "Social Media + AI Reels",
+  description: `Produced fun and vibrant social media content and AI reels for Happies, capturing the brand's joyful essence.`,
+  thumbnail: "/images/Happies/R1.mp4",
+  videos: [
+    "/images/Happies/R1.mp4",
+    "/images/Happies/R2.mp4",
+    "/images/Happies/R3.mp4",
+  ],
+}
@@ -0,0 +1,65 @@
+// Portfolio Data - La Roche (loaded on demand from projects.index.js)
+export default {
+  id: "la-roche",
+  name: "La Roche",
+  type: "Social Media",
+  description: `Adapted a dreamy visual style with the products being the main element in the brand.`,
+  thumbnail: "/images/La Roche/طعــــــمتها ما بتنتسى.jpg",
+  images: [
+    "/images/La Roche/A ball of harmony.jpg",
+    "/images/La Roche/A crunch you can feel.jpg",
+    "/images/La Roche/Almond your dreams come true!.jpg",
+    "/images/La Roche/Charge with la roche.jpg",
+    "/images/La Roche/Crack open a smile!.jpg",
+    "/images/La Roche/Feel Walnut, feel good!.jpg",
+    "/images/La Roche/Malban.png",
+    "/images/La Roche/Snowy Cocoa.png",
+    "/images/La Roche/Sweet Reflections.jpg",
+    "/images/La Roche/Your Piece My Piece.jpg",
+    "/images/La Roche/eid adha.jpg",
+    "/images/La Roche/pistachio knafeh chocolate bar 1.jpg",
+    "/images/La Roche/طعــــــمتها ما بتنتسى.jpg",
+    "/images/La Roche/طعم الذكريات الحلوة.jpg",
+    "/images/La Roche/قصة حب مع الفستق.jpg",
+    "/images/La Roche/لذيذ حلو خفيف.jpg",
+    "/images/La Roche/وقفه حلوه.jpg",
+  ],
+  hashes: {
+    "/images/La Roche/A ball of harmony.jpg": "04bb00b6",
+    "/images/La Roche/A crunch you can feel.jpg": "78f65b1e",
+    "/images/La Roche/Almond your dreams come true!.jpg": "7cd326cb",
+    "/images/La Roche/Charge with la roche.jpg": "0c6eeadd",
+    "/images/La Roche/Crack open a smile!.jpg": "27678251",
+    "/images/La Roche/Feel Walnut, feel good!.jpg": "a3001f6c",
+    "/images/La Roche/Malban.png": "a22a9648",
+    "/images/La Roche/Snowy Cocoa.png": "434a4953",
+    "/images/La Roche/Sweet Reflections.jpg": "3b131947",
+    "/images/La Roche/Your Piece My Piece.jpg": "f46a4892",
+    "/images/La Roche/eid adha.jpg": "41595f5a",
+    "/images/La Roche/pistachio knafeh chocolate bar 1.jpg": "419f1851",
+    "/images/La Roche/طعــــــمتها ما بتنتسى.jpg": "98bc4716",
+    "/images/La Roche/طعم الذكريات الحلوة.jpg": "2b42eb64",
+    "/images/La Roche/قصة حب مع الفستق.jpg": "74e8cb1a",
+    "/images/La Roche/لذيذ حلو خفيف.jpg": "9408c862",
+    "/images/La Roche/وقفه حلوه.jpg": "d1c41302",
+  },
+  imageMeta: {
+    "/images/La Roche/A ball of harmony.jpg": { width: 1080, height: 1350, color: "#938792", placeholder: "data:image/webp;base64,UklGRkwAAABXRUJQVlA4IEAAAACQAwCdASoQABQAPxFysFAsJqSisAgBgCIJZQC2yBR758vKIigAAMKrl3eIUBF82jPhIKT52jKN+VBXQIRPgAAA" },
+    "/images/La Roche/A crunch you can feel.jpg": { width: 1080, height: 1350, color: "#5b4163", placeholder: "data:image/webp;base64,UklGRmQAAABXRUJQVlA4IFgAAADwAwCdASoQABQAPxFwsFAsJiSisAgBgCIJZgCdMoADTpqRw/T+rPvAAP5woffmJJUjZv4dNLSp1Z+Qr71pouHvRdI4sK5UgJk2RGaGh7XCtkj9fN4gAAAA" },
+    "/images/La Roche/Almond your dreams come true!.jpg": { width: 1080, height: 1350, color: "#cdb6dd", placeholder: "data:image/webp;base64,UklGRmIAAABXRUJQVlA4IFYAAAAQBACdASoQABQAPxFysVAsJqSisAgBgCIJaAC7MoADKqlEmPFDCA8ECAD+w/3BM8Ob3iL3cpgqFjGGCV4ZEFFiFzBdO8RLkHOq8poyTwYBm40pFxiQAA==" },
+    "/images/La Roche/Charge with la roche.jpg": { width: 1080, height: 1350, color: "#7c4b30", placeholder: "data:image/webp;base64,UklGRloAAABXRUJQVlA4IE4AAAAwAwCdASoQABQAPxFwsFAsJiSisAgBgCIJSvPgBuPozpagAP7emJh958ACh2lrLLkifOsXZiZQ+5vByu/gy22KiJ6YLbWBvfIVEAAAAAA=" },
+    "/images/La Roche/Crack open a smile!.jpg": { width: 1080, height: 1350, color: "#543d59", placeholder: "data:image/webp;base64,UklGRogAAABXRUJQVlA4IHwAAADQAwCdASoQABQAPxFysFAsJqSisAgBgCIJQBYdhCxxZTWbCyMJFQAA/nDo262Ch7hOXMtVWV/JYTo+jAldsAaEZhQW82y8d+/6kvQEmYM1ZR3qrSAx8u7KFuWXDkC8fuq8/IXmMAOblPHrNEPlIeDtEMIhrJCY3/ZAOsgA" },
+    "/images/La Roche/Feel Walnut, feel good!.jpg": { width: 1080, height: 1350, color: "#5f4468", placeholder: "data:image/webp;base64,UklGRkgAAABXRUJQVlA4IDwAAADwAgCdASoQABQAPxFysFAsJqSisAgBgCIJQBOmUACNQAD+4xN03kMC3/VRjrDtXoKepHpJb9Lp8FPwAAA=" },
+    "/images/La Roche/Malban.png": { width: 1080, height: 1350, color: "#e8d1f6", placeholder: "data:image/webp;base64,UklGRmYAAABXRUJQVlA4IFoAAABwBACdASoQABQAPxFysFAsJqSisAgBgCIJbACdMoMYAEmhlK+UxSeQaBnDAAD+3snBHmN3e5CdJbR5legBr4kw568lWLjZhO8ve/gaUptFXOo1PHIjo28AAAA=" },
+    "/images/La Roche/Snowy Cocoa.png": { width: 1080, height: 1350, color: "#d7c8af", placeholder: "data:image/webp;base64,UklGRm4AAABXRUJQVlA4IGIAAABwBACdASoQABQAPxFwsFAsJiSisAgBgCIJYgCdMoMlxS2AtS13M60aRHC3wAD3Jxwj4WmTH4oFnrwGOzoZ4DipNetiT2vBFMvfqGDxcMXs5yVZV9KGlbXRYtzjhdjLsMAAAA==" },
+    "/images/La Roche/Sweet Reflections.jpg": { width: 1080, height: 1350, color: "#a895d2", placeholder: "data:image/webp;base64,UklGRnAAAABXRUJQVlA4IGQAAACwAwCdASoQABQAPxFysFAsJqSisAgBgCIJYgAAWkN5aVQSMralYAD4UUj0p3BhYsIt7OWlBfBL5GtmpgPsCD+AgP6rJifdrtYdSWIe1wShxruigyzQb2szCbBkYo05soEAbYAA" },
+    "/images/La Roche/Your Piece My Piece.jpg": { width: 1080, height: 1350, color: "#543d59", placeholder: "data:image/webp;base64,UklGRk4AAABXRUJQVlA4IEIAAACwAwCdASoQABQAPxFysFAsJqSisAgBgCIJYwCo9CHf3omMe0JeAAD+b0NBH2Rruh6eDNYJa0BqsisgzyH5uzEUAAA=" },
+    "/images/La Roche/eid adha.jpg": { width: 1080, height: 1350, color: "#c2b7d9", placeholder: "data:image/webp;base64,UklGRlAAAABXRUJQVlA4IEQAAACwAwCdASoQABQAPxFysFAsJqSisAgBgCIJQBdgBCokj+fn0DGUAAD+03U1iV3GgjIXcojogFbQVe7+i9OYXUB5eXgAAA==" },
+    "/images/La Roche/pistachio knafeh chocolate bar 1.jpg": { width: 1080, height: 1350, color: "#d2a26b", placeholder: "data:image/webp;base64,UklGRl4AAABXRUJQVlA4IFIAAADwAwCdASoQABQAPxFysFAsJqSisAgBgCIJaACdMoR3ACqec2jdv6AAAP3SnpTghOcHz1jWcO2YbHsCTBpQfMQH0yMbwVEWP+f6bChSNOEfBAAA" },
+    "/images/La Roche/طعــــــمتها ما بتنتسى.jpg": { width: 1080, height: 1350, color: "#efa4c0", placeholder: "data:image/webp;base64,UklGRoAAAABXRUJQVlA4IHQAAADwAwCdASoQABQAPxFysFAsJqSisAgBgCIJbACdAB5/vrXjsufb2kQAAP7IVcJMMnk/99N/EjEZiEAEG9k3dcJa5gBwTVpNpU+UdpyOLt5nqsYx1eNjCWvYzNKKeqQeeqv1+FEZXLvwDAiVy+rh/3aj04AAAA==" },
+    "/images/La Roche/طعم الذكريات الحلوة.jpg": { width: 1080, height: 1350, color: "#eab6c5", placeholder: "data:image/webp;base64,UklGRlgAAABXRUJQVlA4IEwAAACQAwCdASoQABQAPxFysFAsJqSisAgBgCIJZgCdACHEgOpa+RzAAP7THZ9cmAXofrMij3xt9mT2qJmFMwecq4cA6vhujLz8r2otcAAA" },
+    "/images/La Roche/قصة حب مع الفستق.jpg": { width: 1080, height: 1350, color: "#baaad3", placeholder: "data:image/webp;base64,UklGRmIAAABXRUJQVlA4IFYAAADwAwCdASoQABQAPxFysFAsJqSisAgBgCIJZgCdACHfw6Nbx9jsYn2gAP5SqeF1GPJ6RV3VPScSExxz3UNNLu+OpJzlawoLBlKyyPB7OJM3scDY5wAAAA==" },
+    "/images/La Roche/لذيذ حلو خفيف.jpg": { width: 1080, height: 1350, color: "#c6b4db", placeholder: "data:image/webp;base64,UklGRlAAAABXRUJQVlA4IEQAAACQAwCdASoQABQAPxFysFAsJqSisAgBgCIJQBOgBDwPRawvOGqAAP6uWOZrKiiuNfdgf2pYhushyhmWPh090fiqoFSqAA==" },
+    "/images/La Roche/وقفه حلوه.jpg": { width: 1080, height: 1350, color: "#cbc4cb", placeholder: "data:image/webp;base64,UklGRmgAAABXRUJQVlA4IFwAAAAwBACdASoQABQAPxFysFAsJqSisAgBgCIJZACsAB8m89u5nUekFixB32AAn0DEusofc+nCNpP0Gox/el93Z9AARx5/CDFz9x3xgv1RmhecSof4ASRKJ3as0NqAAA==" },
+  },
+}
@@ -0,0 +1,59 @@
+// Portfolio Data - MAC (loaded on demand from projects.index.js)
+export default {
+  id: "mac",
+  name: "MAC",
+  type: "Social Media",
+  description: `I worked on the account of MAC Platforms, a creative agency I worked in. I adopted a collage style for it along with different style of reels for depending on the client.`,
+  thumbnail: "/images/MAC/Highlights/4.png",
+  images: [
+    "/images/MAC/1.png",
+    "/images/MAC/2.png",
+    "/images/MAC/3.png",
+    "/images/MAC/4.png",
+    "/images/MAC/5.png",
+    "/images/MAC/6.png",
+    "/images/MAC/7.png",
+    "/images/MAC/8.jpg",
+    "/images/MAC/Highlights/1.png",
+    "/images/MAC/Highlights/2.png",
+    "/images/MAC/Highlights/3.png",
+    "/images/MAC/Highlights/4.png",
+    "/images/MAC/Highlights/5.png",
+    "/images/MAC/Highlights/6.png",
+    "/images/MAC/Highlights/7.png",
+  ],
+  hashes: {
+    "/images/MAC/1.png": "00b7d165",
+    "/images/MAC/2.png": "4eefecec",
+    "/images/MAC/3.png": "460e10ee",
+    "/images/MAC/4.png": "81c97e56",
+    "/images/MAC/5.png": "e1fba62d",
+    "/images/MAC/6.png": "1113cc67",
+    "/images/MAC/7.png": "14dfa0cf",
+    "/images/MAC/8.jpg": "f7b7231b",
+    "/images/MAC/Highlights/1.png": "99fa2198",
+    "/images/MAC/Highlights/2.png": "ac7330a5",
+    "/images/MAC/Highlights/3.png": "c9958cb1",
+    "/images/MAC/Highlights/4.png": "1e7aa087",
+    "/images/MAC/Highlights/5.png": "7b36d783",
+    "/images/MAC/Highlights/6.png": "1add3829",
+    "/images/MAC/Highlights/7.png": "f647e24e",
+  },
+  imageMeta: {
+    "/images/MAC/1.png": { width: 1080, height: 1350, color: "#f4c800", placeholder: "data:image/webp;base64,UklGRpoAAABXRUJQVlA4II4AAABQBACdASoQABQAPxFysFAsJqSisAgBgCIJbACdMoR4GCTUwT+L2DpIelgAAP6M75z4xgzJYOM8VhKqUMNPlFvWmeR0+e9xsD/+qBaGgmZg/ajOR7vl0/+RuQfsnAYY1Gt0J6lwSV0fOzmSNXeQDubPNTq19Wk0pL+aArL+OQLXvZbE/dlw0PqmScX4AAAA" },
+    "/images/MAC/2.png": { width: 1080, height: 1350, color: "#006695", placeholder: "data:image/webp;base64,UklGRoYAAABXRUJQVlA4IHoAAABQBACdASoQABQAPxFysFAsJqSisAgBgCIJbACdMoR3ACUHJTYqPSbR83BAAP6ds3c/VzYrbgsEkGvvI01+pqk1IHykZmTeeG43LqolkhwdN7dSTX07g4xxAW55ssEcYc+mg4EFNox/RvAaQ5PMVC9k0itZ0SycngGAAA==" },
+    "/images/MAC/3.png": { width: 1080, height: 1350, color: "#fed300", placeholder: "data:image/webp;base64,UklGRp4AAABXRUJQVlA4IJIAAAAQBQCdASoQABQAPxFysFAsJqSisAgBgCIJbACdMoR3N5K1ADJM95G8mYDWSNrl8jsAAP6wFmHeNTO8bfNjvjJw5p/DSOz6Y4Kv1a8RcSyAkT24l/jBeYkD8p4sB2c4d1XRFZYsCv2q/XDrhw/n4Nf+sa7Z6Yth/DkU61edPIJNuP283+0i7pVheF8zXV6dL6RgAA==" },
+    "/images/MAC/4.png": { width: 1080, height: 1350, color: "#006996", placeholder: "data:image/webp;base64,UklGRqgAAABXRUJQVlA4IJwAAABQBACdASoQABQAPxFysFAsJqSisAgBgCIJbACdMoR3ACmqmGsnENsv7q8AAP5u2jaH4+MeojgF0M3vXpSGSzP4xlfSfZkqfP48GJ7tfKdKZw8yRK0DZsbf0rVBRlNSCvS3jCGbjfoa3UlwYQpJCyKxhN50aFDxoW94TMOrEKh6tHMqFrL7pr+LeUV/L1JkPXo3bsA8+Ssv+PtHugA=" },
+    "/images/MAC/5.png": { width: 1080, height: 1350, color: "#ffca11", placeholder: "data:image/webp;base64,UklGRpQAAABXRUJQVlA4IIgAAADwAwCdASoQABQAPxFysFAsJqSisAgBgCIJbACdMoRwACD0swJv7yIgAP6PrGYnFnGMM1ctH+ssepNZyAKC9a0J1aMQucTlWXLYCpDfW7UiBZ2rNv/yNqHnI8wTgzPOKnt9Ws3g1ARhepZP4Z8nzpnrMWOCGm6AbE+p8goqPLoiCa6Pt3xcAAAA" },
+    "/images/MAC/6.png": { width: 1080, height: 1350, color: "#006895", placeholder: "data:image/webp;base64,UklGRqIAAABXRUJQVlA4IJYAAACQBACdASoQABQAPxFysFAsJqSisAgBgCIJbACdMoRiu3AMYdYrnCGQpls/qIAA/p7L1+Y9aNxjfoOQ/MP21ExK9sgSCsS1LT3I956zZXmYox5zOIynCCvIbCujYQd/IqHIh5I+k72W+c7z8wTMtAe/yG7qaDwVpqjetM3Qa5bW5t4xwoikjKhQ0brwsceG1BFytS2AAAA=" },
+    "/images/MAC/7.png": { width: 1080, height: 1350, color: "#0271a1", placeholder: "data:image/webp;base64,UklGRrQAAABXRUJQVlA4IKgAAAAQBQCdASoQABQAPxFysFAsJqSisAgBgCIJbACdMoRwN6Sfh2BXnqWGRGKH7ypUtnMAAP1v4dcoYgLkO16cAwo4TFBeJKNeyfL3mQl1xPRWa9WErWeIUlvvHpee0V8O/vl0Rx/RwR6+BXGIK6rfjLCWmR06QQQenXJeI4YVP0j+K2lw/A/+fv91+s6yIvRB//4O79/HVhp1nPsv8CTeluP5c7/Z/+gAAAA=" },
+    "/images/MAC/8.jpg": { width: 1080, height: 1350, color: "#55849a", placeholder: "data:image/webp;base64,UklGRmIAAABXRUJQVlA4IFYAAADQAwCdASoQABQAPxFysFAsJqSisAgBgCIJYgCdMoABjhZwHvBOVgAA53X+08+RdJHJWTv+uhKesPVPqWJrIRb3dH0cUMLmDlCuscpqA2e+tcQBh+gAAA==" },
+    "/images/MAC/Highlights/1.png": { width: 1080, height: 1080, color: "#006a92", placeholder: "data:image/webp;base64,UklGRnAAAABXRUJQVlA4IGQAAACQAgCdASoQABAABABoJbACdDiAN5VBkIZZNpaWcAD+uPMHg9VPMDKB/aNfv9lC9lYrnRMwOhHgmCliOcVxxz9to+jlOx0b8rIVvc/k7j2zxkP9RytGn20w08D7h1Hfjiq0AAAA" },
+    "/images/MAC/Highlights/2.png": { width: 1080, height: 1080, color: "#f4c800", placeholder: "data:image/webp;base64,UklGRk4AAABXRUJQVlA4IEIAAACQAQCdASoQABAABABoJbACdLoAA5gA/uts3v1g1NZ2QRlK8WPuQuI+0ptG42c17bqvuS/f/Ngft59vPIX4sNCbcAA=" },
+    "/images/MAC/Highlights/3.png": { width: 1080, height: 1080, color: "#f3f0e8", placeholder: "data:image/webp;base64,UklGRmQAAABXRUJQVlA4IFgAAAAwAgCdASoQABAABABoJbACdAYstyGj/RnsAAD+83ajUJsCDD733atLWe2tDg99hLx4Js2Mcbg56dv1rJNzCOZDsfwUqxcQOdJZXw28m6madT4rOfC2wAAA" },
+    "/images/MAC/Highlights/4.png": { width: 1080, height: 1080, color: "#006a92", placeholder: "data:image/webp;base64,UklGRmgAAABXRUJQVlA4IFwAAABQAgCdASoQABAABABoJbACdDiAAUpA+pOx3gAA/srv/KY/W5FNuR3TyS/aglArEt03A++3b9ZR+1+qS9EqX89CP/B8x6Msn8zt71EU7vYVyPt5EKLrX5eIrAAAAA==" },
+    "/images/MAC/Highlights/5.png": { width: 1080, height: 1080, color: "#006a92", placeholder: "data:image/webp;base64,UklGRmQAAABXRUJQVlA4IFgAAADwAQCdASoQABAABABoJbACdADdnKdfYIAA/rn1IbSpYpv6rTNH0IJUUbAZCE7BwAQKS6iNPso7JZb5LGJ9eJDyD0rqawgpLjb4/5R33/JnUyhZ8hRHYAAA" },
+    "/images/MAC/Highlights/6.png": { width: 1080, height: 1080, color: "#f4c800", placeholder: "data:image/webp;base64,UklGRloAAABXRUJQVlA4IE4AAAAQAgCdASoQABAABABoJbACdLoAAwkCOK8wAP7S4XegoPTrA6EWx12JBta1RPldgSULWxCp/8xZUTMfhYPJ8vg3axa68bJPxYaEu7gMAAA=" },
+    "/images/MAC/Highlights/7.png": { width: 1080, height: 1080, color: "#f4c800", placeholder: "data:image/webp;base64,UklGRmAAAABXRUJQVlA4IFQAAAAQAgCdASoQABAABABoJbACdLoAAwkClpXAAP7S4U9NHZ+Zmvo+rxiRjdhaaEq3v/QKiXtxbv/zFlk84byTn/8iWSS34gDSoz9IEphKbkUvibtZUAA=" },
+  },
+}
@@ -0,0 +1,149 @@
+// Portfolio Data - McCafe (loaded on demand from projects.index.js)
+export default {
+  id: "mccafe",
+  name: "McCafe",
+  type: "Social Media",
+  description: `I handled the account of McCafe - KSA for well over a year, building a consistent yet creative social media image for the brand. Here is a sample of my work for McCafe, many of which I myself come with everything in it from the concept, the copy, and the design.`,
+  thumbnail: "/images/McCafe/A28.jpg",
+  images: [
+    "/images/McCafe/A1.jpg",
+    "/images/McCafe/A10.jpg",
+    "/images/McCafe/A11.jpg",
+    "/images/McCafe/A12.jpg",
+    "/images/McCafe/A13.jpg",
+    "/images/McCafe/A14.jpg",
+    "/images/McCafe/A15.jpg",
+    "/images/McCafe/A16.jpg",
+    "/images/McCafe/A17.jpg",
+    "/images/McCafe/A18.jpg",
+    "/images/McCafe/A19.jpg",
+    "/images/McCafe/A2.jpg",
+    "/images/McCafe/A20.jpg",
+    "/images/McCafe/A21.jpg",
+    "/images/McCafe/A22.jpg",
+    "/images/McCafe/A23.jpg",
+    "/images/McCafe/A24.jpg",
+    "/images/McCafe/A25.jpg",
+    "/images/McCafe/A26.jpg",
+    "/images/McCafe/A27.jpg",
+    "/images/McCafe/A28.jpg",
+    "/images/McCafe/A29.jpg",
+    "/images/McCafe/A3.jpg",
+    "/images/McCafe/A30.jpg",
+    "/images/McCafe/A31.jpg",
+    "/images/McCafe/A32.jpg",
+    "/images/McCafe/A33.jpg",
+    "/images/McCafe/A34.jpg",
+    "/images/McCafe/A35.jpg",
+    "/images/McCafe/A36.jpg",
+    "/images/McCafe/A4.jpg",
+    "/images/McCafe/A5.jpg",
+    "/images/McCafe/A6.jpg",
+    "/images/McCafe/A7.jpg",
+    "/images/McCafe/A8.jpg",
+    "/images/McCafe/A9.jpg",
+    "/images/McCafe/M1.jpg",
+    "/images/McCafe/M2.jpg",
+    "/images/McCafe/S1.jpg",
+    "/images/McCafe/S2.jpg",
+    "/images/McCafe/S3.jpg",
+    "/images/McCafe/S4.jpg",
+    "/images/McCafe/S5.jpg",
+    "/images/McCafe/S6.jpg",
+    "/images/McCafe/S7.jpg",
+  ],
+  hashes: {
+    "/images/McCafe/A1.jpg": "7e50d9bc",
+    "/images/McCafe/A10.jpg": "4ae03a48",
+    "/images/McCafe/A11.jpg": "7483ccad",
+    "/images/McCafe/A12.jpg": "fb8f81b3",
+    "/images/McCafe/A13.jpg": "44cfef82",
+    "/images/McCafe/A14.jpg": "bcf33d19",
+    "/images/McCafe/A15.jpg": "b06d2908",
+    "/images/McCafe/A16.jpg": "1da26f9d",
+    "/images/McCafe/A17.jpg": "3ce1df21",
+    "/images/McCafe/A18.jpg": "6573eb6f",
+    "/images/McCafe/A19.jpg": "1a735cb3",
+    "/images/McCafe/A2.jpg": "1cc429f6",
+    "/images/McCafe/A20.jpg": "0d5f0f6a",
+    "/images/McCafe/A21.jpg": "94beebff",
+    "/images/McCafe/A22.jpg": "46e1a7ae",
+    "/images/McCafe/A23.jpg": "6a13a242",
+    "/images/McCafe/A24.jpg": "f69c873f",
+    "/images/McCafe/A25.jpg": "055f80e5",
+    "/images/McCafe/A26.jpg": "9b836ba4",
+    "/images/McCafe/A27.jpg": "78bf45cf",
+    "/images/McCafe/A28.jpg": "4f6e397a",
+    "/images/McCafe/A29.jpg": "fbe5c608",
+    "/images/McCafe/A3.jpg": "5b72ed9e",
+    "/images/McCafe/A30.jpg": "436eefbe",
+    "/images/McCafe/A31.jpg": "3779e9f8",
+    "/images/McCafe/A32.jpg": "98143ec0",
+    "/images/McCafe/A33.jpg": "2859e1d9",
+    "/images/McCafe/A34.jpg": "e2ba2d86",
+    "/images/McCafe/A35.jpg": "0fa2664a",
+    "/images/McCafe/A36.jpg": "79ef66c6",
+    "/images/McCafe/A4.jpg": "1ed19711",
+    "/images/McCafe/A5.jpg": "947a6ebf",
+    "/images/McCafe/A6.jpg": "8c22ee60",
+    "/images/McCafe/A7.jpg": "a9440fb9",
+    "/images/McCafe/A8.jpg": "993f9a6d",
+    "/images/McCafe/A9.jpg": "88c99f91",
+    "/images/McCafe/M1.jpg": "49e3d76d",
+    "/images/McCafe/M2.jpg": "2920e419",
+    "/images/McCafe/S1.jpg": "acd14863",
+    "/images/McCafe/S2.jpg": "da320c7d",
+    "/images/McCafe/S3.jpg": "0d324121",
+    "/images/McCafe/S4.jpg": "7424ca72",
+    "/images/McCafe/S5.jpg": "b7d8fe2d",
+    "/images/McCafe/S6.jpg": "00a96e14",
+    "/images/McCafe/S7.jpg": "0bc7a73a",
+  },
+  imageMeta: {
+    "/images/McCafe/A1.jpg": { width: 1080, height: 1080, color: "#fdb40a", placeholder: "data:image/webp;base64,UklGRnoAAABXRUJQVlA4IG4AAAAwAgCdASoQABAABABoJbACdLoAAs8UMY3wAADb/mjNMXWfyQh0xaYXG5ezoUyl+kJJKufauhyrKlLpbTg3xaSPDJXFn+xYpGD6AbvfRIC21h1wnDXe//+Q7AM76T1QYtD4jURoeJX4njBrH4AAAA==" },
+    "/images/McCafe/A10.jpg": { width: 1080, height: 1080, color: "#ffe5b4", placeholder: "data:image/webp;base64,UklGRmIAAABXRUJQVlA4IFYAAADwAQCdASoQABAABABoJbACdAELXw0pywAA/vBA2X1+E02DwSPApNPS5ZEkQZ7OXejlaUewQIlMI3UDmytpX2CGh2XH/aUw+H7NYo6nr8bldRXYGAAAAA==" },
+    "/images/McCafe/A11.jpg": { width: 1080, height: 1080, color: "#ffb401", placeholder: "data:image/webp;base64,UklGRmgAAABXRUJQVlA4IFwAAABQAgCdASoQABAABABoJbACdLoAAx9lzQPPQ8AA/q+YOe0BM6Bn9QGPh6ihJHOKgqstv/3e5hwxNnugPl0VP/5VbhVgd3vNyno8DpIGyVyRLq/WtJvigt9+L4l8AA==" },
+    "/images/McCafe/A12.jpg": { width: 1080, height: 1080, color: "#e3a009", placeholder: "data:image/webp;base64,UklGRnAAAABXRUJQVlA4IGQAAABwAgCdASoQABAABABoJbACdLoAEJUVMTpIiGQAAP5TDLwj1/FtmpJ7fpHCIyLcPEJ4PWGDw+0YPlYcNpLxZEkp6h0NvRvllXn7PH/hoREOlrxXmp3NUcWUce8WyPGQ+4+oAAAA" },
+    "/images/McCafe/A13.jpg": { width: 1080, height: 1080, color: "#ffbc0d", placeholder: "data:image/webp;base64,UklGRlwAAABXRUJQVlA4IFAAAABQAgCdASoQABAABABoJbACdLoAAwmwUYnnlgAA/sbsoMeVfYhNGA7crcZNDSudYFMgyQKTRk3f/KrasHK3zc+nmNNe7LYdPtrlVLG5++YAAA==" },
+    "/images/McCafe/A14.jpg": { width: 1080, height: 1080, color: "#ffbc0d", placeholder: "data:image/webp;base64,UklGRmYAAABXRUJQVlA4IFoAAACQAgCdASoQABAABABoJbACdLoAEJAYBuCf+q9cAAD+w14FWzou9KKo/h+LDwH7zTFlhzQMsi3ANN9VOG1ecThvKQP/8iZ+bWndJ4On37yhPJdfJfiCiAAAAAA=" },
+    "/images/McCafe/A15.jpg": { width: 1080, height: 1080, color: "#ffbc0d", placeholder: "data:image/webp;base64,UklGRnYAAABXRUJQVlA4IGoAAABwAgCdASoQABAABABoJbACdAED/QUbK7EsihoAAP7D8jdGSx9TeUUpxqN6GR0TalicuI75Wm0JqncV3278R26k69of8DGxqjEzHeR12mqwc/Mv/lVJC/43RDTbdz0U5/c/gB5jyAbzo7AA" },
+    "/images/McCafe/A16.jpg": { width: 1080, height: 1080, color: "#e9a007", placeholder: "data:image/webp;base64,UklGRnIAAABXRUJQVlA4IGYAAAAwAgCdASoQABAABABoJbACdLoAAwVtFXvEgAD8Zf4Ks7IBlP2REp7nQJYAajYfnCNDME6D8FKOITOKey+qQ5Ja0Qqb7Ak0Tbf/4kYsZL7R8w3eL30zrekVsLQuP71Wp5eD+DEAAAA=" },
+    "/images/McCafe/A17.jpg": { width: 1080, height: 1080, color: "#faab08", placeholder: "data:image/webp;base64,UklGRl4AAABXRUJQVlA4IFIAAABQAgCdASoQABAABABoJbACdLoAAq/Sio0FlMgA/oxlxALeh5UNh5k5ctDZCqKLbh9mAOHrilJLxGRrzpHZ/+RJ4afw4wx9q21ob6wbAyXITQAA" },
+    "/images/McCafe/A18.jpg": { width: 1080, height: 1080, color: "#ffbc0d", placeholder: "data:image/webp;base64,UklGRnIAAABXRUJQVlA4IGYAAADQAQCdASoQABAABABoJbACdADDqJeIAAD+w9yyRfUmGaIvK26FNi+23pW3yNxw7itAGyvcuubb9cXRaPHGv9KSIqfYH/4auQjv7PNhr4PkyueosZPXf/XbzBMz6WFVSs6syM4AAAA=" },
+    "/images/McCafe/A19.jpg": { width: 1080, height: 1080, color: "#fbb50f", placeholder: "data:image/webp;base64,UklGRlwAAABXRUJQVlA4IFAAAAAwAgCdASoQABAABABoJbACdLoAAjvrxmIVgAD+w96iOi5qg5NFzuu6LTH7PUTDmbjEqZp/XCLk/+UsBlPDjLEzSzsmO2dJzVfrfigFBz4AAA==" },
+    "/images/McCafe/A2.jpg": { width: 1080, height: 1080, color: "#94cbeb", placeholder: "data:image/webp;base64,UklGRmAAAABXRUJQVlA4IFQAAABQAgCdASoQABAABABoJbACdGaAAzLkqcDkKiAA/d4TrwBOIL8QGWaZFs5b3SGRC9ywj22N+9oTm6BTbTmVpP5pTA/LqWhCvHvQRVX+yYFzCtYAAAA=" },
+    "/images/McCafe/A20.jpg": { width: 1080, height: 1080, color: "#c3875a", placeholder: "data:image/webp;base64,UklGRngAAABXRUJQVlA4IGwAAABQAgCdASoQABAABABoJbACdAYvDt9Hv6tgrgAA/q8DnUq9aZCFx4bU2IsNOCZ67JKFEdkbq/djX2zmU9d+btPVWwlEioGrSdtqyibO0o6FYnmHvrJANKIIIwuP7J0FTM2xgDz90uXUiHoAAAA=" },
+    "/images/McCafe/A21.jpg": { width: 1080, height: 1080, color: "#328599", placeholder: "data:image/webp;base64,UklGRmQAAABXRUJQVlA4IFgAAADQAQCdASoQABAABABoJbACdACZwy/+QADb3Z6zQV+bna5UmQcoVFMaZrfHR8ZLThUDFV+nx8uz7yRsWAbmxXKIbZYgUNqcBGAU3feBSLvFQoVLbe8xUAAA" },
+    "/images/McCafe/A22.jpg": { width: 1080, height: 1080, color: "#6f4e49", placeholder: "data:image/webp;base64,UklGRmQAAABXRUJQVlA4IFgAAADQAQCdASoQABAABABoJYgCdAEN3n9AAAD+6nmpnkKfQO2hS7ofpcay7A0mpiytvysZeXWTwy6OYjqHUAljE1NsiBVfjM7D+rvWeCxjATa+h5TQcP29AAAA" },
+    "/images/McCafe/A23.jpg": { width: 1080, height: 1080, color: "#c9424c", placeholder: "data:image/webp;base64,UklGRlQAAABXRUJQVlA4IEgAAADwAQCdASoQABAABABoJbACdAEMv43J8KAA+oKoEoQFN4OdOugGoWeSDqfCB94E2GHXi6HMdAIljCaSdH9AvI+OFb2o8BgAAAA=" },
+    "/images/McCafe/A24.jpg": { width: 1080, height: 1080, color: "#53424c", placeholder: "data:image/webp;base64,UklGRmIAAABXRUJQVlA4IFYAAADwAQCdASoQABAABABoJYgCdAEVE+LlMAAA/tcN+T+wy1cVvFc5Qom+Egm+rGCQNX4m2QXbl5vcouQdiMP+54ku1+3HYuLgC4JXOajiYNjYb2OnSgMAAA==" },
+    "/images/McCafe/A25.jpg": { width: 1080, height: 1080, color: "#febc11", placeholder: "data:image/webp;base64,UklGRoIAAABXRUJQVlA4IHYAAACwAgCdASoQABAABABoJbACdLoAFWAXe8aIZCgTOAAA/tPl1rHF8NySsS4mmwGs634DIa7H1KkCApnBONQe01NAuJ5+HJ+waAQAz5xHWnlZKwDzRT3zv/nGdMdyTviZMRa/e+pFNxwLLu4ZZd0nibhHZQPhlIAA" },
+    "/images/McCafe/A26.jpg": { width: 1080, height: 1080, color: "#ffbc0d", placeholder: "data:image/webp;base64,UklGRlQAAABXRUJQVlA4IEgAAAAwAgCdASoQABAABABoJbACdLoAAnGnXmMGgAD8jVQwZgRqcPrzaydBRqHPdWw9PWz2kFVJyMo2T/4trvG72DfLSn6k7z2UYAA=" },
+    "/images/McCafe/A27.jpg": { width: 1080, height: 1080, color: "#fcb009", placeholder: "data:image/webp;base64,UklGRnQAAABXRUJQVlA4IGgAAACQAgCdASoQABAABABoJbACdLoAEJMX+/R0j8y1wAD+s7My3aAPAJieO3ydXHhIPTVUnDHdbJ9slzv7hfWgGR4t1ebGnlGx1Yl//jFFYJPnVoNc7Y7chZCsbjgQI7xxmWHp07Qd24tYAA==" },
+    "/images/McCafe/A28.jpg": { width: 1080, height: 1080, color: "#8a620e", placeholder: "data:image/webp;base64,UklGRm4AAABXRUJQVlA4IGIAAADwAQCdASoQABAABABoJbACdAEPSzw4WgAA/t25MRT/N3unBo3ekQ8r4rEy5BYN+Z1O2leyCNvmuD03/1i2nk0/YDud6IPllk+BJoJvCtH0K388E/KdngqJ2mnXpav/sN54AA==" },
+    "/images/McCafe/A29.jpg": { width: 1080, height: 1080, color: "#f8aa08", placeholder: "data:image/webp;base64,UklGRmwAAABXRUJQVlA4IGAAAAAwAgCdASoQABAABABoJbACdLoAAwp1EypnQAD+szLNR4obsRIYa2XIVSKqKDxo6bzPhxA8TvOPMQgO4y+lOwF6PuvKiHLI8ADf/INaujsa62vZt3RMB6PqJBHyEgMAAAA=" },
+    "/images/McCafe/A3.jpg": { width: 1080, height: 1080, color: "#f3a308", placeholder: "data:image/webp;base64,UklGRlgAAABXRUJQVlA4IEwAAAAwAgCdASoQABAABABoJbACdLoAAq+ZG4wCAAD+w9to5Yjkv1Mu3Dq3j5jlRtpIxHYnqw1E7j8LSv/5FRNH5Z2NPKE7lj7woKX2XwAA" },
+    "/images/McCafe/A30.jpg": { width: 1024, height: 1024, color: "#d5cbbe", placeholder: "data:image/webp;base64,UklGRlwAAABXRUJQVlA4IFAAAABQAgCdASoQABAABABoJYwCdAYsjjONa3ouwAAA/u/XOdBd877OYwQ67HV/pCNwC5MLRUDxhQ51X9Zd9+AisfaL8AuhJ66siD6BZAnp410AAA==" },
+    "/images/McCafe/A31.jpg": { width: 1080, height: 1080, color: "#ab6f34", placeholder: "data:image/webp;base64,UklGRnwAAABXRUJQVlA4IHAAAAAQAgCdASoQABAABABoJbACdAYu5GVGv+94APw3HaikqCb4rbxZnUsztMHQlRAOGoDDIFd0biY380SzjPmpa8OxgltqWihJe4ooTRvZFnI113GLSA3dv1MKJiaapWBPvkelEn9ROL6anYCHmCdCAAAA" },
+    "/images/McCafe/A32.jpg": { width: 1800, height: 600, color: "#b88853", placeholder: "data:image/webp;base64,UklGRlQAAABXRUJQVlA4IEgAAADQAQCdASoQAAUABABoJbACdACzBi2IAADN8RiuM5nDLjnegjV9+y1YkSOkMwcijvOvo/qfNWoaRpQr69F03nYUlfPuaoIAAAA=" },
+    "/images/McCafe/A33.jpg": { width: 1080, height: 1080, color: "#958a80", placeholder: "data:image/webp;base64,UklGRmIAAABXRUJQVlA4IFYAAACwAQCdASoQABAABABoJaACdABg/SFAAM4i6/TMAKO3R23AtpJSZgLWplf/B5KsfMM6G5bPi7pM1AfWBIjKzYHNGz3tYGdfEYDh7Y/bpONDmGs7n/ewAA==" },
+    "/images/McCafe/A34.jpg": { width: 1080, height: 1080, color: "#fcbb1b", placeholder: "data:image/webp;base64,UklGRnwAAABXRUJQVlA4IHAAAADwAQCdASoQABAABABoJbACdLoAAwmjoAAA/sbATdpmLHg2g95ROQN1cJE6RsAT3szNlvnrm+ZlVtMNBeFE0Zexbwd9FGbFek1+6fhkJQuJV4WaNqf/jC5ZV8XXxrOCvdW/tO1Q+LwTL0oj9ii1wAAA" },
+    "/images/McCafe/A35.jpg": { width: 1080, height: 1080, color: "#fbac07", placeholder: "data:image/webp;base64,UklGRmQAAABXRUJQVlA4IFgAAABwAgCdASoQABAABABoJbACdLoAyv8D0PpYA8KAAP7DTf7x0PQ3zbcNKolNDUWj3mc/VujqHyRUNHDBfzJaf/KrY/z2jI4xHL+mErdi69HUz+KAUjiTgAAA" },
+    "/images/McCafe/A36.jpg": { width: 1080, height: 1080, color: "#fbb00a", placeholder: "data:image/webp;base64,UklGRkgAAABXRUJQVlA4IDwAAAAQAgCdASoQABAABABoJbACdLoAAnX8nQ4AAP7D/fMsMWX2sPU8VypqN/+VUXjyxD91MjTOfJgObVx0AAA=" },
+    "/images/McCafe/A4.jpg": { width: 1080, height: 1080, color: "#3f1f12", placeholder: "data:image/webp;base64,UklGRlgAAABXRUJQVlA4IEwAAAAwAgCdASoQABAABABoJZACdADwtpspfmNrAAD+7qBs5mDH5nHnN75lmzpfqqlrmnw1E42Qp+LdWiD9tJx0WYmZ8oD8COI2UAwIAAAA" },
+    "/images/McCafe/A5.jpg": { width: 1080, height: 1080, color: "#eb9507", placeholder: "data:image/webp;base64,UklGRloAAABXRUJQVlA4IE4AAAAwAgCdASoQABAABABoJbACdLoAAixju3VQAAD+01n0Bga8xPuPZth4l5pmUwLPuyWqPqNa/Haf/5Vzpwv7yP/ifM1+uvoe3i4LJlkQAAA=" },
+    "/images/McCafe/A6.jpg": { width: 1080, height: 1080, color: "#b59e58", placeholder: "data:image/webp;base64,UklGRoIAAABXRUJQVlA4IHYAAABQAgCdASoQABAABABoJbACdAYxZqb1gpbjOIAA/pCGTzKILZYDDQlw4UU+04mO30i8pCiTXt3+vzKNzMsZOdujh9tWexqfNUZsUDYojbMGZt+PSmmltAu90bazHWbfM0L/yjvv3mgWiWAks8/F+a8vseMweAAA" },
+    "/images/McCafe/A7.jpg": { width: 1080, height: 1080, color: "#b29e34", placeholder: "data:image/webp;base64,UklGRnIAAABXRUJQVlA4IGYAAADwAQCdASoQABAABABoJbACdAD5JegCEeAA/DHpK+3ATVCKmBgG5Xl2NMyMJDNCqmKfAmwLX9qt0f42cxH49yYzMGDQYTQc+a1lpZS8/5sDUgwHqMaR5SkR/WO7FMRvSaFFiHeAAAA=" },
+    "/images/McCafe/A8.jpg": { width: 1080, height: 1080, color: "#feb301", placeholder: "data:image/webp;base64,UklGRmgAAABXRUJQVlA4IFwAAABQAgCdASoQABAABABoJbACdLoAAx9lzQPPQjAA/q+YOe0BM6Bn9QGPh6ihJHOKgqstv/3e5hwxNnugPl0VP/5VbhVgd3vNyno8DpIGyVyRMqVJGnPtswbM9maAAA==" },
+    "/images/McCafe/A9.jpg": { width: 1080, height: 1080, color: "#fec00e", placeholder: "data:image/webp;base64,UklGRmgAAABXRUJQVlA4IFwAAAAwAgCdASoQABAABABoJbACdLoAAkXK7YBrAAD+08zLODaYgFeFoMYD8PR3ywXN8oYaHotqLnxyXnt3O4iqqgJm//FzAVuR3Y2DFL3MEoRQ/JOy4bd8m8L6WYAAAA==" },
+    "/images/McCafe/M1.jpg": { width: 1080, height: 1080, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRoAAAABXRUJQVlA4IHQAAAAQAgCdASoQABAABABoJbACdAEOUhC5v64AAP7rYX1WEXlA25a1m3SmUCLiV/9SzcwcQJVeTglKho2rmddEMwKxTFnr6XLbs/xOeQINLdcat58ZxcswWZmV8JjkZx+GQFGYD/QBi4+PWvr1+0BZtuCsyAAAAA==" },
+    "/images/McCafe/M2.jpg": { width: 1080, height: 1080, color: "#db2b1f", placeholder: "data:image/webp;base64,UklGRmQAAABXRUJQVlA4IFgAAABQAgCdASoQABAABABoJbACdLoAAwnUDhAo5CQA/ZnvQKfcpcFlGZm/Mp+T3biboWZM2wsRqvnFxAFve9/qI35oAvgNrfF1pMzE73+80CBusZoEDbkoAAAA" },
+    "/images/McCafe/S1.jpg": { width: 1080, height: 1080, color: "#a02b37", placeholder: "data:image/webp;base64,UklGRmYAAABXRUJQVlA4IFoAAADwAQCdASoQABAABABoJbACdADg5CpIUoAA/rqHTYY/HwPWw6Aj+Zqe6ZH0yYbxK8dYxvUyVOXsDOG3PIldB1jTIEioLMw1Y4OwQ7xkBOpUrhd4RTxXIXnAAAA=" },
+    "/images/McCafe/S2.jpg": { width: 1080, height: 1080, color: "#41494b", placeholder: "data:image/webp;base64,UklGRmYAAABXRUJQVlA4IFoAAAAQAgCdASoQABAABABoJbACdAEO6UAsHVAgAP7nGYCLdAHSTwxpTT9en35KWu5VobGIYBzj8anpB3sRcKZE7JHS1b9VDFNY8SBYvWH8iD+odZM+N0rZ4s8AAAA=" },
+    "/images/McCafe/S3.jpg": { width: 1080, height: 1080, color: "#8fad72", placeholder: "data:image/webp;base64,UklGRlgAAABXRUJQVlA4IEwAAADwAQCdASoQABAABABoJbAC7AELhyYseQAA/leVGAB+DyIlncOKVp2rkWJWQ547yoU/Tq75SV7HfNCp856BcCaBQZ9/oe+vRSQI4AAA" },
+    "/images/McCafe/S4.jpg": { width: 1080, height: 1080, color: "#40433c", placeholder: "data:image/webp;base64,UklGRmIAAABXRUJQVlA4IFYAAADwAQCdASoQABAABABoJYwCdAEOOeEYCAAA/vHM8b8JbKekHXYMcmwKgN/BkrbDE9naYPpLvSBnXb49TZ9JOM+wYsRM4JvUIavD0qGM5oV9RENrAW8AAA==" },
+    "/images/McCafe/S5.jpg": { width: 1080, height: 1080, color: "#e0c9b1", placeholder: "data:image/webp;base64,UklGRloAAABXRUJQVlA4IE4AAADQAQCdASoQABAABABoJbACdAEO4zrDQAD+yfSrGp15asDEUEUgIV4GPV3bLEMoWTQ/peKjwoVTQ9O1Nwb/RHJP+vWjTuEe80Prs4CAAAA=" },
+    "/images/McCafe/S6.jpg": { width: 1080, height: 1080, color: "#48453e", placeholder: "data:image/webp;base64,UklGRmgAAABXRUJQVlA4IFwAAAAwAgCdASoQABAABABoJbACdAEWTBcyy2hLAAD+J0ixuC7gAajDu/iwxFuIRnhLg9MuNfJzAXlVaMLD8COhkbRt2qLDnMoG3lWJmLioXNDSm6s6Yq2sN2bsq9gAAA==" },
+    "/images/McCafe/S7.jpg": { width: 1080, height: 1080, color: "#47575e", placeholder: "data:image/webp;base64,UklGRmwAAABXRUJQVlA4IGAAAADQAQCdASoQABAABABoJbACdADuJgi6aAD+zXQER8qaMJi5USbsf8CfOwwOfc8Wn6jHABdS6ZemVpmF+C5B5Z6qyiGQtaXGkbwZPeBQEj91MvZJ7Rc7cWOnOviz3CbFAAA=" },
+  },
+}
@@ -0,0 +1,22 @@
+// Portfolio Data - NeoStrata (loaded on demand from projects.index.js)
+export default {
+  id: "neostrata",
+  name: "NeoStrata",
+  type: "Social Media",
+  thumbnail: "/images/NeoStrata/NeoStrata_03.jpg",
+  images: [
+    "/images/NeoStrata/NeoStrata_01.jpg",
+    "/images/NeoStrata/NeoStrata_02.jpg",
+    "/images/NeoStrata/NeoStrata_03.jpg",
+  ],
+  hashes: {
+    "/images/NeoStrata/NeoStrata_01.jpg": "939fe389",
+    "/images/NeoStrata/NeoStrata_02.jpg": "89c5f2fb",
+    "/images/NeoStrata/NeoStrata_03.jpg": "64846177",
+  },
+  imageMeta: {
+    "/images/NeoStrata/NeoStrata_01.jpg": { width: 1080, height: 1350, color: "#c4c3cd", placeholder: "data:image/webp;base64,UklGRnQAAABXRUJQVlA4IGgAAAAQBACdASoQABQAPxFysFAsJqSisAgBgCIJYgC7MoAC7fF9bBrZoMgKAAD8q3iG6mWPp4wyCnsVVgg0n89GSsND1FtvxQXEBuUZtmHdyFm9emE+A+NitTtyoBC4gMDYoVYTgNJkpoQAAA==" },
+    "/images/NeoStrata/NeoStrata_02.jpg": { width: 1080, height: 1350, color: "#9c6d5b", placeholder: "data:image/webp;base64,UklGRpAAAABXRUJQVlA4IIQAAADwAwCdASoQABQAPxFysFAsJqSisAgBgCIJYgCdMoACrphKGtfgwHagAP6M25I3cbgFbqc+dC6wD1hPf54bDThiu1y5Ls9KO0bGZzDt85lGZkc85UyOpPTGJY6sydvqwnEGPepf1WEDJlcqvqvplT6sbY0q29LQ+MiRsAB/zdPtrK8AAAA=" },
+    "/images/NeoStrata/NeoStrata_03.jpg": { width: 1080, height: 1350, color: "#ebb73a", placeholder: "data:image/webp;base64,UklGRpoAAABXRUJQVlA4II4AAABwBACdASoQABQAPxFysFAsJqSisAgBgCIJbACdOUCEAAM2VIWiBNnQcqToAAD+4ZJcn1dGdpAA/I8M7LI87PiF3dRhDNNjMqZG4k2gb6wpzhzvMT4Jk8/rAmZ3dQM5WzzHnGE4vW3puql3agv8CILC+y27oAu9tOTQ4+4t+bzcu3KTXqr7XMHlK+DIEoAA" },
+  },
+}
@@ -0,0 +1,20 @@
+// Portfolio Data - OPPO (loaded on demand from projects.index.js)
+export default {
+  id: "oppo",
+  name: "OPPO",
+  type: "Social Media + AI Reels",
+  description: `Produced dynamic social media content and AI-driven reels to showcase the technological innovation of OPPO smartphones.`,
+  thumbnail: "/images/OPPO/A1.png",
+  images: [
+    "/images/OPPO/A1.png",
+    "/images/OPPO/A2.jpg",
+  ],
+  hashes: {
+    "/images/OPPO/A1.png": "a52a20d5",
+    "/images/OPPO/A2.jpg": "e46897ef",
+  },
+  imageMeta: {
+    "/images/OPPO/A1.png": { width: 1080, height: 1350, color: "#ced5da", placeholder: "data:image/webp;base64,UklGRoAAAABXRUJQVlA4IHQAAABQBACdASoQABQAPxFwsFAsJiSisAgBgCIJbACdMoR3ACXB+X0h3aqiF+uAAP7L6IlZ0s08zbKS+QUuw+5uJsEvsPKc3w73DIO53PumMhqSJ4dDX21rtUSCInw6QjiKWPQJFxLVzDePy5CRjKkIbrTvxftAAA==" },
+    "/images/OPPO/A2.jpg": { width: 1800, height: 2250, color: "#f5bf44", placeholder: "data:image/webp;base64,UklGRoYAAABXRUJQVlA4IHoAAADQAwCdASoQABQAPxFysFAsJqSisAgBgCIJbACdAB0luMk2tV9U6vgA/q8jVdzzRyx8XbJWX2wzYiIJwdAwMDKNf1nDY54TGtqneyeHG9L+oc9JL7IvpoHBXSfqgPxCa/lLEui+V1H7rqfOhhxeMSN7A9m6TSST6rTAAA==" },
+  },
+}
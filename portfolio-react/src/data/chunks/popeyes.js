@@ -0,0 +1,68 @@
+// Portfolio Data - Popeyes (loaded on demand from projects.index.js)
+export default {
+  id: "popeyes",
+  name: "Popeyes",
+  type: "Social Media",
+  description: `I handled the account of Popeyes as they were opening in KSA. Popeyes integrated right into the Saudi culture as a fun and exciting brand touching with the excited Saudi youth. Here is a sample of my work for Popeyes, many of which I myself come with everything in it from the concept, the copy, and the design.`,
+  thumbnail: "/images/Popeyes/B2.jpg",
+  images: [
+    "/images/Popeyes/1.png",
+    "/images/Popeyes/11.png",
+    "/images/Popeyes/111.png",
+    "/images/Popeyes/2.png",
+    "/images/Popeyes/22.png",
+    "/images/Popeyes/222.png",
+    "/images/Popeyes/3.png",
+    "/images/Popeyes/33.png",
+    "/images/Popeyes/333.png",
+    "/images/Popeyes/A1.jpg",
+    "/images/Popeyes/A2.jpg",
+    "/images/Popeyes/A3.jpg",
+    "/images/Popeyes/A4.jpg",
+    "/images/Popeyes/A5.jpg",
+    "/images/Popeyes/A6.jpg",
+    "/images/Popeyes/B1.jpg",
+    "/images/Popeyes/B2.jpg",
+    "/images/Popeyes/B3.jpg",
+  ],
+  hashes: {
+    "/images/Popeyes/1.png": "c022c66d",
+    "/images/Popeyes/11.png": "ecee4a93",
+    "/images/Popeyes/111.png": "fb524695",
+    "/images/Popeyes/2.png": "38c68daa",
+    "/images/Popeyes/22.png": "aecc7c53",
+    "/images/Popeyes/222.png": "ef725930",
+    "/images/Popeyes/3.png": "71d36c40",
+    "/images/Popeyes/33.png": "054d11a6",
+    "/images/Popeyes/333.png": "f1a60aac",
+    "/images/Popeyes/A1.jpg": "62163379",
+    "/images/Popeyes/A2.jpg": "2868ea71",
+    "/images/Popeyes/A3.jpg": "6af90d4d",
+    "/images/Popeyes/A4.jpg": "d1ccc558",
+    "/images/Popeyes/A5.jpg": "90d7c7cf",
+    "/images/Popeyes/A6.jpg": "718c7e39",
+    "/images/Popeyes/B1.jpg": "532699ac",
+    "/images/Popeyes/B2.jpg": "40a08ad8",
+    "/images/Popeyes/B3.jpg": "f484ce40",
+  },
+  imageMeta: {
+    "/images/Popeyes/1.png": { width: 601, height: 601, color: "#02acac", placeholder: "data:image/webp;base64,UklGRqIAAABXRUJQVlA4WAoAAAAQAAAADwAADwAAQUxQSBcAAAABF/D8/4iIgCDbZoPc/X0uENH/WCXwAwBWUDggZAAAAFACAJ0BKhAAEAAEAGglsAJ0OIAAn4Kppn8IwADriVZJ9UMfJqTJWBkCYYMkrvhnaiHni1qnySMtIiBEjUUrW1RtrFE+W73zIscElXV9Ij3vyKI2Mxt/t59cY0UvrO/8Ww5m0AA=" },
+    "/images/Popeyes/11.png": { width: 601, height: 601, color: "#02aba2", placeholder: "data:image/webp;base64,UklGRpIAAABXRUJQVlA4WAoAAAAQAAAADwAADwAAQUxQSBcAAAABF/D8/4iIgCDbZoPc/X0uENH/WCXwAwBWUDggVAAAANABAJ0BKhAAEAAEAGglsAJ0AO4gw4LAAOlNm6oAT9OnpF2yho35LQ/SkGX2X6cF96e77bM6CtqhnCb8K0VU9DGjxzan/i0P7eYafx7DmBE0nk4AAA==" },
+    "/images/Popeyes/111.png": { width: 601, height: 601, color: "#740369", placeholder: "data:image/webp;base64,UklGRooAAABXRUJQVlA4WAoAAAAQAAAADwAADwAAQUxQSBcAAAABF/D8/4iIgCDbZoPc/X0uENH/WCXwAwBWUDggTAAAAPABAJ0BKhAAEAAEAGglqAJ0AQ3RTwqrgAD+7ofKDp9AynycoV/FrOKA4aBDK41Pz32L/9JxizOU0JOJaRdWrN2qa0/bzzW7DwAAAAA=" },
+    "/images/Popeyes/2.png": { width: 601, height: 601, color: "#02a4a4", placeholder: "data:image/webp;base64,UklGRqIAAABXRUJQVlA4WAoAAAAQAAAADwAADwAAQUxQSBAAAAABD/D8/4iIMP8R/Y8BAAAAVlA4IGwAAAAwAgCdASoQABAABABoJbACdAECvENhM6FIAADpBOj445Qw0qIwKJHgayS2cOOYV/5G9eLNw3MzE0SDjdFVlYiTgumgCaP4qiiSujoLDdWi/Vv6fSKv/hoRIv/COQBEFPBwU+GK9RTN8WAAAAA=" },
+    "/images/Popeyes/22.png": { width: 601, height: 601, color: "#03a29a", placeholder: "data:image/webp;base64,UklGRp4AAABXRUJQVlA4WAoAAAAQAAAADwAADwAAQUxQSBAAAAABD/D8/4iIMP8R/Y8BAAAAVlA4IGgAAADwAQCdASoQABAABABoJbACdAEUaVttbDgA+oT6LIFFmYT3nBdC2JvG42oGqZqog0tTHGY96YeBwlwROKtQfQUBnwSToPd4+AB0xGyNlAoIK8YzQR3/wrX7RuV50/d8f6r4pb73tHr8AA==" },
+    "/images/Popeyes/222.png": { width: 601, height: 601, color: "#e86605", placeholder: "data:image/webp;base64,UklGRqIAAABXRUJQVlA4WAoAAAAQAAAADwAADwAAQUxQSBAAAAABD/D8/4iIMP8R/Y8BAAAAVlA4IGwAAAAwAgCdASoQABAABABoJbACdLoAEJMUCxI8AAB8Ao5sjXlkft6qE0pwJGjYiZ8EHug98FVBIugLfGIbEtMWDoRu/CKSrRrmSVOjcAbCXkF//sS3yP11QAzMttOuMrz+4KY2E1MiKmC/eCo4AAA=" },
+    "/images/Popeyes/3.png": { width: 601, height: 601, color: "#069896", placeholder: "data:image/webp;base64,UklGRpAAAABXRUJQVlA4WAoAAAAQAAAADwAADwAAQUxQSBAAAAABD/D8/4iIMP8R/Y8BAAAAVlA4IFoAAAAQAgCdASoQABAABABoJbACdAEOUWd947eAAP0Rszi+EJdCOcGdbwjutd/yD6ttw7f7s2LgmSgAxiwjjvN3x2Vdjt8Dr3dKbmxv/tPzP0jxukXM71vW8lGfRAA=" },
+    "/images/Popeyes/33.png": { width: 601, height: 601, color: "#cd4f35", placeholder: "data:image/webp;base64,UklGRooAAABXRUJQVlA4WAoAAAAQAAAADwAADwAAQUxQSBAAAAABD/D8/4iIMP8R/Y8BAAAAVlA4IFQAAAAQAgCdASoQABAABABoJbACdADHlGWXZPKAAP0fiLKQsAiqg+5MkSyqZTuvCTHEUMwaMywo2+8I00XMdJNeE765hrYOz/gPxBKRsXl3pEiEz/XsAAA=" },
+    "/images/Popeyes/333.png": { width: 601, height: 601, color: "#02aba2", placeholder: "data:image/webp;base64,UklGRpIAAABXRUJQVlA4WAoAAAAQAAAADwAADwAAQUxQSBAAAAABD/D8/4iIMP8R/Y8BAAAAVlA4IFwAAACwAQCdASoQABAABABoJbACdAEUecUAAPnIktc+UbH3RZBWOqTExABG+hMZloZMkzPjO3ofv9qSZ4lWEpSex/nvrBu93hFSL+mHMryJVGB3+IBf2L4yeBWt+eCwAA==" },
+    "/images/Popeyes/A1.jpg": { width: 1080, height: 1080, color: "#f87b14", placeholder: "data:image/webp;base64,UklGRl4AAABXRUJQVlA4IFIAAABwAgCdASoQABAABABoJbACdLoA4wAGlxEwNs0AAPxaovcrkD2mvy6N7ujjQxHMO5xwUXf/+0ZzTu5Iy+ekupImDSl/Ynx6cOJy6vOADApj0ZgA" },
+    "/images/Popeyes/A2.jpg": { width: 1080, height: 1080, color: "#09b2a7", placeholder: "data:image/webp;base64,UklGRlwAAABXRUJQVlA4IFAAAACQAQCdASoQABAABABoJbACdABxaAAAiScPsCyEL7LIV+Aq7QN5NVCXGVos7nH06iEOwqMwZbu0z2QcAXX/8XH39aGirw4gFyo2ojY6FAAAAA==" },
+    "/images/Popeyes/A3.jpg": { width: 1080, height: 1080, color: "#f48d2b", placeholder: "data:image/webp;base64,UklGRlIAAABXRUJQVlA4IEYAAAAQAgCdASoQABAABABoJbACdLoAAVidH0QAAPxcn/lEaEf+XpoPuJ94GQmUz4l1qA/+LQ60IhjRIlKnV/cGZ1W83qoqOAAA" },
+    "/images/Popeyes/A4.jpg": { width: 1080, height: 1080, color: "#a34691", placeholder: "data:image/webp;base64,UklGRmwAAABXRUJQVlA4IGAAAADQAQCdASoQABAABABoJbACdADsisws8AD+v8M8udJaATrE0QOryxWE5dHiDWFTrj4SK1EQ3GbrbTlA0AqpsX5jMJf8F3xk2tsb6M4J0JEifAfyFby+YJmeoAOrXklgAAA=" },
+    "/images/Popeyes/A5.jpg": { width: 1080, height: 1080, color: "#fa7e0b", placeholder: "data:image/webp;base64,UklGRlQAAABXRUJQVlA4IEgAAABQAgCdASoQABAABABoJbACdLoB+AACeuwx1xgA1H/VGr0ujOCBA31cTJaOs1Qmn+kA2qn/uhmw0znGOmkP/ghSAc+ihMlkHAA=" },
+    "/images/Popeyes/A6.jpg": { width: 764, height: 1080, color: "#f58724", placeholder: "data:image/webp;base64,UklGRpoAAABXRUJQVlA4II4AAACQBACdASoQABcAPxFysFAsJqSisAgBgCIJbACdMoRwN6AAUEv9KuVpOLWl0PAA9x8Yae8Wn/j7MBRTnWHMd0vMw0//xhF9lOBM/0mgZXx2htxPkg/UZbPvnme3tp4JR9aST7LGNqkndtvyjtG/V1LVazD/P/Pqx+DlgojzHX/zRF89XTC8w3zWccH/ZIAA" },
+    "/images/Popeyes/B1.jpg": { width: 1080, height: 1080, color: "#2c221d", placeholder: "data:image/webp;base64,UklGRnQAAABXRUJQVlA4IGgAAADQAQCdASoQABAABABoJbACdADY2GREAAD+5E9Av9vmNHBJm0rz8ehJV4PLSE3h6oVXZemYJ6SpLiSxlt9y7dT/vDPAkH70QiTVv1HRQrnHRQrmcy5HFJKpYrun07PqB5ipzcuqkUAAAA==" },
+    "/images/Popeyes/B2.jpg": { width: 1080, height: 1080, color: "#8f4427", placeholder: "data:image/webp;base64,UklGRoIAAABXRUJQVlA4IHYAAAAwAgCdASoQABAABABoJbACdAYvDgfZR3dLEAD+rQE3ucJKESJp+FqbXPawb70O2NN1A5u99VJicGiiu5GDvBkskWJi8cCZvgnp7Uc10T8Pxm061F4Sac5o//pOTIedJoRvo4hSVF2m7qQ4HwN1j5mzEHsxaEAA" },
+    "/images/Popeyes/B3.jpg": { width: 1080, height: 1080, color: "#4c4a41", placeholder: "data:image/webp;base64,UklGRm4AAABXRUJQVlA4IGIAAAAwAgCdASoQABAABABoJZQAD45OyBy0MfjJMAD+79p71ysx74y1DRcIPrNyQPbOhvt7UjoS+1dVdezPs8og5BK66NZKTiCroYxGP3zUz/JeNB/+RS/s+aynUImcbY00CyhwAA==" },
+  },
+}
@@ -0,0 +1,23 @@
+// Portfolio Data - Private (loaded on demand from projects.index.js)
+export default {
+  id: "private",
+  name: "Private",
+  type: "Others",
+  description: `Confidential projects involving branding and visual identity design.`,
+  thumbnail: "/images/Private/A3.jpg",
+  images: [
+    "/images/Private/A1.jpg",
+    "/images/Private/A2.jpg",
+    "/images/Private/A3.jpg",
+  ],
+  hashes: {
+    "/images/Private/A1.jpg": "435982c5",
+    "/images/Private/A2.jpg": "54e068ce",
+    "/images/Private/A3.jpg": "c209ba14",
+  },
+  imageMeta: {
+    "/images/Private/A1.jpg": { width: 1080, height: 1350, color: "#34363c", placeholder: "data:image/webp;base64,UklGRpYAAABXRUJQVlA4IIoAAAAQBACdASoQABQAPxFysFAsJqSisAgBgCIJZQDE2BxIUTpn7OLNwf52wAD+gTx7LEJ4uuZEYpXDEz3IIG1qatJ4osRajCyDqmjttXAg7D9cTnJWOlrFzBr4qiyDy6WpcrCaRtxbta6fPUcbqMLvIvw0o7ACv9A0dFYmin6IdIj5+8jTP0koBmewAAA=" },
+    "/images/Private/A2.jpg": { width: 1800, height: 2250, color: "#412925", placeholder: "data:image/webp;base64,UklGRo4AAABXRUJQVlA4IIIAAAAwBACdASoQABQAPxFwsFAsJiSisAgBgCIJZgCdMoAB2A0+HnqIXqFlHsAA/lnpy6Qo+yxc/WqAwJuxtHXqS76WqMTCX0ZHZENXK4z9UewIgR0Q2H5rNxrJvM9lm3VSPGMeI6aFLwhTf0ezPxucSYt0+9t3AILM8Gek0GxhTrlQIAAA" },
+    "/images/Private/A3.jpg": { width: 1800, height: 2250, color: "#2b2326", placeholder: "data:image/webp;base64,UklGRpQAAABXRUJQVlA4IIgAAAAQBACdASoQABQAPxFysFAsJqSisAgBgCIJZgCdACPMGWG3rL5dSToRwADzqklKNcIEvoN0qJROH5jze/LtXkX2ouVkiFrypdGP8UdEIRDgdu/alwZ9hAG3CosAvVMCgpWSnBEbAfar0f1WBZ+3u/MJGohxOP/vAAENgzBqYJkPdFoWZdj+AAAA" },
+  },
+}
@@ -0,0 +1,100 @@
+// Portfolio Data - Rami Baddour (loaded on demand from projects.index.js)
+export default {
+  id: "rami-baddour",
+  name: "Rami Baddour",
+  type: "Social Media + Branding",
+  thumbnail: "/images/Rami Baddour/3.png",
+  images: [
+    "/images/Rami Baddour/1.jpg",
+    "/images/Rami Baddour/10.png",
+    "/images/Rami Baddour/11.jpg",
+    "/images/Rami Baddour/12.jpg",
+    "/images/Rami Baddour/13.png",
+    "/images/Rami Baddour/14.png",
+    "/images/Rami Baddour/15.png",
+    "/images/Rami Baddour/16.png",
+    "/images/Rami Baddour/17.png",
+    "/images/Rami Baddour/18.png",
+    "/images/Rami Baddour/19.png",
+    "/images/Rami Baddour/2.jpg",
+    "/images/Rami Baddour/20.jpg",
+    "/images/Rami Baddour/21.jpg",
+    "/images/Rami Baddour/22.jpg",
+    "/images/Rami Baddour/23.jpg",
+    "/images/Rami Baddour/24.jpg",
+    "/images/Rami Baddour/25.jpg",
+    "/images/Rami Baddour/26.png",
+    "/images/Rami Baddour/27.png",
+    "/images/Rami Baddour/28.png",
+    "/images/Rami Baddour/29.png",
+    "/images/Rami Baddour/3.png",
+    "/images/Rami Baddour/4.png",
+    "/images/Rami Baddour/5.png",
+    "/images/Rami Baddour/6.png",
+    "/images/Rami Baddour/7.png",
+    "/images/Rami Baddour/8.jpg",
+    "/images/Rami Baddour/9.jpg",
+  ],
+  hashes: {
+    "/images/Rami Baddour/1.jpg": "f3e93f10",
+    "/images/Rami Baddour/10.png": "ce0038f8",
+    "/images/Rami Baddour/11.jpg": "a52d3e90",
+    "/images/Rami Baddour/12.jpg": "e152e92a",
+    "/images/Rami Baddour/13.png": "6a60cc9b",
+    "/images/Rami Baddour/14.png": "bf8bab09",
+    "/images/Rami Baddour/15.png": "66bce799",
+    "/images/Rami Baddour/16.png": "80f67acb",
+    "/images/Rami Baddour/17.png": "2791f90c",
+    "/images/Rami Baddour/18.png": "1ddacad3",
+    "/images/Rami Baddour/19.png": "e6e225a9",
+    "/images/Rami Baddour/2.jpg": "b4fbc661",
+    "/images/Rami Baddour/20.jpg": "a2b280a1",
+    "/images/Rami Baddour/21.jpg": "f0ebaaaf",
+    "/images/Rami Baddour/22.jpg": "968533df",
+    "/images/Rami Baddour/23.jpg": "c21cd72b",
+    "/images/Rami Baddour/24.jpg": "4865497d",
+    "/images/Rami Baddour/25.jpg": "dc6b3b79",
+    "/images/Rami Baddour/26.png": "0f50d8be",
+    "/images/Rami Baddour/27.png": "629b8214",
+    "/images/Rami Baddour/28.png": "35222a19",
+    "/images/Rami Baddour/29.png": "b963932d",
+    "/images/Rami Baddour/3.png": "f6fa67aa",
+    "/images/Rami Baddour/4.png": "7f991fd2",
+    "/images/Rami Baddour/5.png": "3341f1c8",
+    "/images/Rami Baddour/6.png": "ceec296d",
+    "/images/Rami Baddour/7.png": "df3ed103",
+    "/images/Rami Baddour/8.jpg": "b4cf7e4a",
+    "/images/Rami Baddour/9.jpg": "4f981d61",
+  },
+  imageMeta: {
+    "/images/Rami Baddour/1.jpg": { width: 1920, height: 1080, color: "#f6f6f6", placeholder: "data:image/webp;base64,UklGRl4AAABXRUJQVlA4IFIAAAAwAgCdASoQAAkABABoJQBdgMXX325ilv/UAAD+4oyT1u/OfBCEhDtE/qauBFRWtR1RJe/NY84A00+L+CeRGqQOpVXUMv+RH5QEo0LM0ZWJwAAA" },
+    "/images/Rami Baddour/10.png": { width: 1920, height: 1080, color: "#a97d67", placeholder: "data:image/webp;base64,UklGRroAAABXRUJQVlA4WAoAAAAQAAAADwAACAAAQUxQSEAAAAABb6CmkRTojlcI2lFHTX02IiKgcZJNrv6AqI2kJPe/g/2iAgm4QAMCyDggZwcH6ENBRP9j5IKT9nSlJv/fmbAxVlA4IFQAAADwAQCdASoQAAkABABoJZgCdACpqkH3cEAA/Il8pFeJEzUVmVhC0iACbl+8gL4deqco8vhqoCnfCExBPTOi1kJC9ACCMUQhvqIf6AR9fVzwHCaAAAA=" },
+    "/images/Rami Baddour/11.jpg": { width: 1920, height: 1080, color: "#f6f6f6", placeholder: "data:image/webp;base64,UklGRl4AAABXRUJQVlA4IFIAAAAQAgCdASoQAAkABABoJQBOgCHw9CLf/5gAAP64RUXiNMU+TYx+0tNyl+Sx3ovNpvDiR2uctN/WlNzKgaVEI3A7QEhy36SuTr4MZJaED1pCGcAA" },
+    "/images/Rami Baddour/12.jpg": { width: 1920, height: 1080, color: "#f6f6f6", placeholder: "data:image/webp;base64,UklGRl4AAABXRUJQVlA4IFIAAAAQAgCdASoQAAkABABoJYgCdAEPg+mT/aAAAP4Lue3n69W82vYKyGqFqGQE/91MnDvxzOBqsoFuGTP5A4Q6+WJ73ZOAjiPz1OnPYcvEr86+qAAA" },
+    "/images/Rami Baddour/13.png": { width: 1920, height: 1080, color: "#f6f6f6", placeholder: "data:image/webp;base64,UklGRjAAAABXRUJQVlA4ICQAAABQAQCdASoQAAkABABoJaQABHQAAP7xNGYSDMh71r91rdsAAAA=" },
+    "/images/Rami Baddour/14.png": { width: 1920, height: 1080, color: "#f6f6f6", placeholder: "data:image/webp;base64,UklGRi4AAABXRUJQVlA4ICIAAABQAQCdASoQAAkABABoJaQABHQAAP7xM8iAUp/105bm+AAA" },
+    "/images/Rami Baddour/15.png": { width: 1920, height: 1080, color: "#004524", placeholder: "data:image/webp;base64,UklGRjgAAABXRUJQVlA4ICwAAABwAQCdASoQAAkABABoJaACdAFAAAD+73t7Gk68Au7oTo2JSY8O7m69KwAAAA==" },
+    "/images/Rami Baddour/16.png": { width: 1920, height: 1080, color: "#004524", placeholder: "data:image/webp;base64,UklGRjYAAABXRUJQVlA4ICoAAABwAQCdASoQAAkABABoJaACdAFAAAD+73sjZuzSlFo4aGZ/X160tzbiAAA=" },
+    "/images/Rami Baddour/17.png": { width: 1920, height: 1080, color: "#f6f6f6", placeholder: "data:image/webp;base64,UklGRjoAAABXRUJQVlA4IC4AAAAwAQCdASoQAAkABABoJaQAA3AA/vD0b53JFeuOJbw0gB7tt8fY6/9TvmOPAAAA" },
+    "/images/Rami Baddour/18.png": { width: 1920, height: 1080, color: "#f6f6f6", placeholder: "data:image/webp;base64,UklGRjYAAABXRUJQVlA4ICoAAACwAQCdASoQAAkABABoJaQAAudcyGgAAP702ld71Nv7/bnNNM+ojawAAAA=" },
+    "/images/Rami Baddour/19.png": { width: 1920, height: 1080, color: "#f6f6f6", placeholder: "data:image/webp;base64,UklGRkIAAABXRUJQVlA4IDYAAAAQAgCdASoQAAkABABoJZQC7AEPEHL/OqAAAP7wjh+SlY8RYybqLHUyEm4W0lBf2oU1B0esmAA=" },
+    "/images/Rami Baddour/2.jpg": { width: 1920, height: 1080, color: "#908468", placeholder: "data:image/webp;base64,UklGRlQAAABXRUJQVlA4IEgAAAAQAgCdASoQAAkABABoJaACdAED+NzqXppAAP5hT+RaSb7CWUKtzmeH3y0pdx1lqwQlEDaIeMWxVqScpZFjXbXfJVD4AXKAAAA=" },
+    "/images/Rami Baddour/20.jpg": { width: 1920, height: 1080, color: "#30231a", placeholder: "data:image/webp;base64,UklGRjYAAABXRUJQVlA4ICoAAACwAQCdASoQAAkABABoJZQCdAEO/gLsAP7ugLT7oJsBlxhpZftojjOkqAA=" },
+    "/images/Rami Baddour/21.jpg": { width: 1920, height: 1080, color: "#d0d0d2", placeholder: "data:image/webp;base64,UklGRkwAAABXRUJQVlA4IEAAAAAQAgCdASoQAAkABABoJYwC7AELztP7b4QAAP7vzyOO2ME7OfEYXfHn8XmKvH0Iz5jMq3r8NNhfLS465egCwAAA" },
+    "/images/Rami Baddour/22.jpg": { width: 1920, height: 1080, color: "#151513", placeholder: "data:image/webp;base64,UklGRkwAAABXRUJQVlA4IEAAAACQAQCdASoQAAkABABoJZwAAhad2wAA/vGZ22H3NDiNlfFqbtjfVrAizrP5Q8ef1pZdNt4aL07J0AVZGwE2AAAA" },
+    "/images/Rami Baddour/23.jpg": { width: 1920, height: 1080, color: "#4f4e4c", placeholder: "data:image/webp;base64,UklGRkoAAABXRUJQVlA4ID4AAADQAQCdASoQAAkABABoJaQAAwBOvTqoAAD+nv7dd9fVNi+1o493HgKOmkDRIUiUurRVcgUbKTNuaY2WPoIAAA==" },
+    "/images/Rami Baddour/24.jpg": { width: 1920, height: 1080, color: "#3b453e", placeholder: "data:image/webp;base64,UklGRjQAAABXRUJQVlA4ICgAAADwAQCdASoQAAkABABoJYwBTAA9EwGChAAA/p6CifDRhqGRpTUtJzgA" },
+    "/images/Rami Baddour/25.jpg": { width: 1920, height: 1080, color: "#b4a08f", placeholder: "data:image/webp;base64,UklGRlgAAABXRUJQVlA4IEwAAAAQAgCdASoQAAkABABoJYwCdADdKbA3/oAAAP7oAKP9aN5Zha7c/+265Zvu+sOGmPHGJEvKMeat25IVCSfVoESPe+X2QF430u9vQAAA" },
+    "/images/Rami Baddour/26.png": { width: 252, height: 144, color: "#f6f6f6", placeholder: "data:image/webp;base64,UklGRiwAAABXRUJQVlA4ICAAAACQAQCdASoQAAkABABoJaQAAudUwMAA/vTLkAmPMEAAAA==" },
+    "/images/Rami Baddour/27.png": { width: 252, height: 144, color: "#f6f6f6", placeholder: "data:image/webp;base64,UklGRjoAAABXRUJQVlA4IC4AAACwAQCdASoQAAkABABoJZwAAudc5lGAAP7zcLQEryul3/vWBPUBZ1WXpYfcAAAA" },
+    "/images/Rami Baddour/28.png": { width: 252, height: 144, color: "#004524", placeholder: "data:image/webp;base64,UklGRjgAAABXRUJQVlA4ICwAAABwAQCdASoQAAkABABoJaACdAFAAAD+73t7Gk66ybuNoTW6c369aW5txAAAAA==" },
+    "/images/Rami Baddour/29.png": { width: 252, height: 144, color: "#004524", placeholder: "data:image/webp;base64,UklGRkAAAABXRUJQVlA4IDQAAADQAQCdASoQAAkABABoJaACdAEO/yg8KAD+69vNWF9X020CGKXkEVmxkRrEdEU+vVLblbAA" },
+    "/images/Rami Baddour/3.png": { width: 1920, height: 1080, color: "#768292", placeholder: "data:image/webp;base64,UklGRlAAAABXRUJQVlA4IEQAAADwAQCdASoQAAkABABoJZgCdGuAArdSqDAA/ni77ohs6WnSoNkoY+tpfe7KcMvzYdBSWBOxRqHm7ycQkP+5XKiSLigAAA==" },
+    "/images/Rami Baddour/4.png": { width: 1920, height: 1080, color: "#7b8796", placeholder: "data:image/webp;base64,UklGRlAAAABXRUJQVlA4IEQAAAAwAgCdASoQAAkABABoJZACdGuAAs3Nf2bDAAD+eL5ouWsfNCCWTnNf4IWEq9mk9UUiPFpMY5SFGEUiagBbwQAGLvAwAA==" },
+    "/images/Rami Baddour/5.png": { width: 1920, height: 1080, color: "#7d765a", placeholder: "data:image/webp;base64,UklGRlYAAABXRUJQVlA4IEoAAADwAQCdASoQAAkABABoJZgC7ADp68Tf1QAA/t0YuP/W+BZN5r6lMhaM//pdVYkEckgiHxPm1icfv3SXWVsVeN6mVTFCDYMvjgAAAA==" },
+    "/images/Rami Baddour/6.png": { width: 1920, height: 1080, color: "#807a5c", placeholder: "data:image/webp;base64,UklGRlYAAABXRUJQVlA4IEoAAAAQAgCdASoQAAkABABoJZAC7ADMDLkLn3SAAP7dGLaP03QaPZb/2vP8YXfXDm4/hemICjDUwNUVb7Wz508Cxl2wHFaXc75CYk0AAA==" },
+    "/images/Rami Baddour/7.png": { width: 1920, height: 1080, color: "#f6f6f6", placeholder: "data:image/webp;base64,UklGRjQAAABXRUJQVlA4ICgAAACQAQCdASoQAAkABABoJaQAAuJPfwAA/vPDSsGOPu437XpE/xFT4AAA" },
+    "/images/Rami Baddour/8.jpg": { width: 1920, height: 1080, color: "#f6f6f6", placeholder: "data:image/webp;base64,UklGRkgAAABXRUJQVlA4IDwAAADwAQCdASoQAAkABABoJQBOgB6XF0p8AAAA/vBArBkm+9bBmEchrb+lAGItDTTWzQv4Ww5nGBFlTbRBsAA=" },
+    "/images/Rami Baddour/9.jpg": { width: 1920, height: 1080, color: "#f6f6f6", placeholder: "data:image/webp;base64,UklGRlwAAABXRUJQVlA4IFAAAAAQAgCdASoQAAkABABoJQBdgCKsS3Xwv5gAAP7KgKamOiz2SqIMKddCNv6yMt7V/ZW81owcX9e06wLgn3DfN5yRpT1fkCXdwKqKYVL/WJeAAA==" },
+  },
+}
@@ -0,0 +1,38 @@
+// Portfolio Data - Sifr (loaded on demand from projects.index.js)
+export default {
+  id: "sifr",
+  name: "Sifr",
+  type: "Social Media + Branding",
+  description: `Participated in creating the visual identity, adapting a powerful style of duotone and bitmap for image treatment, and conceptual graphics work. The aim was to create a unique to be stand out in the overwhelming timelines of today.`,
+  thumbnail: "/images/Sifr/A2.jpeg",
+  images: [
+    "/images/Sifr/A1.jpeg",
+    "/images/Sifr/A2.jpeg",
+    "/images/Sifr/B1.jpg",
+    "/images/Sifr/C1.jpeg",
+    "/images/Sifr/G1.jpg",
+    "/images/Sifr/G2.jpg",
+    "/images/Sifr/G3.jpeg",
+    "/images/Sifr/G4.jpeg",
+  ],
+  hashes: {
+    "/images/Sifr/A1.jpeg": "62553cf4",
+    "/images/Sifr/A2.jpeg": "e20de32e",
+    "/images/Sifr/B1.jpg": "f382dd39",
+    "/images/Sifr/C1.jpeg": "73a9fcf0",
+    "/images/Sifr/G1.jpg": "2366fbb9",
+    "/images/Sifr/G2.jpg": "ad6326ab",
+    "/images/Sifr/G3.jpeg": "6898d4c9",
+    "/images/Sifr/G4.jpeg": "d22430df",
+  },
+  imageMeta: {
+    "/images/Sifr/A1.jpeg": { width: 1080, height: 1080, color: "#5b4557", placeholder: "data:image/webp;base64,UklGRkwAAABXRUJQVlA4IEAAAADwAQCdASoQABAABABoJYwAAlhQxs2vPgAA/qFmCkvEP/UmjLta91BgYlfyQwGw8P7iL+nNaLHc8rR57LVhAAAA" },
+    "/images/Sifr/A2.jpeg": { width: 1080, height: 1080, color: "#49460c", placeholder: "data:image/webp;base64,UklGRlgAAABXRUJQVlA4IEwAAADwAQCdASoQABAABABoJbACdAEUlo41dEAA/tqfKbaL6e34OtS49nB538Lwvja226UO/Uxa3xlhHmSLMH4R+vi2fV+1x3ZzcPKjQAAA" },
+    "/images/Sifr/B1.jpg": { width: 1200, height: 675, color: "#6b676c", placeholder: "data:image/webp;base64,UklGRjwAAABXRUJQVlA4IDAAAACwAQCdASoQAAkABABoJZwAAtq8qYMgAP7ypbxE7RPndPuNV2n+JeWyHEvRpekwAAA=" },
+    "/images/Sifr/C1.jpeg": { width: 1200, height: 675, color: "#886f77", placeholder: "data:image/webp;base64,UklGRjwAAABXRUJQVlA4IDAAAACQAQCdASoQAAkABABoJYwAAlHp49AA3FLxTssJrhCHuR5tbzcu7cp3oBfR3lML4gA=" },
+    "/images/Sifr/G1.jpg": { width: 1080, height: 1080, color: "#e8e8e8", placeholder: "data:image/webp;base64,UklGRkAAAABXRUJQVlA4IDQAAABwAQCdASoQABAABABoJaV/2AGIAAD+8EoF6Tj7IzB/pJXvXUP9ZpDXNEZU74V9jDh0twAA" },
+    "/images/Sifr/G2.jpg": { width: 1080, height: 1080, color: "#e8e8e8", placeholder: "data:image/webp;base64,UklGRkoAAABXRUJQVlA4ID4AAADwAQCdASoQABAABABoJaQAAvc4F/dRhAAA/vHbPqte28tl3t6d901WooQZf2zgM09xfKoGLnAmcpmVSyoAAA==" },
+    "/images/Sifr/G3.jpeg": { width: 1081, height: 1081, color: "#ededed", placeholder: "data:image/webp;base64,UklGRkoAAABXRUJQVlA4ID4AAADwAQCdASoQABAABABoJYwAAp2gPgWf7YAA/vH2guw5FfqIG9GL03YasF+clQfk9903CpxmUr1fT5UDfvqgAA==" },
+    "/images/Sifr/G4.jpeg": { width: 1081, height: 1081, color: "#ededed", placeholder: "data:image/webp;base64,UklGRkQAAABXRUJQVlA4IDgAAAAQAgCdASoQABAABABoJYwC7AD0Say5/SAAAP7x4MUoVRyeQgwaFqVtxxO2EDUQ351fY4Me+ekQAA==" },
+  },
+}
@@ -0,0 +1,62 @@
+// Portfolio Data - Sofar (loaded on demand from projects.index.js)
+export default {
+  id: "sofar",
+  name: "Sofar",
+  type: "Social Media + Art Direction",
+  description: `I organize Sofar Beirut - a music concept where hundreds of people attend a music gig without knowing who are the bands that are going to play, also knowing the venue only one day before the gig. I create the poster for every gig announcement, do promotional videos, art direct sets and video shooting style while eventually editing the videos.`,
+  thumbnail: "/images/Sofar/A1.jpg",
+  images: [
+    "/images/Sofar/A1.jpg",
+    "/images/Sofar/A2.jpg",
+    "/images/Sofar/A3.jpg",
+    "/images/Sofar/A4.jpg",
+    "/images/Sofar/A5.jpg",
+    "/images/Sofar/B1.jpg",
+    "/images/Sofar/B2.jpg",
+    "/images/Sofar/B3.jpg",
+    "/images/Sofar/S1.jpg",
+    "/images/Sofar/S3.jpg",
+    "/images/Sofar/S4.jpg",
+    "/images/Sofar/S5.JPG",
+    "/images/Sofar/S6.JPG",
+    "/images/Sofar/S7.jpg",
+    "/images/Sofar/S8.jpg",
+    "/images/Sofar/S9.jpg",
+  ],
+  hashes: {
+    "/images/Sofar/A1.jpg": "91d3f5c3",
+    "/images/Sofar/A2.jpg": "c4685806",
+    "/images/Sofar/A3.jpg": "63109eb2",
+    "/images/Sofar/A4.jpg": "57a6f104",
+    "/images/Sofar/A5.jpg": "0686cf8e",
+    "/images/Sofar/B1.jpg": "724bcf43",
+    "/images/Sofar/B2.jpg": "5dbbe6c2",
+    "/images/Sofar/B3.jpg": "592f7a6d",
+    "/images/Sofar/S1.jpg": "122077f0",
+    "/images/Sofar/S3.jpg": "d4620456",
+    "/images/Sofar/S4.jpg": "7f14ed84",
+    "/images/Sofar/S5.JPG": "31b7f10d",
+    "/images/Sofar/S6.JPG": "2ad4611f",
+    "/images/Sofar/S7.jpg": "6f01a624",
+    "/images/Sofar/S8.jpg": "733a4816",
+    "/images/Sofar/S9.jpg": "3c9b80e2",
+  },
+  imageMeta: {
+    "/images/Sofar/A1.jpg": { width: 1200, height: 1500, color: "#b8361a", placeholder: "data:image/webp;base64,UklGRn4AAABXRUJQVlA4IHIAAADwAwCdASoQABQAPxFysFAsJqSisAgBgCIJbACxG1yBoKcgN7qPs3vwAP4UEEpbwqswdcBnLYUuA1RIDFz5oqpa5hoYsoKppG359bjEab8UMWMfRueWa+7R7y+dCzT7jzKAhVeIFnYh1n4L/YDA08pFgAA=" },
+    "/images/Sofar/A2.jpg": { width: 1080, height: 1350, color: "#80152c", placeholder: "data:image/webp;base64,UklGRnIAAABXRUJQVlA4IGYAAABwAwCdASoQABQAPxFysFAsJqSisAgBgCIJbFTATKATWqCF1wAA/ukH3klwVuNS4mNsy0QSHfHI8z3ihW1VToJH8XdiOMY/4fbqXDVnPRU2ZzrHHKdjTQFMVr8i6ZimB2Ih9vkAAAA=" },
+    "/images/Sofar/A3.jpg": { width: 1080, height: 1350, color: "#723721", placeholder: "data:image/webp;base64,UklGRn4AAABXRUJQVlA4IHIAAABQBACdASoQABQAPxFwsFAsJiSisAgBgCIJZACdMoADf74GVnD0AeIqWqaAAP7r9zLAjYtBGDB7Xz+nPohBf6jzDbOqG94oDjs4qbtqjHaozHSZ55duVM4lLSrRARU03bLaqN1Ziv82MfejR//JL8GAAAA=" },
+    "/images/Sofar/A4.jpg": { width: 1080, height: 1350, color: "#e75e75", placeholder: "data:image/webp;base64,UklGRoAAAABXRUJQVlA4IHQAAABQBACdASoQABQAPxFysFAsJqSisAgBgCIJbACdMoRwN6SAVlL/E1DGSuUAAPxafYbcwkcwJ2hl3WqD3YWhJ5hmclAouL2PixwS+m2ljCsfebhLP7y/8u1fXH2uuReCyeP1n92KXUsxtC+hZ0IpDH1pi4AAAA==" },
+    "/images/Sofar/A5.jpg": { width: 1200, height: 1500, color: "#6c3a32", placeholder: "data:image/webp;base64,UklGRnYAAABXRUJQVlA4IGoAAACQAwCdASoQABQAPxFysFAsJqSisAgBgCIJQBYdg3ba8vIl9UWAAP7ZWfhnw3ZJW40sqRlxAPMV1kzxddCNXZLDX7HobGfiboP1uLFadykoQ20MsGNQlWk0ipHBzXD82qqHKtf1ZAauAAAA" },
+    "/images/Sofar/B1.jpg": { width: 1080, height: 1080, color: "#022517", placeholder: "data:image/webp;base64,UklGRk4AAABXRUJQVlA4IEIAAADwAQCdASoQABAABABoJQAAXOgquN/CfAAA/vKeA0pnabtefzTSgdEeRK9QLMyECjvQaTjh8aECNiMRWF+5P1XwAAA=" },
+    "/images/Sofar/B2.jpg": { width: 1080, height: 1080, color: "#024c53", placeholder: "data:image/webp;base64,UklGRmQAAABXRUJQVlA4IFgAAADwAQCdASoQABAABABoJbACdAELTnKzcwAA/tzSY+ZtdGIuseJwgUXQ9mk/fw34EEqksZpul+vq8gkD2Sq+HpMX9UiVrdBEdbpjjajaJuyd6X8YPr705IAA" },
+    "/images/Sofar/B3.jpg": { width: 1080, height: 1080, color: "#c7c8bd", placeholder: "data:image/webp;base64,UklGRlwAAABXRUJQVlA4IFAAAAAQAgCdASoQABAABABoJZQC7AEPDNe7N+RAAP7rMbVweIFkZVkOELMTAp7M13UkvYaLdUxKJcxQehARv1JmlllGMK94MmtbWnKwSQ3IADtMAA==" },
+    "/images/Sofar/S1.jpg": { width: 1200, height: 800, color: "#261d0f", placeholder: "data:image/webp;base64,UklGRmgAAABXRUJQVlA4IFwAAAAQAgCdASoQAAsABABoJYgCdAEff6MPrAaAAP70UCS3iZOVEaLSfP5MsB7XuJtLbMArIn688GNXhUKmceM0IN3fWVM3SSxhfqw8V/noGuijAwIXFYbUtdQeuAAAAA==" },
+    "/images/Sofar/S3.jpg": { width: 1200, height: 800, color: "#542b1b", placeholder: "data:image/webp;base64,UklGRnAAAABXRUJQVlA4IGQAAADwAQCdASoQAAsABABoJbACdAEKROBttgAA/qvl7VB1/GFlOeyMoNgjWG09XMi0tDtDN8y3aGvil+3ZitAJj0x+amVPrMrxE3O8rppUa8VVxNTtMOhpkzuhDTkzHAiCNsaEgAAA" },
+    "/images/Sofar/S4.jpg": { width: 1200, height: 673, color: "#4f3521", placeholder: "data:image/webp;base64,UklGRlAAAABXRUJQVlA4IEQAAADQAQCdASoQAAkABABoJZACdADc9CBrgAD+zgOC+6WHh4OuXRg7Sq6EncoOJPx9zV6paxtmr7aFKpa1ebvaYVgjtcAAAA==" },
+    "/images/Sofar/S5.JPG": { width: 1800, height: 1200, color: "#171413", placeholder: "data:image/webp;base64,UklGRlgAAABXRUJQVlA4IEwAAADwAQCdASoQAAsABABoJYgCdAEPOtmo0YAA/qgaef+/xewIUzz7sGS0lHEVupsGDRCoabWS2aJJ8gLreVdBI7UZ0i7A0VM7MA5UsQAA" },
+    "/images/Sofar/S6.JPG": { width: 1200, height: 675, color: "#0c0c0e", placeholder: "data:image/webp;base64,UklGRlYAAABXRUJQVlA4IEoAAADQAQCdASoQAAkABABoJYgCdADwQNbYQAD+z4PG1GAa8mpLdM7LBSkOHnNC8zbfnzBnh6u/JQKy66LGeddFaOU+Xcwm1JHzcbaAAA==" },
+    "/images/Sofar/S7.jpg": { width: 1200, height: 800, color: "#42180b", placeholder: "data:image/webp;base64,UklGRloAAABXRUJQVlA4IE4AAAAQAgCdASoQAAsABABoJbACdAEQNZ47AmFgAP70XCwa//3lBtKlbmfsZRdQmzg/K4qmtdpoHohHoEYUHWac/5zCycFyNijcKXaXo1FqAAA=" },
+    "/images/Sofar/S8.jpg": { width: 1200, height: 2134, color: "#06201b", placeholder: "data:image/webp;base64,UklGRnQAAABXRUJQVlA4IGgAAABwAwCdASoQABwALtGIxGIkLCwsDADQS0AF2AHfXJJVXvQyxsAA/tB02AiHXM8weH00Ut1DvVg3Jzgppmdlw0Ge7eiewXGU9q0O9yOZB6Ehd204me0FYPU8ge4QHKLRjJG2XFhGjAAAAA==" },
+    "/images/Sofar/S9.jpg": { width: 1200, height: 1800, color: "#080403", placeholder: "data:image/webp;base64,UklGRngAAABXRUJQVlA4IGwAAAAQBACdASoQABgAPxFysFAsJqSisAgBgCIJQBhQBC4dEcmVT/fuPKXgAAD+47geEhJS4bOyPyKzMiajsyI1/G2Gis05F/C3Tc2zxor51xLbq4fG/kX1KEQ2/bvnfwA8Ya+5tn458eJiYOPhxAA=" },
+  },
+}
@@ -0,0 +1,122 @@
+// Portfolio Data - Sunnymoon (loaded on demand from projects.index.js)
+export default {
+  id: "sunnymoon",
+  name: "Sunnymoon",
+  type: "Social Media + Branding",
+  description: `I handled the full branding, from the original logo ideation down to the smallest detail. I put an emphasis on the icons in this project, where the three icons each represent a character with its own theme, but within one greater identity.`,
+  thumbnail: "/images/Sunnymoon/Artboard 3.png",
+  images: [
+    "/images/Sunnymoon/Artboard 1.png",
+    "/images/Sunnymoon/Artboard 10.png",
+    "/images/Sunnymoon/Artboard 11.png",
+    "/images/Sunnymoon/Artboard 12.png",
+    "/images/Sunnymoon/Artboard 13.png",
+    "/images/Sunnymoon/Artboard 14.png",
+    "/images/Sunnymoon/Artboard 15.png",
+    "/images/Sunnymoon/Artboard 16.png",
+    "/images/Sunnymoon/Artboard 17.png",
+    "/images/Sunnymoon/Artboard 18.png",
+    "/images/Sunnymoon/Artboard 2.png",
+    "/images/Sunnymoon/Artboard 20.jpg",
+    "/images/Sunnymoon/Artboard 21.png",
+    "/images/Sunnymoon/Artboard 22.png",
+    "/images/Sunnymoon/Artboard 23.png",
+    "/images/Sunnymoon/Artboard 24.png",
+    "/images/Sunnymoon/Artboard 25.png",
+    "/images/Sunnymoon/Artboard 26.png",
+    "/images/Sunnymoon/Artboard 27.jpg",
+    "/images/Sunnymoon/Artboard 28.jpg",
+    "/images/Sunnymoon/Artboard 29.jpg",
+    "/images/Sunnymoon/Artboard 3.png",
+    "/images/Sunnymoon/Artboard 30.png",
+    "/images/Sunnymoon/Artboard 31.jpg",
+    "/images/Sunnymoon/Artboard 32.png",
+    "/images/Sunnymoon/Artboard 33.jpg",
+    "/images/Sunnymoon/Artboard 34.jpg",
+    "/images/Sunnymoon/Artboard 35.png",
+    "/images/Sunnymoon/Artboard 36.jpg",
+    "/images/Sunnymoon/Artboard 37.png",
+    "/images/Sunnymoon/Artboard 4.png",
+    "/images/Sunnymoon/Artboard 5.png",
+    "/images/Sunnymoon/Artboard 6.png",
+    "/images/Sunnymoon/Artboard 7.png",
+    "/images/Sunnymoon/Artboard 8.png",
+    "/images/Sunnymoon/Artboard 9.png",
+  ],
+  hashes: {
+    "/images/Sunnymoon/Artboard 1.png": "2955a919",
+    "/images/Sunnymoon/Artboard 10.png": "e90afc8d",
+    "/images/Sunnymoon/Artboard 11.png": "57f4aeab",
+    "/images/Sunnymoon/Artboard 12.png": "f1970d5e",
+    "/images/Sunnymoon/Artboard 13.png": "ebdc9f1c",
+    "/images/Sunnymoon/Artboard 14.png": "353e7168",
+    "/images/Sunnymoon/Artboard 15.png": "c63af72a",
+    "/images/Sunnymoon/Artboard 16.png": "d63a12d5",
+    "/images/Sunnymoon/Artboard 17.png": "4c52c830",
+    "/images/Sunnymoon/Artboard 18.png": "963dad9c",
+    "/images/Sunnymoon/Artboard 2.png": "f5bf2665",
+    "/images/Sunnymoon/Artboard 20.jpg": "4c5f66b9",
+    "/images/Sunnymoon/Artboard 21.png": "f616b38a",
+    "/images/Sunnymoon/Artboard 22.png": "97d0f5e7",
+    "/images/Sunnymoon/Artboard 23.png": "06390fd1",
+    "/images/Sunnymoon/Artboard 24.png": "156d28d3",
+    "/images/Sunnymoon/Artboard 25.png": "9620a15e",
+    "/images/Sunnymoon/Artboard 26.png": "1debe43e",
+    "/images/Sunnymoon/Artboard 27.jpg": "7b145d3f",
+    "/images/Sunnymoon/Artboard 28.jpg": "6da084fe",
+    "/images/Sunnymoon/Artboard 29.jpg": "58ba26e9",
+    "/images/Sunnymoon/Artboard 3.png": "9d77b80a",
+    "/images/Sunnymoon/Artboard 30.png": "f9cc597b",
+    "/images/Sunnymoon/Artboard 31.jpg": "a734ca84",
+    "/images/Sunnymoon/Artboard 32.png": "a1400133",
+    "/images/Sunnymoon/Artboard 33.jpg": "4b652bf0",
+    "/images/Sunnymoon/Artboard 34.jpg": "bfbdfa5b",
+    "/images/Sunnymoon/Artboard 35.png": "0a634ead",
+    "/images/Sunnymoon/Artboard 36.jpg": "7574ca20",
+    "/images/Sunnymoon/Artboard 37.png": "1a8bc971",
+    "/images/Sunnymoon/Artboard 4.png": "56d02954",
+    "/images/Sunnymoon/Artboard 5.png": "08c14993",
+    "/images/Sunnymoon/Artboard 6.png": "8f7bb6bf",
+    "/images/Sunnymoon/Artboard 7.png": "217f0ead",
+    "/images/Sunnymoon/Artboard 8.png": "58bba994",
+    "/images/Sunnymoon/Artboard 9.png": "e3ffe0b9",
+  },
+  imageMeta: {
+    "/images/Sunnymoon/Artboard 1.png": { width: 1920, height: 1080, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRkgAAABXRUJQVlA4IDwAAACwAQCdASoQAAkABABoJaQAAuiobgjwAP7zzsw7pqKJJCbSnvX7MggzTn/29idfgwgZVgG7AcjEAQAAAAA=" },
+    "/images/Sunnymoon/Artboard 10.png": { width: 1920, height: 1080, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRkwAAABXRUJQVlA4IEAAAACwAQCdASoQAAkABABoJZgCdAENcueAAP7wNVDPNUs7UrHI8qtI/4C6wiAb8d5LVCWNx46+/5kp+vbtffHlgAAA" },
+    "/images/Sunnymoon/Artboard 11.png": { width: 1920, height: 1080, color: "#e2e5fb", placeholder: "data:image/webp;base64,UklGRkIAAABXRUJQVlA4IDYAAADQAQCdASoQAAkABABoJZACw7D2PP6kgAD+4fDebt/AhjnuRzZ0HcU1b2alk4zQ0lz1CL0YAAA=" },
+    "/images/Sunnymoon/Artboard 12.png": { width: 1920, height: 1080, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRkAAAABXRUJQVlA4IDQAAACwAQCdASoQAAkABABoJQBdgB6OgADIAP7rMbXSmbvr7Xpr0pZ4PETLm00IlN/G+FaQAAAA" },
+    "/images/Sunnymoon/Artboard 13.png": { width: 1920, height: 1080, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRkIAAABXRUJQVlA4IDYAAACwAQCdASoQAAkABABoJZACw7D0alQAAP7t6kOVa+hpz5dGp+Rnc1jXIvQgtmhKCJ+arhgAAAA=" },
+    "/images/Sunnymoon/Artboard 14.png": { width: 1920, height: 1080, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRjwAAABXRUJQVlA4IDAAAABQAQCdASoQAAkABABoJaQABHQAAP7xP/+yj9fv2dSMedCOTk5bNnLjMLLF/TPcAAA=" },
+    "/images/Sunnymoon/Artboard 15.png": { width: 1920, height: 1080, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRl4AAABXRUJQVlA4IFIAAADwAQCdASoQAAkABABoJaQAAu0eop4mUYAA/vBKScq+pDrXzxe4Nd+6H8IoxY+AkYpf4ojf7k0cv6LKXKdP4cJfPupF8HZohkYOJq52/BV99AAA" },
+    "/images/Sunnymoon/Artboard 16.png": { width: 1920, height: 1080, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRmAAAABXRUJQVlA4IFQAAACwAQCdASoQAAkABABoJaQAAtdOQlXgAP7wQcy85P1VtYbXvfQSP5eTXPn3qtu+LgrtuPuruvkfKvXGfyCDCTuu0Wnw9Xn8RSPxyHvhOY2p1hQAAAA=" },
+    "/images/Sunnymoon/Artboard 17.png": { width: 1920, height: 1080, color: "#fcfcfc", placeholder: "data:image/webp;base64,UklGRi4AAABXRUJQVlA4ICIAAAAwAQCdASoQAAkABABoJaQAA3AA/vIU8RnRRucmiz03AAAA" },
+    "/images/Sunnymoon/Artboard 18.png": { width: 1920, height: 1080, color: "#df88ff", placeholder: "data:image/webp;base64,UklGRjQAAABXRUJQVlA4ICgAAACQAQCdASoQAAkABABoJbACdLoAA5gA/uk9RLuePH5L0v329nQ0JQAA" },
+    "/images/Sunnymoon/Artboard 2.png": { width: 1920, height: 1080, color: "#de85ff", placeholder: "data:image/webp;base64,UklGRkIAAABXRUJQVlA4IDYAAAAQAgCdASoQAAkABABoJbACdLoAAxkLC0QAAP7DYh4So2xvgZf9WHvqN7lHME54iObVTYriAAA=" },
+    "/images/Sunnymoon/Artboard 20.jpg": { width: 1920, height: 1080, color: "#d589ee", placeholder: "data:image/webp;base64,UklGRlIAAABXRUJQVlA4IEYAAADwAQCdASoQAAkABABoJbACdAEPEBkT/IAA/tTE6h/DoX40X5i5HDSstROAuPkisnbUHYiK1pSlVNSDL4aGMwBgy99aAAAA" },
+    "/images/Sunnymoon/Artboard 21.png": { width: 1920, height: 1080, color: "#6278b7", placeholder: "data:image/webp;base64,UklGRoQAAABXRUJQVlA4WAoAAAAQAAAADwAACAAAQUxQSBgAAAABF3D//4iIwiDbSOcPcv9f0zeI6H9CXgpWUDggRgAAABACAJ0BKhAACQAEAGgloAJ0ARRI0Mtg6AAA/pi7C0x45SOM0UFhYKSAH1zKd6UK0VA6F8z4ajRSe9sQ0+R2EN2HIRhb4AA=" },
+    "/images/Sunnymoon/Artboard 22.png": { width: 1920, height: 1080, color: "#faf3e1", placeholder: "data:image/webp;base64,UklGRoYAAABXRUJQVlA4WAoAAAAQAAAADwAACAAAQUxQSBoAAAABF3D//4iIQiEbSdD6IxzAV9MziOh/NvKqBlZQOCBGAAAA0AEAnQEqEAAJAAQAaCWwAnQBDdfC7ogA/u4xWdkAn3tyPrRWyHNamy9PN1I6mUYgIVfLwXPUEFNvvBIpyMBNlm3BK3AAAA==" },
+    "/images/Sunnymoon/Artboard 23.png": { width: 1920, height: 1080, color: "#fadbf8", placeholder: "data:image/webp;base64,UklGRogAAABXRUJQVlA4WAoAAAAQAAAADwAACAAAQUxQSBoAAAABF3D//4iIQiEbSdD6IxzAV9MziOh/NvKqBlZQOCBIAAAA8AEAnQEqEAAJAAQAaCUAToAhvFRutUAAAP7oWYOoanSwZFpB3+ZAmqjd03KOzKsDwOeD1cpXyaJcvR1l3HTqoxJmmqshxAAA" },
+    "/images/Sunnymoon/Artboard 24.png": { width: 1920, height: 1080, color: "#f9b14f", placeholder: "data:image/webp;base64,UklGRkwAAABXRUJQVlA4IEAAAAAQAgCdASoQAAkABABoJbACdAEUjIqh6/QAAP7TVg/NOYETU61Hgi9ZonByP1HOtX6f24p5K353JvrWim6In0AA" },
+    "/images/Sunnymoon/Artboard 25.png": { width: 1920, height: 1080, color: "#de85ff", placeholder: "data:image/webp;base64,UklGRkoAAABXRUJQVlA4ID4AAAAQAgCdASoQAAkABABoJbACdADdRGMRZRUYAP6vltiFdBZ211V40c1sXCTOjinyb61oyRAe4jrQykbOgdgAAA==" },
+    "/images/Sunnymoon/Artboard 26.png": { width: 1920, height: 1080, color: "#6273ff", placeholder: "data:image/webp;base64,UklGRk4AAABXRUJQVlA4IEIAAADwAQCdASoQAAkABABoJbACdAEJMB/dTAAAyQH+Z9GzfkDuSlhoekhWP+oWhtDiFw/2KlzH7BviiZ/ILlgncHxXwAA=" },
+    "/images/Sunnymoon/Artboard 27.jpg": { width: 1920, height: 1080, color: "#33232c", placeholder: "data:image/webp;base64,UklGRl4AAABXRUJQVlA4IFIAAAAQAgCdASoQAAkABABoJbACdAELYLSOv6twAPkSvg/zuH7USN+gKI7gd9aMmP45HO/CMT1IzG91Ph3tKJl9nuw6f6b30I5Z79oFS6+DGYwYAAAA" },
+    "/images/Sunnymoon/Artboard 28.jpg": { width: 1920, height: 1080, color: "#4c3311", placeholder: "data:image/webp;base64,UklGRmAAAABXRUJQVlA4IFQAAAAQAgCdASoQAAkABABoJbACdAEesRWkSz4QAOH7KX6HCS4ByLBi2i7fxtjApP1eT1zrkysHUqIFNs6KROQ51zgBr/HGodyv+RjggwFRbWuZg9HsNAA=" },
+    "/images/Sunnymoon/Artboard 29.jpg": { width: 1920, height: 1080, color: "#46474b", placeholder: "data:image/webp;base64,UklGRlQAAABXRUJQVlA4IEgAAADQAQCdASoQAAkABABoJZwAAvfBXFWCQAD+xQcw9AaeYPi3zzUBXJnybBWcVGQBDo6LMM3xjV7EuVsxY+fFRjgsGCIsoMzhAAA=" },
+    "/images/Sunnymoon/Artboard 3.png": { width: 1920, height: 1080, color: "#f9ba65", placeholder: "data:image/webp;base64,UklGRkYAAABXRUJQVlA4IDoAAAAwAgCdASoQAAkABABoJbACdLoAAwnnnwqxAAD+3pDvT21dWkk9awmQv8bzfDfC7YebxYcBut8DUAAA" },
+    "/images/Sunnymoon/Artboard 30.png": { width: 1920, height: 1080, color: "#e3e2e2", placeholder: "data:image/webp;base64,UklGRj4AAABXRUJQVlA4IDIAAACQAQCdASoQAAkABABoJaQAAhn08AAA/u2grnjBYbVQHIOqdcfRqLt+cCnQgjj686gAAA==" },
+    "/images/Sunnymoon/Artboard 31.jpg": { width: 1920, height: 1080, color: "#c79494", placeholder: "data:image/webp;base64,UklGRl4AAABXRUJQVlA4IFIAAADQAQCdASoQAAkABABoJbACdAECjIFxoAD+jUQBgk7SvPUFsY2HG5rcYIYhm9eKp1zjrN0H/Pf5GU8ZBu8NGlWvd/0NYnv5LpwKGZekta0XAAAA" },
+    "/images/Sunnymoon/Artboard 32.png": { width: 1920, height: 1080, color: "#191919", placeholder: "data:image/webp;base64,UklGRkYAAABXRUJQVlA4IDoAAACwAQCdASoQAAkABABoJaQAAv9EupiAAP7x4xMePrktJLFEgcuzFPCWa2wNjFol17UhN3dUI8gFAAAA" },
+    "/images/Sunnymoon/Artboard 33.jpg": { width: 1920, height: 1080, color: "#c89595", placeholder: "data:image/webp;base64,UklGRmAAAABXRUJQVlA4IFQAAADQAQCdASoQAAkABABoJbACdAECgUlmYAD+jUQBgk7SvPUFsY2HHC3+Qt3qzP2Wu1au+1ka5Psv1okmbLVYu8NGlWvd/0MjO3IiDVoSTr229+4AAAA=" },
+    "/images/Sunnymoon/Artboard 34.jpg": { width: 1920, height: 1080, color: "#b27029", placeholder: "data:image/webp;base64,UklGRlYAAABXRUJQVlA4IEoAAAAQAgCdASoQAAkABABoJbACdADp/quodJyAAP7rJehdj4do0yHLVlsxu48U+eLi0Eaczn08ExZgO2NVyNJw9xN9BtcQC9kJYkAAAA==" },
+    "/images/Sunnymoon/Artboard 35.png": { width: 1920, height: 1080, color: "#c1b8b1", placeholder: "data:image/webp;base64,UklGRm4AAABXRUJQVlA4WAoAAAAQAAAADwAACAAAQUxQSBIAAAABD/D+/4iIIBBIQt9+hYj+Rx5WUDggNgAAANABAJ0BKhAACQAEAGgllAJ0AOGIpn+gAP7n3DJfnkS3KdfiwgdRBNQSGPcQM5mtdM4YSmmgAA==" },
+    "/images/Sunnymoon/Artboard 36.jpg": { width: 1920, height: 1080, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRlIAAABXRUJQVlA4IEYAAAAQAgCdASoQAAkABABoJZQC7AYrxq/pYsbAAP71AW2WGu+yinlHH55fqoRWdPcnJ+xhOnA2KIIJDky2t+f1vPUIAOcnPgAA" },
+    "/images/Sunnymoon/Artboard 37.png": { width: 1920, height: 1080, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRjYAAABXRUJQVlA4ICoAAACwAQCdASoQAAkABABoJaQAAudc/ZswAP72EKlQYpl0Dl2QKm9ZgGVYAAA=" },
+    "/images/Sunnymoon/Artboard 4.png": { width: 1920, height: 1080, color: "#6273ff", placeholder: "data:image/webp;base64,UklGRkQAAABXRUJQVlA4IDgAAACwAQCdASoQAAkABABoJagCdAEH0AMAAPi0uMW0XR9gCNeZRsQfFFyv9wfaquzb/aiwf0s3g6egAA==" },
+    "/images/Sunnymoon/Artboard 5.png": { width: 1920, height: 1080, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRjoAAABXRUJQVlA4IC4AAACwAQCdASoQAAkABABoJYwAAujfLkUAAP7wOdfs0A60DsQkRA638u5jJT9IIUAA" },
+    "/images/Sunnymoon/Artboard 6.png": { width: 1920, height: 1080, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRkIAAABXRUJQVlA4IDYAAACwAQCdASoQAAkABABoJZwAAxeVUXwAAP7yOrbR2VCiX9bUa5YXhFxlUal7dn82IHQu6bQAAAA=" },
+    "/images/Sunnymoon/Artboard 7.png": { width: 1920, height: 1080, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRj4AAABXRUJQVlA4IDIAAACwAQCdASoQAAkABABoJZwAAu0dpR6AAP7zqP+WX7N7dAvX2xy5iPmALRXa66T9bAAAAA==" },
+    "/images/Sunnymoon/Artboard 8.png": { width: 1920, height: 1080, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRlYAAABXRUJQVlA4IEoAAACwAQCdASoQAAkABABoJZQAAuMJtpyAAP7yOh4HsZHOG4mxel6VZngd8y01Y/yolMLj9NcbrUhKyRGxlPlKHNdLW7zc0Kk2y1AAAA==" },
+    "/images/Sunnymoon/Artboard 9.png": { width: 1920, height: 1080, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRkQAAABXRUJQVlA4IDgAAACwAQCdASoQAAkABABoJaQAAugg13UAAP7wOySknDSNVbf77BvK7nQ5Updmg9+TpUmH6xHo0UAAAA==" },
+  },
+}
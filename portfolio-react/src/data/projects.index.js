@@ -0,0 +1,437 @@
+// Portfolio Index - card fields only; full projects load from ./chunks/<id>.js
+export const projects = [
+  {
+    id: "avene",
+    name: "Avene",
+    type: "Art Direction",
+    thumbnail: "/images/Avene/C2.jpg",
+    imageCount: 15,
+    videoCount: 0,
+    pdfCount: 0,
+    imageMeta: {
+      "/images/Avene/C2.jpg": { width: 1800, height: 2250, color: "#86c7f7", placeholder: "data:image/webp;base64,UklGRpQAAABXRUJQVlA4IIgAAAAQBACdASoQABQAPxFysFAsJqSisAgBgCIJbACdMoACiH7YdICJ7swEAADOF8bKJMMNg1Y0PRf/TzbTe3oHKPjZWDDUm6vYIaV4m/SVj+bC+wihCE2r/Rn9b42XqDP1wuWmsvwMJ7SI4HVT7UDq1mR+sNyrqZGIgr3griCbSFjkDRhg6gP3AAAA" },
+    },
+    hashes: {
+      "/images/Avene/C2.jpg": "b4fc95b8",
+    },
+  },
+  {
+    id: "mccafe",
+    name: "McCafe",
+    type: "Social Media",
+    thumbnail: "/images/McCafe/A28.jpg",
+    imageCount: 45,
+    videoCount: 0,
+    pdfCount: 0,
+    imageMeta: {
+      "/images/McCafe/A28.jpg": { width: 1080, height: 1080, color: "#8a620e", placeholder: "data:image/webp;base64,UklGRm4AAABXRUJQVlA4IGIAAADwAQCdASoQABAABABoJbACdAEPSzw4WgAA/t25MRT/N3unBo3ekQ8r4rEy5BYN+Z1O2leyCNvmuD03/1i2nk0/YDud6IPllk+BJoJvCtH0K388E/KdngqJ2mnXpav/sN54AA==" },
+    },
+    hashes: {
+      "/images/McCafe/A28.jpg": "4f6e397a",
+    },
+  },
+  {
+    id: "sofar",
+    name: "Sofar",
+    type: "Social Media + Art Direction",
+    thumbnail: "/images/Sofar/A1.jpg",
+    imageCount: 16,
+    videoCount: 0,
+    pdfCount: 0,
+    imageMeta: {
+      "/images/Sofar/A1.jpg": { width: 1200, height: 1500, color: "#b8361a", placeholder: "data:image/webp;base64,UklGRn4AAABXRUJQVlA4IHIAAADwAwCdASoQABQAPxFysFAsJqSisAgBgCIJbACxG1yBoKcgN7qPs3vwAP4UEEpbwqswdcBnLYUuA1RIDFz5oqpa5hoYsoKppG359bjEab8UMWMfRueWa+7R7y+dCzT7jzKAhVeIFnYh1n4L/YDA08pFgAA=" },
+    },
+    hashes: {
+      "/images/Sofar/A1.jpg": "91d3f5c3",
+    },
+  },
+  {
+    id: "sunnymoon",
+    name: "Sunnymoon",
+    type: "Social Media + Branding",
+    thumbnail: "/images/Sunnymoon/Artboard 3.png",
+    imageCount: 36,
+    videoCount: 0,
+    pdfCount: 0,
+    imageMeta: {
+      "/images/Sunnymoon/Artboard 3.png": { width: 1920, height: 1080, color: "#f9ba65", placeholder: "data:image/webp;base64,UklGRkYAAABXRUJQVlA4IDoAAAAwAgCdASoQAAkABABoJbACdLoAAwnnnwqxAAD+3pDvT21dWkk9awmQv8bzfDfC7YebxYcBut8DUAAA" },
+    },
+    hashes: {
+      "/images/Sunnymoon/Artboard 3.png": "9d77b80a",
+    },
+  },
+  {
+    id: "cannelle",
+    name: "Cannelle",
+    type: "Others",
+    thumbnail: "/images/Cannelle/C3.jpg",
+    imageCount: 12,
+    videoCount: 0,
+    pdfCount: 0,
+    imageMeta: {
+      "/images/Cannelle/C3.jpg": { width: 1800, height: 1349, color: "#c92e4e", placeholder: "data:image/webp;base64,UklGRlAAAABXRUJQVlA4IEQAAADwAQCdASoQAAwABABoJbACdAD5gunIo5AAyjY7Vz6RYOiYp+cGI2/Tv1uYH4YMxE6Obh8ElD+G/urFPht4P626vAAAAA==" },
+    },
+    hashes: {
+      "/images/Cannelle/C3.jpg": "c7415b12",
+    },
+  },
+  {
+    id: "oppo",
+    name: "OPPO",
+    type: "Social Media + AI Reels",
+    thumbnail: "/images/OPPO/A1.png",
+    imageCount: 2,
+    videoCount: 0,
+    pdfCount: 0,
+    imageMeta: {
+      "/images/OPPO/A1.png": { width: 1080, height: 1350, color: "#ced5da", placeholder: "data:image/webp;base64,UklGRoAAAABXRUJQVlA4IHQAAABQBACdASoQABQAPxFwsFAsJiSisAgBgCIJbACdMoR3ACXB+X0h3aqiF+uAAP7L6IlZ0s08zbKS+QUuw+5uJsEvsPKc3w73DIO53PumMhqSJ4dDX21rtUSCInw6QjiKWPQJFxLVzDePy5CRjKkIbrTvxftAAA==" },
+    },
+    hashes: {
+      "/images/OPPO/A1.png": "a52a20d5",
+    },
+  },
+  {
+    id: "freshdays",
+    name: "Freshdays",
+    type: "Social Media + AI Reels",
+    thumbnail: "/images/Freshdays/A12.jpg",
+    imageCount: 12,
+    videoCount: 0,
+    pdfCount: 0,
+    imageMeta: {
+      "/images/Freshdays/A12.jpg": { width: 1600, height: 2000, color: "#d9a48c", placeholder: "data:image/webp;base64,UklGRogAAABXRUJQVlA4IHwAAABwBACdASoQABQAPxFysFAsJqSisAgBgCIJbACdMoR3ACxAQxF7Lf46RPf5AAD+tABN6KTpJg28g9u/E2NM/28JGolLWz3KuE1vpiTA9r2NYQVRy/LYy0wjuvc1tjRmE01MnGny7rTyYtMFZ2wL2TJ7jqdJN33O2BtUlTAA" },
+    },
+    hashes: {
+      "/images/Freshdays/A12.jpg": "ed4f8be8",
+    },
+  },
+  {
+    id: "popeyes",
+    name: "Popeyes",
+    type: "Social Media",
+    thumbnail: "/images/Popeyes/B2.jpg",
+    imageCount: 18,
+    videoCount: 0,
+    pdfCount: 0,
+    imageMeta: {
+      "/images/Popeyes/B2.jpg": { width: 1080, height: 1080, color: "#8f4427", placeholder: "data:image/webp;base64,UklGRoIAAABXRUJQVlA4IHYAAAAwAgCdASoQABAABABoJbACdAYvDgfZR3dLEAD+rQE3ucJKESJp+FqbXPawb70O2NN1A5u99VJicGiiu5GDvBkskWJi8cCZvgnp7Uc10T8Pxm061F4Sac5o//pOTIedJoRvo4hSVF2m7qQ4HwN1j5mzEHsxaEAA" },
+    },
+    hashes: {
+      "/images/Popeyes/B2.jpg": "40a08ad8",
+    },
+  },
+  {
+    id: "gipsy",
+    name: "Gipsy",
+    type: "Social Media + AI Reels",
+    thumbnail: "/images/Gipsy/B3.png",
+    imageCount: 9,
+    videoCount: 0,
+    pdfCount: 0,
+    imageMeta: {
+      "/images/Gipsy/B3.png": { width: 1080, height: 1350, color: "#de372a", placeholder: "data:image/webp;base64,UklGRnAAAABXRUJQVlA4IGQAAACwAwCdASoQABQAPxFysFAsJqSisAgBgCIJbAC7ABPGbjcfQlP6cABbg2rk5KXiw557U+zh1H4jf8SmQIMuBMejjd7UaM+nFHT0YvMcrxnPE7d84hZVdtfqdGcpiwnJ/+VEAAAA" },
+    },
+    hashes: {
+      "/images/Gipsy/B3.png": "d2ef1247",
+    },
+  },
+  {
+    id: "handy",
+    name: "Handy",
+    type: "Social Media + AI Reels",
+    thumbnail: "/images/Handy/A3.png",
+    imageCount: 6,
+    videoCount: 0,
+    pdfCount: 0,
+    imageMeta: {
+      "/images/Handy/A3.png": { width: 1080, height: 1350, color: "#233010", placeholder: "data:image/webp;base64,UklGRnwAAABXRUJQVlA4IHAAAACwAwCdASoQABQAPxFysFAsJqSisAgBgCIJbAC7LwABGjbVrAn3wAD+dt8YZxvApMyE1foxhpQ++2DDP4BLg1nVK0rq8Ee4z+DAAVhVOCbzldac7/vymGwh68oy8D2Ib9PyrtxVQgreNlgVt2U41oAA" },
+    },
+    hashes: {
+      "/images/Handy/A3.png": "b612013c",
+    },
+  },
+  {
+    id: "ash",
+    name: "ASH",
+    type: "Social Media",
+    thumbnail: "/images/ASH/ASH 4.jpg",
+    imageCount: 6,
+    videoCount: 0,
+    pdfCount: 0,
+    imageMeta: {
+      "/images/ASH/ASH 4.jpg": { width: 1080, height: 1350, color: "#404471", placeholder: "data:image/webp;base64,UklGRnoAAABXRUJQVlA4IG4AAADwAwCdASoQABQAPxFysFAsJqSisAgBgCIJagC7ACLvsJl8sL+oIbUAAP7oJ6nePGQRmdfGXklIqKjHiACxZo1J4b5KuN4sngW649PcNLjyGUiDE5Qq/VZUdxMCgr5cdAtXsUmWTVJgM0V94wDYAA==" },
+    },
+    hashes: {
+      "/images/ASH/ASH 4.jpg": "30a33791",
+    },
+  },
+  {
+    id: "la-roche",
+    name: "La Roche",
+    type: "Social Media",
+    thumbnail: "/images/La Roche/طعــــــمتها ما بتنتسى.jpg",
+    imageCount: 17,
+    videoCount: 0,
+    pdfCount: 0,
+    imageMeta: {
+      "/images/La Roche/طعــــــمتها ما بتنتسى.jpg": { width: 1080, height: 1350, color: "#efa4c0", placeholder: "data:image/webp;base64,UklGRoAAAABXRUJQVlA4IHQAAADwAwCdASoQABQAPxFysFAsJqSisAgBgCIJbACdAB5/vrXjsufb2kQAAP7IVcJMMnk/99N/EjEZiEAEG9k3dcJa5gBwTVpNpU+UdpyOLt5nqsYx1eNjCWvYzNKKeqQeeqv1+FEZXLvwDAiVy+rh/3aj04AAAA==" },
+    },
+    hashes: {
+      "/images/La Roche/طعــــــمتها ما بتنتسى.jpg": "98bc4716",
+    },
+  },
+  {
+    id: "aalaqaat",
+    name: "Aalaqaat",
+    type: "Social Media + Branding",
+    thumbnail: "/images/Aalaqaat/Artboard 5.png",
+    imageCount: 10,
+    videoCount: 0,
+    pdfCount: 0,
+    imageMeta: {
+      "/images/Aalaqaat/Artboard 5.png": { width: 1920, height: 1080, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRlYAAABXRUJQVlA4IEoAAAAQAgCdASoQAAkABABoJQBOhxAAJHIlNLHwAP7wprXS3Hcdlncb2zBDW3kyO+YvjhLcesXEGb6UiUKbXsCVb/l9rJ2Xxgz9cw8AAA==" },
+    },
+    hashes: {
+      "/images/Aalaqaat/Artboard 5.png": "7bb2eeb4",
+    },
+  },
+  {
+    id: "al-hawari",
+    name: "Al Hawari",
+    type: "Social Media + Branding",
+    thumbnail: "/images/Al Hawari/Artboard 40.jpg",
+    imageCount: 48,
+    videoCount: 0,
+    pdfCount: 0,
+    imageMeta: {
+      "/images/Al Hawari/Artboard 40.jpg": { width: 1920, height: 1080, color: "#c34b3d", placeholder: "data:image/webp;base64,UklGRlgAAABXRUJQVlA4IEwAAACwAQCdASoQAAkABABoJbACdACfs+kAAP0hdlpZ62LZJPxsmLtKs8xZXQ7F7p36SJLnFCupT9NOwqqRCRhFj9eM09RmcFJ2DglIAAAA" },
+    },
+    hashes: {
+      "/images/Al Hawari/Artboard 40.jpg": "b8f64f74",
+    },
+  },
+  {
+    id: "aveeno",
+    name: "Aveeno",
+    type: "Social Media",
+    thumbnail: "/images/Aveeno/Aveeno-1-Row-Grid_01.jpg",
+    imageCount: 3,
+    videoCount: 0,
+    pdfCount: 0,
+    imageMeta: {
+      "/images/Aveeno/Aveeno-1-Row-Grid_01.jpg": { width: 1080, height: 1350, color: "#f8f2e6", placeholder: "data:image/webp;base64,UklGRn4AAABXRUJQVlA4IHIAAADwAwCdASoQABQAPxFysFAsJqSisAgBgCIJYgC06CHKUIbm7GOyhIrgAP7qcKfQs/3sLVWZW7DVWkQDYghmWoM6BAJ53ptFukHQ2KnnpFSXQjcOVB+qwzB52MRNdDz9Y/nxnCeU4dClN3IRm5jfIp3R4AA=" },
+    },
+    hashes: {
+      "/images/Aveeno/Aveeno-1-Row-Grid_01.jpg": "741ee84e",
+    },
+  },
+  {
+    id: "cwf",
+    name: "CwF",
+    type: "Social Media + Branding",
+    thumbnail: "/images/CwF/3.png",
+    imageCount: 28,
+    videoCount: 1,
+    pdfCount: 0,
+    video: "/images/CwF/R1.mp4",
+    imageMeta: {
+      "/images/CwF/3.png": { width: 1080, height: 1350, color: "#c0490c", placeholder: "data:image/webp;base64,UklGRoYAAABXRUJQVlA4IHoAAABwBACdASoQABQAPxFysFAsJqSisAgBgCIJbACdMoRwN6AARZbiI+IAiK4OAAD9GypFCJ0ylVkWB4/JByb5MveiIE/vKSHKhVqPToIcAq3yAFvTZWz/1KSlYWSDzLQjl954efQMxWT3Ko8UBsIyCvQSVZETG0k/TguAAA==" },
+    },
+    hashes: {
+      "/images/CwF/3.png": "4cc0a379",
+      "/images/CwF/R1.mp4": "97359e8a",
+    },
+  },
+  {
+    id: "dermacare",
+    name: "DermaCare",
+    type: "Social Media",
+    thumbnail: "/images/DermaCare/DermaCare_02.jpg",
+    imageCount: 3,
+    videoCount: 0,
+    pdfCount: 0,
+    imageMeta: {
+      "/images/DermaCare/DermaCare_02.jpg": { width: 1080, height: 1350, color: "#5caaae", placeholder: "data:image/webp;base64,UklGRo4AAABXRUJQVlA4IIIAAAAwBACdASoQABQAPxFwsFAsJiSisAgBgCIJbACdMoR3ABo5qVuMeL4Kd4AA9wQc5mn2sZ5MEUOffhWnMjDqZsT5ttsK6XDSpiBZ2GMjc96jmf/ifW8EwLPiQzEx7yamKE1gyfdi5QM9dzEeeWjO0L8a0WR/dlX27BlgxKB+2Mg24AAA" },
+    },
+    hashes: {
+      "/images/DermaCare/DermaCare_02.jpg": "363380c2",
+    },
+  },
+  {
+    id: "dga",
+    name: "DGA",
+    type: "Others",
+    thumbnail: "/images/DGA/Artboard 2.png",
+    imageCount: 37,
+    videoCount: 0,
+    pdfCount: 0,
+    imageMeta: {
+      "/images/DGA/Artboard 2.png": { width: 596, height: 843, color: "#2a2a68", placeholder: "data:image/webp;base64,UklGRnYAAABXRUJQVlA4WAoAAAAQAAAADwAAFgAAQUxQSBMAAAABD3D//4iIIBZM8pfeH0FE/7MVAFZQOCA8AAAA0AIAnQEqEAAXAD8RcrBQLCakorAIAYAiCUAX5wWkgAD+66rUCZH4cFzenJ4KkGW51VTvnsFVWd4QAAAA" },
+    },
+    hashes: {
+      "/images/DGA/Artboard 2.png": "567cc485",
+    },
+  },
+  {
+    id: "ethos",
+    name: "Ethos",
+    type: "Social Media",
+    thumbnail: "/images/Ethos/عيد أضحى مبارك.jpg",
+    imageCount: 4,
+    videoCount: 0,
+    pdfCount: 0,
+    imageMeta: {
+      "/images/Ethos/عيد أضحى مبارك.jpg": { width: 1080, height: 1080, color: "#98b9cf", placeholder: "data:image/webp;base64,UklGRmQAAABXRUJQVlA4IFgAAAAwAgCdASoQABAABABoJbACdH8AF7cbRXfq8AD+9NvJI0TQKJjrMFMpYo0tbxbbiNg/FLEeSwU/S87IioternFxxziYGWG1r4v7A6wFDeM+szwUAMPfGPAA" },
+    },
+    hashes: {
+      "/images/Ethos/عيد أضحى مبارك.jpg": "759c70f9",
+    },
+  },
+  {
+    id: "ferra-rawan",
+    name: "Ferra Rawan",
+    type: "Social Media + Branding",
+    thumbnail: "/images/Ferra Rawan/Artboard 2.png",
+    imageCount: 4,
+    videoCount: 0,
+    pdfCount: 0,
+    imageMeta: {
+      "/images/Ferra Rawan/Artboard 2.png": { width: 1080, height: 1080, color: "#000000", placeholder: "data:image/webp;base64,UklGRugAAABXRUJQVlA4WAoAAAAQAAAADwAADwAAQUxQSFQAAAABcB3bttJs3B367w3inot/xT0FRMQE8H/drHCx8szAKHIdNiIly6aZMxNZwng67WhOJ0FOp+4dh7adsmyaOcu23YIdpxZmlmvgBQBpDIQRkBU3vw5WUDggbgAAALACAJ0BKhAAEAAEAGglmAJ0fwXH+MAA4BkMUNjWAAD+y1js8VVgrVQ21tXllN3EnpLBv/5sgnShjGyFo8fs62PyLiToyunLxQkR3qQ0d3Ft/Rr2T0xxcGmp4EtMytqnZStzr9N8ejMsQUrwCAAA" },
+    },
+    hashes: {
+      "/images/Ferra Rawan/Artboard 2.png": "8bcb1249",
+    },
+  },
+  {
+    id: "fff",
+    name: "FFF",
+    type: "Social Media",
+    thumbnail: "/images/FFF/2.png",
+    imageCount: 6,
+    videoCount: 0,
+    pdfCount: 0,
+    imageMeta: {
+      "/images/FFF/2.png": { width: 400, height: 500, color: "#d6e5f1", placeholder: "data:image/webp;base64,UklGRlgAAABXRUJQVlA4IEwAAADQAwCdASoQABQAPxFysFAsJqSisAgBgCIJYwCdACHfLzay6jUfeAAA/t6TKGVDT/UtcTaozL9js1lM0vjg2w0U0z+6GyYqS6IxzgAA" },
+    },
+    hashes: {
+      "/images/FFF/2.png": "5102dcf1",
+    },
+  },
+  {
+    id: "happies",
+    name: "Happies",
+    type: "Social Media + AI Reels",
+    thumbnail: "/images/Happies/R1.mp4",
+    imageCount: 0,
+    videoCount: 3,
+    pdfCount: 0,
+    video: "/images/Happies/R1.mp4",
+  },
+  {
+    id: "mac",
+    name: "MAC",
+    type: "Social Media",
+    thumbnail: "/images/MAC/Highlights/4.png",
+    imageCount: 15,
+    videoCount: 0,
+    pdfCount: 0,
+    imageMeta: {
+      "/images/MAC/Highlights/4.png": { width: 1080, height: 1080, color: "#006a92", placeholder: "data:image/webp;base64,UklGRmgAAABXRUJQVlA4IFwAAABQAgCdASoQABAABABoJbACdDiAAUpA+pOx3gAA/srv/KY/W5FNuR3TyS/aglArEt03A++3b9ZR+1+qS9EqX89CP/B8x6Msn8zt71EU7vYVyPt5EKLrX5eIrAAAAA==" },
+    },
+    hashes: {
+      "/images/MAC/Highlights/4.png": "1e7aa087",
+    },
+  },
+  {
+    id: "neostrata",
+    name: "NeoStrata",
+    type: "Social Media",
+    thumbnail: "/images/NeoStrata/NeoStrata_03.jpg",
+    imageCount: 3,
+    videoCount: 0,
+    pdfCount: 0,
+    imageMeta: {
+      "/images/NeoStrata/NeoStrata_03.jpg": { width: 1080, height: 1350, color: "#ebb73a", placeholder: "data:image/webp;base64,UklGRpoAAABXRUJQVlA4II4AAABwBACdASoQABQAPxFysFAsJqSisAgBgCIJbACdOUCEAAM2VIWiBNnQcqToAAD+4ZJcn1dGdpAA/I8M7LI87PiF3dRhDNNjMqZG4k2gb6wpzhzvMT4Jk8/rAmZ3dQM5WzzHnGE4vW3puql3agv8CILC+y27oAu9tOTQ4+4t+bzcu3KTXqr7XMHlK+DIEoAA" },
+    },
+    hashes: {
+      "/images/NeoStrata/NeoStrata_03.jpg": "64846177",
+    },
+  },
+  {
+    id: "private",
+    name: "Private",
+    type: "Others",
+    thumbnail: "/images/Private/A3.jpg",
+    imageCount: 3,
+    videoCount: 0,
+    pdfCount: 0,
+    imageMeta: {
+      "/images/Private/A3.jpg": { width: 1800, height: 2250, color: "#2b2326", placeholder: "data:image/webp;base64,UklGRpQAAABXRUJQVlA4IIgAAAAQBACdASoQABQAPxFysFAsJqSisAgBgCIJZgCdACPMGWG3rL5dSToRwADzqklKNcIEvoN0qJROH5jze/LtXkX2ouVkiFrypdGP8UdEIRDgdu/alwZ9hAG3CosAvVMCgpWSnBEbAfar0f1WBZ+3u/MJGohxOP/vAAENgzBqYJkPdFoWZdj+AAAA" },
+    },
+    hashes: {
+      "/images/Private/A3.jpg": "c209ba14",
+    },
+  },
+  {
+    id: "rami-baddour",
+    name: "Rami Baddour",
+    type: "Social Media + Branding",
+    thumbnail: "/images/Rami Baddour/3.png",
+    imageCount: 29,
+    videoCount: 0,
+    pdfCount: 0,
+    imageMeta: {
+      "/images/Rami Baddour/3.png": { width: 1920, height: 1080, color: "#768292", placeholder: "data:image/webp;base64,UklGRlAAAABXRUJQVlA4IEQAAADwAQCdASoQAAkABABoJZgCdGuAArdSqDAA/ni77ohs6WnSoNkoY+tpfe7KcMvzYdBSWBOxRqHm7ycQkP+5XKiSLigAAA==" },
+    },
+    hashes: {
+      "/images/Rami Baddour/3.png": "f6fa67aa",
+    },
+  },
+  {
+    id: "sifr",
+    name: "Sifr",
+    type: "Social Media + Branding",
+    thumbnail: "/images/Sifr/A2.jpeg",
+    imageCount: 8,
+    videoCount: 0,
+    pdfCount: 0,
+    imageMeta: {
+      "/images/Sifr/A2.jpeg": { width: 1080, height: 1080, color: "#49460c", placeholder: "data:image/webp;base64,UklGRlgAAABXRUJQVlA4IEwAAADwAQCdASoQABAABABoJbACdAEUlo41dEAA/tqfKbaL6e34OtS49nB538Lwvja226UO/Uxa3xlhHmSLMH4R+vi2fV+1x3ZzcPKjQAAA" },
+    },
+    hashes: {
+      "/images/Sifr/A2.jpeg": "e20de32e",
+    },
+  },
+]
+
+const loaders = {
+  "avene": () => import("./chunks/avene.js"),
+  "mccafe": () => import("./chunks/mccafe.js"),
+  "sofar": () => import("./chunks/sofar.js"),
+  "sunnymoon": () => import("./chunks/sunnymoon.js"),
+  "cannelle": () => import("./chunks/cannelle.js"),
+  "oppo": () => import("./chunks/oppo.js"),
+  "freshdays": () => import("./chunks/freshdays.js"),
+  "popeyes": () => import("./chunks/popeyes.js"),
+  "gipsy": () => import("./chunks/gipsy.js"),
+  "handy": () => import("./chunks/handy.js"),
+  "ash": () => import("./chunks/ash.js"),
+  "la-roche": () => import("./chunks/la-roche.js"),
+  "aalaqaat": () => import("./chunks/aalaqaat.js"),
+  "al-hawari": () => import("./chunks/al-hawari.js"),
+  "aveeno": () => import("./chunks/aveeno.js"),
+  "cwf": () => import("./chunks/cwf.js"),
+  "dermacare": () => import("./chunks/dermacare.js"),
+  "dga": () => import("./chunks/dga.js"),
+  "ethos": () => import("./chunks/ethos.js"),
+  "ferra-rawan": () => import("./chunks/ferra-rawan.js"),
+  "fff": () => import("./chunks/fff.js"),
+  "happies": () => import("./chunks/happies.js"),
+  "mac": () => import("./chunks/mac.js"),
+  "neostrata": () => import("./chunks/neostrata.js"),
+  "private": () => import("./chunks/private.js"),
+  "rami-baddour": () => import("./chunks/rami-baddour.js"),
+  "sifr": () => import("./chunks/sifr.js"),
+}
+
+export const loadProject = (id) => loaders[id]().then(module => module.default)
@@ -1,54 +1,71 @@
-// Portfolio Data - All projects with their images (Auto-generated)
+// Portfolio Data - All projects with their images (Alphabetically sorted)
 export const projects = [
   {
     id: "avene",
     name: "Avene",
     type: "Art Direction",
     description: `Directed the visual art direction for Avene's digital presence, focusing on clean, dermatological aesthetics that highlight product purity and efficacy.`,
-    thumbnail: "/images/Avene/A1.jpg",
+    thumbnail: "/images/Avene/C2.jpg",
     images: [
       "/images/Avene/A1.jpg",
-      "/images/Avene/B1.jpg",
-      "/images/Avene/C1.jpg",
       "/images/Avene/A2.jpg",
-      "/images/Avene/B2.jpg",
-      "/images/Avene/C2.jpg",
       "/images/Avene/A3.jpg",
-      "/images/Avene/B3.jpg",
-      "/images/Avene/C3.jpg",
       "/images/Avene/A4.jpg",
-      "/images/Avene/B4.jpg",
       "/images/Avene/A5.jpg",
-      "/images/Avene/B5.jpg",
       "/images/Avene/A6.jpg",
+      "/images/Avene/B1.jpg",
+      "/images/Avene/B2.jpg",
+      "/images/Avene/B3.jpg",
+      "/images/Avene/B4.jpg",
+      "/images/Avene/B5.jpg",
       "/images/Avene/B6.jpg",
+      "/images/Avene/C1.jpg",
+      "/images/Avene/C2.jpg",
+      "/images/Avene/C3.jpg",
     ],
+    hashes: {
+      "/images/Avene/A1.jpg": "37adf3be",
+      "/images/Avene/A2.jpg": "8f643f86",
+      "/images/Avene/A3.jpg": "ebc35240",
+      "/images/Avene/A4.jpg": "489389c6",
+      "/images/Avene/A5.jpg": "b36f2d19",
+      "/images/Avene/A6.jpg": "39353174",
+      "/images/Avene/B1.jpg": "69b6ab38",
+      "/images/Avene/B2.jpg": "ae41c1aa",
+      "/images/Avene/B3.jpg": "ce3318d6",
+      "/images/Avene/B4.jpg": "7b7e3b8f",
+      "/images/Avene/B5.jpg": "cb0479c3",
+      "/images/Avene/B6.jpg": "904140d1",
+      "/images/Avene/C1.jpg": "1f98f438",
+      "/images/Avene/C2.jpg": "b4fc95b8",
+      "/images/Avene/C3.jpg": "20483c4a",
+    },
+    imageMeta: {
+      "/images/Avene/A1.jpg": { width: 1800, height: 2250, color: "#2fc9e6", placeholder: "data:image/webp;base64,UklGRn4AAABXRUJQVlA4IHIAAAAQBACdASoQABQAPxFysFCsJqSisAgBgCIJbACdMoRwACnEcjytojpXUAD9zp15/I9SG2IeAthMKfkXexW2u78bTzlOh6oGY6zFLfwG2YGvN700pKI62T6rKT+EOOSQRT05n0tffCRCOPvyIFPigFsfAAA=" },
+      "/images/Avene/A2.jpg": { width: 1800, height: 2250, color: "#acddf9", placeholder: "data:image/webp;base64,UklGRmIAAABXRUJQVlA4IFYAAADQAwCdASoQABQAPxFysFCsJqSisAgBgCIJagCdMoADTr4xhph0VQAA/t7C1UvXk7MMvmC7ZLzrqN2LaQtC6RjiLfQZHctkprtD/GgMAJGZRa7LJuMgAA==" },
+      "/images/Avene/A3.jpg": { width: 1800, height: 2250, color: "#d1b9a3", placeholder: "data:image/webp;base64,UklGRnAAAABXRUJQVlA4IGQAAACwAwCdASoQABQAPxFysVCsJqSisAgBgCIJbACdMoMYAGHYsA3yAAD+5qoIttPal4+vdzfGFn+oYQIk6q6ovxZYTBOmzDv61dGs7iBJBGJwp7FY6U2pJ8tk2t3sa351NSC2gAAA" },
+      "/images/Avene/A4.jpg": { width: 1800, height: 2250, color: "#2682d4", placeholder: "data:image/webp;base64,UklGRmIAAABXRUJQVlA4IFYAAACwAwCdASoQABQAPxFysFAsJqSisAgBgCIJbACdH8ABHvw1ipOUAAD9Ea0rgRmshUtarbenMft5zZdEV2+IvKrg3OKeiVb5d3rxJjsV0kjRxxik6xtIAA==" },
+      "/images/Avene/A5.jpg": { width: 1800, height: 2250, color: "#afdeff", placeholder: "data:image/webp;base64,UklGRkoAAABXRUJQVlA4ID4AAABwAwCdASoQABQAPxFwsFAsJiSisAgBgCIJYgCdMoAEZgC3XgAA/uxOOcEyaMhNNxhBpwUnisPrnY5dV6wAAA==" },
+      "/images/Avene/A6.jpg": { width: 1800, height: 2250, color: "#a2d5ee", placeholder: "data:image/webp;base64,UklGRnIAAABXRUJQVlA4IGYAAAAQBACdASoQABQAPxFyslCsJqSisAgBgCIJaACdL1AB0cMiDnxHCamyAAD+3qyZf7fmav/K8wW+iKIhxS2ls6fQp8InHG66NcQuaDedZCYyttvrT7vmmFGgOn98FZTCbEJ11gM4AAA=" },
+      "/images/Avene/B1.jpg": { width: 1800, height: 2249, color: "#c0947c", placeholder: "data:image/webp;base64,UklGRnIAAABXRUJQVlA4IGYAAACQAwCdASoQABQAPxFysFAsJqSisAgBgCIJQBOmUAAqmhImG2lwAP5T2Gk21oZ7YRlm95fPOrsoVrH+p1ggFXuQPTem/x0qQfUl9bITo45TcoF7a7Q5XRK84t+k9zxOo0Kx708AAAA=" },
+      "/images/Avene/B2.jpg": { width: 1800, height: 2249, color: "#af7963", placeholder: "data:image/webp;base64,UklGRngAAABXRUJQVlA4IGwAAABwBACdASoQABQAPxFysFAsJqSisAgBgCIJYgCdMoADaYsOHknFAA4CgrLfQAD+jOeyDqQLNt/BMX9EpsUOT1CDgwsFPzv3KYtZ69liKMpSVQmmF/nfmfChPf7ekSN/YwS2edR7nKatKWqo+AA=" },
+      "/images/Avene/B3.jpg": { width: 1800, height: 2250, color: "#bd9275", placeholder: "data:image/webp;base64,UklGRoAAAABXRUJQVlA4IHQAAAAwBACdASoQABQAPxFwsFAsJiSisAgBgCIJYgCdMoADJ5ZuE14kTnwFoUAA/o0r8bkkpgAnga18kvIdRQDIiq1vyXDBUYSoIBfARXoOCkSe2uqdwGONLdXfZ9SX1sHqbz8eYLHClKKTM/3IRb+jDGe3iQAAAA==" },
+      "/images/Avene/B4.jpg": { width: 1800, height: 2250, color: "#cfbfaa", placeholder: "data:image/webp;base64,UklGRnoAAABXRUJQVlA4IG4AAACwAwCdASoQABQAPxFysFAsJqSisAgBgCIJQBYdgyVBZMw7xO2UQAD+YAoSYl6WbJDfM4WGb5Ea8PtDhAvC7JbMHz5VEJgtvZJrn6gQDzUkrHsQZTKbcrq23hSDqznyHxTzT58TEjDzOV6hjiAAAA==" },
+      "/images/Avene/B5.jpg": { width: 1600, height: 2000, color: "#d3997f", placeholder: "data:image/webp;base64,UklGRn4AAABXRUJQVlA4IHIAAADwAwCdASoQABQAPxFysFAsJqSisAgBgCIJZgCdL1yBu/zEv32C7yIAAOICfpPBwhuY+5rIz6rElF8y2OE0YXItfl9el8GPJS+urLSwFBgIC90DLVyvsSajkKxVTcWE48GnT3Ve1M0HYRnvFDPuXC4YQAA=" },
+      "/images/Avene/B6.jpg": { width: 1800, height: 2249, color: "#c9a183", placeholder: "data:image/webp;base64,UklGRnwAAABXRUJQVlA4IHAAAAAQBACdASoQABQAPxFysFAsJqSisAgBgCIJQBOmUBcAAbbVbo3lR6V0XAD+AHmyT0+BIjEW8BHBaMtm3RuPu1JOYaks+IZt43S6DSmk/0WCo0YZZ/NbC6gcSt1GT13GTIbUG8FkGuNvVZEetm2NP8AA" },
+      "/images/Avene/C1.jpg": { width: 1800, height: 2250, color: "#a5c9dc", placeholder: "data:image/webp;base64,UklGRmgAAABXRUJQVlA4IFwAAAAQBACdASoQABQAPxFwsFAsJiSisAgBgCIJbACdACFKy6MaItd8pNw2AAD+w7fdpz7k4Bxdw8Jn9MRKYVD8uMTpqvUs8AD1XPW30sKitwE4s2AhR+WG9WG7TkwAAA==" },
+      "/images/Avene/C2.jpg": { width: 1800, height: 2250, color: "#86c7f7", placeholder: "data:image/webp;base64,UklGRpQAAABXRUJQVlA4IIgAAAAQBACdASoQABQAPxFysFAsJqSisAgBgCIJbACdMoACiH7YdICJ7swEAADOF8bKJMMNg1Y0PRf/TzbTe3oHKPjZWDDUm6vYIaV4m/SVj+bC+wihCE2r/Rn9b42XqDP1wuWmsvwMJ7SI4HVT7UDq1mR+sNyrqZGIgr3griCbSFjkDRhg6gP3AAAA" },
+      "/images/Avene/C3.jpg": { width: 1600, height: 2000, color: "#2a546d", placeholder: "data:image/webp;base64,UklGRlwAAABXRUJQVlA4IFAAAABwAwCdASoQABQAPxFysFAsJqSisAgBgCIJQBYdgdJUyUEVG4AAycb0siF+rnXn0hOD/73b1B8l8rwRcn6ctw3gm6uSGOf6B+AwDjMBiUcAAA==" },
+    },
   },
   {
     id: "mccafe",
     name: "McCafe",
     type: "Social Media",
     description: `I handled the account of McCafe - KSA for well over a year, building a consistent yet creative social media image for the brand. Here is a sample of my work for McCafe, many of which I myself come with everything in it from the concept, the copy, and the design.`,
-    thumbnail: "/images/McCafe/A1.jpg",
+    thumbnail: "/images/McCafe/A28.jpg",
     images: [
       "/images/McCafe/A1.jpg",
-      "/images/McCafe/M1.jpg",
-      "/images/McCafe/S1.jpg",
-      "/images/McCafe/A2.jpg",
-      "/images/McCafe/M2.jpg",
-      "/images/McCafe/S2.jpg",
-      "/images/McCafe/A3.jpg",
-      "/images/McCafe/S3.jpg",
-      "/images/McCafe/A4.jpg",
-      "/images/McCafe/S4.jpg",
-      "/images/McCafe/A5.jpg",
-      "/images/McCafe/S5.jpg",
-      "/images/McCafe/A6.jpg",
-      "/images/McCafe/S6.jpg",
-      "/images/McCafe/A7.jpg",
-      "/images/McCafe/S7.jpg",
-      "/images/McCafe/A8.jpg",
-      "/images/McCafe/A9.jpg",
       "/images/McCafe/A10.jpg",
       "/images/McCafe/A11.jpg",
       "/images/McCafe/A12.jpg",
@@ -59,6 +76,7 @@ export const projects = [
       "/images/McCafe/A17.jpg",
       "/images/McCafe/A18.jpg",
       "/images/McCafe/A19.jpg",
+      "/images/McCafe/A2.jpg",
       "/images/McCafe/A20.jpg",
       "/images/McCafe/A21.jpg",
       "/images/McCafe/A22.jpg",
@@ -69,6 +87,7 @@ export const projects = [
       "/images/McCafe/A27.jpg",
       "/images/McCafe/A28.jpg",
       "/images/McCafe/A29.jpg",
+      "/images/McCafe/A3.jpg",
       "/images/McCafe/A30.jpg",
       "/images/McCafe/A31.jpg",
       "/images/McCafe/A32.jpg",
@@ -76,7 +95,116 @@ export const projects = [
       "/images/McCafe/A34.jpg",
       "/images/McCafe/A35.jpg",
       "/images/McCafe/A36.jpg",
+      "/images/McCafe/A4.jpg",
+      "/images/McCafe/A5.jpg",
+      "/images/McCafe/A6.jpg",
+      "/images/McCafe/A7.jpg",
+      "/images/McCafe/A8.jpg",
+      "/images/McCafe/A9.jpg",
+      "/images/McCafe/M1.jpg",
+      "/images/McCafe/M2.jpg",
+      "/images/McCafe/S1.jpg",
+      "/images/McCafe/S2.jpg",
+      "/images/McCafe/S3.jpg",
+      "/images/McCafe/S4.jpg",
+      "/images/McCafe/S5.jpg",
+      "/images/McCafe/S6.jpg",
+      "/images/McCafe/S7.jpg",
     ],
+    hashes: {
+      "/images/McCafe/A1.jpg": "7e50d9bc",
+      "/images/McCafe/A10.jpg": "4ae03a48",
+      "/images/McCafe/A11.jpg": "7483ccad",
+      "/images/McCafe/A12.jpg": "fb8f81b3",
+      "/images/McCafe/A13.jpg": "44cfef82",
+      "/images/McCafe/A14.jpg": "bcf33d19",
+      "/images/McCafe/A15.jpg": "b06d2908",
+      "/images/McCafe/A16.jpg": "1da26f9d",
+      "/images/McCafe/A17.jpg": "3ce1df21",
+      "/images/McCafe/A18.jpg": "6573eb6f",
+      "/images/McCafe/A19.jpg": "1a735cb3",
+      "/images/McCafe/A2.jpg": "1cc429f6",
+      "/images/McCafe/A20.jpg": "0d5f0f6a",
+      "/images/McCafe/A21.jpg": "94beebff",
+      "/images/McCafe/A22.jpg": "46e1a7ae",
+      "/images/McCafe/A23.jpg": "6a13a242",
+      "/images/McCafe/A24.jpg": "f69c873f",
+      "/images/McCafe/A25.jpg": "055f80e5",
+      "/images/McCafe/A26.jpg": "9b836ba4",
+      "/images/McCafe/A27.jpg": "78bf45cf",
+      "/images/McCafe/A28.jpg": "4f6e397a",
+      "/images/McCafe/A29.jpg": "fbe5c608",
+      "/images/McCafe/A3.jpg": "5b72ed9e",
+      "/images/McCafe/A30.jpg": "436eefbe",
+      "/images/McCafe/A31.jpg": "3779e9f8",
+      "/images/McCafe/A32.jpg": "98143ec0",
+      "/images/McCafe/A33.jpg": "2859e1d9",
+      "/images/McCafe/A34.jpg": "e2ba2d86",
+      "/images/McCafe/A35.jpg": "0fa2664a",
+      "/images/McCafe/A36.jpg": "79ef66c6",
+      "/images/McCafe/A4.jpg": "1ed19711",
+      "/images/McCafe/A5.jpg": "947a6ebf",
+      "/images/McCafe/A6.jpg": "8c22ee60",
+      "/images/McCafe/A7.jpg": "a9440fb9",
+      "/images/McCafe/A8.jpg": "993f9a6d",
+      "/images/McCafe/A9.jpg": "88c99f91",
+      "/images/McCafe/M1.jpg": "49e3d76d",
+      "/images/McCafe/M2.jpg": "2920e419",
+      "/images/McCafe/S1.jpg": "acd14863",
+      "/images/McCafe/S2.jpg": "da320c7d",
+      "/images/McCafe/S3.jpg": "0d324121",
+      "/images/McCafe/S4.jpg": "7424ca72",
+      "/images/McCafe/S5.jpg": "b7d8fe2d",
+      "/images/McCafe/S6.jpg": "00a96e14",
+      "/images/McCafe/S7.jpg": "0bc7a73a",
+    },
+    imageMeta: {
+      "/images/McCafe/A1.jpg": { width: 1080, height: 1080, color: "#fdb40a", placeholder: "data:image/webp;base64,UklGRnoAAABXRUJQVlA4IG4AAAAwAgCdASoQABAABABoJbACdLoAAs8UMY3wAADb/mjNMXWfyQh0xaYXG5ezoUyl+kJJKufauhyrKlLpbTg3xaSPDJXFn+xYpGD6AbvfRIC21h1wnDXe//+Q7AM76T1QYtD4jURoeJX4njBrH4AAAA==" },
+      "/images/McCafe/A10.jpg": { width: 1080, height: 1080, color: "#ffe5b4", placeholder: "data:image/webp;base64,UklGRmIAAABXRUJQVlA4IFYAAADwAQCdASoQABAABABoJbACdAELXw0pywAA/vBA2X1+E02DwSPApNPS5ZEkQZ7OXejlaUewQIlMI3UDmytpX2CGh2XH/aUw+H7NYo6nr8bldRXYGAAAAA==" },
+      "/images/McCafe/A11.jpg": { width: 1080, height: 1080, color: "#ffb401", placeholder: "data:image/webp;base64,UklGRmgAAABXRUJQVlA4IFwAAABQAgCdASoQABAABABoJbACdLoAAx9lzQPPQ8AA/q+YOe0BM6Bn9QGPh6ihJHOKgqstv/3e5hwxNnugPl0VP/5VbhVgd3vNyno8DpIGyVyRLq/WtJvigt9+L4l8AA==" },
+      "/images/McCafe/A12.jpg": { width: 1080, height: 1080, color: "#e3a009", placeholder: "data:image/webp;base64,UklGRnAAAABXRUJQVlA4IGQAAABwAgCdASoQABAABABoJbACdLoAEJUVMTpIiGQAAP5TDLwj1/FtmpJ7fpHCIyLcPEJ4PWGDw+0YPlYcNpLxZEkp6h0NvRvllXn7PH/hoREOlrxXmp3NUcWUce8WyPGQ+4+oAAAA" },
+      "/images/McCafe/A13.jpg": { width: 1080, height: 1080, color: "#ffbc0d", placeholder: "data:image/webp;base64,UklGRlwAAABXRUJQVlA4IFAAAABQAgCdASoQABAABABoJbACdLoAAwmwUYnnlgAA/sbsoMeVfYhNGA7crcZNDSudYFMgyQKTRk3f/KrasHK3zc+nmNNe7LYdPtrlVLG5++YAAA==" },
+      "/images/McCafe/A14.jpg": { width: 1080, height: 1080, color: "#ffbc0d", placeholder: "data:image/webp;base64,UklGRmYAAABXRUJQVlA4IFoAAACQAgCdASoQABAABABoJbACdLoAEJAYBuCf+q9cAAD+w14FWzou9KKo/h+LDwH7zTFlhzQMsi3ANN9VOG1ecThvKQP/8iZ+bWndJ4On37yhPJdfJfiCiAAAAAA=" },
+      "/images/McCafe/A15.jpg": { width: 1080, height: 1080, color: "#ffbc0d", placeholder: "data:image/webp;base64,UklGRnYAAABXRUJQVlA4IGoAAABwAgCdASoQABAABABoJbACdAED/QUbK7EsihoAAP7D8jdGSx9TeUUpxqN6GR0TalicuI75Wm0JqncV3278R26k69of8DGxqjEzHeR12mqwc/Mv/lVJC/43RDTbdz0U5/c/gB5jyAbzo7AA" },
+      "/images/McCafe/A16.jpg": { width: 1080, height: 1080, color: "#e9a007", placeholder: "data:image/webp;base64,UklGRnIAAABXRUJQVlA4IGYAAAAwAgCdASoQABAABABoJbACdLoAAwVtFXvEgAD8Zf4Ks7IBlP2REp7nQJYAajYfnCNDME6D8FKOITOKey+qQ5Ja0Qqb7Ak0Tbf/4kYsZL7R8w3eL30zrekVsLQuP71Wp5eD+DEAAAA=" },
+      "/images/McCafe/A17.jpg": { width: 1080, height: 1080, color: "#faab08", placeholder: "data:image/webp;base64,UklGRl4AAABXRUJQVlA4IFIAAABQAgCdASoQABAABABoJbACdLoAAq/Sio0FlMgA/oxlxALeh5UNh5k5ctDZCqKLbh9mAOHrilJLxGRrzpHZ/+RJ4afw4wx9q21ob6wbAyXITQAA" },
+      "/images/McCafe/A18.jpg": { width: 1080, height: 1080, color: "#ffbc0d", placeholder: "data:image/webp;base64,UklGRnIAAABXRUJQVlA4IGYAAADQAQCdASoQABAABABoJbACdADDqJeIAAD+w9yyRfUmGaIvK26FNi+23pW3yNxw7itAGyvcuubb9cXRaPHGv9KSIqfYH/4auQjv7PNhr4PkyueosZPXf/XbzBMz6WFVSs6syM4AAAA=" },
+      "/images/McCafe/A19.jpg": { width: 1080, height: 1080, color: "#fbb50f", placeholder: "data:image/webp;base64,UklGRlwAAABXRUJQVlA4IFAAAAAwAgCdASoQABAABABoJbACdLoAAjvrxmIVgAD+w96iOi5qg5NFzuu6LTH7PUTDmbjEqZp/XCLk/+UsBlPDjLEzSzsmO2dJzVfrfigFBz4AAA==" },
+      "/images/McCafe/A2.jpg": { width: 1080, height: 1080, color: "#94cbeb", placeholder: "data:image/webp;base64,UklGRmAAAABXRUJQVlA4IFQAAABQAgCdASoQABAABABoJbACdGaAAzLkqcDkKiAA/d4TrwBOIL8QGWaZFs5b3SGRC9ywj22N+9oTm6BTbTmVpP5pTA/LqWhCvHvQRVX+yYFzCtYAAAA=" },
+      "/images/McCafe/A20.jpg": { width: 1080, height: 1080, color: "#c3875a", placeholder: "data:image/webp;base64,UklGRngAAABXRUJQVlA4IGwAAABQAgCdASoQABAABABoJbACdAYvDt9Hv6tgrgAA/q8DnUq9aZCFx4bU2IsNOCZ67JKFEdkbq/djX2zmU9d+btPVWwlEioGrSdtqyibO0o6FYnmHvrJANKIIIwuP7J0FTM2xgDz90uXUiHoAAAA=" },
+      "/images/McCafe/A21.jpg": { width: 1080, height: 1080, color: "#328599", placeholder: "data:image/webp;base64,UklGRmQAAABXRUJQVlA4IFgAAADQAQCdASoQABAABABoJbACdACZwy/+QADb3Z6zQV+bna5UmQcoVFMaZrfHR8ZLThUDFV+nx8uz7yRsWAbmxXKIbZYgUNqcBGAU3feBSLvFQoVLbe8xUAAA" },
+      "/images/McCafe/A22.jpg": { width: 1080, height: 1080, color: "#6f4e49", placeholder: "data:image/webp;base64,UklGRmQAAABXRUJQVlA4IFgAAADQAQCdASoQABAABABoJYgCdAEN3n9AAAD+6nmpnkKfQO2hS7ofpcay7A0mpiytvysZeXWTwy6OYjqHUAljE1NsiBVfjM7D+rvWeCxjATa+h5TQcP29AAAA" },
+      "/images/McCafe/A23.jpg": { width: 1080, height: 1080, color: "#c9424c", placeholder: "data:image/webp;base64,UklGRlQAAABXRUJQVlA4IEgAAADwAQCdASoQABAABABoJbACdAEMv43J8KAA+oKoEoQFN4OdOugGoWeSDqfCB94E2GHXi6HMdAIljCaSdH9AvI+OFb2o8BgAAAA=" },
+      "/images/McCafe/A24.jpg": { width: 1080, height: 1080, color: "#53424c", placeholder: "data:image/webp;base64,UklGRmIAAABXRUJQVlA4IFYAAADwAQCdASoQABAABABoJYgCdAEVE+LlMAAA/tcN+T+wy1cVvFc5Qom+Egm+rGCQNX4m2QXbl5vcouQdiMP+54ku1+3HYuLgC4JXOajiYNjYb2OnSgMAAA==" },
+      "/images/McCafe/A25.jpg": { width: 1080, height: 1080, color: "#febc11", placeholder: "data:image/webp;base64,UklGRoIAAABXRUJQVlA4IHYAAACwAgCdASoQABAABABoJbACdLoAFWAXe8aIZCgTOAAA/tPl1rHF8NySsS4mmwGs634DIa7H1KkCApnBONQe01NAuJ5+HJ+waAQAz5xHWnlZKwDzRT3zv/nGdMdyTviZMRa/e+pFNxwLLu4ZZd0nibhHZQPhlIAA" },
+      "/images/McCafe/A26.jpg": { width: 1080, height: 1080, color: "#ffbc0d", placeholder: "data:image/webp;base64,UklGRlQAAABXRUJQVlA4IEgAAAAwAgCdASoQABAABABoJbACdLoAAnGnXmMGgAD8jVQwZgRqcPrzaydBRqHPdWw9PWz2kFVJyMo2T/4trvG72DfLSn6k7z2UYAA=" },
+      "/images/McCafe/A27.jpg": { width: 1080, height: 1080, color: "#fcb009", placeholder: "data:image/webp;base64,UklGRnQAAABXRUJQVlA4IGgAAACQAgCdASoQABAABABoJbACdLoAEJMX+/R0j8y1wAD+s7My3aAPAJieO3ydXHhIPTVUnDHdbJ9slzv7hfWgGR4t1ebGnlGx1Yl//jFFYJPnVoNc7Y7chZCsbjgQI7xxmWHp07Qd24tYAA==" },
+      "/images/McCafe/A28.jpg": { width: 1080, height: 1080, color: "#8a620e", placeholder: "data:image/webp;base64,UklGRm4AAABXRUJQVlA4IGIAAADwAQCdASoQABAABABoJbACdAEPSzw4WgAA/t25MRT/N3unBo3ekQ8r4rEy5BYN+Z1O2leyCNvmuD03/1i2nk0/YDud6IPllk+BJoJvCtH0K388E/KdngqJ2mnXpav/sN54AA==" },
+      "/images/McCafe/A29.jpg": { width: 1080, height: 1080, color: "#f8aa08", placeholder: "data:image/webp;base64,UklGRmwAAABXRUJQVlA4IGAAAAAwAgCdASoQABAABABoJbACdLoAAwp1EypnQAD+szLNR4obsRIYa2XIVSKqKDxo6bzPhxA8TvOPMQgO4y+lOwF6PuvKiHLI8ADf/INaujsa62vZt3RMB6PqJBHyEgMAAAA=" },
+      "/images/McCafe/A3.jpg": { width: 1080, height: 1080, color: "#f3a308", placeholder: "data:image/webp;base64,UklGRlgAAABXRUJQVlA4IEwAAAAwAgCdASoQABAABABoJbACdLoAAq+ZG4wCAAD+w9to5Yjkv1Mu3Dq3j5jlRtpIxHYnqw1E7j8LSv/5FRNH5Z2NPKE7lj7woKX2XwAA" },
+      "/images/McCafe/A30.jpg": { width: 1024, height: 1024, color: "#d5cbbe", placeholder: "data:image/webp;base64,UklGRlwAAABXRUJQVlA4IFAAAABQAgCdASoQABAABABoJYwCdAYsjjONa3ouwAAA/u/XOdBd877OYwQ67HV/pCNwC5MLRUDxhQ51X9Zd9+AisfaL8AuhJ66siD6BZAnp410AAA==" },
+      "/images/McCafe/A31.jpg": { width: 1080, height: 1080, color: "#ab6f34", placeholder: "data:image/webp;base64,UklGRnwAAABXRUJQVlA4IHAAAAAQAgCdASoQABAABABoJbACdAYu5GVGv+94APw3HaikqCb4rbxZnUsztMHQlRAOGoDDIFd0biY380SzjPmpa8OxgltqWihJe4ooTRvZFnI113GLSA3dv1MKJiaapWBPvkelEn9ROL6anYCHmCdCAAAA" },
+      "/images/McCafe/A32.jpg": { width: 1800, height: 600, color: "#b88853", placeholder: "data:image/webp;base64,UklGRlQAAABXRUJQVlA4IEgAAADQAQCdASoQAAUABABoJbACdACzBi2IAADN8RiuM5nDLjnegjV9+y1YkSOkMwcijvOvo/qfNWoaRpQr69F03nYUlfPuaoIAAAA=" },
+      "/images/McCafe/A33.jpg": { width: 1080, height: 1080, color: "#958a80", placeholder: "data:image/webp;base64,UklGRmIAAABXRUJQVlA4IFYAAACwAQCdASoQABAABABoJaACdABg/SFAAM4i6/TMAKO3R23AtpJSZgLWplf/B5KsfMM6G5bPi7pM1AfWBIjKzYHNGz3tYGdfEYDh7Y/bpONDmGs7n/ewAA==" },
+      "/images/McCafe/A34.jpg": { width: 1080, height: 1080, color: "#fcbb1b", placeholder: "data:image/webp;base64,UklGRnwAAABXRUJQVlA4IHAAAADwAQCdASoQABAABABoJbACdLoAAwmjoAAA/sbATdpmLHg2g95ROQN1cJE6RsAT3szNlvnrm+ZlVtMNBeFE0Zexbwd9FGbFek1+6fhkJQuJV4WaNqf/jC5ZV8XXxrOCvdW/tO1Q+LwTL0oj9ii1wAAA" },
+      "/images/McCafe/A35.jpg": { width: 1080, height: 1080, color: "#fbac07", placeholder: "data:image/webp;base64,UklGRmQAAABXRUJQVlA4IFgAAABwAgCdASoQABAABABoJbACdLoAyv8D0PpYA8KAAP7DTf7x0PQ3zbcNKolNDUWj3mc/VujqHyRUNHDBfzJaf/KrY/z2jI4xHL+mErdi69HUz+KAUjiTgAAA" },
+      "/images/McCafe/A36.jpg": { width: 1080, height: 1080, color: "#fbb00a", placeholder: "data:image/webp;base64,UklGRkgAAABXRUJQVlA4IDwAAAAQAgCdASoQABAABABoJbACdLoAAnX8nQ4AAP7D/fMsMWX2sPU8VypqN/+VUXjyxD91MjTOfJgObVx0AAA=" },
+      "/images/McCafe/A4.jpg": { width: 1080, height: 1080, color: "#3f1f12", placeholder: "data:image/webp;base64,UklGRlgAAABXRUJQVlA4IEwAAAAwAgCdASoQABAABABoJZACdADwtpspfmNrAAD+7qBs5mDH5nHnN75lmzpfqqlrmnw1E42Qp+LdWiD9tJx0WYmZ8oD8COI2UAwIAAAA" },
+      "/images/McCafe/A5.jpg": { width: 1080, height: 1080, color: "#eb9507", placeholder: "data:image/webp;base64,UklGRloAAABXRUJQVlA4IE4AAAAwAgCdASoQABAABABoJbACdLoAAixju3VQAAD+01n0Bga8xPuPZth4l5pmUwLPuyWqPqNa/Haf/5Vzpwv7yP/ifM1+uvoe3i4LJlkQAAA=" },
+      "/images/McCafe/A6.jpg": { width: 1080, height: 1080, color: "#b59e58", placeholder: "data:image/webp;base64,UklGRoIAAABXRUJQVlA4IHYAAABQAgCdASoQABAABABoJbACdAYxZqb1gpbjOIAA/pCGTzKILZYDDQlw4UU+04mO30i8pCiTXt3+vzKNzMsZOdujh9tWexqfNUZsUDYojbMGZt+PSmmltAu90bazHWbfM0L/yjvv3mgWiWAks8/F+a8vseMweAAA" },
+      "/images/McCafe/A7.jpg": { width: 1080, height: 1080, color: "#b29e34", placeholder: "data:image/webp;base64,UklGRnIAAABXRUJQVlA4IGYAAADwAQCdASoQABAABABoJbACdAD5JegCEeAA/DHpK+3ATVCKmBgG5Xl2NMyMJDNCqmKfAmwLX9qt0f42cxH49yYzMGDQYTQc+a1lpZS8/5sDUgwHqMaR5SkR/WO7FMRvSaFFiHeAAAA=" },
+      "/images/McCafe/A8.jpg": { width: 1080, height: 1080, color: "#feb301", placeholder: "data:image/webp;base64,UklGRmgAAABXRUJQVlA4IFwAAABQAgCdASoQABAABABoJbACdLoAAx9lzQPPQjAA/q+YOe0BM6Bn9QGPh6ihJHOKgqstv/3e5hwxNnugPl0VP/5VbhVgd3vNyno8DpIGyVyRMqVJGnPtswbM9maAAA==" },
+      "/images/McCafe/A9.jpg": { width: 1080, height: 1080, color: "#fec00e", placeholder: "data:image/webp;base64,UklGRmgAAABXRUJQVlA4IFwAAAAwAgCdASoQABAABABoJbACdLoAAkXK7YBrAAD+08zLODaYgFeFoMYD8PR3ywXN8oYaHotqLnxyXnt3O4iqqgJm//FzAVuR3Y2DFL3MEoRQ/JOy4bd8m8L6WYAAAA==" },
+      "/images/McCafe/M1.jpg": { width: 1080, height: 1080, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRoAAAABXRUJQVlA4IHQAAAAQAgCdASoQABAABABoJbACdAEOUhC5v64AAP7rYX1WEXlA25a1m3SmUCLiV/9SzcwcQJVeTglKho2rmddEMwKxTFnr6XLbs/xOeQINLdcat58ZxcswWZmV8JjkZx+GQFGYD/QBi4+PWvr1+0BZtuCsyAAAAA==" },
+      "/images/McCafe/M2.jpg": { width: 1080, height: 1080, color: "#db2b1f", placeholder: "data:image/webp;base64,UklGRmQAAABXRUJQVlA4IFgAAABQAgCdASoQABAABABoJbACdLoAAwnUDhAo5CQA/ZnvQKfcpcFlGZm/Mp+T3biboWZM2wsRqvnFxAFve9/qI35oAvgNrfF1pMzE73+80CBusZoEDbkoAAAA" },
+      "/images/McCafe/S1.jpg": { width: 1080, height: 1080, color: "#a02b37", placeholder: "data:image/webp;base64,UklGRmYAAABXRUJQVlA4IFoAAADwAQCdASoQABAABABoJbACdADg5CpIUoAA/rqHTYY/HwPWw6Aj+Zqe6ZH0yYbxK8dYxvUyVOXsDOG3PIldB1jTIEioLMw1Y4OwQ7xkBOpUrhd4RTxXIXnAAAA=" },
+      "/images/McCafe/S2.jpg": { width: 1080, height: 1080, color: "#41494b", placeholder: "data:image/webp;base64,UklGRmYAAABXRUJQVlA4IFoAAAAQAgCdASoQABAABABoJbACdAEO6UAsHVAgAP7nGYCLdAHSTwxpTT9en35KWu5VobGIYBzj8anpB3sRcKZE7JHS1b9VDFNY8SBYvWH8iD+odZM+N0rZ4s8AAAA=" },
+      "/images/McCafe/S3.jpg": { width: 1080, height: 1080, color: "#8fad72", placeholder: "data:image/webp;base64,UklGRlgAAABXRUJQVlA4IEwAAADwAQCdASoQABAABABoJbAC7AELhyYseQAA/leVGAB+DyIlncOKVp2rkWJWQ547yoU/Tq75SV7HfNCp856BcCaBQZ9/oe+vRSQI4AAA" },
+      "/images/McCafe/S4.jpg": { width: 1080, height: 1080, color: "#40433c", placeholder: "data:image/webp;base64,UklGRmIAAABXRUJQVlA4IFYAAADwAQCdASoQABAABABoJYwCdAEOOeEYCAAA/vHM8b8JbKekHXYMcmwKgN/BkrbDE9naYPpLvSBnXb49TZ9JOM+wYsRM4JvUIavD0qGM5oV9RENrAW8AAA==" },
+      "/images/McCafe/S5.jpg": { width: 1080, height: 1080, color: "#e0c9b1", placeholder: "data:image/webp;base64,UklGRloAAABXRUJQVlA4IE4AAADQAQCdASoQABAABABoJbACdAEO4zrDQAD+yfSrGp15asDEUEUgIV4GPV3bLEMoWTQ/peKjwoVTQ9O1Nwb/RHJP+vWjTuEe80Prs4CAAAA=" },
+      "/images/McCafe/S6.jpg": { width: 1080, height: 1080, color: "#48453e", placeholder: "data:image/webp;base64,UklGRmgAAABXRUJQVlA4IFwAAAAwAgCdASoQABAABABoJbACdAEWTBcyy2hLAAD+J0ixuC7gAajDu/iwxFuIRnhLg9MuNfJzAXlVaMLD8COhkbRt2qLDnMoG3lWJmLioXNDSm6s6Yq2sN2bsq9gAAA==" },
+      "/images/McCafe/S7.jpg": { width: 1080, height: 1080, color: "#47575e", placeholder: "data:image/webp;base64,UklGRmwAAABXRUJQVlA4IGAAAADQAQCdASoQABAABABoJbACdADuJgi6aAD+zXQER8qaMJi5USbsf8CfOwwOfc8Wn6jHABdS6ZemVpmF+C5B5Z6qyiGQtaXGkbwZPeBQEj91MvZJ7Rc7cWOnOviz3CbFAAA=" },
+    },
   },
   {
     id: "sofar",
@@ -86,88 +214,228 @@ export const projects = [
     thumbnail: "/images/Sofar/A1.jpg",
     images: [
       "/images/Sofar/A1.jpg",
-      "/images/Sofar/B1.jpg",
-      "/images/Sofar/S1.jpg",
       "/images/Sofar/A2.jpg",
-      "/images/Sofar/B2.jpg",
       "/images/Sofar/A3.jpg",
+      "/images/Sofar/A4.jpg",
+      "/images/Sofar/A5.jpg",
+      "/images/Sofar/B1.jpg",
+      "/images/Sofar/B2.jpg",
       "/images/Sofar/B3.jpg",
+      "/images/Sofar/S1.jpg",
       "/images/Sofar/S3.jpg",
-      "/images/Sofar/A4.jpg",
       "/images/Sofar/S4.jpg",
-      "/images/Sofar/A5.jpg",
       "/images/Sofar/S5.JPG",
       "/images/Sofar/S6.JPG",
       "/images/Sofar/S7.jpg",
       "/images/Sofar/S8.jpg",
       "/images/Sofar/S9.jpg",
     ],
+    hashes: {
+      "/images/Sofar/A1.jpg": "91d3f5c3",
+      "/images/Sofar/A2.jpg": "c4685806",
+      "/images/Sofar/A3.jpg": "63109eb2",
+      "/images/Sofar/A4.jpg": "57a6f104",
+      "/images/Sofar/A5.jpg": "0686cf8e",
+      "/images/Sofar/B1.jpg": "724bcf43",
+      "/images/Sofar/B2.jpg": "5dbbe6c2",
+      "/images/Sofar/B3.jpg": "592f7a6d",
+      "/images/Sofar/S1.jpg": "122077f0",
+      "/images/Sofar/S3.jpg": "d4620456",
+      "/images/Sofar/S4.jpg": "7f14ed84",
+      "/images/Sofar/S5.JPG": "31b7f10d",
+      "/images/Sofar/S6.JPG": "2ad4611f",
+      "/images/Sofar/S7.jpg": "6f01a624",
+      "/images/Sofar/S8.jpg": "733a4816",
+      "/images/Sofar/S9.jpg": "3c9b80e2",
+    },
+    imageMeta: {
+      "/images/Sofar/A1.jpg": { width: 1200, height: 1500, color: "#b8361a", placeholder: "data:image/webp;base64,UklGRn4AAABXRUJQVlA4IHIAAADwAwCdASoQABQAPxFysFAsJqSisAgBgCIJbACxG1yBoKcgN7qPs3vwAP4UEEpbwqswdcBnLYUuA1RIDFz5oqpa5hoYsoKppG359bjEab8UMWMfRueWa+7R7y+dCzT7jzKAhVeIFnYh1n4L/YDA08pFgAA=" },
+      "/images/Sofar/A2.jpg": { width: 1080, height: 1350, color: "#80152c", placeholder: "data:image/webp;base64,UklGRnIAAABXRUJQVlA4IGYAAABwAwCdASoQABQAPxFysFAsJqSisAgBgCIJbFTATKATWqCF1wAA/ukH3klwVuNS4mNsy0QSHfHI8z3ihW1VToJH8XdiOMY/4fbqXDVnPRU2ZzrHHKdjTQFMVr8i6ZimB2Ih9vkAAAA=" },
+      "/images/Sofar/A3.jpg": { width: 1080, height: 1350, color: "#723721", placeholder: "data:image/webp;base64,UklGRn4AAABXRUJQVlA4IHIAAABQBACdASoQABQAPxFwsFAsJiSisAgBgCIJZACdMoADf74GVnD0AeIqWqaAAP7r9zLAjYtBGDB7Xz+nPohBf6jzDbOqG94oDjs4qbtqjHaozHSZ55duVM4lLSrRARU03bLaqN1Ziv82MfejR//JL8GAAAA=" },
+      "/images/Sofar/A4.jpg": { width: 1080, height: 1350, color: "#e75e75", placeholder: "data:image/webp;base64,UklGRoAAAABXRUJQVlA4IHQAAABQBACdASoQABQAPxFysFAsJqSisAgBgCIJbACdMoRwN6SAVlL/E1DGSuUAAPxafYbcwkcwJ2hl3WqD3YWhJ5hmclAouL2PixwS+m2ljCsfebhLP7y/8u1fXH2uuReCyeP1n92KXUsxtC+hZ0IpDH1pi4AAAA==" },
+      "/images/Sofar/A5.jpg": { width: 1200, height: 1500, color: "#6c3a32", placeholder: "data:image/webp;base64,UklGRnYAAABXRUJQVlA4IGoAAACQAwCdASoQABQAPxFysFAsJqSisAgBgCIJQBYdg3ba8vIl9UWAAP7ZWfhnw3ZJW40sqRlxAPMV1kzxddCNXZLDX7HobGfiboP1uLFadykoQ20MsGNQlWk0ipHBzXD82qqHKtf1ZAauAAAA" },
+      "/images/Sofar/B1.jpg": { width: 1080, height: 1080, color: "#022517", placeholder: "data:image/webp;base64,UklGRk4AAABXRUJQVlA4IEIAAADwAQCdASoQABAABABoJQAAXOgquN/CfAAA/vKeA0pnabtefzTSgdEeRK9QLMyECjvQaTjh8aECNiMRWF+5P1XwAAA=" },
+      "/images/Sofar/B2.jpg": { width: 1080, height: 1080, color: "#024c53", placeholder: "data:image/webp;base64,UklGRmQAAABXRUJQVlA4IFgAAADwAQCdASoQABAABABoJbACdAELTnKzcwAA/tzSY+ZtdGIuseJwgUXQ9mk/fw34EEqksZpul+vq8gkD2Sq+HpMX9UiVrdBEdbpjjajaJuyd6X8YPr705IAA" },
+      "/images/Sofar/B3.jpg": { width: 1080, height: 1080, color: "#c7c8bd", placeholder: "data:image/webp;base64,UklGRlwAAABXRUJQVlA4IFAAAAAQAgCdASoQABAABABoJZQC7AEPDNe7N+RAAP7rMbVweIFkZVkOELMTAp7M13UkvYaLdUxKJcxQehARv1JmlllGMK94MmtbWnKwSQ3IADtMAA==" },
+      "/images/Sofar/S1.jpg": { width: 1200, height: 800, color: "#261d0f", placeholder: "data:image/webp;base64,UklGRmgAAABXRUJQVlA4IFwAAAAQAgCdASoQAAsABABoJYgCdAEff6MPrAaAAP70UCS3iZOVEaLSfP5MsB7XuJtLbMArIn688GNXhUKmceM0IN3fWVM3SSxhfqw8V/noGuijAwIXFYbUtdQeuAAAAA==" },
+      "/images/Sofar/S3.jpg": { width: 1200, height: 800, color: "#542b1b", placeholder: "data:image/webp;base64,UklGRnAAAABXRUJQVlA4IGQAAADwAQCdASoQAAsABABoJbACdAEKROBttgAA/qvl7VB1/GFlOeyMoNgjWG09XMi0tDtDN8y3aGvil+3ZitAJj0x+amVPrMrxE3O8rppUa8VVxNTtMOhpkzuhDTkzHAiCNsaEgAAA" },
+      "/images/Sofar/S4.jpg": { width: 1200, height: 673, color: "#4f3521", placeholder: "data:image/webp;base64,UklGRlAAAABXRUJQVlA4IEQAAADQAQCdASoQAAkABABoJZACdADc9CBrgAD+zgOC+6WHh4OuXRg7Sq6EncoOJPx9zV6paxtmr7aFKpa1ebvaYVgjtcAAAA==" },
+      "/images/Sofar/S5.JPG": { width: 1800, height: 1200, color: "#171413", placeholder: "data:image/webp;base64,UklGRlgAAABXRUJQVlA4IEwAAADwAQCdASoQAAsABABoJYgCdAEPOtmo0YAA/qgaef+/xewIUzz7sGS0lHEVupsGDRCoabWS2aJJ8gLreVdBI7UZ0i7A0VM7MA5UsQAA" },
+      "/images/Sofar/S6.JPG": { width: 1200, height: 675, color: "#0c0c0e", placeholder: "data:image/webp;base64,UklGRlYAAABXRUJQVlA4IEoAAADQAQCdASoQAAkABABoJYgCdADwQNbYQAD+z4PG1GAa8mpLdM7LBSkOHnNC8zbfnzBnh6u/JQKy66LGeddFaOU+Xcwm1JHzcbaAAA==" },
+      "/images/Sofar/S7.jpg": { width: 1200, height: 800, color: "#42180b", placeholder: "data:image/webp;base64,UklGRloAAABXRUJQVlA4IE4AAAAQAgCdASoQAAsABABoJbACdAEQNZ47AmFgAP70XCwa//3lBtKlbmfsZRdQmzg/K4qmtdpoHohHoEYUHWac/5zCycFyNijcKXaXo1FqAAA=" },
+      "/images/Sofar/S8.jpg": { width: 1200, height: 2134, color: "#06201b", placeholder: "data:image/webp;base64,UklGRnQAAABXRUJQVlA4IGgAAABwAwCdASoQABwALtGIxGIkLCwsDADQS0AF2AHfXJJVXvQyxsAA/tB02AiHXM8weH00Ut1DvVg3Jzgppmdlw0Ge7eiewXGU9q0O9yOZB6Ehd204me0FYPU8ge4QHKLRjJG2XFhGjAAAAA==" },
+      "/images/Sofar/S9.jpg": { width: 1200, height: 1800, color: "#080403", placeholder: "data:image/webp;base64,UklGRngAAABXRUJQVlA4IGwAAAAQBACdASoQABgAPxFysFAsJqSisAgBgCIJQBhQBC4dEcmVT/fuPKXgAAD+47geEhJS4bOyPyKzMiajsyI1/G2Gis05F/C3Tc2zxor51xLbq4fG/kX1KEQ2/bvnfwA8Ya+5tn458eJiYOPhxAA=" },
+    },
   },
   {
     id: "sunnymoon",
     name: "Sunnymoon",
     type: "Social Media + Branding",
     description: `I handled the full branding, from the original logo ideation down to the smallest detail. I put an emphasis on the icons in this project, where the three icons each represent a character with its own theme, but within one greater identity.`,
-    thumbnail: "/images/Sunnymoon/Artboard%2028.jpg",
+    thumbnail: "/images/Sunnymoon/Artboard 3.png",
     images: [
-      "/images/Sunnymoon/Artboard%201.png",
-      "/images/Sunnymoon/Artboard%202.png",
-      "/images/Sunnymoon/Artboard%203.png",
-      "/images/Sunnymoon/Artboard%204.png",
-      "/images/Sunnymoon/Artboard%205.png",
-      "/images/Sunnymoon/Artboard%206.png",
-      "/images/Sunnymoon/Artboard%207.png",
-      "/images/Sunnymoon/Artboard%208.png",
-      "/images/Sunnymoon/Artboard%209.png",
-      "/images/Sunnymoon/Artboard%2010.png",
-      "/images/Sunnymoon/Artboard%2011.png",
-      "/images/Sunnymoon/Artboard%2012.png",
-      "/images/Sunnymoon/Artboard%2013.png",
-      "/images/Sunnymoon/Artboard%2014.png",
-      "/images/Sunnymoon/Artboard%2015.png",
-      "/images/Sunnymoon/Artboard%2016.png",
-      "/images/Sunnymoon/Artboard%2017.png",
-      "/images/Sunnymoon/Artboard%2018.png",
-      "/images/Sunnymoon/Artboard%2020.jpg",
-      "/images/Sunnymoon/Artboard%2021.png",
-      "/images/Sunnymoon/Artboard%2022.png",
-      "/images/Sunnymoon/Artboard%2023.png",
-      "/images/Sunnymoon/Artboard%2024.png",
-      "/images/Sunnymoon/Artboard%2025.png",
-      "/images/Sunnymoon/Artboard%2026.png",
-      "/images/Sunnymoon/Artboard%2027.jpg",
-      "/images/Sunnymoon/Artboard%2028.jpg",
-      "/images/Sunnymoon/Artboard%2029.jpg",
-      "/images/Sunnymoon/Artboard%2030.png",
-      "/images/Sunnymoon/Artboard%2031.jpg",
-      "/images/Sunnymoon/Artboard%2032.png",
-      "/images/Sunnymoon/Artboard%2033.jpg",
-      "/images/Sunnymoon/Artboard%2034.jpg",
-      "/images/Sunnymoon/Artboard%2035.png",
-      "/images/Sunnymoon/Artboard%2036.jpg",
-      "/images/Sunnymoon/Artboard%2037.png",
+      "/images/Sunnymoon/Artboard 1.png",
+      "/images/Sunnymoon/Artboard 10.png",
+      "/images/Sunnymoon/Artboard 11.png",
+      "/images/Sunnymoon/Artboard 12.png",
+      "/images/Sunnymoon/Artboard 13.png",
+      "/images/Sunnymoon/Artboard 14.png",
+      "/images/Sunnymoon/Artboard 15.png",
+      "/images/Sunnymoon/Artboard 16.png",
+      "/images/Sunnymoon/Artboard 17.png",
+      "/images/Sunnymoon/Artboard 18.png",
+      "/images/Sunnymoon/Artboard 2.png",
+      "/images/Sunnymoon/Artboard 20.jpg",
+      "/images/Sunnymoon/Artboard 21.png",
+      "/images/Sunnymoon/Artboard 22.png",
+      "/images/Sunnymoon/Artboard 23.png",
+      "/images/Sunnymoon/Artboard 24.png",
+      "/images/Sunnymoon/Artboard 25.png",
+      "/images/Sunnymoon/Artboard 26.png",
+      "/images/Sunnymoon/Artboard 27.jpg",
+      "/images/Sunnymoon/Artboard 28.jpg",
+      "/images/Sunnymoon/Artboard 29.jpg",
+      "/images/Sunnymoon/Artboard 3.png",
+      "/images/Sunnymoon/Artboard 30.png",
+      "/images/Sunnymoon/Artboard 31.jpg",
+      "/images/Sunnymoon/Artboard 32.png",
+      "/images/Sunnymoon/Artboard 33.jpg",
+      "/images/Sunnymoon/Artboard 34.jpg",
+      "/images/Sunnymoon/Artboard 35.png",
+      "/images/Sunnymoon/Artboard 36.jpg",
+      "/images/Sunnymoon/Artboard 37.png",
+      "/images/Sunnymoon/Artboard 4.png",
+      "/images/Sunnymoon/Artboard 5.png",
+      "/images/Sunnymoon/Artboard 6.png",
+      "/images/Sunnymoon/Artboard 7.png",
+      "/images/Sunnymoon/Artboard 8.png",
+      "/images/Sunnymoon/Artboard 9.png",
     ],
+    hashes: {
+      "/images/Sunnymoon/Artboard 1.png": "2955a919",
+      "/images/Sunnymoon/Artboard 10.png": "e90afc8d",
+      "/images/Sunnymoon/Artboard 11.png": "57f4aeab",
+      "/images/Sunnymoon/Artboard 12.png": "f1970d5e",
+      "/images/Sunnymoon/Artboard 13.png": "ebdc9f1c",
+      "/images/Sunnymoon/Artboard 14.png": "353e7168",
+      "/images/Sunnymoon/Artboard 15.png": "c63af72a",
+      "/images/Sunnymoon/Artboard 16.png": "d63a12d5",
+      "/images/Sunnymoon/Artboard 17.png": "4c52c830",
+      "/images/Sunnymoon/Artboard 18.png": "963dad9c",
+      "/images/Sunnymoon/Artboard 2.png": "f5bf2665",
+      "/images/Sunnymoon/Artboard 20.jpg": "4c5f66b9",
+      "/images/Sunnymoon/Artboard 21.png": "f616b38a",
+      "/images/Sunnymoon/Artboard 22.png": "97d0f5e7",
+      "/images/Sunnymoon/Artboard 23.png": "06390fd1",
+      "/images/Sunnymoon/Artboard 24.png": "156d28d3",
+      "/images/Sunnymoon/Artboard 25.png": "9620a15e",
+      "/images/Sunnymoon/Artboard 26.png": "1debe43e",
+      "/images/Sunnymoon/Artboard 27.jpg": "7b145d3f",
+      "/images/Sunnymoon/Artboard 28.jpg": "6da084fe",
+      "/images/Sunnymoon/Artboard 29.jpg": "58ba26e9",
+      "/images/Sunnymoon/Artboard 3.png": "9d77b80a",
+      "/images/Sunnymoon/Artboard 30.png": "f9cc597b",
+      "/images/Sunnymoon/Artboard 31.jpg": "a734ca84",
+      "/images/Sunnymoon/Artboard 32.png": "a1400133",
+      "/images/Sunnymoon/Artboard 33.jpg": "4b652bf0",
+      "/images/Sunnymoon/Artboard 34.jpg": "bfbdfa5b",
+      "/images/Sunnymoon/Artboard 35.png": "0a634ead",
+      "/images/Sunnymoon/Artboard 36.jpg": "7574ca20",
+      "/images/Sunnymoon/Artboard 37.png": "1a8bc971",
+      "/images/Sunnymoon/Artboard 4.png": "56d02954",
+      "/images/Sunnymoon/Artboard 5.png": "08c14993",
+      "/images/Sunnymoon/Artboard 6.png": "8f7bb6bf",
+      "/images/Sunnymoon/Artboard 7.png": "217f0ead",
+      "/images/Sunnymoon/Artboard 8.png": "58bba994",
+      "/images/Sunnymoon/Artboard 9.png": "e3ffe0b9",
+    },
+    imageMeta: {
+      "/images/Sunnymoon/Artboard 1.png": { width: 1920, height: 1080, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRkgAAABXRUJQVlA4IDwAAACwAQCdASoQAAkABABoJaQAAuiobgjwAP7zzsw7pqKJJCbSnvX7MggzTn/29idfgwgZVgG7AcjEAQAAAAA=" },
+      "/images/Sunnymoon/Artboard 10.png": { width: 1920, height: 1080, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRkwAAABXRUJQVlA4IEAAAACwAQCdASoQAAkABABoJZgCdAENcueAAP7wNVDPNUs7UrHI8qtI/4C6wiAb8d5LVCWNx46+/5kp+vbtffHlgAAA" },
+      "/images/Sunnymoon/Artboard 11.png": { width: 1920, height: 1080, color: "#e2e5fb", placeholder: "data:image/webp;base64,UklGRkIAAABXRUJQVlA4IDYAAADQAQCdASoQAAkABABoJZACw7D2PP6kgAD+4fDebt/AhjnuRzZ0HcU1b2alk4zQ0lz1CL0YAAA=" },
+      "/images/Sunnymoon/Artboard 12.png": { width: 1920, height: 1080, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRkAAAABXRUJQVlA4IDQAAACwAQCdASoQAAkABABoJQBdgB6OgADIAP7rMbXSmbvr7Xpr0pZ4PETLm00IlN/G+FaQAAAA" },
+      "/images/Sunnymoon/Artboard 13.png": { width: 1920, height: 1080, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRkIAAABXRUJQVlA4IDYAAACwAQCdASoQAAkABABoJZACw7D0alQAAP7t6kOVa+hpz5dGp+Rnc1jXIvQgtmhKCJ+arhgAAAA=" },
+      "/images/Sunnymoon/Artboard 14.png": { width: 1920, height: 1080, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRjwAAABXRUJQVlA4IDAAAABQAQCdASoQAAkABABoJaQABHQAAP7xP/+yj9fv2dSMedCOTk5bNnLjMLLF/TPcAAA=" },
+      "/images/Sunnymoon/Artboard 15.png": { width: 1920, height: 1080, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRl4AAABXRUJQVlA4IFIAAADwAQCdASoQAAkABABoJaQAAu0eop4mUYAA/vBKScq+pDrXzxe4Nd+6H8IoxY+AkYpf4ojf7k0cv6LKXKdP4cJfPupF8HZohkYOJq52/BV99AAA" },
+      "/images/Sunnymoon/Artboard 16.png": { width: 1920, height: 1080, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRmAAAABXRUJQVlA4IFQAAACwAQCdASoQAAkABABoJaQAAtdOQlXgAP7wQcy85P1VtYbXvfQSP5eTXPn3qtu+LgrtuPuruvkfKvXGfyCDCTuu0Wnw9Xn8RSPxyHvhOY2p1hQAAAA=" },
+      "/images/Sunnymoon/Artboard 17.png": { width: 1920, height: 1080, color: "#fcfcfc", placeholder: "data:image/webp;base64,UklGRi4AAABXRUJQVlA4ICIAAAAwAQCdASoQAAkABABoJaQAA3AA/vIU8RnRRucmiz03AAAA" },
+      "/images/Sunnymoon/Artboard 18.png": { width: 1920, height: 1080, color: "#df88ff", placeholder: "data:image/webp;base64,UklGRjQAAABXRUJQVlA4ICgAAACQAQCdASoQAAkABABoJbACdLoAA5gA/uk9RLuePH5L0v329nQ0JQAA" },
+      "/images/Sunnymoon/Artboard 2.png": { width: 1920, height: 1080, color: "#de85ff", placeholder: "data:image/webp;base64,UklGRkIAAABXRUJQVlA4IDYAAAAQAgCdASoQAAkABABoJbACdLoAAxkLC0QAAP7DYh4So2xvgZf9WHvqN7lHME54iObVTYriAAA=" },
+      "/images/Sunnymoon/Artboard 20.jpg": { width: 1920, height: 1080, color: "#d589ee", placeholder: "data:image/webp;base64,UklGRlIAAABXRUJQVlA4IEYAAADwAQCdASoQAAkABABoJbACdAEPEBkT/IAA/tTE6h/DoX40X5i5HDSstROAuPkisnbUHYiK1pSlVNSDL4aGMwBgy99aAAAA" },
+      "/images/Sunnymoon/Artboard 21.png": { width: 1920, height: 1080, color: "#6278b7", placeholder: "data:image/webp;base64,UklGRoQAAABXRUJQVlA4WAoAAAAQAAAADwAACAAAQUxQSBgAAAABF3D//4iIwiDbSOcPcv9f0zeI6H9CXgpWUDggRgAAABACAJ0BKhAACQAEAGgloAJ0ARRI0Mtg6AAA/pi7C0x45SOM0UFhYKSAH1zKd6UK0VA6F8z4ajRSe9sQ0+R2EN2HIRhb4AA=" },
+      "/images/Sunnymoon/Artboard 22.png": { width: 1920, height: 1080, color: "#faf3e1", placeholder: "data:image/webp;base64,UklGRoYAAABXRUJQVlA4WAoAAAAQAAAADwAACAAAQUxQSBoAAAABF3D//4iIQiEbSdD6IxzAV9MziOh/NvKqBlZQOCBGAAAA0AEAnQEqEAAJAAQAaCWwAnQBDdfC7ogA/u4xWdkAn3tyPrRWyHNamy9PN1I6mUYgIVfLwXPUEFNvvBIpyMBNlm3BK3AAAA==" },
+      "/images/Sunnymoon/Artboard 23.png": { width: 1920, height: 1080, color: "#fadbf8", placeholder: "data:image/webp;base64,UklGRogAAABXRUJQVlA4WAoAAAAQAAAADwAACAAAQUxQSBoAAAABF3D//4iIQiEbSdD6IxzAV9MziOh/NvKqBlZQOCBIAAAA8AEAnQEqEAAJAAQAaCUAToAhvFRutUAAAP7oWYOoanSwZFpB3+ZAmqjd03KOzKsDwOeD1cpXyaJcvR1l3HTqoxJmmqshxAAA" },
+      "/images/Sunnymoon/Artboard 24.png": { width: 1920, height: 1080, color: "#f9b14f", placeholder: "data:image/webp;base64,UklGRkwAAABXRUJQVlA4IEAAAAAQAgCdASoQAAkABABoJbACdAEUjIqh6/QAAP7TVg/NOYETU61Hgi9ZonByP1HOtX6f24p5K353JvrWim6In0AA" },
+      "/images/Sunnymoon/Artboard 25.png": { width: 1920, height: 1080, color: "#de85ff", placeholder: "data:image/webp;base64,UklGRkoAAABXRUJQVlA4ID4AAAAQAgCdASoQAAkABABoJbACdADdRGMRZRUYAP6vltiFdBZ211V40c1sXCTOjinyb61oyRAe4jrQykbOgdgAAA==" },
+      "/images/Sunnymoon/Artboard 26.png": { width: 1920, height: 1080, color: "#6273ff", placeholder: "data:image/webp;base64,UklGRk4AAABXRUJQVlA4IEIAAADwAQCdASoQAAkABABoJbACdAEJMB/dTAAAyQH+Z9GzfkDuSlhoekhWP+oWhtDiFw/2KlzH7BviiZ/ILlgncHxXwAA=" },
+      "/images/Sunnymoon/Artboard 27.jpg": { width: 1920, height: 1080, color: "#33232c", placeholder: "data:image/webp;base64,UklGRl4AAABXRUJQVlA4IFIAAAAQAgCdASoQAAkABABoJbACdAELYLSOv6twAPkSvg/zuH7USN+gKI7gd9aMmP45HO/CMT1IzG91Ph3tKJl9nuw6f6b30I5Z79oFS6+DGYwYAAAA" },
+      "/images/Sunnymoon/Artboard 28.jpg": { width: 1920, height: 1080, color: "#4c3311", placeholder: "data:image/webp;base64,UklGRmAAAABXRUJQVlA4IFQAAAAQAgCdASoQAAkABABoJbACdAEesRWkSz4QAOH7KX6HCS4ByLBi2i7fxtjApP1eT1zrkysHUqIFNs6KROQ51zgBr/HGodyv+RjggwFRbWuZg9HsNAA=" },
+      "/images/Sunnymoon/Artboard 29.jpg": { width: 1920, height: 1080, color: "#46474b", placeholder: "data:image/webp;base64,UklGRlQAAABXRUJQVlA4IEgAAADQAQCdASoQAAkABABoJZwAAvfBXFWCQAD+xQcw9AaeYPi3zzUBXJnybBWcVGQBDo6LMM3xjV7EuVsxY+fFRjgsGCIsoMzhAAA=" },
+      "/images/Sunnymoon/Artboard 3.png": { width: 1920, height: 1080, color: "#f9ba65", placeholder: "data:image/webp;base64,UklGRkYAAABXRUJQVlA4IDoAAAAwAgCdASoQAAkABABoJbACdLoAAwnnnwqxAAD+3pDvT21dWkk9awmQv8bzfDfC7YebxYcBut8DUAAA" },
+      "/images/Sunnymoon/Artboard 30.png": { width: 1920, height: 1080, color: "#e3e2e2", placeholder: "data:image/webp;base64,UklGRj4AAABXRUJQVlA4IDIAAACQAQCdASoQAAkABABoJaQAAhn08AAA/u2grnjBYbVQHIOqdcfRqLt+cCnQgjj686gAAA==" },
+      "/images/Sunnymoon/Artboard 31.jpg": { width: 1920, height: 1080, color: "#c79494", placeholder: "data:image/webp;base64,UklGRl4AAABXRUJQVlA4IFIAAADQAQCdASoQAAkABABoJbACdAECjIFxoAD+jUQBgk7SvPUFsY2HG5rcYIYhm9eKp1zjrN0H/Pf5GU8ZBu8NGlWvd/0NYnv5LpwKGZekta0XAAAA" },
+      "/images/Sunnymoon/Artboard 32.png": { width: 1920, height: 1080, color: "#191919", placeholder: "data:image/webp;base64,UklGRkYAAABXRUJQVlA4IDoAAACwAQCdASoQAAkABABoJaQAAv9EupiAAP7x4xMePrktJLFEgcuzFPCWa2wNjFol17UhN3dUI8gFAAAA" },
+      "/images/Sunnymoon/Artboard 33.jpg": { width: 1920, height: 1080, color: "#c89595", placeholder: "data:image/webp;base64,UklGRmAAAABXRUJQVlA4IFQAAADQAQCdASoQAAkABABoJbACdAECgUlmYAD+jUQBgk7SvPUFsY2HHC3+Qt3qzP2Wu1au+1ka5Psv1okmbLVYu8NGlWvd/0MjO3IiDVoSTr229+4AAAA=" },
+      "/images/Sunnymoon/Artboard 34.jpg": { width: 1920, height: 1080, color: "#b27029", placeholder: "data:image/webp;base64,UklGRlYAAABXRUJQVlA4IEoAAAAQAgCdASoQAAkABABoJbACdADp/quodJyAAP7rJehdj4do0yHLVlsxu48U+eLi0Eaczn08ExZgO2NVyNJw9xN9BtcQC9kJYkAAAA==" },
+      "/images/Sunnymoon/Artboard 35.png": { width: 1920, height: 1080, color: "#c1b8b1", placeholder: "data:image/webp;base64,UklGRm4AAABXRUJQVlA4WAoAAAAQAAAADwAACAAAQUxQSBIAAAABD/D+/4iIIBBIQt9+hYj+Rx5WUDggNgAAANABAJ0BKhAACQAEAGgllAJ0AOGIpn+gAP7n3DJfnkS3KdfiwgdRBNQSGPcQM5mtdM4YSmmgAA==" },
+      "/images/Sunnymoon/Artboard 36.jpg": { width: 1920, height: 1080, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRlIAAABXRUJQVlA4IEYAAAAQAgCdASoQAAkABABoJZQC7AYrxq/pYsbAAP71AW2WGu+yinlHH55fqoRWdPcnJ+xhOnA2KIIJDky2t+f1vPUIAOcnPgAA" },
+      "/images/Sunnymoon/Artboard 37.png": { width: 1920, height: 1080, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRjYAAABXRUJQVlA4ICoAAACwAQCdASoQAAkABABoJaQAAudc/ZswAP72EKlQYpl0Dl2QKm9ZgGVYAAA=" },
+      "/images/Sunnymoon/Artboard 4.png": { width: 1920, height: 1080, color: "#6273ff", placeholder: "data:image/webp;base64,UklGRkQAAABXRUJQVlA4IDgAAACwAQCdASoQAAkABABoJagCdAEH0AMAAPi0uMW0XR9gCNeZRsQfFFyv9wfaquzb/aiwf0s3g6egAA==" },
+      "/images/Sunnymoon/Artboard 5.png": { width: 1920, height: 1080, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRjoAAABXRUJQVlA4IC4AAACwAQCdASoQAAkABABoJYwAAujfLkUAAP7wOdfs0A60DsQkRA638u5jJT9IIUAA" },
+      "/images/Sunnymoon/Artboard 6.png": { width: 1920, height: 1080, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRkIAAABXRUJQVlA4IDYAAACwAQCdASoQAAkABABoJZwAAxeVUXwAAP7yOrbR2VCiX9bUa5YXhFxlUal7dn82IHQu6bQAAAA=" },
+      "/images/Sunnymoon/Artboard 7.png": { width: 1920, height: 1080, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRj4AAABXRUJQVlA4IDIAAACwAQCdASoQAAkABABoJZwAAu0dpR6AAP7zqP+WX7N7dAvX2xy5iPmALRXa66T9bAAAAA==" },
+      "/images/Sunnymoon/Artboard 8.png": { width: 1920, height: 1080, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRlYAAABXRUJQVlA4IEoAAACwAQCdASoQAAkABABoJZQAAuMJtpyAAP7yOh4HsZHOG4mxel6VZngd8y01Y/yolMLj9NcbrUhKyRGxlPlKHNdLW7zc0Kk2y1AAAA==" },
+      "/images/Sunnymoon/Artboard 9.png": { width: 1920, height: 1080, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRkQAAABXRUJQVlA4IDgAAACwAQCdASoQAAkABABoJaQAAugg13UAAP7wOySknDSNVbf77BvK7nQ5Updmg9+TpUmH6xHo0UAAAA==" },
+    },
   },
   {
     id: "cannelle",
     name: "Cannelle",
     type: "Others",
     description: `Product photography and visual content creation for Cannelle, highlighting the texture and quality of their offerings.`,
-    thumbnail: "/images/Cannelle/A1.jpg",
+    thumbnail: "/images/Cannelle/C3.jpg",
     images: [
       "/images/Cannelle/A1.jpg",
-      "/images/Cannelle/B1.jpg",
-      "/images/Cannelle/C1.jpg",
       "/images/Cannelle/A2.jpg",
-      "/images/Cannelle/B2.jpg",
-      "/images/Cannelle/C2.jpg",
       "/images/Cannelle/A3.jpg",
+      "/images/Cannelle/B1.jpg",
+      "/images/Cannelle/B2.jpg",
       "/images/Cannelle/B3.jpg",
+      "/images/Cannelle/C1.jpg",
+      "/images/Cannelle/C2.jpg",
       "/images/Cannelle/C3.jpg",
       "/images/Cannelle/C4.jpg",
       "/images/Cannelle/C5.jpg",
       "/images/Cannelle/C6.jpg",
     ],
+    hashes: {
+      "/images/Cannelle/A1.jpg": "331b1d82",
+      "/images/Cannelle/A2.jpg": "c30b7ecb",
+      "/images/Cannelle/A3.jpg": "d1a4cae7",
+      "/images/Cannelle/B1.jpg": "3032688a",
+      "/images/Cannelle/B2.jpg": "b6073533",
+      "/images/Cannelle/B3.jpg": "d231b594",
+      "/images/Cannelle/C1.jpg": "2b5d09d1",
+      "/images/Cannelle/C2.jpg": "eb08d9e1",
+      "/images/Cannelle/C3.jpg": "c7415b12",
+      "/images/Cannelle/C4.jpg": "4368d8f5",
+      "/images/Cannelle/C5.jpg": "be733a00",
+      "/images/Cannelle/C6.jpg": "5c9629ff",
+    },
+    imageMeta: {
+      "/images/Cannelle/A1.jpg": { width: 1800, height: 2250, color: "#a67553", placeholder: "data:image/webp;base64,UklGRpYAAABXRUJQVlA4IIoAAAAwBACdASoQABQAPxFysFAsJqSisAgBgCIJbACdMoRwABDK291gBnJEjgAA9HGI+dfFlPEs3Aciz+gMQ6K3OX+0cvZvhacqZ+Fd/se9qhS98WB94zBM90mUilweO1hZnWjfuJ3aK7dpkdGIkd2yhisvx5JeEbL6Rfc3EdC10hEVvIXgLu390ac0AAA=" },
+      "/images/Cannelle/A2.jpg": { width: 1800, height: 2250, color: "#987f6f", placeholder: "data:image/webp;base64,UklGRnoAAABXRUJQVlA4IG4AAAAQBACdASoQABQAPxFysFAsJqSisAgBgCIJZgC7Aq/wbLawymL/EzGaAADNoQ/4HXlFH8MrMCwKQyyMmJv7b7wxvXnZqJL5XTowoxm+/lWMsxiN40Fg+NE4MRtKcj7Fsx2c2hfvJnVD0dHMlT2AAA==" },
+      "/images/Cannelle/A3.jpg": { width: 1800, height: 2249, color: "#9d938c", placeholder: "data:image/webp;base64,UklGRoQAAABXRUJQVlA4IHgAAAAwBACdASoQABQAPxFysFAsJqSisAgBgCIJYgCdABxIjigu1CdR2ndp7AAAy/QRS4Vzx4OBK0+UM2Hiv5VUep4/+SMVbykmdxb5ovjV2PL0w3BT6CWwmWizIef8p6j6vbIF/JWtMIm/nlO0zKdIw+812HSoAgmQAAA=" },
+      "/images/Cannelle/B1.jpg": { width: 1800, height: 2400, color: "#6f361d", placeholder: "data:image/webp;base64,UklGRnQAAABXRUJQVlA4IGgAAABwAwCdASoQABUAPxFysFAsJqSisAgBgCIJagCw7BURgrPDbUAA/rnKenbb+zVVDEZqxJQYDJxDYGOykf+WOSPTSHN9Nd0dBgnSnGMxlRb0OETAWJFfXfdA+OXs2N2rFTXcHO65DwAAAA==" },
+      "/images/Cannelle/B2.jpg": { width: 1500, height: 2000, color: "#9e6345", placeholder: "data:image/webp;base64,UklGRm4AAABXRUJQVlA4IGIAAABwAwCdASoQABUAPxF4slEsJ6SisAgBgCIJZgCdMoRwADaUtdgA/rzNt6P6qeZb4DV86WDuJ3MaLqTQjrZMe1295eCMaf+y3MkmG4RCLMUMUF6QfGXpq/HVMF2LozaIaaQAAA==" },
+      "/images/Cannelle/B3.jpg": { width: 1800, height: 2400, color: "#b87a4f", placeholder: "data:image/webp;base64,UklGRnYAAABXRUJQVlA4IGoAAABwAwCdASoQABUAPxFysFAsJqSisAgBgCIJZgCw7A0WMwUZ6wAAkqIkQ5Jl1rXlFpiecTLsK2GR8j3owUBJkjB6sJIkmJF2HJtdfc7VsfZ9TlfqTPqdUeN7obiixFMCjsb3EjPqgLhyyAAA" },
+      "/images/Cannelle/C1.jpg": { width: 1800, height: 1349, color: "#b5a84e", placeholder: "data:image/webp;base64,UklGRlYAAABXRUJQVlA4IEoAAADwAQCdASoQAAwABABoJbACdAECuDn7wgAA/rIJRg8D9wLa7Ncj3H86LV0FEHif+dxO+gHQJGbkPDPNRWvppxv1976vKnrex5dAAA==" },
+      "/images/Cannelle/C2.jpg": { width: 1800, height: 1349, color: "#eac8a4", placeholder: "data:image/webp;base64,UklGRlAAAABXRUJQVlA4IEQAAAAQAgCdASoQAAwABABoJZgCdAEN5YXCYfgAAP7qxeVqWONw+yFvcGDFqspeW4KsW7SbiJNVhhEi/Pxiw8PkVcrVfgAAAA==" },
+      "/images/Cannelle/C3.jpg": { width: 1800, height: 1349, color: "#c92e4e", placeholder: "data:image/webp;base64,UklGRlAAAABXRUJQVlA4IEQAAADwAQCdASoQAAwABABoJbACdAD5gunIo5AAyjY7Vz6RYOiYp+cGI2/Tv1uYH4YMxE6Obh8ElD+G/urFPht4P626vAAAAA==" },
+      "/images/Cannelle/C4.jpg": { width: 1800, height: 1349, color: "#d0713b", placeholder: "data:image/webp;base64,UklGRlQAAABXRUJQVlA4IEgAAAAQAgCdASoQAAwABABoJbACdLoAAacq+O4AAP3su4CtANtJ9K9kZgDVb7sRit5h+nem9oof/MfZLJssE34iEXAbe/JHefavOAA=" },
+      "/images/Cannelle/C5.jpg": { width: 1800, height: 1349, color: "#b3785e", placeholder: "data:image/webp;base64,UklGRlgAAABXRUJQVlA4IEwAAADwAQCdASoQAAwABABoJbACdADp6uLeBAAA/pCgsBauHLjzsT+yzAnShMf3WXozUNFnS4nhiNhPW8sqJBAEQylpSw5Nrr7dJ+qAwAAA" },
+      "/images/Cannelle/C6.jpg": { width: 1800, height: 1349, color: "#c66d3f", placeholder: "data:image/webp;base64,UklGRlYAAABXRUJQVlA4IEoAAADQAQCdASoQAAwABABoJbACdLoAAO8gAAD8paI0eP1/o2iaqvT1Zr6oAUmBGVgelSn0y0/AFn8lhxKquOcRPH68p8VFftswfQWgAA==" },
+    },
   },
   {
     id: "oppo",
@@ -179,21 +447,26 @@ export const projects = [
       "/images/OPPO/A1.png",
       "/images/OPPO/A2.jpg",
     ],
-    videos: [
-      "/images/OPPO/R1.mp4",
-      "/images/OPPO/R2.mp4",
-      "/images/OPPO/R3.mp4",
-      "/images/OPPO/R4.mp4",
-    ],
+    hashes: {
+      "/images/OPPO/A1.png": "a52a20d5",
+      "/images/OPPO/A2.jpg": "e46897ef",
+    },
+    imageMeta: {
+      "/images/OPPO/A1.png": { width: 1080, height: 1350, color: "#ced5da", placeholder: "data:image/webp;base64,UklGRoAAAABXRUJQVlA4IHQAAABQBACdASoQABQAPxFwsFAsJiSisAgBgCIJbACdMoR3ACXB+X0h3aqiF+uAAP7L6IlZ0s08zbKS+QUuw+5uJsEvsPKc3w73DIO53PumMhqSJ4dDX21rtUSCInw6QjiKWPQJFxLVzDePy5CRjKkIbrTvxftAAA==" },
+      "/images/OPPO/A2.jpg": { width: 1800, height: 2250, color: "#f5bf44", placeholder: "data:image/webp;base64,UklGRoYAAABXRUJQVlA4IHoAAADQAwCdASoQABQAPxFysFAsJqSisAgBgCIJbACdAB0luMk2tV9U6vgA/q8jVdzzRyx8XbJWX2wzYiIJwdAwMDKNf1nDY54TGtqneyeHG9L+oc9JL7IvpoHBXSfqgPxCa/lLEui+V1H7rqfOhhxeMSN7A9m6TSST6rTAAA==" },
+    },
   },
   {
     id: "freshdays",
     name: "Freshdays",
     type: "Social Media + AI Reels",
     description: `Developed engaging social media content and AI reels for Freshdays, focusing on a fresh and relatable brand voice.`,
-    thumbnail: "/images/Freshdays/A1.png",
+    thumbnail: "/images/Freshdays/A12.jpg",
     images: [
       "/images/Freshdays/A1.png",
+      "/images/Freshdays/A10.jpg",
+      "/images/Freshdays/A11.jpg",
+      "/images/Freshdays/A12.jpg",
       "/images/Freshdays/A2.png",
       "/images/Freshdays/A3.png",
       "/images/Freshdays/A4.png",
@@ -202,72 +475,149 @@ export const projects = [
       "/images/Freshdays/A7.jpg",
       "/images/Freshdays/A8.jpg",
       "/images/Freshdays/A9.png",
-      "/images/Freshdays/A10.jpg",
-      "/images/Freshdays/A11.jpg",
-      "/images/Freshdays/A12.jpg",
-    ],
-    videos: [
-      "/images/Freshdays/R1.mp4",
-      "/images/Freshdays/R2.mp4",
-      "/images/Freshdays/R3.mp4",
-      "/images/Freshdays/R4.mp4",
     ],
+    hashes: {
+      "/images/Freshdays/A1.png": "19140de7",
+      "/images/Freshdays/A10.jpg": "3cef2b3c",
+      "/images/Freshdays/A11.jpg": "7ca42784",
+      "/images/Freshdays/A12.jpg": "ed4f8be8",
+      "/images/Freshdays/A2.png": "3c2c64b2",
+      "/images/Freshdays/A3.png": "9ca3b316",
+      "/images/Freshdays/A4.png": "2d91bd21",
+      "/images/Freshdays/A5.jpg": "bc0c3d8e",
+      "/images/Freshdays/A6.jpg": "4f666a15",
+      "/images/Freshdays/A7.jpg": "c8d1d862",
+      "/images/Freshdays/A8.jpg": "2d7121ff",
+      "/images/Freshdays/A9.png": "d10987d4",
+    },
+    imageMeta: {
+      "/images/Freshdays/A1.png": { width: 1800, height: 2250, color: "#f6f6f6", placeholder: "data:image/webp;base64,UklGRmAAAABXRUJQVlA4IFQAAABQAwCdASoQABQAPxFysFCsJqSisAgBgCIJYgAAXEjlG7gbqAD+6o53NR1lPQHz9a3l5qdfd7/Ypfa7o7G4ow3JNWj4qcMHt77fo9ig6XKhsm2SAAA=" },
+      "/images/Freshdays/A10.jpg": { width: 1500, height: 2000, color: "#deddcf", placeholder: "data:image/webp;base64,UklGRmQAAABXRUJQVlA4IFgAAABwAwCdASoQABUAPxFysFAsJqSisAgBgCIJZwDCgC0bVBpwIAAA/u16kiG29glFXxFcv1m3g6gtXmBkmy4Ls+U0WysK96emwPitmD6mCYG/rQwAeRs7cegA" },
+      "/images/Freshdays/A11.jpg": { width: 1800, height: 2400, color: "#fad5cc", placeholder: "data:image/webp;base64,UklGRmoAAABXRUJQVlA4IF4AAAAQBACdASoQABUAPxFysFAsJqSisAgBgCIJYwCdMoADTidPiedvc7PaAAD+3nbEC0xJRpyo03Pr9UOWSlWFczPkESXWmj7/JsqQvo+4GvI9ZMHbPhbRB11Y+jE4VigA" },
+      "/images/Freshdays/A12.jpg": { width: 1600, height: 2000, color: "#d9a48c", placeholder: "data:image/webp;base64,UklGRogAAABXRUJQVlA4IHwAAABwBACdASoQABQAPxFysFAsJqSisAgBgCIJbACdMoR3ACxAQxF7Lf46RPf5AAD+tABN6KTpJg28g9u/E2NM/28JGolLWz3KuE1vpiTA9r2NYQVRy/LYy0wjuvc1tjRmE01MnGny7rTyYtMFZ2wL2TJ7jqdJN33O2BtUlTAA" },
+      "/images/Freshdays/A2.png": { width: 1800, height: 2250, color: "#f6f6f6", placeholder: "data:image/webp;base64,UklGRnAAAABXRUJQVlA4IGQAAADQAwCdASoQABQAPxFysFAsJqSisAgBgCIJZQAAW+LWaupdilB0C4AA/uqOUKudBbZWyDh6Ms2GCSI68PHWIMQ+N7NiPrl7lgOTJ3GGkyT+3p9GwOFsa3KCdIABv/7lXHf/AAAA" },
+      "/images/Freshdays/A3.png": { width: 1600, height: 2000, color: "#f6f6f6", placeholder: "data:image/webp;base64,UklGRlgAAABXRUJQVlA4IEwAAAAQAwCdASoQABQAPxFysFAsJqSisAgBgCIJY2fkWeATx+AA/u5uDD671bMjooIC+m4cSoDG2SzY7noZHo5jR18P6X0C9B8PlTptgAAA" },
+      "/images/Freshdays/A4.png": { width: 1800, height: 2250, color: "#f6f6f6", placeholder: "data:image/webp;base64,UklGRlgAAABXRUJQVlA4IEwAAABQAwCdASoQABQAPxFwsFAsJiSisAgBgCIJZQAAW/BV3iGXAAD+6o/UWXPz3o7HOhU876thBmfBJt5ThCBkit8rtYeDuYJBN1GPHwAA" },
+      "/images/Freshdays/A5.jpg": { width: 1500, height: 2000, color: "#866a60", placeholder: "data:image/webp;base64,UklGRqYAAABXRUJQVlA4IJoAAABQBACdASoQABUAPxFysFAsJqSisAgBgCIJbACdMoMxgEmbQRawkJBCJfoAAPx/UhIsK/DOi+Y358BHhetT+3qUzVP8d2od3n6hGDV6ruKmZj+CyfjGbESbm0lyetTHV1QRQlBVHCCQD9QcdcAxqvyzyUWcc3xtqWGJdfYz8IuB/Ftrt5G0gTlXKDz97G9Do2oWlNBSvQigEAAA" },
+      "/images/Freshdays/A6.jpg": { width: 1800, height: 2250, color: "#718a81", placeholder: "data:image/webp;base64,UklGRooAAABXRUJQVlA4IH4AAACQAwCdASoQABQAPxFysFAsJqSisAgBgCIJQBAAARC2wtK+rk+AAP7Dh/ZhLiZpUVWBIVNyarXVbBVuZM+0jqvdOCOlR2ZNCZbK11tW4OT/UwSSqsmTspNRqqCCXjD5eN3iRsXWv0YIJqeJWOQEfKNSNI5ySnig1glg/Z11AAA=" },
+      "/images/Freshdays/A7.jpg": { width: 1080, height: 1350, color: "#51593e", placeholder: "data:image/webp;base64,UklGRoIAAABXRUJQVlA4IHYAAAAQBACdASoQABQAPxFysFAsJqSisAgBgCIJQBOgA+napKZDxGCC+0BgAAD8zsfFucr162Hjwcv32wpmH3NtWB+exwj71fTJ9nOqAG2P8MCm3xA+dAZa6x+iNLdHPSv13bbk8JWXQ7lXmE+yLpo84Oefm3zWwAAA" },
+      "/images/Freshdays/A8.jpg": { width: 1500, height: 2000, color: "#827d6c", placeholder: "data:image/webp;base64,UklGRpQAAABXRUJQVlA4IIgAAACwAwCdASoQABUAPxFysFAsJqSisAgBgCIJQAAMNz6FbrcYWQrBwADN+lygyfZF3riZg0o5OTpg6ruXsKTTSrSaLrZxoITHm1KXYYXMnuwQcFVT7073x6QZuqb/iHvmyPLYrZl3sMZO+belf9398PDD2sKW/1p/tPDYHS1mkvtgooNP15ncbgAA" },
+      "/images/Freshdays/A9.png": { width: 1800, height: 2250, color: "#b8c8b7", placeholder: "data:image/webp;base64,UklGRk4AAABXRUJQVlA4IEIAAACwAwCdASoQABQAPxFysFAsJqSisAgBgCIJZwCdAB6uwCmpCnSsAAD+jO3vOFdZAKo6JuQ/Fm9N4eKX+7cUCDQUAAA=" },
+    },
   },
   {
     id: "popeyes",
     name: "Popeyes",
     type: "Social Media",
     description: `I handled the account of Popeyes as they were opening in KSA. Popeyes integrated right into the Saudi culture as a fun and exciting brand touching with the excited Saudi youth. Here is a sample of my work for Popeyes, many of which I myself come with everything in it from the concept, the copy, and the design.`,
-    thumbnail: "/images/Popeyes/1.png",
+    thumbnail: "/images/Popeyes/B2.jpg",
     images: [
       "/images/Popeyes/1.png",
-      "/images/Popeyes/A1.jpg",
-      "/images/Popeyes/B1.jpg",
+      "/images/Popeyes/11.png",
+      "/images/Popeyes/111.png",
       "/images/Popeyes/2.png",
-      "/images/Popeyes/A2.jpg",
-      "/images/Popeyes/B2.jpg",
+      "/images/Popeyes/22.png",
+      "/images/Popeyes/222.png",
       "/images/Popeyes/3.png",
+      "/images/Popeyes/33.png",
+      "/images/Popeyes/333.png",
+      "/images/Popeyes/A1.jpg",
+      "/images/Popeyes/A2.jpg",
       "/images/Popeyes/A3.jpg",
-      "/images/Popeyes/B3.jpg",
       "/images/Popeyes/A4.jpg",
       "/images/Popeyes/A5.jpg",
       "/images/Popeyes/A6.jpg",
-      "/images/Popeyes/11.png",
-      "/images/Popeyes/22.png",
-      "/images/Popeyes/33.png",
-      "/images/Popeyes/111.png",
-      "/images/Popeyes/222.png",
-      "/images/Popeyes/333.png",
+      "/images/Popeyes/B1.jpg",
+      "/images/Popeyes/B2.jpg",
+      "/images/Popeyes/B3.jpg",
     ],
+    hashes: {
+      "/images/Popeyes/1.png": "c022c66d",
+      "/images/Popeyes/11.png": "ecee4a93",
+      "/images/Popeyes/111.png": "fb524695",
+      "/images/Popeyes/2.png": "38c68daa",
+      "/images/Popeyes/22.png": "aecc7c53",
+      "/images/Popeyes/222.png": "ef725930",
+      "/images/Popeyes/3.png": "71d36c40",
+      "/images/Popeyes/33.png": "054d11a6",
+      "/images/Popeyes/333.png": "f1a60aac",
+      "/images/Popeyes/A1.jpg": "62163379",
+      "/images/Popeyes/A2.jpg": "2868ea71",
+      "/images/Popeyes/A3.jpg": "6af90d4d",
+      "/images/Popeyes/A4.jpg": "d1ccc558",
+      "/images/Popeyes/A5.jpg": "90d7c7cf",
+      "/images/Popeyes/A6.jpg": "718c7e39",
+      "/images/Popeyes/B1.jpg": "532699ac",
+      "/images/Popeyes/B2.jpg": "40a08ad8",
+      "/images/Popeyes/B3.jpg": "f484ce40",
+    },
+    imageMeta: {
+      "/images/Popeyes/1.png": { width: 601, height: 601, color: "#02acac", placeholder: "data:image/webp;base64,UklGRqIAAABXRUJQVlA4WAoAAAAQAAAADwAADwAAQUxQSBcAAAABF/D8/4iIgCDbZoPc/X0uENH/WCXwAwBWUDggZAAAAFACAJ0BKhAAEAAEAGglsAJ0OIAAn4Kppn8IwADriVZJ9UMfJqTJWBkCYYMkrvhnaiHni1qnySMtIiBEjUUrW1RtrFE+W73zIscElXV9Ij3vyKI2Mxt/t59cY0UvrO/8Ww5m0AA=" },
+      "/images/Popeyes/11.png": { width: 601, height: 601, color: "#02aba2", placeholder: "data:image/webp;base64,UklGRpIAAABXRUJQVlA4WAoAAAAQAAAADwAADwAAQUxQSBcAAAABF/D8/4iIgCDbZoPc/X0uENH/WCXwAwBWUDggVAAAANABAJ0BKhAAEAAEAGglsAJ0AO4gw4LAAOlNm6oAT9OnpF2yho35LQ/SkGX2X6cF96e77bM6CtqhnCb8K0VU9DGjxzan/i0P7eYafx7DmBE0nk4AAA==" },
+      "/images/Popeyes/111.png": { width: 601, height: 601, color: "#740369", placeholder: "data:image/webp;base64,UklGRooAAABXRUJQVlA4WAoAAAAQAAAADwAADwAAQUxQSBcAAAABF/D8/4iIgCDbZoPc/X0uENH/WCXwAwBWUDggTAAAAPABAJ0BKhAAEAAEAGglqAJ0AQ3RTwqrgAD+7ofKDp9AynycoV/FrOKA4aBDK41Pz32L/9JxizOU0JOJaRdWrN2qa0/bzzW7DwAAAAA=" },
+      "/images/Popeyes/2.png": { width: 601, height: 601, color: "#02a4a4", placeholder: "data:image/webp;base64,UklGRqIAAABXRUJQVlA4WAoAAAAQAAAADwAADwAAQUxQSBAAAAABD/D8/4iIMP8R/Y8BAAAAVlA4IGwAAAAwAgCdASoQABAABABoJbACdAECvENhM6FIAADpBOj445Qw0qIwKJHgayS2cOOYV/5G9eLNw3MzE0SDjdFVlYiTgumgCaP4qiiSujoLDdWi/Vv6fSKv/hoRIv/COQBEFPBwU+GK9RTN8WAAAAA=" },
+      "/images/Popeyes/22.png": { width: 601, height: 601, color: "#03a29a", placeholder: "data:image/webp;base64,UklGRp4AAABXRUJQVlA4WAoAAAAQAAAADwAADwAAQUxQSBAAAAABD/D8/4iIMP8R/Y8BAAAAVlA4IGgAAADwAQCdASoQABAABABoJbACdAEUaVttbDgA+oT6LIFFmYT3nBdC2JvG42oGqZqog0tTHGY96YeBwlwROKtQfQUBnwSToPd4+AB0xGyNlAoIK8YzQR3/wrX7RuV50/d8f6r4pb73tHr8AA==" },
+      "/images/Popeyes/222.png": { width: 601, height: 601, color: "#e86605", placeholder: "data:image/webp;base64,UklGRqIAAABXRUJQVlA4WAoAAAAQAAAADwAADwAAQUxQSBAAAAABD/D8/4iIMP8R/Y8BAAAAVlA4IGwAAAAwAgCdASoQABAABABoJbACdLoAEJMUCxI8AAB8Ao5sjXlkft6qE0pwJGjYiZ8EHug98FVBIugLfGIbEtMWDoRu/CKSrRrmSVOjcAbCXkF//sS3yP11QAzMttOuMrz+4KY2E1MiKmC/eCo4AAA=" },
+      "/images/Popeyes/3.png": { width: 601, height: 601, color: "#069896", placeholder: "data:image/webp;base64,UklGRpAAAABXRUJQVlA4WAoAAAAQAAAADwAADwAAQUxQSBAAAAABD/D8/4iIMP8R/Y8BAAAAVlA4IFoAAAAQAgCdASoQABAABABoJbACdAEOUWd947eAAP0Rszi+EJdCOcGdbwjutd/yD6ttw7f7s2LgmSgAxiwjjvN3x2Vdjt8Dr3dKbmxv/tPzP0jxukXM71vW8lGfRAA=" },
+      "/images/Popeyes/33.png": { width: 601, height: 601, color: "#cd4f35", placeholder: "data:image/webp;base64,UklGRooAAABXRUJQVlA4WAoAAAAQAAAADwAADwAAQUxQSBAAAAABD/D8/4iIMP8R/Y8BAAAAVlA4IFQAAAAQAgCdASoQABAABABoJbACdADHlGWXZPKAAP0fiLKQsAiqg+5MkSyqZTuvCTHEUMwaMywo2+8I00XMdJNeE765hrYOz/gPxBKRsXl3pEiEz/XsAAA=" },
+      "/images/Popeyes/333.png": { width: 601, height: 601, color: "#02aba2", placeholder: "data:image/webp;base64,UklGRpIAAABXRUJQVlA4WAoAAAAQAAAADwAADwAAQUxQSBAAAAABD/D8/4iIMP8R/Y8BAAAAVlA4IFwAAACwAQCdASoQABAABABoJbACdAEUecUAAPnIktc+UbH3RZBWOqTExABG+hMZloZMkzPjO3ofv9qSZ4lWEpSex/nvrBu93hFSL+mHMryJVGB3+IBf2L4yeBWt+eCwAA==" },
+      "/images/Popeyes/A1.jpg": { width: 1080, height: 1080, color: "#f87b14", placeholder: "data:image/webp;base64,UklGRl4AAABXRUJQVlA4IFIAAABwAgCdASoQABAABABoJbACdLoA4wAGlxEwNs0AAPxaovcrkD2mvy6N7ujjQxHMO5xwUXf/+0ZzTu5Iy+ekupImDSl/Ynx6cOJy6vOADApj0ZgA" },
+      "/images/Popeyes/A2.jpg": { width: 1080, height: 1080, color: "#09b2a7", placeholder: "data:image/webp;base64,UklGRlwAAABXRUJQVlA4IFAAAACQAQCdASoQABAABABoJbACdABxaAAAiScPsCyEL7LIV+Aq7QN5NVCXGVos7nH06iEOwqMwZbu0z2QcAXX/8XH39aGirw4gFyo2ojY6FAAAAA==" },
+      "/images/Popeyes/A3.jpg": { width: 1080, height: 1080, color: "#f48d2b", placeholder: "data:image/webp;base64,UklGRlIAAABXRUJQVlA4IEYAAAAQAgCdASoQABAABABoJbACdLoAAVidH0QAAPxcn/lEaEf+XpoPuJ94GQmUz4l1qA/+LQ60IhjRIlKnV/cGZ1W83qoqOAAA" },
+      "/images/Popeyes/A4.jpg": { width: 1080, height: 1080, color: "#a34691", placeholder: "data:image/webp;base64,UklGRmwAAABXRUJQVlA4IGAAAADQAQCdASoQABAABABoJbACdADsisws8AD+v8M8udJaATrE0QOryxWE5dHiDWFTrj4SK1EQ3GbrbTlA0AqpsX5jMJf8F3xk2tsb6M4J0JEifAfyFby+YJmeoAOrXklgAAA=" },
+      "/images/Popeyes/A5.jpg": { width: 1080, height: 1080, color: "#fa7e0b", placeholder: "data:image/webp;base64,UklGRlQAAABXRUJQVlA4IEgAAABQAgCdASoQABAABABoJbACdLoB+AACeuwx1xgA1H/VGr0ujOCBA31cTJaOs1Qmn+kA2qn/uhmw0znGOmkP/ghSAc+ihMlkHAA=" },
+      "/images/Popeyes/A6.jpg": { width: 764, height: 1080, color: "#f58724", placeholder: "data:image/webp;base64,UklGRpoAAABXRUJQVlA4II4AAACQBACdASoQABcAPxFysFAsJqSisAgBgCIJbACdMoRwN6AAUEv9KuVpOLWl0PAA9x8Yae8Wn/j7MBRTnWHMd0vMw0//xhF9lOBM/0mgZXx2htxPkg/UZbPvnme3tp4JR9aST7LGNqkndtvyjtG/V1LVazD/P/Pqx+DlgojzHX/zRF89XTC8w3zWccH/ZIAA" },
+      "/images/Popeyes/B1.jpg": { width: 1080, height: 1080, color: "#2c221d", placeholder: "data:image/webp;base64,UklGRnQAAABXRUJQVlA4IGgAAADQAQCdASoQABAABABoJbACdADY2GREAAD+5E9Av9vmNHBJm0rz8ehJV4PLSE3h6oVXZemYJ6SpLiSxlt9y7dT/vDPAkH70QiTVv1HRQrnHRQrmcy5HFJKpYrun07PqB5ipzcuqkUAAAA==" },
+      "/images/Popeyes/B2.jpg": { width: 1080, height: 1080, color: "#8f4427", placeholder: "data:image/webp;base64,UklGRoIAAABXRUJQVlA4IHYAAAAwAgCdASoQABAABABoJbACdAYvDgfZR3dLEAD+rQE3ucJKESJp+FqbXPawb70O2NN1A5u99VJicGiiu5GDvBkskWJi8cCZvgnp7Uc10T8Pxm061F4Sac5o//pOTIedJoRvo4hSVF2m7qQ4HwN1j5mzEHsxaEAA" },
+      "/images/Popeyes/B3.jpg": { width: 1080, height: 1080, color: "#4c4a41", placeholder: "data:image/webp;base64,UklGRm4AAABXRUJQVlA4IGIAAAAwAgCdASoQABAABABoJZQAD45OyBy0MfjJMAD+79p71ysx74y1DRcIPrNyQPbOhvt7UjoS+1dVdezPs8og5BK66NZKTiCroYxGP3zUz/JeNB/+RS/s+aynUImcbY00CyhwAA==" },
+    },
   },
   {
     id: "gipsy",
     name: "Gipsy",
     type: "Social Media + AI Reels",
     description: `Created high-energy social media content and AI reels for Gipsy, aligning with their bold brand identity.`,
-    thumbnail: "/images/Gipsy/A1.png",
+    thumbnail: "/images/Gipsy/B3.png",
     images: [
       "/images/Gipsy/A1.png",
-      "/images/Gipsy/B1.png",
-      "/images/Gipsy/C1.jpg",
       "/images/Gipsy/A2.png",
-      "/images/Gipsy/B2.png",
       "/images/Gipsy/A3.png",
-      "/images/Gipsy/B3.png",
       "/images/Gipsy/A4.png",
+      "/images/Gipsy/B1.png",
+      "/images/Gipsy/B2.png",
+      "/images/Gipsy/B3.png",
       "/images/Gipsy/B4.png",
+      "/images/Gipsy/C1.jpg",
     ],
-    videos: [
-      "/images/Gipsy/R1.MOV",
-      "/images/Gipsy/R2.mp4",
-    ],
+    hashes: {
+      "/images/Gipsy/A1.png": "e68b22bc",
+      "/images/Gipsy/A2.png": "3402d3be",
+      "/images/Gipsy/A3.png": "5408286b",
+      "/images/Gipsy/A4.png": "ca8a59b8",
+      "/images/Gipsy/B1.png": "9308caac",
+      "/images/Gipsy/B2.png": "d2e6fe5b",
+      "/images/Gipsy/B3.png": "d2ef1247",
+      "/images/Gipsy/B4.png": "e7a30f96",
+      "/images/Gipsy/C1.jpg": "7e844c0a",
+    },
+    imageMeta: {
+      "/images/Gipsy/A1.png": { width: 1080, height: 1350, color: "#0a261b", placeholder: "data:image/webp;base64,UklGRoIAAABXRUJQVlA4IHYAAACQAwCdASoQABQAPxFysFAsJqSisAgBgCIJbACsMoAC5bw3dQ9AAP7o7+rj4/Z0zFuy6cR5GIAikR2/PKRsCTPdOzgP1ST/uCINQwm7lbrNPZZqV6SeAgKIj9HQtsOHruax2PvZXJYRpnkEoWjebCMi8qcyAAAA" },
+      "/images/Gipsy/A2.png": { width: 1080, height: 1350, color: "#3f6241", placeholder: "data:image/webp;base64,UklGRnIAAABXRUJQVlA4IGYAAABwBACdASoQABQAPxFysVCsJqSisAgBgCIJbACdMoAC8c3SfDr6Kxj94zq0AADrcds4MSCwdek6djN6PJ2sRwbbcp+Pwvy/KHPO61FwBybMJ9SCPrZHG6hTJYSH1b+K3Dth2RAwAAA=" },
+      "/images/Gipsy/A3.png": { width: 1080, height: 1350, color: "#486347", placeholder: "data:image/webp;base64,UklGRm4AAABXRUJQVlA4IGIAAACQAwCdASoQABQAPxFysVAsJqSisAgBgCIJbACdABB5phD6ak0AANYb4Yf/9nuhBNm1spRKHPD1R3cZ+B2HyEKzqwWcV/2T2rreylkUtk5j12+pAlj3xs8V3PcfHj/vdddAAA==" },
+      "/images/Gipsy/A4.png": { width: 1080, height: 1350, color: "#56a673", placeholder: "data:image/webp;base64,UklGRoYAAABXRUJQVlA4IHoAAADwAwCdASoQABQAPxFysFAsJqSisAgBgCIJbACdMoABo8Fuz9UW0dYAANX4TIYQfPDhwGso0sakyVNQdTYEP4qhBCptC6Kc4ESpBKeEZdFtnyQjsvZcDsFLiRttlEa5CkNOEXsyglRYNqI/sDlX0gWlRnN5nbSXsCFAAA==" },
+      "/images/Gipsy/B1.png": { width: 1080, height: 1350, color: "#399362", placeholder: "data:image/webp;base64,UklGRnAAAABXRUJQVlA4IGQAAACQAwCdASoQABQAPxFysFAsJqSisAgBgCIJbACdMoABX+zQtPfwAF8aVQcdUeT3WAvif9wgWtwYGZOKCcdTFOch2oxqxYk5zRb7Ex0FK8l+anbg6Sgvr2zM26eZUQ7OCn6oAAAA" },
+      "/images/Gipsy/B2.png": { width: 1080, height: 1350, color: "#4773d8", placeholder: "data:image/webp;base64,UklGRmYAAABXRUJQVlA4IFoAAADQAwCdASoQABQAPxFysFAsJqSisAgBgCIJagCdLwABmRMyTocJdYAA7pNO1NL68UWZAqF+Lg9yZSFiPk262+nABgB/Yuia6782vVntp9bom9Ld8rGEdaZ5EAA=" },
+      "/images/Gipsy/B3.png": { width: 1080, height: 1350, color: "#de372a", placeholder: "data:image/webp;base64,UklGRnAAAABXRUJQVlA4IGQAAACwAwCdASoQABQAPxFysFAsJqSisAgBgCIJbAC7ABPGbjcfQlP6cABbg2rk5KXiw557U+zh1H4jf8SmQIMuBMejjd7UaM+nFHT0YvMcrxnPE7d84hZVdtfqdGcpiwnJ/+VEAAAA" },
+      "/images/Gipsy/B4.png": { width: 1080, height: 1350, color: "#3c8c60", placeholder: "data:image/webp;base64,UklGRngAAABXRUJQVlA4IGwAAADQAwCdASoQABQAPxFysFAsJqSisAgBgCIJZgCdAYsEmm3F0Ku0IAAAx7Ia44obVZQxBs+RzkKV/aw/gEK0ke646N6VTxFAtSimGQaIKBFt9KJztJmj6OAzYBI2FY6zl3JkYpr9IFJUbNxdgAA=" },
+      "/images/Gipsy/C1.jpg": { width: 1080, height: 1350, color: "#7c614d", placeholder: "data:image/webp;base64,UklGRoYAAABXRUJQVlA4IHoAAAAQBACdASoQABQAPxFwsFAsJiSisAgBgCIJZgCw7B4bX49YwluUWtm7LAD+09tfLACL3PDIn2gbBPPul3nb5rUfBt2oAa+1XA9nrCD2VehZyYZtV/lZ++HOYkI6hxiLLgx7IOUJed1yadgPo5FrNKtLcerjQKyz6K4AAA==" },
+    },
   },
   {
     id: "handy",
     name: "Handy",
     type: "Social Media + AI Reels",
     description: `Managed social media visuals and AI reels for Handy, ensuring a clean and professional aesthetic.`,
-    thumbnail: "/images/Handy/A1.png",
+    thumbnail: "/images/Handy/A3.png",
     images: [
       "/images/Handy/A1.png",
       "/images/Handy/A2.png",
@@ -276,155 +626,347 @@ export const projects = [
       "/images/Handy/A5.jpg",
       "/images/Handy/A6.jpg",
     ],
-    videos: [
-      "/images/Handy/R1.mp4",
-    ],
+    hashes: {
+      "/images/Handy/A1.png": "7714da0c",
+      "/images/Handy/A2.png": "81369059",
+      "/images/Handy/A3.png": "b612013c",
+      "/images/Handy/A4.png": "130b1d03",
+      "/images/Handy/A5.jpg": "e66efe1f",
+      "/images/Handy/A6.jpg": "ff68b870",
+    },
+    imageMeta: {
+      "/images/Handy/A1.png": { width: 1080, height: 1350, color: "#5a4b40", placeholder: "data:image/webp;base64,UklGRoAAAABXRUJQVlA4IHQAAAAQBACdASoQABQAPxFysFAsJqSisAgBgCIJYwCw7B4mjLt6PDRMCnwtcAD+3NSm8Vktpfqc7W/W8Wl5YOWEnRPQtb2CF/dIPxnZp0Q4YhGN89Z4liL5hYYP8hbH/ArJJocKnaAjKS63CKygwUp3TOHlSSwAAA==" },
+      "/images/Handy/A2.png": { width: 1080, height: 1350, color: "#b1a291", placeholder: "data:image/webp;base64,UklGRloAAABXRUJQVlA4IE4AAADQAwCdASoQABQAPxF0slCsJqSisAgBgCIJZQC06CG/NXU3bhoHDMAA/sO/zY6hvd1r1l2ATVOHgEUVzy5M8s2aLxrVaGeniXzcY4lkAAA=" },
+      "/images/Handy/A3.png": { width: 1080, height: 1350, color: "#233010", placeholder: "data:image/webp;base64,UklGRnwAAABXRUJQVlA4IHAAAACwAwCdASoQABQAPxFysFAsJqSisAgBgCIJbAC7LwABGjbVrAn3wAD+dt8YZxvApMyE1foxhpQ++2DDP4BLg1nVK0rq8Ee4z+DAAVhVOCbzldac7/vymGwh68oy8D2Ib9PyrtxVQgreNlgVt2U41oAA" },
+      "/images/Handy/A4.png": { width: 1080, height: 1350, color: "#846953", placeholder: "data:image/webp;base64,UklGRoQAAABXRUJQVlA4IHgAAADQAwCdASoQABQAPxFwsFAsJiSisAgBgCIJaACdACKjxsypf1F8lbAA/s4B0XWfaWGsP5mXxSil7v4uNsrIzQfhjKoDRBcp9OZMdKWSHEdxJRrJZW2Z3/27fAOC/JPMdhPq/xSbC2AohThJ5TuRML5uOmWg9S4AAAA=" },
+      "/images/Handy/A5.jpg": { width: 1080, height: 1350, color: "#a39a8b", placeholder: "data:image/webp;base64,UklGRmYAAABXRUJQVlA4IFoAAAAQBACdASoQABQAPxFysFAsJqSisAgBgCIJaAAAV6b/FCJVJjOYtCDMGAD+jG9JKUeY8qqK/9YcSndwiTk4RX+NWvx/32ss+5C97M/XX5YvJ2EomZPncglUgAA=" },
+      "/images/Handy/A6.jpg": { width: 1080, height: 1920, color: "#183c67", placeholder: "data:image/webp;base64,UklGRowAAABXRUJQVlA4IIAAAABwBACdASoQABwAPxF0sFCsJqSisAgBgCIJaACdMoAKRtWHPcQvGa08y6p2AAD++uzTjPAUNhj9IZLJ1YgmWq68dSNfIY8y6ytskU93gLyZd0Td6N79vLENRkgIBXaUHzOqfx5AduER7F4cWnAS//+phjIcggh2eyrprin4J8uoAA==" },
+    },
   },
   {
     id: "ash",
     name: "ASH",
     type: "Social Media",
     description: `ASH Vodka is a Lebanese Vodka Brand that is bold, young, elegant and proud.`,
-    thumbnail: "/images/ASH/ASH%201.jpg",
+    thumbnail: "/images/ASH/ASH 4.jpg",
     images: [
-      "/images/ASH/ASH%201.jpg",
-      "/images/ASH/ASH%202.jpg",
-      "/images/ASH/ASH%203.jpg",
-      "/images/ASH/ASH%204.jpg",
-      "/images/ASH/ASH%205.jpg",
-      "/images/ASH/ASH%206.jpg",
+      "/images/ASH/ASH 1.jpg",
+      "/images/ASH/ASH 2.jpg",
+      "/images/ASH/ASH 3.jpg",
+      "/images/ASH/ASH 4.jpg",
+      "/images/ASH/ASH 5.jpg",
+      "/images/ASH/ASH 6.jpg",
     ],
+    hashes: {
+      "/images/ASH/ASH 1.jpg": "9673e31b",
+      "/images/ASH/ASH 2.jpg": "0c9d1340",
+      "/images/ASH/ASH 3.jpg": "d8693166",
+      "/images/ASH/ASH 4.jpg": "30a33791",
+      "/images/ASH/ASH 5.jpg": "161bf562",
+      "/images/ASH/ASH 6.jpg": "cfec631b",
+    },
+    imageMeta: {
+      "/images/ASH/ASH 1.jpg": { width: 1080, height: 1350, color: "#010c15", placeholder: "data:image/webp;base64,UklGRmoAAABXRUJQVlA4IF4AAACQAwCdASoQABQAPxFysFAsJqSisAgBgCIJQBOmUABp0BjC8fAgAPyy2PycAj1ZZf024zY+cOw+zJ0U5uA4ATM+dLOjHiYFj4NAbsL9Cb+t9+tVvgBubIg2hnsY7oAA" },
+      "/images/ASH/ASH 2.jpg": { width: 1080, height: 1350, color: "#182826", placeholder: "data:image/webp;base64,UklGRoQAAABXRUJQVlA4IHgAAAAwBACdASoQABQAPxFysFAsJqSisAgBgCIJYgC072pQNciuy+JgEn7NJLAA/uxI2DraL/nv9VPZFF1jMcPk4kCeryS6j8JqJ0bhvQ8HEjo7v8P5d1zeTlqarQssLO2ygI4FfzCOsvpekXxR7nfuiRAa/ZyE474f0AA=" },
+      "/images/ASH/ASH 3.jpg": { width: 1080, height: 1350, color: "#0d0705", placeholder: "data:image/webp;base64,UklGRoQAAABXRUJQVlA4IHgAAAAQBACdASoQABQAPxFysFAsJqSisAgBgCIJQBadBDvg8SJxUvwpyjKFgAD+6SMIxLANHjFRvIw71EQBLllcf25MX2tbf9jyihhXGNrZ5CfIUZTrkF3JUfC/V65Sik+evO570hVZ4oMu3a1QbX8KCtFnrkGZf/QAAAA=" },
+      "/images/ASH/ASH 4.jpg": { width: 1080, height: 1350, color: "#404471", placeholder: "data:image/webp;base64,UklGRnoAAABXRUJQVlA4IG4AAADwAwCdASoQABQAPxFysFAsJqSisAgBgCIJagC7ACLvsJl8sL+oIbUAAP7oJ6nePGQRmdfGXklIqKjHiACxZo1J4b5KuN4sngW649PcNLjyGUiDE5Qq/VZUdxMCgr5cdAtXsUmWTVJgM0V94wDYAA==" },
+      "/images/ASH/ASH 5.jpg": { width: 1080, height: 1350, color: "#2a2a2f", placeholder: "data:image/webp;base64,UklGRmIAAABXRUJQVlA4IFYAAADQAwCdASoQABQAPxFysFAsJqSisAgBgCIJQAAKVjYFINj0Oium6BAA/ujvrPyZPNib5KUdEAx3ScfI/WRmHwGZREmMyr4+NYq97vKonwJYJQ1TjAAAAA==" },
+      "/images/ASH/ASH 6.jpg": { width: 1080, height: 1350, color: "#0c1112", placeholder: "data:image/webp;base64,UklGRoYAAABXRUJQVlA4IHoAAABQAwCdASoQABQAPxFysFAsJqSisAgBgCIJQAAHQzyRmsiIAAD+7IJuFeEbyV3+aaKEHBe+aGTHzuXBe3y+i/nXt/8Drwe/YiEEXSWHPrQzlc/h0/wgjZqwAphL5llfRryCll2oZAsAS+zZzSpH8H1vXkHMG66Jok7AAA==" },
+    },
   },
   {
     id: "la-roche",
     name: "La Roche",
     type: "Social Media",
     description: `Adapted a dreamy visual style with the products being the main element in the brand.`,
-    thumbnail: "/images/La%20Roche/A%20ball%20of%20harmony.jpg",
+    thumbnail: "/images/La Roche/طعــــــمتها ما بتنتسى.jpg",
     images: [
-      "/images/La%20Roche/A%20ball%20of%20harmony.jpg",
-      "/images/La%20Roche/A%20crunch%20you%20can%20feel.jpg",
-      "/images/La%20Roche/Almond%20your%20dreams%20come%20true!.jpg",
-      "/images/La%20Roche/Charge%20with%20la%20roche.jpg",
-      "/images/La%20Roche/Crack%20open%20a%20smile!.jpg",
-      "/images/La%20Roche/eid%20adha.jpg",
-      "/images/La%20Roche/Feel%20Walnut%2C%20feel%20good!.jpg",
-      "/images/La%20Roche/Malban.png",
-      "/images/La%20Roche/Snowy%20Cocoa.png",
-      "/images/La%20Roche/Sweet%20Reflections.jpg",
-      "/images/La%20Roche/Your%20Piece%20My%20Piece.jpg",
-      "/images/La%20Roche/%D8%B7%D8%B9%D9%85%20%D8%A7%D9%84%D8%B0%D9%83%D8%B1%D9%8A%D8%A7%D8%AA%20%D8%A7%D9%84%D8%AD%D9%84%D9%88%D8%A9.jpg",
-      "/images/La%20Roche/%D8%B7%D8%B9%D9%80%D9%80%D9%80%D9%80%D9%80%D9%80%D9%85%D8%AA%D9%87%D8%A7%20%D9%85%D8%A7%20%D8%A8%D8%AA%D9%86%D8%AA%D8%B3%D9%89.jpg",
-      "/images/La%20Roche/%D9%82%D8%B5%D8%A9%20%D8%AD%D8%A8%20%D9%85%D8%B9%20%D8%A7%D9%84%D9%81%D8%B3%D8%AA%D9%82.jpg",
-      "/images/La%20Roche/%D9%84%D8%B0%D9%8A%D8%B0%20%D8%AD%D9%84%D9%88%20%D8%AE%D9%81%D9%8A%D9%81.jpg",
-      "/images/La%20Roche/%D9%88%D9%82%D9%81%D9%87%20%D8%AD%D9%84%D9%88%D9%87.jpg",
-      "/images/La%20Roche/pistachio%20knafeh%20chocolate%20bar%201.jpg",
+      "/images/La Roche/A ball of harmony.jpg",
+      "/images/La Roche/A crunch you can feel.jpg",
+      "/images/La Roche/Almond your dreams come true!.jpg",
+      "/images/La Roche/Charge with la roche.jpg",
+      "/images/La Roche/Crack open a smile!.jpg",
+      "/images/La Roche/Feel Walnut, feel good!.jpg",
+      "/images/La Roche/Malban.png",
+      "/images/La Roche/Snowy Cocoa.png",
+      "/images/La Roche/Sweet Reflections.jpg",
+      "/images/La Roche/Your Piece My Piece.jpg",
+      "/images/La Roche/eid adha.jpg",
+      "/images/La Roche/pistachio knafeh chocolate bar 1.jpg",
+      "/images/La Roche/طعــــــمتها ما بتنتسى.jpg",
+      "/images/La Roche/طعم الذكريات الحلوة.jpg",
+      "/images/La Roche/قصة حب مع الفستق.jpg",
+      "/images/La Roche/لذيذ حلو خفيف.jpg",
+      "/images/La Roche/وقفه حلوه.jpg",
     ],
+    hashes: {
+      "/images/La Roche/A ball of harmony.jpg": "04bb00b6",
+      "/images/La Roche/A crunch you can feel.jpg": "78f65b1e",
+      "/images/La Roche/Almond your dreams come true!.jpg": "7cd326cb",
+      "/images/La Roche/Charge with la roche.jpg": "0c6eeadd",
+      "/images/La Roche/Crack open a smile!.jpg": "27678251",
+      "/images/La Roche/Feel Walnut, feel good!.jpg": "a3001f6c",
+      "/images/La Roche/Malban.png": "a22a9648",
+      "/images/La Roche/Snowy Cocoa.png": "434a4953",
+      "/images/La Roche/Sweet Reflections.jpg": "3b131947",
+      "/images/La Roche/Your Piece My Piece.jpg": "f46a4892",
+      "/images/La Roche/eid adha.jpg": "41595f5a",
+      "/images/La Roche/pistachio knafeh chocolate bar 1.jpg": "419f1851",
+      "/images/La Roche/طعــــــمتها ما بتنتسى.jpg": "98bc4716",
+      "/images/La Roche/طعم الذكريات الحلوة.jpg": "2b42eb64",
+      "/images/La Roche/قصة حب مع الفستق.jpg": "74e8cb1a",
+      "/images/La Roche/لذيذ حلو خفيف.jpg": "9408c862",
+      "/images/La Roche/وقفه حلوه.jpg": "d1c41302",
+    },
+    imageMeta: {
+      "/images/La Roche/A ball of harmony.jpg": { width: 1080, height: 1350, color: "#938792", placeholder: "data:image/webp;base64,UklGRkwAAABXRUJQVlA4IEAAAACQAwCdASoQABQAPxFysFAsJqSisAgBgCIJZQC2yBR758vKIigAAMKrl3eIUBF82jPhIKT52jKN+VBXQIRPgAAA" },
+      "/images/La Roche/A crunch you can feel.jpg": { width: 1080, height: 1350, color: "#5b4163", placeholder: "data:image/webp;base64,UklGRmQAAABXRUJQVlA4IFgAAADwAwCdASoQABQAPxFwsFAsJiSisAgBgCIJZgCdMoADTpqRw/T+rPvAAP5woffmJJUjZv4dNLSp1Z+Qr71pouHvRdI4sK5UgJk2RGaGh7XCtkj9fN4gAAAA" },
+      "/images/La Roche/Almond your dreams come true!.jpg": { width: 1080, height: 1350, color: "#cdb6dd", placeholder: "data:image/webp;base64,UklGRmIAAABXRUJQVlA4IFYAAAAQBACdASoQABQAPxFysVAsJqSisAgBgCIJaAC7MoADKqlEmPFDCA8ECAD+w/3BM8Ob3iL3cpgqFjGGCV4ZEFFiFzBdO8RLkHOq8poyTwYBm40pFxiQAA==" },
+      "/images/La Roche/Charge with la roche.jpg": { width: 1080, height: 1350, color: "#7c4b30", placeholder: "data:image/webp;base64,UklGRloAAABXRUJQVlA4IE4AAAAwAwCdASoQABQAPxFwsFAsJiSisAgBgCIJSvPgBuPozpagAP7emJh958ACh2lrLLkifOsXZiZQ+5vByu/gy22KiJ6YLbWBvfIVEAAAAAA=" },
+      "/images/La Roche/Crack open a smile!.jpg": { width: 1080, height: 1350, color: "#543d59", placeholder: "data:image/webp;base64,UklGRogAAABXRUJQVlA4IHwAAADQAwCdASoQABQAPxFysFAsJqSisAgBgCIJQBYdhCxxZTWbCyMJFQAA/nDo262Ch7hOXMtVWV/JYTo+jAldsAaEZhQW82y8d+/6kvQEmYM1ZR3qrSAx8u7KFuWXDkC8fuq8/IXmMAOblPHrNEPlIeDtEMIhrJCY3/ZAOsgA" },
+      "/images/La Roche/Feel Walnut, feel good!.jpg": { width: 1080, height: 1350, color: "#5f4468", placeholder: "data:image/webp;base64,UklGRkgAAABXRUJQVlA4IDwAAADwAgCdASoQABQAPxFysFAsJqSisAgBgCIJQBOmUACNQAD+4xN03kMC3/VRjrDtXoKepHpJb9Lp8FPwAAA=" },
+      "/images/La Roche/Malban.png": { width: 1080, height: 1350, color: "#e8d1f6", placeholder: "data:image/webp;base64,UklGRmYAAABXRUJQVlA4IFoAAABwBACdASoQABQAPxFysFAsJqSisAgBgCIJbACdMoMYAEmhlK+UxSeQaBnDAAD+3snBHmN3e5CdJbR5legBr4kw568lWLjZhO8ve/gaUptFXOo1PHIjo28AAAA=" },
+      "/images/La Roche/Snowy Cocoa.png": { width: 1080, height: 1350, color: "#d7c8af", placeholder: "data:image/webp;base64,UklGRm4AAABXRUJQVlA4IGIAAABwBACdASoQABQAPxFwsFAsJiSisAgBgCIJYgCdMoMlxS2AtS13M60aRHC3wAD3Jxwj4WmTH4oFnrwGOzoZ4DipNetiT2vBFMvfqGDxcMXs5yVZV9KGlbXRYtzjhdjLsMAAAA==" },
+      "/images/La Roche/Sweet Reflections.jpg": { width: 1080, height: 1350, color: "#a895d2", placeholder: "data:image/webp;base64,UklGRnAAAABXRUJQVlA4IGQAAACwAwCdASoQABQAPxFysFAsJqSisAgBgCIJYgAAWkN5aVQSMralYAD4UUj0p3BhYsIt7OWlBfBL5GtmpgPsCD+AgP6rJifdrtYdSWIe1wShxruigyzQb2szCbBkYo05soEAbYAA" },
+      "/images/La Roche/Your Piece My Piece.jpg": { width: 1080, height: 1350, color: "#543d59", placeholder: "data:image/webp;base64,UklGRk4AAABXRUJQVlA4IEIAAACwAwCdASoQABQAPxFysFAsJqSisAgBgCIJYwCo9CHf3omMe0JeAAD+b0NBH2Rruh6eDNYJa0BqsisgzyH5uzEUAAA=" },
+      "/images/La Roche/eid adha.jpg": { width: 1080, height: 1350, color: "#c2b7d9", placeholder: "data:image/webp;base64,UklGRlAAAABXRUJQVlA4IEQAAACwAwCdASoQABQAPxFysFAsJqSisAgBgCIJQBdgBCokj+fn0DGUAAD+03U1iV3GgjIXcojogFbQVe7+i9OYXUB5eXgAAA==" },
+      "/images/La Roche/pistachio knafeh chocolate bar 1.jpg": { width: 1080, height: 1350, color: "#d2a26b", placeholder: "data:image/webp;base64,UklGRl4AAABXRUJQVlA4IFIAAADwAwCdASoQABQAPxFysFAsJqSisAgBgCIJaACdMoR3ACqec2jdv6AAAP3SnpTghOcHz1jWcO2YbHsCTBpQfMQH0yMbwVEWP+f6bChSNOEfBAAA" },
+      "/images/La Roche/طعــــــمتها ما بتنتسى.jpg": { width: 1080, height: 1350, color: "#efa4c0", placeholder: "data:image/webp;base64,UklGRoAAAABXRUJQVlA4IHQAAADwAwCdASoQABQAPxFysFAsJqSisAgBgCIJbACdAB5/vrXjsufb2kQAAP7IVcJMMnk/99N/EjEZiEAEG9k3dcJa5gBwTVpNpU+UdpyOLt5nqsYx1eNjCWvYzNKKeqQeeqv1+FEZXLvwDAiVy+rh/3aj04AAAA==" },
+      "/images/La Roche/طعم الذكريات الحلوة.jpg": { width: 1080, height: 1350, color: "#eab6c5", placeholder: "data:image/webp;base64,UklGRlgAAABXRUJQVlA4IEwAAACQAwCdASoQABQAPxFysFAsJqSisAgBgCIJZgCdACHEgOpa+RzAAP7THZ9cmAXofrMij3xt9mT2qJmFMwecq4cA6vhujLz8r2otcAAA" },
+      "/images/La Roche/قصة حب مع الفستق.jpg": { width: 1080, height: 1350, color: "#baaad3", placeholder: "data:image/webp;base64,UklGRmIAAABXRUJQVlA4IFYAAADwAwCdASoQABQAPxFysFAsJqSisAgBgCIJZgCdACHfw6Nbx9jsYn2gAP5SqeF1GPJ6RV3VPScSExxz3UNNLu+OpJzlawoLBlKyyPB7OJM3scDY5wAAAA==" },
+      "/images/La Roche/لذيذ حلو خفيف.jpg": { width: 1080, height: 1350, color: "#c6b4db", placeholder: "data:image/webp;base64,UklGRlAAAABXRUJQVlA4IEQAAACQAwCdASoQABQAPxFysFAsJqSisAgBgCIJQBOgBDwPRawvOGqAAP6uWOZrKiiuNfdgf2pYhushyhmWPh090fiqoFSqAA==" },
+      "/images/La Roche/وقفه حلوه.jpg": { width: 1080, height: 1350, color: "#cbc4cb", placeholder: "data:image/webp;base64,UklGRmgAAABXRUJQVlA4IFwAAAAwBACdASoQABQAPxFysFAsJqSisAgBgCIJZACsAB8m89u5nUekFixB32AAn0DEusofc+nCNpP0Gox/el93Z9AARx5/CDFz9x3xgv1RmhecSof4ASRKJ3as0NqAAA==" },
+    },
   },
   {
     id: "aalaqaat",
     name: "Aalaqaat",
     type: "Social Media + Branding",
     description: `I designed the core identity of Alaqaat, a Saudi law firm looking to position itself as a market-leading trustable partner.`,
-    thumbnail: "/images/Aalaqaat/Artboard%201.png",
+    thumbnail: "/images/Aalaqaat/Artboard 5.png",
     images: [
-      "/images/Aalaqaat/Artboard%201.png",
-      "/images/Aalaqaat/Artboard%202.png",
-      "/images/Aalaqaat/Artboard%203.png",
-      "/images/Aalaqaat/Artboard%204.png",
-      "/images/Aalaqaat/Artboard%205.png",
-      "/images/Aalaqaat/Artboard%206.png",
-      "/images/Aalaqaat/Artboard%207.jpg",
-      "/images/Aalaqaat/Artboard%208.png",
-      "/images/Aalaqaat/Artboard%209.png",
-      "/images/Aalaqaat/Artboard%2010.png",
+      "/images/Aalaqaat/Artboard 1.png",
+      "/images/Aalaqaat/Artboard 10.png",
+      "/images/Aalaqaat/Artboard 2.png",
+      "/images/Aalaqaat/Artboard 3.png",
+      "/images/Aalaqaat/Artboard 4.png",
+      "/images/Aalaqaat/Artboard 5.png",
+      "/images/Aalaqaat/Artboard 6.png",
+      "/images/Aalaqaat/Artboard 7.jpg",
+      "/images/Aalaqaat/Artboard 8.png",
+      "/images/Aalaqaat/Artboard 9.png",
     ],
+    hashes: {
+      "/images/Aalaqaat/Artboard 1.png": "565c0ee3",
+      "/images/Aalaqaat/Artboard 10.png": "0a9e2377",
+      "/images/Aalaqaat/Artboard 2.png": "37906795",
+      "/images/Aalaqaat/Artboard 3.png": "3de12f7e",
+      "/images/Aalaqaat/Artboard 4.png": "5adec414",
+      "/images/Aalaqaat/Artboard 5.png": "7bb2eeb4",
+      "/images/Aalaqaat/Artboard 6.png": "67e1a960",
+      "/images/Aalaqaat/Artboard 7.jpg": "a6b0fd80",
+      "/images/Aalaqaat/Artboard 8.png": "fc5c2359",
+      "/images/Aalaqaat/Artboard 9.png": "cfd95db0",
+    },
+    imageMeta: {
+      "/images/Aalaqaat/Artboard 1.png": { width: 1920, height: 1080, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRjYAAABXRUJQVlA4ICoAAAAwAQCdASoQAAkABABoJaQAA3AA/vF9nvPD3OJX4+Hg79wKySYsAyV78AA=" },
+      "/images/Aalaqaat/Artboard 10.png": { width: 1920, height: 1080, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRi4AAABXRUJQVlA4ICIAAACQAQCdASoQAAkABABoJaQAAudUwMAA/vYC34CNZdiE8AAA" },
+      "/images/Aalaqaat/Artboard 2.png": { width: 1920, height: 1080, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRkIAAABXRUJQVlA4IDYAAABwAQCdASoQAAkABABoJaQ28AAXQAD+8X2fE2OWN4fFnO0Ks3/s/Ds3Tnv6DGALJOCZGbFAAAA=" },
+      "/images/Aalaqaat/Artboard 3.png": { width: 1920, height: 1080, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRjIAAABXRUJQVlA4ICYAAACwAQCdASoQAAkABABoJaQAAudgks4AAP72Av1mDe8qWnGDwAAAAA==" },
+      "/images/Aalaqaat/Artboard 4.png": { width: 1920, height: 1080, color: "#27245f", placeholder: "data:image/webp;base64,UklGRjgAAABXRUJQVlA4ICwAAACwAQCdASoQAAkABABoJZgAAudgPOwAAP7uhLruNLWQPlTGbZ3/O20Wl8XCAA==" },
+      "/images/Aalaqaat/Artboard 5.png": { width: 1920, height: 1080, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRlYAAABXRUJQVlA4IEoAAAAQAgCdASoQAAkABABoJQBOhxAAJHIlNLHwAP7wprXS3Hcdlncb2zBDW3kyO+YvjhLcesXEGb6UiUKbXsCVb/l9rJ2Xxgz9cw8AAA==" },
+      "/images/Aalaqaat/Artboard 6.png": { width: 1920, height: 1080, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRjIAAABXRUJQVlA4ICYAAACwAQCdASoQAAkABABoJaQAAueETMwAAP701i3iba44zfJthagAAA==" },
+      "/images/Aalaqaat/Artboard 7.jpg": { width: 1920, height: 1080, color: "#616a70", placeholder: "data:image/webp;base64,UklGRkwAAABXRUJQVlA4IEAAAAAQAgCdASoQAAkABABoJQBWACPszq+mrOoAAP114ReOJpzUmGA7qwEjgkeaBWxyUFHLbq0Sf5sLSgbTbOGkQAAA" },
+      "/images/Aalaqaat/Artboard 8.png": { width: 1920, height: 1080, color: "#343535", placeholder: "data:image/webp;base64,UklGRk4AAABXRUJQVlA4IEIAAACwAQCdASoQAAkABABoJaQAAxcYJuUgAP6F/waKUEWmpgovgUCJR/csBGFuP8j7sb1YavD9CKCj0HR6pSvwbAAAAAA=" },
+      "/images/Aalaqaat/Artboard 9.png": { width: 1920, height: 1080, color: "#cfc7bc", placeholder: "data:image/webp;base64,UklGRnAAAABXRUJQVlA4WAoAAAAQAAAADwAACAAAQUxQSA0AAAABD9D/iAjMf0T/YwAAAFZQOCA8AAAA8AEAnQEqEAAJAAQAaCWMAuwBA/2cmxcAAP7ZXBtbTyrdbcxpR9kNPp0j8fD0yfZKB34bwOwue1C6AAAA" },
+    },
   },
   {
     id: "al-hawari",
     name: "Al Hawari",
     type: "Social Media + Branding",
     description: `I was responsible for the full rebranding of Al Hawari's famous juice shop in Beirut. I focused on blending 2 key elements into it; 1st was the old nostalgic Beirut feel as it Al Hawari's history is a big plus against its competitors. 2nd key element was having a very appealing visual style, using strong colors with minimal design to give it an aesthetic sense its target audiences would notice and enjoy.`,
-    thumbnail: "/images/Al%20Hawari/Artboard%201.png",
+    thumbnail: "/images/Al Hawari/Artboard 40.jpg",
     images: [
-      "/images/Al%20Hawari/Artboard%201.png",
-      "/images/Al%20Hawari/Artboard%202.jpg",
-      "/images/Al%20Hawari/Artboard%203.png",
-      "/images/Al%20Hawari/Artboard%204.jpg",
-      "/images/Al%20Hawari/Artboard%205.jpg",
-      "/images/Al%20Hawari/Artboard%206.png",
-      "/images/Al%20Hawari/Artboard%207.png",
-      "/images/Al%20Hawari/Artboard%208.png",
-      "/images/Al%20Hawari/Artboard%209.jpg",
-      "/images/Al%20Hawari/Artboard%2010.png",
-      "/images/Al%20Hawari/Artboard%2011.png",
-      "/images/Al%20Hawari/Artboard%2012.png",
-      "/images/Al%20Hawari/Artboard%2013.jpg",
-      "/images/Al%20Hawari/Artboard%2014.png",
-      "/images/Al%20Hawari/Artboard%2015.jpg",
-      "/images/Al%20Hawari/Artboard%2016.png",
-      "/images/Al%20Hawari/Artboard%2017.jpg",
-      "/images/Al%20Hawari/Artboard%2018.jpg",
-      "/images/Al%20Hawari/Artboard%2019.jpg",
-      "/images/Al%20Hawari/Artboard%2020.png",
-      "/images/Al%20Hawari/Artboard%2021.jpg",
-      "/images/Al%20Hawari/Artboard%2022.png",
-      "/images/Al%20Hawari/Artboard%2023.png",
-      "/images/Al%20Hawari/Artboard%2024.png",
-      "/images/Al%20Hawari/Artboard%2025.png",
-      "/images/Al%20Hawari/Artboard%2026.png",
-      "/images/Al%20Hawari/Artboard%2027.jpg",
-      "/images/Al%20Hawari/Artboard%2028.png",
-      "/images/Al%20Hawari/Artboard%2029.png",
-      "/images/Al%20Hawari/Artboard%2030.jpg",
-      "/images/Al%20Hawari/Artboard%2031.png",
-      "/images/Al%20Hawari/Artboard%2032.png",
-      "/images/Al%20Hawari/Artboard%2033.png",
-      "/images/Al%20Hawari/Artboard%2034.png",
-      "/images/Al%20Hawari/Artboard%2035.png",
-      "/images/Al%20Hawari/Artboard%2036.jpg",
-      "/images/Al%20Hawari/Artboard%2037.jpg",
-      "/images/Al%20Hawari/Artboard%2038.png",
-      "/images/Al%20Hawari/Artboard%2039.png",
-      "/images/Al%20Hawari/Artboard%2040.jpg",
-      "/images/Al%20Hawari/Artboard%2041.png",
-      "/images/Al%20Hawari/Artboard%2042.jpg",
-      "/images/Al%20Hawari/Artboard%2043.png",
-      "/images/Al%20Hawari/Artboard%2044.jpg",
-      "/images/Al%20Hawari/Artboard%2045.png",
-      "/images/Al%20Hawari/Artboard%2046.png",
-      "/images/Al%20Hawari/Artboard%2047.png",
-      "/images/Al%20Hawari/Artboard%2048.png",
+      "/images/Al Hawari/Artboard 1.png",
+      "/images/Al Hawari/Artboard 10.png",
+      "/images/Al Hawari/Artboard 11.png",
+      "/images/Al Hawari/Artboard 12.png",
+      "/images/Al Hawari/Artboard 13.jpg",
+      "/images/Al Hawari/Artboard 14.png",
+      "/images/Al Hawari/Artboard 15.jpg",
+      "/images/Al Hawari/Artboard 16.png",
+      "/images/Al Hawari/Artboard 17.jpg",
+      "/images/Al Hawari/Artboard 18.jpg",
+      "/images/Al Hawari/Artboard 19.jpg",
+      "/images/Al Hawari/Artboard 2.jpg",
+      "/images/Al Hawari/Artboard 20.png",
+      "/images/Al Hawari/Artboard 21.jpg",
+      "/images/Al Hawari/Artboard 22.png",
+      "/images/Al Hawari/Artboard 23.png",
+      "/images/Al Hawari/Artboard 24.png",
+      "/images/Al Hawari/Artboard 25.png",
+      "/images/Al Hawari/Artboard 26.png",
+      "/images/Al Hawari/Artboard 27.jpg",
+      "/images/Al Hawari/Artboard 28.png",
+      "/images/Al Hawari/Artboard 29.png",
+      "/images/Al Hawari/Artboard 3.png",
+      "/images/Al Hawari/Artboard 30.jpg",
+      "/images/Al Hawari/Artboard 31.png",
+      "/images/Al Hawari/Artboard 32.png",
+      "/images/Al Hawari/Artboard 33.png",
+      "/images/Al Hawari/Artboard 34.png",
+      "/images/Al Hawari/Artboard 35.png",
+      "/images/Al Hawari/Artboard 36.jpg",
+      "/images/Al Hawari/Artboard 37.jpg",
+      "/images/Al Hawari/Artboard 38.png",
+      "/images/Al Hawari/Artboard 39.png",
+      "/images/Al Hawari/Artboard 4.jpg",
+      "/images/Al Hawari/Artboard 40.jpg",
+      "/images/Al Hawari/Artboard 41.png",
+      "/images/Al Hawari/Artboard 42.jpg",
+      "/images/Al Hawari/Artboard 43.png",
+      "/images/Al Hawari/Artboard 44.jpg",
+      "/images/Al Hawari/Artboard 45.png",
+      "/images/Al Hawari/Artboard 46.png",
+      "/images/Al Hawari/Artboard 47.png",
+      "/images/Al Hawari/Artboard 48.png",
+      "/images/Al Hawari/Artboard 5.jpg",
+      "/images/Al Hawari/Artboard 6.png",
+      "/images/Al Hawari/Artboard 7.png",
+      "/images/Al Hawari/Artboard 8.png",
+      "/images/Al Hawari/Artboard 9.jpg",
     ],
+    hashes: {
+      "/images/Al Hawari/Artboard 1.png": "ec73ee39",
+      "/images/Al Hawari/Artboard 10.png": "a47e72c1",
+      "/images/Al Hawari/Artboard 11.png": "e9793bc0",
+      "/images/Al Hawari/Artboard 12.png": "faf8b5ef",
+      "/images/Al Hawari/Artboard 13.jpg": "dd495184",
+      "/images/Al Hawari/Artboard 14.png": "16d5ab71",
+      "/images/Al Hawari/Artboard 15.jpg": "5204d897",
+      "/images/Al Hawari/Artboard 16.png": "81af7818",
+      "/images/Al Hawari/Artboard 17.jpg": "73545757",
+      "/images/Al Hawari/Artboard 18.jpg": "d1a7efcf",
+      "/images/Al Hawari/Artboard 19.jpg": "4c8f4be2",
+      "/images/Al Hawari/Artboard 2.jpg": "3038cf67",
+      "/images/Al Hawari/Artboard 20.png": "106d70a1",
+      "/images/Al Hawari/Artboard 21.jpg": "507c0615",
+      "/images/Al Hawari/Artboard 22.png": "3ccc846f",
+      "/images/Al Hawari/Artboard 23.png": "238e21e5",
+      "/images/Al Hawari/Artboard 24.png": "bfe4ebcc",
+      "/images/Al Hawari/Artboard 25.png": "f70fafda",
+      "/images/Al Hawari/Artboard 26.png": "4e748a11",
+      "/images/Al Hawari/Artboard 27.jpg": "3a92ed55",
+      "/images/Al Hawari/Artboard 28.png": "22683ea0",
+      "/images/Al Hawari/Artboard 29.png": "09e8a28c",
+      "/images/Al Hawari/Artboard 3.png": "d48116f9",
+      "/images/Al Hawari/Artboard 30.jpg": "1f0d3fb0",
+      "/images/Al Hawari/Artboard 31.png": "9825acdb",
+      "/images/Al Hawari/Artboard 32.png": "3445007a",
+      "/images/Al Hawari/Artboard 33.png": "7ad18ce9",
+      "/images/Al Hawari/Artboard 34.png": "635761e5",
+      "/images/Al Hawari/Artboard 35.png": "b94443e6",
+      "/images/Al Hawari/Artboard 36.jpg": "b2e30071",
+      "/images/Al Hawari/Artboard 37.jpg": "48decda1",
+      "/images/Al Hawari/Artboard 38.png": "a8576ace",
+      "/images/Al Hawari/Artboard 39.png": "b72b9a41",
+      "/images/Al Hawari/Artboard 4.jpg": "90f142dc",
+      "/images/Al Hawari/Artboard 40.jpg": "b8f64f74",
+      "/images/Al Hawari/Artboard 41.png": "377ea783",
+      "/images/Al Hawari/Artboard 42.jpg": "88bc5ce6",
+      "/images/Al Hawari/Artboard 43.png": "708269da",
+      "/images/Al Hawari/Artboard 44.jpg": "12205ef1",
+      "/images/Al Hawari/Artboard 45.png": "c2340009",
+      "/images/Al Hawari/Artboard 46.png": "973cfb6c",
+      "/images/Al Hawari/Artboard 47.png": "4bcac107",
+      "/images/Al Hawari/Artboard 48.png": "c2052cd8",
+      "/images/Al Hawari/Artboard 5.jpg": "b69ac036",
+      "/images/Al Hawari/Artboard 6.png": "97e877e3",
+      "/images/Al Hawari/Artboard 7.png": "59daa913",
+      "/images/Al Hawari/Artboard 8.png": "19828dd9",
+      "/images/Al Hawari/Artboard 9.jpg": "e5b4787f",
+    },
+    imageMeta: {
+      "/images/Al Hawari/Artboard 1.png": { width: 1920, height: 1080, color: "#81a374", placeholder: "data:image/webp;base64,UklGRjwAAABXRUJQVlA4IDAAAACwAQCdASoQAAkABABoJQBOgB4IeOIAANsaY+UmSCphZtqMDabDEMIz1pjSt4YgAAA=" },
+      "/images/Al Hawari/Artboard 10.png": { width: 1920, height: 1080, color: "#34b5b6", placeholder: "data:image/webp;base64,UklGRkgAAABXRUJQVlA4IDwAAADQAQCdASoQAAkABABoJbACdAEUf/jKAAD+9hDZPAovNbZjjOWySCemPVHmPqPVnneOV5qY7L5/PVOgAAA=" },
+      "/images/Al Hawari/Artboard 11.png": { width: 1920, height: 1080, color: "#34b5b6", placeholder: "data:image/webp;base64,UklGRjQAAABXRUJQVlA4ICgAAABwAQCdASoQAAkABABoJagCdAFAAAD+wbacOzsoE/IP/AfiD+LZfAAA" },
+      "/images/Al Hawari/Artboard 12.png": { width: 1920, height: 1080, color: "#34b5b6", placeholder: "data:image/webp;base64,UklGRjIAAABXRUJQVlA4ICYAAABwAQCdASoQAAkABUBoJagCdAFAAAD+ya8KKvV6Mr/Fv2j/d+DgAA==" },
+      "/images/Al Hawari/Artboard 13.jpg": { width: 1920, height: 1080, color: "#99c286", placeholder: "data:image/webp;base64,UklGRjIAAABXRUJQVlA4ICYAAABwAQCdASoQAAkABABoJYgCdAF1AAD+6UmrpPgnEl04X8IwzrAAAA==" },
+      "/images/Al Hawari/Artboard 14.png": { width: 1920, height: 1080, color: "#5a615b", placeholder: "data:image/webp;base64,UklGRlQAAABXRUJQVlA4IEgAAADwAQCdASoQAAkABABoJYwAAvau1VuJSIAA/sYDP0udSs+0s/8hzJCq1SaPi4Gvu+qQyGivw9LA+IniocyrPVPik4drItvFwAA=" },
+      "/images/Al Hawari/Artboard 15.jpg": { width: 1920, height: 1080, color: "#3a5337", placeholder: "data:image/webp;base64,UklGRlIAAABXRUJQVlA4IEYAAAAQAgCdASoQAAkABABoJZgCdAEerrItP2YAAMtAhEewDR6VTzvW+iHIg3y1wOHHSmFVqH+ZubTi2GzmQv+kumEZ/k/VfAAA" },
+      "/images/Al Hawari/Artboard 16.png": { width: 1920, height: 1080, color: "#212222", placeholder: "data:image/webp;base64,UklGRoYAAABXRUJQVlA4WAoAAAAQAAAADwAACAAAQUxQSBIAAAABD3D//4iIIBBIQt9+hYj+hx5WUDggTgAAABACAJ0BKhAACQAEAGgliAJ0Biy1WJskE0AA+EP7CeTXE8ycBPtYvtlxFKIxoKQ5+fwoT+5pcWGfJSIdxf25JrdJA8txijQGJODuooAAAA==" },
+      "/images/Al Hawari/Artboard 17.jpg": { width: 1920, height: 1080, color: "#c4c4c3", placeholder: "data:image/webp;base64,UklGRkIAAABXRUJQVlA4IDYAAACwAQCdASoQAAkABABoJaQAAp0S++dAAP7h/sYf7CoiBjZdrM/9RHA9+DvbS+tremWDMEAtgAA=" },
+      "/images/Al Hawari/Artboard 18.jpg": { width: 1920, height: 1080, color: "#25241f", placeholder: "data:image/webp;base64,UklGRkgAAABXRUJQVlA4IDwAAAAQAgCdASoQAAkABABoJYwAAxbR7qm2prVAAP7eGHq+zFJAaZAQeKMXcM85vOAmZbBmUG/PRryFONTwAAA=" },
+      "/images/Al Hawari/Artboard 19.jpg": { width: 1920, height: 1080, color: "#d5d9da", placeholder: "data:image/webp;base64,UklGRkgAAABXRUJQVlA4IDwAAADQAQCdASoQAAkABABoJZQAAtq5S9KAAAD+53D0kVtirAE14fVTtOCW8bLmPQdpvr/62tBHUJQS62E0AgA=" },
+      "/images/Al Hawari/Artboard 2.jpg": { width: 1920, height: 1080, color: "#9bcb8a", placeholder: "data:image/webp;base64,UklGRlAAAABXRUJQVlA4IEQAAADQAQCdASoQAAkABABoJZgCdADHdKwwgAD+xX+NzkkHCULCT+ymf7DyCGExVUjfCPTtPKlu5JmsKlF605lLk4HUPYAAAA==" },
+      "/images/Al Hawari/Artboard 20.png": { width: 1920, height: 1080, color: "#d3dedf", placeholder: "data:image/webp;base64,UklGRmoAAABXRUJQVlA4WAoAAAAQAAAADwAACAAAQUxQSBEAAAABD9D/iAgIBJLQt18hov+hBwBWUDggMgAAANABAJ0BKhAACQAEAGgllAACrgnfUCLAAP7qozRsxkVODpEMaC+tY08r13uZblVtgAAA" },
+      "/images/Al Hawari/Artboard 21.jpg": { width: 1920, height: 1080, color: "#7aa2a0", placeholder: "data:image/webp;base64,UklGRkIAAABXRUJQVlA4IDYAAACwAQCdASoQAAkABABoJYgCdAChVMAAANrZ8VPcfRaNDGMFP/wvTkJNoOJ6iqbeCcjYwmkPYAA=" },
+      "/images/Al Hawari/Artboard 22.png": { width: 1920, height: 1080, color: "#6e9896", placeholder: "data:image/webp;base64,UklGRmwAAABXRUJQVlA4WAoAAAAQAAAADwAACAAAQUxQSBEAAAABD9D/iAgIBJLQt18hov+hBwBWUDggNAAAALABAJ0BKhAACQAEAGgliAJ0ALHlsAAA2tnxU9x9Fo0MatDxjfiU9GM+Lgsr1O2OkultcAA=" },
+      "/images/Al Hawari/Artboard 23.png": { width: 1920, height: 1080, color: "#34b5b6", placeholder: "data:image/webp;base64,UklGRkoAAABXRUJQVlA4ID4AAACQAQCdASoQAAkABABoJbACdAEDLGgA9yFiVdCqvDoPfu9SNTi5LrBklsVH5rWUzz5Bfzjx9NuhJn5ynQAAAA==" },
+      "/images/Al Hawari/Artboard 24.png": { width: 1920, height: 1080, color: "#34b5b6", placeholder: "data:image/webp;base64,UklGRkQAAABXRUJQVlA4IDgAAABwAQCdASoQAAkABABoJbACdAAAAAD+a9dIsw9Xv5kk7UodFc8bn3O0e/hq0mkm5/i39kfzlOgAAA==" },
+      "/images/Al Hawari/Artboard 25.png": { width: 1920, height: 1080, color: "#fbdf14", placeholder: "data:image/webp;base64,UklGRnIAAABXRUJQVlA4WAoAAAAQAAAADwAACAAAQUxQSBIAAAABD9D/iAgIBJJQ9hddIaL/6QNWUDggOgAAAHABAJ0BKhAACQAEAGglsAJ0AUAAAP7vQ8sotObccA5jrKDWb/yrcqZfv9+oXmce3/gj0A4ElbZ3YAA=" },
+      "/images/Al Hawari/Artboard 26.png": { width: 1920, height: 1080, color: "#fbdf14", placeholder: "data:image/webp;base64,UklGRnIAAABXRUJQVlA4WAoAAAAQAAAADwAACAAAQUxQSBIAAAABD9D/iAgIBJJQ9hddIaL/6QNWUDggOgAAAHABAJ0BKhAACQAEAGglsAJ0AUAAAP7vHqI6jDW9vhiaux08/+Qa31niYMcv/y6/6x9/u6T9aYsAAAA=" },
+      "/images/Al Hawari/Artboard 27.jpg": { width: 1920, height: 1080, color: "#839c6e", placeholder: "data:image/webp;base64,UklGRjwAAABXRUJQVlA4IDAAAACwAQCdASoQAAkABABoJZACdADglXiAAPyjsX/SVLPOCZ8txOjHbNxhcYTSThdVwAA=" },
+      "/images/Al Hawari/Artboard 28.png": { width: 1920, height: 1080, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRmAAAABXRUJQVlA4IFQAAADQAQCdASoQAAkABABoJaQAAjuE4U7vQAD+8jNJdfYaepda5DfqGbfwxZlaYn8/i9WHqG9tqxOhXEqUVCZKS+3DL/vGp3RZOheP0fffb9kxkoOAAAA=" },
+      "/images/Al Hawari/Artboard 29.png": { width: 1920, height: 1080, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRl4AAABXRUJQVlA4IFIAAACwAQCdASoQAAkABABoJaQAAjuEyEIQAP7yM5Q0H0eAPivODo4jFsHZq44hLvfn1OQilYtwWArcVTlAkvrhN6aO3NY2RSPx/YZtPdMACkIAAAAA" },
+      "/images/Al Hawari/Artboard 3.png": { width: 1920, height: 1080, color: "#d4decb", placeholder: "data:image/webp;base64,UklGRowAAABXRUJQVlA4WAoAAAAQAAAADwAACAAAQUxQSBMAAAABD/D+/4iIIBZM8pfemUJE/7MFAFZQOCBSAAAAEAIAnQEqEAAJAAQAaCWIAnQGKyVHuFTYAADODqW1a/mV6IhwZ+H08j9N0M0EwI9XmMgODdoN1M7kLFKs3TfGmPifY7sex0nUQpOFFyA7kKIAAA==" },
+      "/images/Al Hawari/Artboard 30.jpg": { width: 1920, height: 1080, color: "#8da977", placeholder: "data:image/webp;base64,UklGRkAAAABXRUJQVlA4IDQAAADwAQCdASoQAAkABABoJYgCdADp+4HE7QAA/rWFsWmlsinalX76UpMTKLCUsYTSTntIcaAA" },
+      "/images/Al Hawari/Artboard 31.png": { width: 1920, height: 1080, color: "#000000", placeholder: "data:image/webp;base64,UklGRu4AAABXRUJQVlA4WAoAAAAQAAAADwAACAAAQUxQSGUAAAABcFpr29q8Yc4MkZmBaYEoaKtYoaQBOgFXc1VsV4r6JyjDCBExAfirmbSSWqNjfKJliRckmXtXLybdYogvF7fr7nb5rVvWR2X6MiOnOdkOSGtK8hdYYD1GjUXdEd9wAEdRLAUWAABWUDggYgAAAPABAJ0BKhAACQAEAGglsAJ0OIzBLmjnQADI2ZP9ixBfHNE/C9Y8E55euwICjX+VqLqvvfwz3wgL6anX0YKi28c4S7x6I/wOy/n4/Bv5pxyOvXEwpIuMXn/Gu/Q2gwQ8AAAA" },
+      "/images/Al Hawari/Artboard 32.png": { width: 1920, height: 1080, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRkQAAABXRUJQVlA4IDgAAADQAQCdASoQAAkABABoJQBdgB7HmDTgAAD+9R2X9lZUnP7XeyqvgefeiMQn4M89cZ5KCB1f5QAAAA==" },
+      "/images/Al Hawari/Artboard 33.png": { width: 1920, height: 1080, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRkIAAABXRUJQVlA4IDYAAACwAQCdASoQAAkABABoJaAC7ADwlrAAAP72E5KmD1AkaU0FUlJKy99G3pEB5LuGl35/qlv9QAA=" },
+      "/images/Al Hawari/Artboard 34.png": { width: 1920, height: 1080, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRkwAAABXRUJQVlA4IEAAAADQAQCdASoQAAkABABoJYgC7ADw0KDmAAD+9R2X9SZ9xM5dsMHT4TN5KhOO/WM1ET6MWO4tzCE0tdLWSYtAIAAA" },
+      "/images/Al Hawari/Artboard 35.png": { width: 1920, height: 1080, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRjwAAABXRUJQVlA4IDAAAACwAQCdASoQAAkABABoJZQAApMUJ/JAAP72EzRts15XqMD/G+s7aiHcKxAbdGqkCAA=" },
+      "/images/Al Hawari/Artboard 36.jpg": { width: 1920, height: 1080, color: "#90af7a", placeholder: "data:image/webp;base64,UklGRjgAAABXRUJQVlA4ICwAAADQAQCdASoQAAkABABoJZACdAEOSs8oAAD98iVe6Awius/pvu9y0UiSMM6wAA==" },
+      "/images/Al Hawari/Artboard 37.jpg": { width: 1920, height: 1080, color: "#85ae76", placeholder: "data:image/webp;base64,UklGRi4AAABXRUJQVlA4ICIAAABwAQCdASoQAAkABABoJYgCdAFAAAD+3URYYTBOhMeiYAAA" },
+      "/images/Al Hawari/Artboard 38.png": { width: 1920, height: 1080, color: "#9acb89", placeholder: "data:image/webp;base64,UklGRjwAAABXRUJQVlA4IDAAAABwAQCdASoQAAkABABoJagCdAFAAAD+6qsxZy4XY5l6mMXL8LNsMKmdMJ71pjKYAAA=" },
+      "/images/Al Hawari/Artboard 39.png": { width: 1920, height: 1080, color: "#9acb89", placeholder: "data:image/webp;base64,UklGRlQAAABXRUJQVlA4IEgAAADwAQCdASoQAAkABABoJaACdADcIQDZ3zQA/ltmBk0aPtWQ/kA2a16U5VsJDoBA4WYevk955konR3BFxhNJvNjxJldMHKQAAAA=" },
+      "/images/Al Hawari/Artboard 4.jpg": { width: 1920, height: 1080, color: "#4d4e46", placeholder: "data:image/webp;base64,UklGRl4AAABXRUJQVlA4IFIAAACwAQCdASoQAAkABABoJQBOgBX4p4cAAPkIFZql6xCLOTfQAMgzmnaKy2WFMJRqnAl1jrEA1icRv5UlbEJm1XuZ77ZzDIJPaijYFCyA9TDQgAAA" },
+      "/images/Al Hawari/Artboard 40.jpg": { width: 1920, height: 1080, color: "#c34b3d", placeholder: "data:image/webp;base64,UklGRlgAAABXRUJQVlA4IEwAAACwAQCdASoQAAkABABoJbACdACfs+kAAP0hdlpZ62LZJPxsmLtKs8xZXQ7F7p36SJLnFCupT9NOwqqRCRhFj9eM09RmcFJ2DglIAAAA" },
+      "/images/Al Hawari/Artboard 41.png": { width: 1920, height: 1080, color: "#264747", placeholder: "data:image/webp;base64,UklGRqAAAABXRUJQVlA4WAoAAAAQAAAADwAACAAAQUxQSDcAAAABYBzbVhPiMkOzrCkAs3YWi8n6WoiICdBWeedVVJK85m7op6lvynvaD3BeoQWaoRXKXfmftCAgAFZQOCBCAAAA8AEAnQEqEAAJAAQAaCWQAnQBEQHKtNQAAMtPAs9f0mZsYReM30yMf9tGo6eJudx/T3XiHtHwXP+ywsWysYZe4AAA" },
+      "/images/Al Hawari/Artboard 42.jpg": { width: 1920, height: 1080, color: "#52b4b5", placeholder: "data:image/webp;base64,UklGRlIAAABXRUJQVlA4IEYAAACwAQCdASoQAAkABABoJaACdACXpXeIAP6OHRHSlA+vsKsxFE2S25VnVxaHX1121ukLtE/mHZ8QvAKWrrvHEuRlHTCqAAAA" },
+      "/images/Al Hawari/Artboard 43.png": { width: 1920, height: 1080, color: "#34b5b6", placeholder: "data:image/webp;base64,UklGRkQAAABXRUJQVlA4IDgAAADQAQCdASoQAAkABABoJbACdAECl1yLeAD3K6eMPRRugIF5L64oP+s14pui/mVKj9DdpP/YFiAAAA==" },
+      "/images/Al Hawari/Artboard 44.jpg": { width: 1920, height: 1080, color: "#8eae7a", placeholder: "data:image/webp;base64,UklGRj4AAABXRUJQVlA4IDIAAACQAQCdASoQAAkABABoJYl2ARgAogAA/uTpej2SKB48IwrsbkGDU8JcJ6sMJgnQi7iAAA==" },
+      "/images/Al Hawari/Artboard 45.png": { width: 1920, height: 1080, color: "#f7fbfb", placeholder: "data:image/webp;base64,UklGRiYAAABXRUJQVlA4IBoAAAAwAQCdASoQAAkABABoJaQAA3AA/vH+8CAAAA==" },
+      "/images/Al Hawari/Artboard 46.png": { width: 1920, height: 1080, color: "#cfe6c7", placeholder: "data:image/webp;base64,UklGRjwAAABXRUJQVlA4IDAAAADwAQCdASoQAAkABABoJYwCdAEO+TovvgAA/u1Qc7zM7SyfaC4TOwUtXsc3fknwAAA=" },
+      "/images/Al Hawari/Artboard 47.png": { width: 1920, height: 1080, color: "#3cb7b8", placeholder: "data:image/webp;base64,UklGRjIAAABXRUJQVlA4ICYAAABwAQCdASoQAAkABABoJaACdAFAAAD+yL8GW2xUfxb+yPzXO4AAAA==" },
+      "/images/Al Hawari/Artboard 48.png": { width: 1920, height: 1080, color: "#8aa874", placeholder: "data:image/webp;base64,UklGRnIAAABXRUJQVlA4WAoAAAAQAAAADwAACAAAQUxQSBsAAAABFyAmTfrn3S3WiIhwEJAQfy2Toy5E9D977AEAVlA4IDAAAACQAQCdASoQAAkABABoJZGDrRgAiwAA/uGUY9HdsXk6Ly4TxtkzoxhNJbbyfhUAAAA=" },
+      "/images/Al Hawari/Artboard 5.jpg": { width: 1920, height: 1080, color: "#8ba979", placeholder: "data:image/webp;base64,UklGRjoAAABXRUJQVlA4IC4AAACQAQCdASoQAAkABABoJYmDrRgAiwAA/uGf3FXBCmXdP1N37BWGEwToRhnWAAAA" },
+      "/images/Al Hawari/Artboard 6.png": { width: 1920, height: 1080, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRiwAAABXRUJQVlA4ICAAAAAwAQCdASoQAAkABABoJZwAA3AA/vJPElXxQNslG+rAAA==" },
+      "/images/Al Hawari/Artboard 7.png": { width: 1920, height: 1080, color: "#9acb89", placeholder: "data:image/webp;base64,UklGRjYAAABXRUJQVlA4ICoAAABwAQCdASoQAAkABABoJZgCdAFAAAD+6qzdjDzmFW+eJqo7U3IxhNJHYAA=" },
+      "/images/Al Hawari/Artboard 8.png": { width: 1920, height: 1080, color: "#34b5b6", placeholder: "data:image/webp;base64,UklGRlAAAABXRUJQVlA4IEQAAACQAQCdASoQAAkABABoJbACdADuQAAA/vYT3n9Dd6TcA8wSyrsBLa9j18DxdpCDmlEHIPjt0pf9hrVGe0wk2r85ToAAAA==" },
+      "/images/Al Hawari/Artboard 9.jpg": { width: 1920, height: 1080, color: "#94b282", placeholder: "data:image/webp;base64,UklGRjYAAABXRUJQVlA4ICoAAACwAQCdASoQAAkABABoJZACdADOaNQAAPxdWgiZyJFmMgW9qQ5avCncAAA=" },
+    },
   },
   {
     id: "aveeno",
     name: "Aveeno",
     type: "Social Media",
-    description: ``,
     thumbnail: "/images/Aveeno/Aveeno-1-Row-Grid_01.jpg",
     images: [
       "/images/Aveeno/Aveeno-1-Row-Grid_01.jpg",
       "/images/Aveeno/Aveeno-1-Row-Grid_02.jpg",
       "/images/Aveeno/Aveeno-1-Row-Grid_03.jpg",
     ],
+    hashes: {
+      "/images/Aveeno/Aveeno-1-Row-Grid_01.jpg": "741ee84e",
+      "/images/Aveeno/Aveeno-1-Row-Grid_02.jpg": "405d8496",
+      "/images/Aveeno/Aveeno-1-Row-Grid_03.jpg": "34d4ed5d",
+    },
+    imageMeta: {
+      "/images/Aveeno/Aveeno-1-Row-Grid_01.jpg": { width: 1080, height: 1350, color: "#f8f2e6", placeholder: "data:image/webp;base64,UklGRn4AAABXRUJQVlA4IHIAAADwAwCdASoQABQAPxFysFAsJqSisAgBgCIJYgC06CHKUIbm7GOyhIrgAP7qcKfQs/3sLVWZW7DVWkQDYghmWoM6BAJ53ptFukHQ2KnnpFSXQjcOVB+qwzB52MRNdDz9Y/nxnCeU4dClN3IRm5jfIp3R4AA=" },
+      "/images/Aveeno/Aveeno-1-Row-Grid_02.jpg": { width: 1080, height: 1350, color: "#f8f2e6", placeholder: "data:image/webp;base64,UklGRk4AAABXRUJQVlA4IEIAAABQAwCdASoQABQAPxFysVCsJqSisAgBgCIJZQDG9CHf448xAAD+6mhRO2j75Y+fhgaDatyQ8gmeh1rYwEIPFdPaAAA=" },
+      "/images/Aveeno/Aveeno-1-Row-Grid_03.jpg": { width: 1080, height: 1350, color: "#60753c", placeholder: "data:image/webp;base64,UklGRmAAAABXRUJQVlA4IFQAAAAwAwCdASoQABQAPxFysFAsJqSisAgBgCIJQBadAsZ1kXQAAP0cEZjjQ1ya2Jk25xK2tGt1J3I5P/FD2DvWXGxefJSd7t5I7kRGluvAeFpoLoAAAAA=" },
+    },
   },
   {
     id: "cwf",
     name: "CwF",
     type: "Social Media + Branding",
     description: `I created both the visual identity and the communication style for Crispy w Fahita, adapted to reach all of its potential target audience with a strong persona. Redesigned the logo, adapted poppy colors, directed photoshoots, created new wrapping paper and packaging, store sign, and much more.`,
-    thumbnail: "/images/CwF/1.png",
+    thumbnail: "/images/CwF/3.png",
     images: [
       "/images/CwF/1.png",
-      "/images/CwF/2.png",
-      "/images/CwF/3.png",
-      "/images/CwF/4.png",
-      "/images/CwF/5.png",
-      "/images/CwF/6.png",
-      "/images/CwF/7.png",
-      "/images/CwF/8.png",
-      "/images/CwF/9.png",
       "/images/CwF/10.png",
       "/images/CwF/11.png",
       "/images/CwF/12.png",
@@ -435,6 +977,7 @@ export const projects = [
       "/images/CwF/17.png",
       "/images/CwF/18.png",
       "/images/CwF/19.png",
+      "/images/CwF/2.png",
       "/images/CwF/20.png",
       "/images/CwF/21.png",
       "/images/CwF/22.png",
@@ -444,106 +987,279 @@ export const projects = [
       "/images/CwF/27.png",
       "/images/CwF/28.png",
       "/images/CwF/29.png",
+      "/images/CwF/3.png",
+      "/images/CwF/4.png",
+      "/images/CwF/5.png",
+      "/images/CwF/6.png",
+      "/images/CwF/7.png",
+      "/images/CwF/8.png",
+      "/images/CwF/9.png",
     ],
     videos: [
       "/images/CwF/R1.mp4",
-      "/images/CwF/R2.mp4",
-      "/images/CwF/R3.mp4",
     ],
+    hashes: {
+      "/images/CwF/1.png": "1770c795",
+      "/images/CwF/10.png": "d7c930ac",
+      "/images/CwF/11.png": "53c5b412",
+      "/images/CwF/12.png": "54864f0a",
+      "/images/CwF/13.png": "76ec3651",
+      "/images/CwF/14.png": "4016a9ed",
+      "/images/CwF/15.png": "734f03fc",
+      "/images/CwF/16.png": "ec55d345",
+      "/images/CwF/17.png": "5e64bcdb",
+      "/images/CwF/18.png": "0d474551",
+      "/images/CwF/19.png": "55d2e135",
+      "/images/CwF/2.png": "ec606298",
+      "/images/CwF/20.png": "c50ca48d",
+      "/images/CwF/21.png": "a05bacb8",
+      "/images/CwF/22.png": "c8b7857e",
+      "/images/CwF/23.png": "fee45831",
+      "/images/CwF/24.png": "418a20d2",
+      "/images/CwF/25.png": "c975636a",
+      "/images/CwF/27.png": "2ec44f97",
+      "/images/CwF/28.png": "1ef60f82",
+      "/images/CwF/29.png": "539881fd",
+      "/images/CwF/3.png": "4cc0a379",
+      "/images/CwF/4.png": "d2bbc15a",
+      "/images/CwF/5.png": "f7e2b4fc",
+      "/images/CwF/6.png": "c4268eb4",
+      "/images/CwF/7.png": "4a1cadb7",
+      "/images/CwF/8.png": "7789ddf8",
+      "/images/CwF/9.png": "529bdf97",
+      "/images/CwF/R1.mp4": "97359e8a",
+    },
+    imageMeta: {
+      "/images/CwF/1.png": { width: 1080, height: 1350, color: "#e58816", placeholder: "data:image/webp;base64,UklGRmIAAABXRUJQVlA4IFYAAAAwAwCdASoQABQAPxFysFAsJqSjMAgBgCIJaACo9CHfdfYAAP648Y9KEGNi08p+BoTU1g/dZkt+FtpDE6OLVX8GyR5f957E/8bx/TD6WzmFme61n6ugAA==" },
+      "/images/CwF/10.png": { width: 1080, height: 1350, color: "#4475b9", placeholder: "data:image/webp;base64,UklGRnAAAABXRUJQVlA4IGQAAADwAwCdASoQABQAPxFysFAsJqSisAgBgCIJaACdMoR3ABKsvOxER8OwAP0cGsm7/Fy0WBzKvNwzjIHkvspzTs3NwwQ4RiJQnQLsX1nndzxiwoTrdMoc2WYpgXB5eWmSIxpUYwAA" },
+      "/images/CwF/11.png": { width: 1080, height: 1350, color: "#cb3005", placeholder: "data:image/webp;base64,UklGRoAAAABXRUJQVlA4IHQAAAAwBACdASoQABQAPxFysFAsJqSisAgBgCIJbACdMoRwACZgxANZi/lDVOAA/p6kNCLrcuAgA/f5rfFDH3yFIepqIs79tKxJxzM/n81qHhoiWfDUPcJ/1dasMAsitojZoSZ3Gxciwgy8NOqbXMsdHT4LNlFwAA==" },
+      "/images/CwF/12.png": { width: 1080, height: 1350, color: "#dfa008", placeholder: "data:image/webp;base64,UklGRmQAAABXRUJQVlA4IFgAAACQAwCdASoQABQAPxFysFAsJqSisAgBgCIJbACxG1AAiWFMjTsAANNiP3rbRixfvrXNj497Ja/4tyZ2i/pyutVqs3/2oKJRPHRikfvGEIhaS0sI5qJacCAA" },
+      "/images/CwF/13.png": { width: 1080, height: 1350, color: "#e0ac0e", placeholder: "data:image/webp;base64,UklGRqIAAABXRUJQVlA4IJYAAABwBACdASoQABQAPxFysFAsJqSisAgBgCIJbACdMoADYuT2hSkrS8os7iaLAADLS0Bh4HdPwE1YvwAUs82N/tLK+0wKmtYTal77tUQXH/BrxlLVmcfz8Wp5n9Cvl6qQ/hExmCBxVfWZlJnC+pCueHxzUmus56kEMbmeySKz956BaUvwsT2Ml2met8qhd7AS/Lt8NeBFAAA=" },
+      "/images/CwF/14.png": { width: 1080, height: 1350, color: "#798c91", placeholder: "data:image/webp;base64,UklGRooAAABXRUJQVlA4IH4AAACwAwCdASoQABQAPxFysFAsJqSisAgBgCIJbACdAB2Mqb5Pf7o2iAD9RFJOn2c71Eh5rQg5nU5su4fTl3U5nk1OjLANvTUD4vAglIaa3ZR052RIwQU2R/U/2skTOcMu9MLY0A+eQDeoLl6pUWbe3nswahH7l+NVTJXn92NuAAA=" },
+      "/images/CwF/15.png": { width: 1080, height: 1350, color: "#c48d73", placeholder: "data:image/webp;base64,UklGRngAAABXRUJQVlA4IGwAAAAwBACdASoQABQAPxFysFAsJqSisAgBgCIJagCdMoADQIl8+Zmhbw0SH4AA/hDgjlM8YxAjB8DHG+RVnq6U1SbckPPEt+C/q72KiweCnYxDQojfvjgxfbCGO9ETNEtEYCVuIp0p8+/nSnz7gAA=" },
+      "/images/CwF/16.png": { width: 1080, height: 1350, color: "#2e2e2f", placeholder: "data:image/webp;base64,UklGRmAAAABXRUJQVlA4IFQAAABQAwCdASoQABQAPxFysFAsJqSisAgBgCIJZwAAXK5Bs4WgAAD+7D5UH/cCz/EoyyaOxGxCVkprYnZh8WLqoZcQrAYHwSovHR5j7smb9uiehMVRwAA=" },
+      "/images/CwF/17.png": { width: 1080, height: 1350, color: "#eceaea", placeholder: "data:image/webp;base64,UklGRngAAABXRUJQVlA4IGwAAACwAwCdASoQABQAPxFysFAsJqSisAgBgCIJZQDE2Bh34YYaaSY+hAD+50CqqKBL5YTv1ntJXOPdJ5cyAsHqQyuFX4agusQD7s050AjUZSOvmlNo5KaT89L1+tp/+kVFbz3HDVltRBnsqtGAAAA=" },
+      "/images/CwF/18.png": { width: 1080, height: 1350, color: "#cc393f", placeholder: "data:image/webp;base64,UklGRpwAAABXRUJQVlA4IJAAAACQBACdASoQABQAPxFysFAsJqSisAgBgCIJbACdMoRwAdCs6Kpi7O4UWxKaKgAA/p6P1UCIsYyVla06RXUyjL8pAnTOAA0++LXpcu6Ku65DGH+/F60xBgrXWT/sx5kV3PuktZD+0lIPyWWtKsAB/Er1tCbANg3qobvKsXi0YI6euEDccuSX2A47e/vNDRAAAAA=" },
+      "/images/CwF/19.png": { width: 1080, height: 1350, color: "#939394", placeholder: "data:image/webp;base64,UklGRoIAAABXRUJQVlA4IHYAAADQAwCdASoQABQAPxF0sFCsJqSisAgBgCIJQBgbhDvovAQ/IkqIFtgA/t55Gp3SZkjhmhqyZn2dhtzGKwtP/1I/A/dG/qI8Bdz569HwChkjuWj/A5FT9tCQ1vZcca9xNyPclgTQAFwvaaQdz9+ml5aky+oFgAAA" },
+      "/images/CwF/2.png": { width: 500, height: 500, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRlYAAABXRUJQVlA4IEoAAABQAgCdASoQABAABABoJYwC7IExGBsmBpIBowAA/vYFNHiiSAmYav3XRlP+7rGhEZfHQqIfcL74eRbKHl3wGQ+13r1JXw1shoAAAA==" },
+      "/images/CwF/20.png": { width: 1080, height: 1350, color: "#792a01", placeholder: "data:image/webp;base64,UklGRoIAAABXRUJQVlA4IHYAAABwBACdASoQABQAPxFwsFAsJiSisAgBgCIJagCdMoMYAEKRDIF8U8O21W4oxAD+y/Ug7yorGplPE6tYnubpozY+Hj6QbMSob9NiQ3+2CK+uuwp0oFwI0BNIXujv55LQaMYVR07YyN+zo6WJRgSypzSQDRaRcWAA" },
+      "/images/CwF/21.png": { width: 1080, height: 1350, color: "#eec311", placeholder: "data:image/webp;base64,UklGRpIAAABXRUJQVlA4IIYAAABQBACdASoQABQAPxFwsFAsJiSisAgBgCIJbACdMoRwACna0NaAlMBEwoZwAP5YAcvAvgD725dKe9G71edIlbkS+QUnk2fhBNYLT35mOywMqRiWfWPDhNUcKTLQoig/wZg344DbyFwnyRXCXlrMrM8Y44I8UZ5/DWMIBZ2C7dRO6soz0AAAAA==" },
+      "/images/CwF/22.png": { width: 1080, height: 1350, color: "#dedcda", placeholder: "data:image/webp;base64,UklGRk4AAABXRUJQVlA4IEIAAABQAwCdASoQABQAPxFysFAsJqSisAgBgCIJYwDG9CHf6XgXsAD+3nkIZd8QEl+6qEMWwrAyquuAXu4BG+ymEQkQAAA=" },
+      "/images/CwF/23.png": { width: 1080, height: 1350, color: "#c3181f", placeholder: "data:image/webp;base64,UklGRmwAAABXRUJQVlA4IGAAAABwAwCdASoQABQAPxFwsFAsJiSisAgBgCIJZgCdAB3Fc5GzKgAA/p7GfpJ1aDYwGk/XvusjIgSE3lHQvIKy6tq/cJi/aGhyr/EsaC+TuVTY8B94DaX3imJqb6OdO63d4AA=" },
+      "/images/CwF/24.png": { width: 1080, height: 1350, color: "#675c64", placeholder: "data:image/webp;base64,UklGRn4AAABXRUJQVlA4IHIAAADQAwCdASoQABQAPxFysFAsJqSisAgBgCIJbACdMoR3ACm8mwLLRgAA/orwgM5j6rgBaclRbZcIDtKwfpkhhKOQWlX89PJfITpzjXV0q/1BJXCQLP5IwkDmSPXMhgPhNljenA1Fg2yAfXiYlmsDxl0AAAA=" },
+      "/images/CwF/25.png": { width: 1080, height: 1350, color: "#c3191f", placeholder: "data:image/webp;base64,UklGRlYAAABXRUJQVlA4IEoAAABQAwCdASoQABQAPxFysFAsJqSisAgBgCIJZgCdAC0CrotZgAD+5SPy+TKc8lmsEGqIYUF6j/jCaS27+rv4++9ko4E6oawZ0PAAAA==" },
+      "/images/CwF/27.png": { width: 1080, height: 1350, color: "#544e48", placeholder: "data:image/webp;base64,UklGRn4AAABXRUJQVlA4IHIAAADwAwCdASoQABQAPxFysFAsJqSisAgBgCIJYgDE2B6Lbpg4mBZ/lHa4AP3838Q/MoA0O9K0Gm4fTGbo63TwZjNgOpJCL08cAvvYhrhn7XrFl/IDicQB3JQaP07RoIWcznJTuXmCNVnb23UommPFKa8AAAA=" },
+      "/images/CwF/28.png": { width: 1080, height: 1350, color: "#8bbde0", placeholder: "data:image/webp;base64,UklGRmwAAABXRUJQVlA4IGAAAADwAwCdASoQABQAPxFysFAsJqSisAgBgCIJbACdMoRwABBVLQm2IcAAANaGlpWJ3EhefPdKkJXeu+W6XmV4U9ihdbrPhp0f6TZch6Z6lEm0LYrqJobo+btQa6dfhg5gAAA=" },
+      "/images/CwF/29.png": { width: 1702, height: 630, color: "#a7582c", placeholder: "data:image/webp;base64,UklGRk4AAABXRUJQVlA4IEIAAADQAQCdASoQAAYABABoJbACdAC9EsmEoAD+lEmppDpGAvDOnHOyvMq3PQq2jMAFeJplH/4uPrx33q6R4u9ir7gFaAA=" },
+      "/images/CwF/3.png": { width: 1080, height: 1350, color: "#c0490c", placeholder: "data:image/webp;base64,UklGRoYAAABXRUJQVlA4IHoAAABwBACdASoQABQAPxFysFAsJqSisAgBgCIJbACdMoRwN6AARZbiI+IAiK4OAAD9GypFCJ0ylVkWB4/JByb5MveiIE/vKSHKhVqPToIcAq3yAFvTZWz/1KSlYWSDzLQjl954efQMxWT3Ko8UBsIyCvQSVZETG0k/TguAAA==" },
+      "/images/CwF/4.png": { width: 1080, height: 1350, color: "#9a1519", placeholder: "data:image/webp;base64,UklGRnYAAABXRUJQVlA4IGoAAABwBACdASoQABQAPxFysFAsJqSisAgBgCIJbACdMoADAMYTY6HCGZWJb/eUAAD+vBSS+EVXl+2GfyVEcrAkQTdRc4kgQd3rWSPzf2Cb2CUobksM4T/FCxGpJVKFvVhTYxy5ohf9BKACAAAA" },
+      "/images/CwF/5.png": { width: 1080, height: 1350, color: "#376bb9", placeholder: "data:image/webp;base64,UklGRnIAAABXRUJQVlA4IGYAAACQAwCdASoQABQAPxFysFAsJqSisAgBgCIJbACdMoRwACSbqtQwAP5xBczh73Kmc+CRflI5o6hAPJUMDig/owCPxZzu5LU/J6mkC6osVRplDE9O9r9HXmnJlqgulAHvDVJQkC+YAAA=" },
+      "/images/CwF/6.png": { width: 1080, height: 1350, color: "#3c0f01", placeholder: "data:image/webp;base64,UklGRmgAAABXRUJQVlA4IFwAAADQAwCdASoQABQAPxFysFAsJqSisAgBgCIJajcAAwAAr2P4znlgccAA/nFjtpWc/+8KuZaTE8fHbcetScsrd8be0VtY74SfSNJ7JmgjkRmmm6tZ3CnUcqdJBwAAAA==" },
+      "/images/CwF/7.png": { width: 1080, height: 1350, color: "#f0c512", placeholder: "data:image/webp;base64,UklGRmYAAABXRUJQVlA4IFoAAACQAwCdASoQABQAPxFwsFAsJiSisAgBgCIJbACdMoRwACnHNDqAAP6K1zYNDq6SW6P/e6siNNead8rbNSrvD6vaggd5hrnHgKQIKGQZSSMosmdluk3kG6gAAAA=" },
+      "/images/CwF/8.png": { width: 1080, height: 1350, color: "#be4011", placeholder: "data:image/webp;base64,UklGRpIAAABXRUJQVlA4IIYAAACwBACdASoQABQAPxFysFAsJqSisAgBgCIJbACdMoIj/o2ACQhlgXJLCCjtdMEAAPnafkbg99SDg8e4NJt/aVSNpqB9vxzIqHUZevTl7W4K/klohMA5AFhusCn0xpx1hyeCZCR+cnAmTgon16GNjUJfle86i6/QtwBO3BkYy//ct4MjDgcAAA==" },
+      "/images/CwF/9.png": { width: 1080, height: 1350, color: "#bb1f1e", placeholder: "data:image/webp;base64,UklGRoIAAABXRUJQVlA4IHYAAADwAwCdASoQABQAPxFysFAsJqSisAgBgCIJbACdMoRwACnEdz8eTZEAAP5vBcdi6cUkJQuGKkpjr5bNfvYY2usmZ2PTAFU6v8dutaDwDwHD+FGlSaoVghs1x79aZUbbtGftAs+ixXJTncJrgMIIamupNaxaoAAA" },
+    },
   },
   {
     id: "dermacare",
     name: "DermaCare",
     type: "Social Media",
-    description: ``,
-    thumbnail: "/images/DermaCare/DermaCare_01.jpg",
+    thumbnail: "/images/DermaCare/DermaCare_02.jpg",
     images: [
       "/images/DermaCare/DermaCare_01.jpg",
       "/images/DermaCare/DermaCare_02.jpg",
       "/images/DermaCare/DermaCare_03.jpg",
     ],
+    hashes: {
+      "/images/DermaCare/DermaCare_01.jpg": "13424d22",
+      "/images/DermaCare/DermaCare_02.jpg": "363380c2",
+      "/images/DermaCare/DermaCare_03.jpg": "b7b2c426",
+    },
+    imageMeta: {
+      "/images/DermaCare/DermaCare_01.jpg": { width: 1080, height: 1350, color: "#d7b2a9", placeholder: "data:image/webp;base64,UklGRmwAAABXRUJQVlA4IGAAAAAQAwCdASoQABQAPxFysFAsJqSisAgBgCIJYwCdAA3oA0AAyRZ18xiExpvf0uQsRFp0FCe7JhZyr4cGYR5OkZENg/3helpEoJiL+HnlKyd5/Ilc6y6pPXo88J1oOE0gAAA=" },
+      "/images/DermaCare/DermaCare_02.jpg": { width: 1080, height: 1350, color: "#5caaae", placeholder: "data:image/webp;base64,UklGRo4AAABXRUJQVlA4IIIAAAAwBACdASoQABQAPxFwsFAsJiSisAgBgCIJbACdMoR3ABo5qVuMeL4Kd4AA9wQc5mn2sZ5MEUOffhWnMjDqZsT5ttsK6XDSpiBZ2GMjc96jmf/ifW8EwLPiQzEx7yamKE1gyfdi5QM9dzEeeWjO0L8a0WR/dlX27BlgxKB+2Mg24AAA" },
+      "/images/DermaCare/DermaCare_03.jpg": { width: 1080, height: 1350, color: "#76b1b4", placeholder: "data:image/webp;base64,UklGRnAAAABXRUJQVlA4IGQAAADQAwCdASoQABQAPxFysVCsJqSisAgBgCIJYgCsAB6J3l7PicbsWwAA9yumWIAHfFN5eoBsyVdQSYSh2TUy033piwHLb+P7WhUG6QaZuqfQSIlHOWVkX6q0O90GZr93kyNm3AAA" },
+    },
   },
   {
     id: "dga",
     name: "DGA",
     type: "Others",
     description: `DGA is a program by the Saudi Government that aims to digitalize work in all of its branches. I created the PDF that was given to all entities to explain the program (You can find snippets below) as well as designing and directing the main video of it.`,
-    thumbnail: "/images/DGA/Artboard%201.png",
+    thumbnail: "/images/DGA/Artboard 2.png",
     images: [
-      "/images/DGA/Artboard%201.png",
-      "/images/DGA/Artboard%202.png",
-      "/images/DGA/Artboard%203.png",
-      "/images/DGA/Artboard%204.png",
-      "/images/DGA/Artboard%205.png",
-      "/images/DGA/Artboard%206.png",
-      "/images/DGA/Artboard%207.png",
-      "/images/DGA/Artboard%208.png",
-      "/images/DGA/Artboard%209.png",
-      "/images/DGA/Artboard%2010.png",
-      "/images/DGA/Artboard%2011.png",
-      "/images/DGA/Artboard%2012.png",
-      "/images/DGA/Artboard%2013.png",
-      "/images/DGA/Artboard%2014.png",
-      "/images/DGA/Artboard%2015.png",
-      "/images/DGA/Artboard%2016.png",
-      "/images/DGA/Artboard%2017.png",
-      "/images/DGA/Artboard%2018.png",
-      "/images/DGA/Artboard%2019.png",
-      "/images/DGA/Artboard%2020.png",
-      "/images/DGA/Artboard%2021.png",
-      "/images/DGA/Artboard%2022.png",
-      "/images/DGA/Artboard%2023.png",
-      "/images/DGA/Artboard%2024.png",
-      "/images/DGA/Artboard%2025.png",
-      "/images/DGA/Artboard%2026.png",
-      "/images/DGA/Artboard%2027.png",
-      "/images/DGA/Artboard%2028.png",
-      "/images/DGA/Artboard%2029.png",
-      "/images/DGA/Artboard%2030.png",
-      "/images/DGA/Artboard%2031.png",
-      "/images/DGA/Artboard%2032.png",
-      "/images/DGA/Artboard%2033.png",
-      "/images/DGA/Artboard%2034.png",
-      "/images/DGA/Artboard%2035.png",
-      "/images/DGA/Artboard%2036.png",
-      "/images/DGA/Artboard%2037.png",
-    ],
-    videos: [
-      "/images/DGA/Video.mp4",
+      "/images/DGA/Artboard 1.png",
+      "/images/DGA/Artboard 10.png",
+      "/images/DGA/Artboard 11.png",
+      "/images/DGA/Artboard 12.png",
+      "/images/DGA/Artboard 13.png",
+      "/images/DGA/Artboard 14.png",
+      "/images/DGA/Artboard 15.png",
+      "/images/DGA/Artboard 16.png",
+      "/images/DGA/Artboard 17.png",
+      "/images/DGA/Artboard 18.png",
+      "/images/DGA/Artboard 19.png",
+      "/images/DGA/Artboard 2.png",
+      "/images/DGA/Artboard 20.png",
+      "/images/DGA/Artboard 21.png",
+      "/images/DGA/Artboard 22.png",
+      "/images/DGA/Artboard 23.png",
+      "/images/DGA/Artboard 24.png",
+      "/images/DGA/Artboard 25.png",
+      "/images/DGA/Artboard 26.png",
+      "/images/DGA/Artboard 27.png",
+      "/images/DGA/Artboard 28.png",
+      "/images/DGA/Artboard 29.png",
+      "/images/DGA/Artboard 3.png",
+      "/images/DGA/Artboard 30.png",
+      "/images/DGA/Artboard 31.png",
+      "/images/DGA/Artboard 32.png",
+      "/images/DGA/Artboard 33.png",
+      "/images/DGA/Artboard 34.png",
+      "/images/DGA/Artboard 35.png",
+      "/images/DGA/Artboard 36.png",
+      "/images/DGA/Artboard 37.png",
+      "/images/DGA/Artboard 4.png",
+      "/images/DGA/Artboard 5.png",
+      "/images/DGA/Artboard 6.png",
+      "/images/DGA/Artboard 7.png",
+      "/images/DGA/Artboard 8.png",
+      "/images/DGA/Artboard 9.png",
     ],
+    hashes: {
+      "/images/DGA/Artboard 1.png": "b41faaf5",
+      "/images/DGA/Artboard 10.png": "28fdfa2d",
+      "/images/DGA/Artboard 11.png": "961e6bbe",
+      "/images/DGA/Artboard 12.png": "37ccb6d9",
+      "/images/DGA/Artboard 13.png": "85e622a6",
+      "/images/DGA/Artboard 14.png": "b4a9837e",
+      "/images/DGA/Artboard 15.png": "eb1f268f",
+      "/images/DGA/Artboard 16.png": "6dd7e692",
+      "/images/DGA/Artboard 17.png": "a56d23a7",
+      "/images/DGA/Artboard 18.png": "6362ca29",
+      "/images/DGA/Artboard 19.png": "34b4d64d",
+      "/images/DGA/Artboard 2.png": "567cc485",
+      "/images/DGA/Artboard 20.png": "7ea1cda4",
+      "/images/DGA/Artboard 21.png": "d9ca8422",
+      "/images/DGA/Artboard 22.png": "663e6b95",
+      "/images/DGA/Artboard 23.png": "a72cbc1e",
+      "/images/DGA/Artboard 24.png": "488290af",
+      "/images/DGA/Artboard 25.png": "41e53bce",
+      "/images/DGA/Artboard 26.png": "5869095a",
+      "/images/DGA/Artboard 27.png": "94f5ac33",
+      "/images/DGA/Artboard 28.png": "a11161b2",
+      "/images/DGA/Artboard 29.png": "137d7790",
+      "/images/DGA/Artboard 3.png": "bf31ba22",
+      "/images/DGA/Artboard 30.png": "d54e87d8",
+      "/images/DGA/Artboard 31.png": "e5568e2e",
+      "/images/DGA/Artboard 32.png": "9cfabfd7",
+      "/images/DGA/Artboard 33.png": "021d7e69",
+      "/images/DGA/Artboard 34.png": "ba27d7a2",
+      "/images/DGA/Artboard 35.png": "f2fa4e4e",
+      "/images/DGA/Artboard 36.png": "a37e0d43",
+      "/images/DGA/Artboard 37.png": "43f5abf6",
+      "/images/DGA/Artboard 4.png": "7865e5e5",
+      "/images/DGA/Artboard 5.png": "afe3a5d0",
+      "/images/DGA/Artboard 6.png": "0df2e356",
+      "/images/DGA/Artboard 7.png": "b5cb9a7c",
+      "/images/DGA/Artboard 8.png": "cbc5856c",
+      "/images/DGA/Artboard 9.png": "1883a0c8",
+    },
+    imageMeta: {
+      "/images/DGA/Artboard 1.png": { width: 597, height: 843, color: "#2b286a", placeholder: "data:image/webp;base64,UklGRr4AAABXRUJQVlA4WAoAAAAQAAAADwAAFgAAQUxQSB0AAAABJ3D//4iIBTINCJNABpNA/3hud0T/J4CY+imeBQBWUDggegAAANADAJ0BKhAAFwA/EXKyUKwmpKKwCAGAIglmAABcFbwU4cpiR7t8sAD+6GeRo0jcBaJSeol3+DOmQ9S0AFZvyN0b3LcKqgm1OBkgE/R3VskhDRvxkqXM03tLSnFUMLcHsrjU/vJfcisvy4gejmtSwQZD+H7SwVtjusAA" },
+      "/images/DGA/Artboard 10.png": { width: 596, height: 843, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRoAAAABXRUJQVlA4WAoAAAAQAAAADwAAFgAAQUxQSBMAAAABD/D+/4iIIBZM8pfeH0FE/7MVAFZQOCBGAAAAMAMAnQEqEAAXAD8RcrBQLCakorAIAYAiCWcAAFvqA+AFYAD+7UdgSCjeb9kAmJw5hHLG5tr8QSwgN6s9FRV0Y8XS/sIAAA==" },
+      "/images/DGA/Artboard 11.png": { width: 596, height: 843, color: "#fcfcfc", placeholder: "data:image/webp;base64,UklGRnwAAABXRUJQVlA4WAoAAAAQAAAADwAAFgAAQUxQSBcAAAABH3D//4iIBUG2zeZvsqseIKL/IfC5CgBWUDggPgAAALADAJ0BKhAAFwA/EXKwUCwmpKKwCAGAIglpAABcTsXZzJ5wrYQAAP7qfCKxOpiLFV0hO3Pf/0rGPGDAgAAA" },
+      "/images/DGA/Artboard 12.png": { width: 597, height: 843, color: "#e9e9ef", placeholder: "data:image/webp;base64,UklGRpQAAABXRUJQVlA4WAoAAAAQAAAADwAAFgAAQUxQSB0AAAABJ3D//4iIBTINCJNABpNA/3hud0T/J4CY+imeBQBWUDggUAAAAJADAJ0BKhAAFwA/EXKwUCwmpKKwCAGAIglnAABcG/fFp6x1OUAA/up8ClqVjnbANv5PGBYRp2Dibki/HS9JfqoCumljMBnfTvBPh4VAgAAA" },
+      "/images/DGA/Artboard 13.png": { width: 596, height: 843, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRnoAAABXRUJQVlA4WAoAAAAQAAAADwAAFgAAQUxQSBMAAAABD/D+/4iIIBZM8pfeH0FE/7MVAFZQOCBAAAAAUAMAnQEqEAAXAD8RcrFQLCakorAIAYAiCWcAAF3wpd9IncAA/uqF82nZVGo7jZj/UdDtJj43CVUVzstIAQAAAA==" },
+      "/images/DGA/Artboard 14.png": { width: 596, height: 843, color: "#e8eaee", placeholder: "data:image/webp;base64,UklGRowAAABXRUJQVlA4WAoAAAAQAAAADwAAFgAAQUxQSBMAAAABD/D+/4iIIBZM8pfeH0FE/7MVAFZQOCBSAAAAcAMAnQEqEAAXAD8RcrBQLCakorAIAYAiCWUAAFvT1/KiZ5vwAP7neSGVK5qWnvcwe8jUygCnGILbtThOgAeLACqoKgCycKwtuHSG8w6cytEAAA==" },
+      "/images/DGA/Artboard 15.png": { width: 597, height: 842, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRrIAAABXRUJQVlA4WAoAAAAQAAAADwAAFgAAQUxQSBMAAAABF9D/iAgISAhZ5v82AyL6H0JfAFZQOCB4AAAAsAMAnQEqEAAXAD8RcrBQLCakorAIAYAiCWMAAFxN5uNjyc05vgAA/u1O5KlVKuRqgIlWwcGXUyKoAn8OK38iDP0X3PlXqmPGJRBjsEtdFKqn1Wccp/iLcal164dhSvV3O83gcREAej7F7cX03zUYAW0qYFFIaAAA" },
+      "/images/DGA/Artboard 16.png": { width: 596, height: 842, color: "#ebebf0", placeholder: "data:image/webp;base64,UklGRkwAAABXRUJQVlA4IEAAAACQAwCdASoQABcAPxFysFCsJqSisAgBgCIJZwAAW9VP2xSsSCIAAP7qfAZDH8B84+YOge6T1SUPb71AErSYAAAA" },
+      "/images/DGA/Artboard 17.png": { width: 596, height: 842, color: "#f0f0f2", placeholder: "data:image/webp;base64,UklGRkoAAABXRUJQVlA4ID4AAABwAwCdASoQABcAPxFysFAsJqSisAgBgCIJZwAAW+i2aPJEuwAA/ud5GpYqPGt/F4EhX+Oz46/wIpxwwAAAAA==" },
+      "/images/DGA/Artboard 18.png": { width: 597, height: 842, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRnYAAABXRUJQVlA4WAoAAAAQAAAADwAAFgAAQUxQSBQAAAABF3D//4iIQUBC8Nz/DIjofwh9AVZQOCA8AAAAkAMAnQEqEAAXAD8RcrBQLCakorAIAYAiCWcAAFvp/Da8E1ALkAD+53kaldXU8ux+G3jhumURey24QAAA" },
+      "/images/DGA/Artboard 19.png": { width: 596, height: 842, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRm4AAABXRUJQVlA4WAoAAAAQAAAADwAAFgAAQUxQSBEAAAABD9D/iAgIBJLQ558gov+hFwBWUDggNgAAABADAJ0BKhAAFwA/EXKwUCwmpKMwCAGAIglpAABb6WhncAD+53kaliqtkeMHXofyVYx4tsAAAA==" },
+      "/images/DGA/Artboard 2.png": { width: 596, height: 843, color: "#2a2a68", placeholder: "data:image/webp;base64,UklGRnYAAABXRUJQVlA4WAoAAAAQAAAADwAAFgAAQUxQSBMAAAABD3D//4iIIBZM8pfeH0FE/7MVAFZQOCA8AAAA0AIAnQEqEAAXAD8RcrBQLCakorAIAYAiCUAX5wWkgAD+66rUCZH4cFzenJ4KkGW51VTvnsFVWd4QAAAA" },
+      "/images/DGA/Artboard 20.png": { width: 596, height: 842, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRmIAAABXRUJQVlA4IFYAAACwAwCdASoQABcAPxFysFAsJqSisAgBgCIJYwBTAAehvAyri2IvIAD+7T54W88ET4RElRcmSNNzFqK8LPm1BIuVRGpilXHZVZIIrDyeL2muqc7HRAAAAA==" },
+      "/images/DGA/Artboard 21.png": { width: 596, height: 842, color: "#eeeff2", placeholder: "data:image/webp;base64,UklGRlIAAABXRUJQVlA4IEYAAABQAwCdASoQABcAPxFysFAsJqSisAgBgCIJZwAAW9W8sN81AAD+6pjGyxtl2HI/92Qtm8sAsKRqN6qP4ZOYZ8jlVSEGbgIA" },
+      "/images/DGA/Artboard 22.png": { width: 597, height: 842, color: "#eae9ef", placeholder: "data:image/webp;base64,UklGRooAAABXRUJQVlA4WAoAAAAQAAAADwAAFgAAQUxQSBIAAAABD9D/iAgIZJPdPP4IIvofegFWUDggUgAAANADAJ0BKhAAFwA/EXKwUCwmpKKwCAGAIglnAMssIdSrLBLpgWSi5AD+7UgJZglB+TssHcE7MzthZHA4juMl++SESBBw6eLwBWOdmGbYw+GXgAA=" },
+      "/images/DGA/Artboard 23.png": { width: 596, height: 842, color: "#f4f4f7", placeholder: "data:image/webp;base64,UklGRmYAAABXRUJQVlA4IFoAAAAQBACdASoQABcAPxFysFAsJqSisAgBgCIJZQDDNB6W9fEKCKbW8v98AAD+7WGk8C6PI2UINQky0rscNwTL4Dtn04ConPBJsVzEc2BIEst6f2gG2pTxqCEHUAA=" },
+      "/images/DGA/Artboard 24.png": { width: 596, height: 842, color: "#e5e4ec", placeholder: "data:image/webp;base64,UklGRkAAAABXRUJQVlA4IDQAAADQAgCdASoQABcAPxFysFAsJqSisAgBgCIJaQAAifQAAP7vHiBr3gO8w470Zgww6V9SYEAA" },
+      "/images/DGA/Artboard 25.png": { width: 596, height: 842, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRqgAAABXRUJQVlA4WAoAAAAQAAAADwAAFgAAQUxQSBEAAAABD9D/iAgIBJL2N58gov+RFwBWUDggcAAAAJADAJ0BKhAAFwA/EXKwUCwmpKKwCAGAIglnAAPkOdYzE7nwgYAA/uDXk9xdyES6wY+ofoct1T9zXxS62yMl+bmf6rxCc98kbJsLECKAjtnJJHVG2HynO7IdBxLG7w3cwfqtCYbex2LEDcPARefwAAA=" },
+      "/images/DGA/Artboard 26.png": { width: 597, height: 842, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRnIAAABXRUJQVlA4WAoAAAAQAAAADwAAFgAAQUxQSBUAAAABF3D//4iIQUBCyDL/txkQ0f8Q+gIAVlA4IDYAAAAQAwCdASoQABcAPxFysFAsJqSisAgBgCIJZwAAeteaBKAA/u9mgCt9E+G9auuMFjzLRYAAAAA=" },
+      "/images/DGA/Artboard 27.png": { width: 596, height: 842, color: "#ebeef2", placeholder: "data:image/webp;base64,UklGRmQAAABXRUJQVlA4IFgAAAAQBACdASoQABcAPxFysFAsJqSisAgBgCIJZQAAXK+U/p7lnbDOCnlLAAD+4AXvUQYfX95bZcVc3TdvKDNFL48NQeSG6X0A1PNAcowLbc45nhFhDoUmgAAA" },
+      "/images/DGA/Artboard 28.png": { width: 596, height: 842, color: "#e9e8ef", placeholder: "data:image/webp;base64,UklGRl4AAABXRUJQVlA4IFIAAACwAwCdASoQABcAPxFysVAsJqSisAgBgCIJZwABHsvzcsSn6/LgAAD+/H5JnJDrR+te6SUeo1UzTE170yHkzSwI/ULPkygsnVjc1XU78+mGh4AA" },
+      "/images/DGA/Artboard 29.png": { width: 597, height: 842, color: "#e8e7ed", placeholder: "data:image/webp;base64,UklGRn4AAABXRUJQVlA4WAoAAAAQAAAADwAAFgAAQUxQSBQAAAABF3D//4iIQUBC8Nz/DIjofwh9AVZQOCBEAAAAcAMAnQEqEAAXAD8RcrBQrCakorAIAYAiCWcAAFvTWuyBkyrAAP7npvnw5OVlhMpQa/a2RnolZa0pOvQ9yEpkvW44AAA=" },
+      "/images/DGA/Artboard 3.png": { width: 596, height: 843, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRooAAABXRUJQVlA4WAoAAAAQAAAADwAAFgAAQUxQSBMAAAABD/D+/4iIIBZM8pfeH0FE/7MVAFZQOCBQAAAAEAMAnQEqEAAXAD8RcLBQLCYkorAIAYAiCWMAAFG8c6AAAP3h97bah2XS7ZYN0ki/qpWJy0lpXQMjWf4+PpJPzI0brrpbwk0Zu1gwdioAAAA=" },
+      "/images/DGA/Artboard 30.png": { width: 596, height: 842, color: "#e7e7ed", placeholder: "data:image/webp;base64,UklGRnoAAABXRUJQVlA4WAoAAAAQAAAADwAAFgAAQUxQSBEAAAABD9D/iAgIBJLQ558gov+hFwBWUDggQgAAAHADAJ0BKhAAFwA/EXKxUCwmpKKwCAGAIglnAABb6zbmUdyBgAD+53kalgpCjUIn0bsiXOpj9McOAxHKpeSqI4AAAA==" },
+      "/images/DGA/Artboard 31.png": { width: 596, height: 842, color: "#efeff3", placeholder: "data:image/webp;base64,UklGRkYAAABXRUJQVlA4IDoAAACQAwCdASoQABcAPxFysFAsJqSisAgBgCIJZwAAW+n7J3g0o0wAAP7neRqV8h6+O97qsMW/mioAAAAA" },
+      "/images/DGA/Artboard 32.png": { width: 596, height: 842, color: "#ecebef", placeholder: "data:image/webp;base64,UklGRlQAAABXRUJQVlA4IEgAAACQAwCdASoQABcAPxFysFAsJqSisAgBgCIJZQAAW9b218hZZfcAAP7tWrWccEdiUMvfOBrOQx1PQmPwJR58PHhzsS3PjAHAAAA=" },
+      "/images/DGA/Artboard 33.png": { width: 597, height: 842, color: "#ecebf0", placeholder: "data:image/webp;base64,UklGRnoAAABXRUJQVlA4WAoAAAAQAAAADwAAFgAAQUxQSBUAAAABF3D//4iIQUBCyDL/txkQ0f8Q+gIAVlA4ID4AAACQAwCdASoQABcAPxFysVCsJqSisAgBgCIJZwAAW+o9Be6i1W3AAP7neRqWvgKcGzIM84jb8SPrKgfv8AAAAA==" },
+      "/images/DGA/Artboard 34.png": { width: 596, height: 842, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRkAAAABXRUJQVlA4IDQAAABQAwCdASoQABcAPxFysFAsJqSjMAgBgCIJaQAAW+n9nhpQwAD+53kZRgZVALGaEy3OyBAA" },
+      "/images/DGA/Artboard 35.png": { width: 596, height: 842, color: "#e9e9ef", placeholder: "data:image/webp;base64,UklGRmgAAABXRUJQVlA4IFwAAADwAwCdASoQABcAPxFwsFAsJiSisAgBgCIJZQDG9CHnhMMOWZXaAeQAAP7neSGUOgluDAsltlk+CoaXk/VWsKlI+0yWaOg5AI4oAvHSk9Hz+Wnx6jxkgC4GwBAAAA==" },
+      "/images/DGA/Artboard 36.png": { width: 596, height: 842, color: "#ffffff", placeholder: "data:image/webp;base64,UklGRnYAAABXRUJQVlA4WAoAAAAQAAAADwAAFgAAQUxQSBEAAAABD9D/iAgIBJL2N58gov+RFwBWUDggPgAAABADAJ0BKhAAFwA/EXKwUCwmpKMwCAGAIglnAABb6zV3gAD+53kamb+okSCl60DQR9aUS/n6O0AOIXjDRAAA" },
+      "/images/DGA/Artboard 37.png": { width: 596, height: 842, color: "#2a2a68", placeholder: "data:image/webp;base64,UklGRj4AAABXRUJQVlA4IDIAAADQAgCdASoQABcAPxFwsFAsJiSisAgBgCIJQBibBaSAAP7sfG/jhdrCOTBrvSeJmwAAAA==" },
+      "/images/DGA/Artboard 4.png": { width: 597, height: 843, color: "#e9eaef", placeholder: "data:image/webp;base64,UklGRr4AAABXRUJQVlA4WAoAAAAQAAAADwAAFgAAQUxQSDAAAAABL6AgbQPGv+l2x0REpAcKGklxwMlJoDnBv5v2xUBE/yeAqZQVGvkGjXyHRrrwMgFWUDggaAAAADAEAJ0BKhAAFwA/EXKwUCwmpKKwCAGAIgllAFMED/gPJNKsVwUh3N423AD+5+zy+j8hzS5gPgbaiOWTyIelQEFs/obE/BBSIDF17Srf05mROQNy1Hu42B7ZhnEuhMr9jfRg3KzUAAAA" },
+      "/images/DGA/Artboard 5.png": { width: 596, height: 843, color: "#eeedf2", placeholder: "data:image/webp;base64,UklGRqwAAABXRUJQVlA4WAoAAAAQAAAADwAAFgAAQUxQSBwAAAABH3D//4iIBVmAydDiHVoefQFE9H8OgAw2H9QCVlA4IGoAAADQAwCdASoQABcAPxFysFAsJqSisAgBgCIJZQDImCHhZg+EKDqrnQAA/ufs8vo/sVkIHPMCXvsUpsX1NxLmpy1gMLC4QCLkkJ9h9P1h9BFk+QP/2PG3+yAvyFKphjubDVDFCyAHXiIfxIgA" },
+      "/images/DGA/Artboard 6.png": { width: 596, height: 843, color: "#e8e8ee", placeholder: "data:image/webp;base64,UklGRnwAAABXRUJQVlA4WAoAAAAQAAAADwAAFgAAQUxQSBMAAAABD/D+/4iIIBZM8pfeH0FE/7MVAFZQOCBCAAAAMAMAnQEqEAAXAD8RcrBQLCakorAIAYAiCWkAAInrz+ZrAAD+7x39uBcbpqv817B+zrWUQ2M5aClu4a7UMx3H4QAA" },
+      "/images/DGA/Artboard 7.png": { width: 596, height: 843, color: "#ebebf0", placeholder: "data:image/webp;base64,UklGRoAAAABXRUJQVlA4WAoAAAAQAAAADwAAFgAAQUxQSBMAAAABD/D+/4iIIBZM8pfeH0FE/7MVAFZQOCBGAAAAsAMAnQEqEAAXAD8RcrBQLCakorAIAYAiCWkAAFxOxba+V7+8HAAA/up8IrEuq3KMznJyMkQ/Qea+kv6cOXv+GFbZQgAAAA==" },
+      "/images/DGA/Artboard 8.png": { width: 597, height: 843, color: "#eeecf2", placeholder: "data:image/webp;base64,UklGRooAAABXRUJQVlA4WAoAAAAQAAAADwAAFgAAQUxQSBgAAAABH3D//4iIBYEARZ7ZyzNbDIjofwj82WRWUDggTAAAALADAJ0BKhAAFwA/EXSyUKwmpKKwCAGAIgllAABb6M8YEomESbVwAP7tSRsyN+sLsUMPKzAgYqE+fgKv69d1pzsXsseieS9VLoTtCAA=" },
+      "/images/DGA/Artboard 9.png": { width: 596, height: 843, color: "#eaeaee", placeholder: "data:image/webp;base64,UklGRpYAAABXRUJQVlA4WAoAAAAQAAAADwAAFgAAQUxQSBMAAAABD/D+/4iIIBZM8pfeH0FE/7MVAFZQOCBcAAAAsAMAnQEqEAAXAD8RcrBQLCakorAIAYAiCWcAAFvavToeg5eD1qwA/u1Hao5JwoD655u5McFXMsYGgAMcN8bcDqXgc0IJKi4nI0PhzILXZiNmtqk06GVZ/wGEAAA=" },
+    },
   },
   {
     id: "ethos",
     name: "Ethos",
     type: "Social Media",
     description: `Ethos is a KSA based creative agency I spent over a year working in. I used to create the visuals for the company whether they were needed to be posted on LinkedIn or be sent to the team or clients.`,
-    thumbnail: "/images/Ethos/Hiring-%20Digital%20Account%20Lead.jpg",
+    thumbnail: "/images/Ethos/عيد أضحى مبارك.jpg",
     images: [
-      "/images/Ethos/Hiring-%20Digital%20Account%20Lead.jpg",
-      "/images/Ethos/%D8%B9%D9%8A%D8%AF%20%20%D8%A7%D9%94%D8%B6%D8%AD%D9%89%20%D9%85%D8%A8%D8%A7%D8%B1%D9%83.jpg",
-      "/images/Ethos/%D8%B9%D9%8A%D8%AF%20%D8%A7%D9%94%D8%B6%D8%AD%D9%89%20%D9%85%D8%A8%D8%A7%D8%B1%D9%83.jpg",
-      "/images/Ethos/%D9%81%D8%B7%D8%B1%20%D8%B3%D8%B9%D9%8A%D8%AF.jpg",
+      "/images/Ethos/Hiring- Digital Account Lead.jpg",
+      "/images/Ethos/عيد  أضحى مبارك.jpg",
+      "/images/Ethos/عيد أضحى مبارك.jpg",
+      "/images/Ethos/فطر سعيد.jpg",
     ],
+    hashes: {
+      "/images/Ethos/Hiring- Digital Account Lead.jpg": "3ae308fd",
+      "/images/Ethos/عيد  أضحى مبارك.jpg": "a307dc73",
+      "/images/Ethos/عيد أضحى مبارك.jpg": "759c70f9",
+      "/images/Ethos/فطر سعيد.jpg": "d83a919b",
+    },
+    imageMeta: {
+      "/images/Ethos/Hiring- Digital Account Lead.jpg": { width: 1080, height: 1080, color: "#dfbdc4", placeholder: "data:image/webp;base64,UklGRnAAAABXRUJQVlA4IGQAAADwAQCdASoQABAABABoJZAC7AEQNSydwAAA/u3hjMgCtgcw/5Mbn3RSffQVhl6RxVnR+B8nw8RROvMvNT8nlq3kQZ3tn3FLGnR3vMyqaBsmZQd5+d/gyHH3jq9YG920CRkOAAAA" },
+      "/images/Ethos/عيد  أضحى مبارك.jpg": { width: 1080, height: 1080, color: "#d9d4d9", placeholder: "data:image/webp;base64,UklGRlYAAABXRUJQVlA4IEoAAADwAQCdASoQABAABABoJZQAAud+K7oy23QA/uqCkiy+fXQTJzMlxbMJ2L86nz4A/rM9m7yD+c6pBSt0MLlxqE/PrfJlwVpCsAAAAA==" },
+      "/images/Ethos/عيد أضحى مبارك.jpg": { width: 1080, height: 1080, color: "#98b9cf", placeholder: "data:image/webp;base64,UklGRmQAAABXRUJQVlA4IFgAAAAwAgCdASoQABAABABoJbACdH8AF7cbRXfq8AD+9NvJI0TQKJjrMFMpYo0tbxbbiNg/FLEeSwU/S87IioternFxxziYGWG1r4v7A6wFDeM+szwUAMPfGPAA" },
+      "/images/Ethos/فطر سعيد.jpg": { width: 1080, height: 1080, color: "#d39d9f", placeholder: "data:image/webp;base64,UklGRm4AAABXRUJQVlA4IGIAAAAwAgCdASoQABAABABoJbAC7AELlZPMYxcDAAD+83T0Exqat2fcDTdtxH/3Xv9kQc8zVqpkP8qm2kSO+DUiFwlIQHfI5Gx3X2NcAFVeX8TIQTa70alFeuA4330G+xO6YoAAAA==" },
+    },
   },
   {
     id: "ferra-rawan",
     name: "Ferra Rawan",
     type: "Social Media + Branding",
-    description: ``,
-    thumbnail: "/images/Ferra%20Rawan/Artboard%201.png",
+    thumbnail: "/images/Ferra Rawan/Artboard 2.png",
     images: [
-      "/images/Ferra%20Rawan/Artboard%201.png",
-      "/images/Ferra%20Rawan/Artboard%202.png",
-      "/images/Ferra%20Rawan/Artboard%203.png",
-      "/images/Ferra%20Rawan/Artboard%204.png",
+      "/images/Ferra Rawan/Artboard 1.png",
+      "/images/Ferra Rawan/Artboard 2.png",
+      "/images/Ferra Rawan/Artboard 3.png",
+      "/images/Ferra Rawan/Artboard 4.png",
     ],
+    hashes: {
+      "/images/Ferra Rawan/Artboard 1.png": "f6e2d5e5",
+      "/images/Ferra Rawan/Artboard 2.png": "8bcb1249",
+      "/images/Ferra Rawan/Artboard 3.png": "7b23189b",
+      "/images/Ferra Rawan/Artboard 4.png": "07e0ad90",
+    },
+    imageMeta: {
+      "/images/Ferra Rawan/Artboard 1.png": { width: 1080, height: 1080, color: "#f4f3ee", placeholder: "data:image/webp;base64,UklGRiYAAABXRUJQVlA4IBoAAAAwAQCdASoQABAABABoJZwAA3AA/vESYwgAAA==" },
+      "/images/Ferra Rawan/Artboard 2.png": { width: 1080, height: 1080, color: "#000000", placeholder: "data:image/webp;base64,UklGRugAAABXRUJQVlA4WAoAAAAQAAAADwAADwAAQUxQSFQAAAABcB3bttJs3B367w3inot/xT0FRMQE8H/drHCx8szAKHIdNiIly6aZMxNZwng67WhOJ0FOp+4dh7adsmyaOcu23YIdpxZmlmvgBQBpDIQRkBU3vw5WUDggbgAAALACAJ0BKhAAEAAEAGglmAJ0fwXH+MAA4BkMUNjWAAD+y1js8VVgrVQ21tXllN3EnpLBv/5sgnShjGyFo8fs62PyLiToyunLxQkR3qQ0d3Ft/Rr2T0xxcGmp4EtMytqnZStzr9N8ejMsQUrwCAAA" },
+      "/images/Ferra Rawan/Artboard 3.png": { width: 1080, height: 1080, color: "#000000", placeholder: "data:image/webp;base64,UklGRoIAAABXRUJQVlA4WAoAAAAQAAAADwAADwAAQUxQSEEAAAABuS5E9D/AOpKkVIv9ef5pkBc8d3cJIGICJgDhBx1m1BMmoxY3yewEsKsJEzgvEYMLGnfFoq4IlwCIC0bligffBABWUDggGgAAADABAJ0BKhAAEAAEAGglpAADcAD+8z3WAAAA" },
+      "/images/Ferra Rawan/Artboard 4.png": { width: 1080, height: 1080, color: "#f4f3ee", placeholder: "data:image/webp;base64,UklGRlgAAABXRUJQVlA4IEwAAADwAQCdASoQABAABABoJZwAApMisJJpPrIA/vOCgL4Dkt3+rp60KrLoz9QxhZUz20+/TWOD3LZCe6V/v5kXUu+I82s8SSxuTWQ5PgAA" },
+    },
   },
   {
     id: "fff",
     name: "FFF",
     type: "Social Media",
     description: `Created the social media visual style and opening grids for Frozen Food Factory, a brand selling high level - long lasting frozen meals.`,
-    thumbnail: "/images/FFF/1.png",
+    thumbnail: "/images/FFF/2.png",
     images: [
       "/images/FFF/1.png",
       "/images/FFF/2.png",
@@ -552,6 +1268,22 @@ export const projects = [
       "/images/FFF/5.png",
       "/images/FFF/6.png",
     ],
+    hashes: {
+      "/images/FFF/1.png": "ade52cc5",
+      "/images/FFF/2.png": "5102dcf1",
+      "/images/FFF/3.png": "d8bb3354",
+      "/images/FFF/4.png": "7be67ed2",
+      "/images/FFF/5.png": "86b8374b",
+      "/images/FFF/6.png": "2bcd312a",
+    },
+    imageMeta: {
+      "/images/FFF/1.png": { width: 400, height: 500, color: "#d9e6f0", placeholder: "data:image/webp;base64,UklGRl4AAABXRUJQVlA4IFIAAADQAwCdASoQABQAPxFysFAsJqSisAgBgCIJZQC/OCG+x0jcSVETEgAA/ufCr179ja4EsvHj8LLxIOUYoPHF2th3mwS6OziisIl18OzgJSLh4AAA" },
+      "/images/FFF/2.png": { width: 400, height: 500, color: "#d6e5f1", placeholder: "data:image/webp;base64,UklGRlgAAABXRUJQVlA4IEwAAADQAwCdASoQABQAPxFysFAsJqSisAgBgCIJYwCdACHfLzay6jUfeAAA/t6TKGVDT/UtcTaozL9js1lM0vjg2w0U0z+6GyYqS6IxzgAA" },
+      "/images/FFF/3.png": { width: 400, height: 500, color: "#d9e7f5", placeholder: "data:image/webp;base64,UklGRlgAAABXRUJQVlA4IEwAAACwAwCdASoQABQAPxFysFAsJqSisAgBgCIJZQC7ACHfL2ozDwd/gAD+5yaRdzWIWWJlMaQpCiJhU8xvcutXSkqAI9qg1bUhcYSQAAAA" },
+      "/images/FFF/4.png": { width: 400, height: 500, color: "#493c38", placeholder: "data:image/webp;base64,UklGRnoAAABXRUJQVlA4IG4AAADQAwCdASoQABQAPxFysFAsJqSisAgBgCIJZQAAXqSyS8MGIcy92IAA/ujwydyK7ynXNaysHfY4MXdGmeNIzW+fnvqvMgCnBK9SLJDj6cRLWqvAP+JHh2eQoDw4AA2e8YXHNziRL27HE8Gp+OiAAA==" },
+      "/images/FFF/5.png": { width: 400, height: 500, color: "#22201e", placeholder: "data:image/webp;base64,UklGRmwAAABXRUJQVlA4IGAAAACwAwCdASoQABQAPxFysFAsJqSisAgBgCIJYwAAW+skilQCO6EdwAD+6LnKDKx5FThvRrWXCGXBh+sZ5jGmbWNW703QHApdfq4rN2ycv4bJYRHhvmj+OPyuiaZhbSmgAAA=" },
+      "/images/FFF/6.png": { width: 400, height: 500, color: "#0b0807", placeholder: "data:image/webp;base64,UklGRnYAAABXRUJQVlA4IGoAAACwAwCdASoQABQAPxFysFAsJqSisAgBgCIJQBdgBDvwAkFWItppYAD+7nhVOjQQPyYtz7tHgCfzB9br7Eao6D3zbMydH2eM0vo7ncA5nUPghBTLtrdUoExEV/I1yOFf2q41ZEiK1pXpRywA" },
+    },
   },
   {
     id: "happies",
@@ -570,107 +1302,237 @@ export const projects = [
     name: "MAC",
     type: "Social Media",
     description: `I worked on the account of MAC Platforms, a creative agency I worked in. I adopted a collage style for it along with different style of reels for depending on the client.`,
-    thumbnail: "/images/MAC/1.png",
+    thumbnail: "/images/MAC/Highlights/4.png",
     images: [
       "/images/MAC/1.png",
-      "/images/MAC/Highlights/1.png",
       "/images/MAC/2.png",
-      "/images/MAC/Highlights/2.png",
       "/images/MAC/3.png",
-      "/images/MAC/Highlights/3.png",
       "/images/MAC/4.png",
-      "/images/MAC/Highlights/4.png",
       "/images/MAC/5.png",
-      "/images/MAC/Highlights/5.png",
       "/images/MAC/6.png",
-      "/images/MAC/Highlights/6.png",
       "/images/MAC/7.png",
-      "/images/MAC/Highlights/7.png",
       "/images/MAC/8.jpg",
+      "/images/MAC/Highlights/1.png",
+      "/images/MAC/Highlights/2.png",
+      "/images/MAC/Highlights/3.png",
+      "/images/MAC/Highlights/4.png",
+      "/images/MAC/Highlights/5.png",
+      "/images/MAC/Highlights/6.png",
+      "/images/MAC/Highlights/7.png",
     ],
-    videos: [
-      "/images/MAC/CWF%20x%20MAC%202.mp4",
-      "/images/MAC/Crispy%20w%20Fahita%20Rebranding%20MAC%20Reel.mp4",
-    ],
+    hashes: {
+      "/images/MAC/1.png": "00b7d165",
+      "/images/MAC/2.png": "4eefecec",
+      "/images/MAC/3.png": "460e10ee",
+      "/images/MAC/4.png": "81c97e56",
+      "/images/MAC/5.png": "e1fba62d",
+      "/images/MAC/6.png": "1113cc67",
+      "/images/MAC/7.png": "14dfa0cf",
+      "/images/MAC/8.jpg": "f7b7231b",
+      "/images/MAC/Highlights/1.png": "99fa2198",
+      "/images/MAC/Highlights/2.png": "ac7330a5",
+      "/images/MAC/Highlights/3.png": "c9958cb1",
+      "/images/MAC/Highlights/4.png": "1e7aa087",
+      "/images/MAC/Highlights/5.png": "7b36d783",
+      "/images/MAC/Highlights/6.png": "1add3829",
+      "/images/MAC/Highlights/7.png": "f647e24e",
+    },
+    imageMeta: {
+      "/images/MAC/1.png": { width: 1080, height: 1350, color: "#f4c800", placeholder: "data:image/webp;base64,UklGRpoAAABXRUJQVlA4II4AAABQBACdASoQABQAPxFysFAsJqSisAgBgCIJbACdMoR4GCTUwT+L2DpIelgAAP6M75z4xgzJYOM8VhKqUMNPlFvWmeR0+e9xsD/+qBaGgmZg/ajOR7vl0/+RuQfsnAYY1Gt0J6lwSV0fOzmSNXeQDubPNTq19Wk0pL+aArL+OQLXvZbE/dlw0PqmScX4AAAA" },
+      "/images/MAC/2.png": { width: 1080, height: 1350, color: "#006695", placeholder: "data:image/webp;base64,UklGRoYAAABXRUJQVlA4IHoAAABQBACdASoQABQAPxFysFAsJqSisAgBgCIJbACdMoR3ACUHJTYqPSbR83BAAP6ds3c/VzYrbgsEkGvvI01+pqk1IHykZmTeeG43LqolkhwdN7dSTX07g4xxAW55ssEcYc+mg4EFNox/RvAaQ5PMVC9k0itZ0SycngGAAA==" },
+      "/images/MAC/3.png": { width: 1080, height: 1350, color: "#fed300", placeholder: "data:image/webp;base64,UklGRp4AAABXRUJQVlA4IJIAAAAQBQCdASoQABQAPxFysFAsJqSisAgBgCIJbACdMoR3N5K1ADJM95G8mYDWSNrl8jsAAP6wFmHeNTO8bfNjvjJw5p/DSOz6Y4Kv1a8RcSyAkT24l/jBeYkD8p4sB2c4d1XRFZYsCv2q/XDrhw/n4Nf+sa7Z6Yth/DkU61edPIJNuP283+0i7pVheF8zXV6dL6RgAA==" },
+      "/images/MAC/4.png": { width: 1080, height: 1350, color: "#006996", placeholder: "data:image/webp;base64,UklGRqgAAABXRUJQVlA4IJwAAABQBACdASoQABQAPxFysFAsJqSisAgBgCIJbACdMoR3ACmqmGsnENsv7q8AAP5u2jaH4+MeojgF0M3vXpSGSzP4xlfSfZkqfP48GJ7tfKdKZw8yRK0DZsbf0rVBRlNSCvS3jCGbjfoa3UlwYQpJCyKxhN50aFDxoW94TMOrEKh6tHMqFrL7pr+LeUV/L1JkPXo3bsA8+Ssv+PtHugA=" },
+      "/images/MAC/5.png": { width: 1080, height: 1350, color: "#ffca11", placeholder: "data:image/webp;base64,UklGRpQAAABXRUJQVlA4IIgAAADwAwCdASoQABQAPxFysFAsJqSisAgBgCIJbACdMoRwACD0swJv7yIgAP6PrGYnFnGMM1ctH+ssepNZyAKC9a0J1aMQucTlWXLYCpDfW7UiBZ2rNv/yNqHnI8wTgzPOKnt9Ws3g1ARhepZP4Z8nzpnrMWOCGm6AbE+p8goqPLoiCa6Pt3xcAAAA" },
+      "/images/MAC/6.png": { width: 1080, height: 1350, color: "#006895", placeholder: "data:image/webp;base64,UklGRqIAAABXRUJQVlA4IJYAAACQBACdASoQABQAPxFysFAsJqSisAgBgCIJbACdMoRiu3AMYdYrnCGQpls/qIAA/p7L1+Y9aNxjfoOQ/MP21ExK9sgSCsS1LT3I956zZXmYox5zOIynCCvIbCujYQd/IqHIh5I+k72W+c7z8wTMtAe/yG7qaDwVpqjetM3Qa5bW5t4xwoikjKhQ0brwsceG1BFytS2AAAA=" },
+      "/images/MAC/7.png": { width: 1080, height: 1350, color: "#0271a1", placeholder: "data:image/webp;base64,UklGRrQAAABXRUJQVlA4IKgAAAAQBQCdASoQABQAPxFysFAsJqSisAgBgCIJbACdMoRwN6Sfh2BXnqWGRGKH7ypUtnMAAP1v4dcoYgLkO16cAwo4TFBeJKNeyfL3mQl1xPRWa9WErWeIUlvvHpee0V8O/vl0Rx/RwR6+BXGIK6rfjLCWmR06QQQenXJeI4YVP0j+K2lw/A/+fv91+s6yIvRB//4O79/HVhp1nPsv8CTeluP5c7/Z/+gAAAA=" },
+      "/images/MAC/8.jpg": { width: 1080, height: 1350, color: "#55849a", placeholder: "data:image/webp;base64,UklGRmIAAABXRUJQVlA4IFYAAADQAwCdASoQABQAPxFysFAsJqSisAgBgCIJYgCdMoABjhZwHvBOVgAA53X+08+RdJHJWTv+uhKesPVPqWJrIRb3dH0cUMLmDlCuscpqA2e+tcQBh+gAAA==" },
+      "/images/MAC/Highlights/1.png": { width: 1080, height: 1080, color: "#006a92", placeholder: "data:image/webp;base64,UklGRnAAAABXRUJQVlA4IGQAAACQAgCdASoQABAABABoJbACdDiAN5VBkIZZNpaWcAD+uPMHg9VPMDKB/aNfv9lC9lYrnRMwOhHgmCliOcVxxz9to+jlOx0b8rIVvc/k7j2zxkP9RytGn20w08D7h1Hfjiq0AAAA" },
+      "/images/MAC/Highlights/2.png": { width: 1080, height: 1080, color: "#f4c800", placeholder: "data:image/webp;base64,UklGRk4AAABXRUJQVlA4IEIAAACQAQCdASoQABAABABoJbACdLoAA5gA/uts3v1g1NZ2QRlK8WPuQuI+0ptG42c17bqvuS/f/Ngft59vPIX4sNCbcAA=" },
+      "/images/MAC/Highlights/3.png": { width: 1080, height: 1080, color: "#f3f0e8", placeholder: "data:image/webp;base64,UklGRmQAAABXRUJQVlA4IFgAAAAwAgCdASoQABAABABoJbACdAYstyGj/RnsAAD+83ajUJsCDD733atLWe2tDg99hLx4Js2Mcbg56dv1rJNzCOZDsfwUqxcQOdJZXw28m6madT4rOfC2wAAA" },
+      "/images/MAC/Highlights/4.png": { width: 1080, height: 1080, color: "#006a92", placeholder: "data:image/webp;base64,UklGRmgAAABXRUJQVlA4IFwAAABQAgCdASoQABAABABoJbACdDiAAUpA+pOx3gAA/srv/KY/W5FNuR3TyS/aglArEt03A++3b9ZR+1+qS9EqX89CP/B8x6Msn8zt71EU7vYVyPt5EKLrX5eIrAAAAA==" },
+      "/images/MAC/Highlights/5.png": { width: 1080, height: 1080, color: "#006a92", placeholder: "data:image/webp;base64,UklGRmQAAABXRUJQVlA4IFgAAADwAQCdASoQABAABABoJbACdADdnKdfYIAA/rn1IbSpYpv6rTNH0IJUUbAZCE7BwAQKS6iNPso7JZb5LGJ9eJDyD0rqawgpLjb4/5R33/JnUyhZ8hRHYAAA" },
+      "/images/MAC/Highlights/6.png": { width: 1080, height: 1080, color: "#f4c800", placeholder: "data:image/webp;base64,UklGRloAAABXRUJQVlA4IE4AAAAQAgCdASoQABAABABoJbACdLoAAwkCOK8wAP7S4XegoPTrA6EWx12JBta1RPldgSULWxCp/8xZUTMfhYPJ8vg3axa68bJPxYaEu7gMAAA=" },
+      "/images/MAC/Highlights/7.png": { width: 1080, height: 1080, color: "#f4c800", placeholder: "data:image/webp;base64,UklGRmAAAABXRUJQVlA4IFQAAAAQAgCdASoQABAABABoJbACdLoAAwkClpXAAP7S4U9NHZ+Zmvo+rxiRjdhaaEq3v/QKiXtxbv/zFlk84byTn/8iWSS34gDSoz9IEphKbkUvibtZUAA=" },
+    },
   },
   {
     id: "neostrata",
     name: "NeoStrata",
     type: "Social Media",
-    description: ``,
-    thumbnail: "/images/NeoStrata/NeoStrata_01.jpg",
+    thumbnail: "/images/NeoStrata/NeoStrata_03.jpg",
     images: [
       "/images/NeoStrata/NeoStrata_01.jpg",
       "/images/NeoStrata/NeoStrata_02.jpg",
       "/images/NeoStrata/NeoStrata_03.jpg",
     ],
+    hashes: {
+      "/images/NeoStrata/NeoStrata_01.jpg": "939fe389",
+      "/images/NeoStrata/NeoStrata_02.jpg": "89c5f2fb",
+      "/images/NeoStrata/NeoStrata_03.jpg": "64846177",
+    },
+    imageMeta: {
+      "/images/NeoStrata/NeoStrata_01.jpg": { width: 1080, height: 1350, color: "#c4c3cd", placeholder: "data:image/webp;base64,UklGRnQAAABXRUJQVlA4IGgAAAAQBACdASoQABQAPxFysFAsJqSisAgBgCIJYgC7MoAC7fF9bBrZoMgKAAD8q3iG6mWPp4wyCnsVVgg0n89GSsND1FtvxQXEBuUZtmHdyFm9emE+A+NitTtyoBC4gMDYoVYTgNJkpoQAAA==" },
+      "/images/NeoStrata/NeoStrata_02.jpg": { width: 1080, height: 1350, color: "#9c6d5b", placeholder: "data:image/webp;base64,UklGRpAAAABXRUJQVlA4IIQAAADwAwCdASoQABQAPxFysFAsJqSisAgBgCIJYgCdMoACrphKGtfgwHagAP6M25I3cbgFbqc+dC6wD1hPf54bDThiu1y5Ls9KO0bGZzDt85lGZkc85UyOpPTGJY6sydvqwnEGPepf1WEDJlcqvqvplT6sbY0q29LQ+MiRsAB/zdPtrK8AAAA=" },
+      "/images/NeoStrata/NeoStrata_03.jpg": { width: 1080, height: 1350, color: "#ebb73a", placeholder: "data:image/webp;base64,UklGRpoAAABXRUJQVlA4II4AAABwBACdASoQABQAPxFysFAsJqSisAgBgCIJbACdOUCEAAM2VIWiBNnQcqToAAD+4ZJcn1dGdpAA/I8M7LI87PiF3dRhDNNjMqZG4k2gb6wpzhzvMT4Jk8/rAmZ3dQM5WzzHnGE4vW3puql3agv8CILC+y27oAu9tOTQ4+4t+bzcu3KTXqr7XMHlK+DIEoAA" },
+    },
   },
   {
     id: "private",
     name: "Private",
     type: "Others",
     description: `Confidential projects involving branding and visual identity design.`,
-    thumbnail: "/images/Private/A1.jpg",
+    thumbnail: "/images/Private/A3.jpg",
     images: [
       "/images/Private/A1.jpg",
       "/images/Private/A2.jpg",
       "/images/Private/A3.jpg",
     ],
+    hashes: {
+      "/images/Private/A1.jpg": "435982c5",
+      "/images/Private/A2.jpg": "54e068ce",
+      "/images/Private/A3.jpg": "c209ba14",
+    },
+    imageMeta: {
+      "/images/Private/A1.jpg": { width: 1080, height: 1350, color: "#34363c", placeholder: "data:image/webp;base64,UklGRpYAAABXRUJQVlA4IIoAAAAQBACdASoQABQAPxFysFAsJqSisAgBgCIJZQDE2BxIUTpn7OLNwf52wAD+gTx7LEJ4uuZEYpXDEz3IIG1qatJ4osRajCyDqmjttXAg7D9cTnJWOlrFzBr4qiyDy6WpcrCaRtxbta6fPUcbqMLvIvw0o7ACv9A0dFYmin6IdIj5+8jTP0koBmewAAA=" },
+      "/images/Private/A2.jpg": { width: 1800, height: 2250, color: "#412925", placeholder: "data:image/webp;base64,UklGRo4AAABXRUJQVlA4IIIAAAAwBACdASoQABQAPxFwsFAsJiSisAgBgCIJZgCdMoAB2A0+HnqIXqFlHsAA/lnpy6Qo+yxc/WqAwJuxtHXqS76WqMTCX0ZHZENXK4z9UewIgR0Q2H5rNxrJvM9lm3VSPGMeI6aFLwhTf0ezPxucSYt0+9t3AILM8Gek0GxhTrlQIAAA" },
+      "/images/Private/A3.jpg": { width: 1800, height: 2250, color: "#2b2326", placeholder: "data:image/webp;base64,UklGRpQAAABXRUJQVlA4IIgAAAAQBACdASoQABQAPxFysFAsJqSisAgBgCIJZgCdACPMGWG3rL5dSToRwADzqklKNcIEvoN0qJROH5jze/LtXkX2ouVkiFrypdGP8UdEIRDgdu/alwZ9hAG3CosAvVMCgpWSnBEbAfar0f1WBZ+3u/MJGohxOP/vAAENgzBqYJkPdFoWZdj+AAAA" },
+    },
   },
   {
     id: "rami-baddour",
     name: "Rami Baddour",
     type: "Social Media + Branding",
-    description: ``,
-    thumbnail: "/images/Rami%20Baddour/1.jpg",
+    thumbnail: "/images/Rami Baddour/3.png",
     images: [
-      "/images/Rami%20Baddour/1.jpg",
-      "/images/Rami%20Baddour/2.jpg",
-      "/images/Rami%20Baddour/3.png",
-      "/images/Rami%20Baddour/4.png",
-      "/images/Rami%20Baddour/5.png",
-      "/images/Rami%20Baddour/6.png",
-      "/images/Rami%20Baddour/7.png",
-      "/images/Rami%20Baddour/8.jpg",
-      "/images/Rami%20Baddour/9.jpg",
-      "/images/Rami%20Baddour/10.png",
-      "/images/Rami%20Baddour/11.jpg",
-      "/images/Rami%20Baddour/12.jpg",
-      "/images/Rami%20Baddour/13.png",
-      "/images/Rami%20Baddour/14.png",
-      "/images/Rami%20Baddour/15.png",
-      "/images/Rami%20Baddour/16.png",
-      "/images/Rami%20Baddour/17.png",
-      "/images/Rami%20Baddour/18.png",
-      "/images/Rami%20Baddour/19.png",
-      "/images/Rami%20Baddour/20.jpg",
-      "/images/Rami%20Baddour/21.jpg",
-      "/images/Rami%20Baddour/22.jpg",
-      "/images/Rami%20Baddour/23.jpg",
-      "/images/Rami%20Baddour/24.jpg",
-      "/images/Rami%20Baddour/25.jpg",
-      "/images/Rami%20Baddour/26.png",
-      "/images/Rami%20Baddour/27.png",
-      "/images/Rami%20Baddour/28.png",
-      "/images/Rami%20Baddour/29.png",
+      "/images/Rami Baddour/1.jpg",
+      "/images/Rami Baddour/10.png",
+      "/images/Rami Baddour/11.jpg",
+      "/images/Rami Baddour/12.jpg",
+      "/images/Rami Baddour/13.png",
+      "/images/Rami Baddour/14.png",
+      "/images/Rami Baddour/15.png",
+      "/images/Rami Baddour/16.png",
+      "/images/Rami Baddour/17.png",
+      "/images/Rami Baddour/18.png",
+      "/images/Rami Baddour/19.png",
+      "/images/Rami Baddour/2.jpg",
+      "/images/Rami Baddour/20.jpg",
+      "/images/Rami Baddour/21.jpg",
+      "/images/Rami Baddour/22.jpg",
+      "/images/Rami Baddour/23.jpg",
+      "/images/Rami Baddour/24.jpg",
+      "/images/Rami Baddour/25.jpg",
+      "/images/Rami Baddour/26.png",
+      "/images/Rami Baddour/27.png",
+      "/images/Rami Baddour/28.png",
+      "/images/Rami Baddour/29.png",
+      "/images/Rami Baddour/3.png",
+      "/images/Rami Baddour/4.png",
+      "/images/Rami Baddour/5.png",
+      "/images/Rami Baddour/6.png",
+      "/images/Rami Baddour/7.png",
+      "/images/Rami Baddour/8.jpg",
+      "/images/Rami Baddour/9.jpg",
     ],
+    hashes: {
+      "/images/Rami Baddour/1.jpg": "f3e93f10",
+      "/images/Rami Baddour/10.png": "ce0038f8",
+      "/images/Rami Baddour/11.jpg": "a52d3e90",
+      "/images/Rami Baddour/12.jpg": "e152e92a",
+      "/images/Rami Baddour/13.png": "6a60cc9b",
+      "/images/Rami Baddour/14.png": "bf8bab09",
+      "/images/Rami Baddour/15.png": "66bce799",
+      "/images/Rami Baddour/16.png": "80f67acb",
+      "/images/Rami Baddour/17.png": "2791f90c",
+      "/images/Rami Baddour/18.png": "1ddacad3",
+      "/images/Rami Baddour/19.png": "e6e225a9",
+      "/images/Rami Baddour/2.jpg": "b4fbc661",
+      "/images/Rami Baddour/20.jpg": "a2b280a1",
+      "/images/Rami Baddour/21.jpg": "f0ebaaaf",
+      "/images/Rami Baddour/22.jpg": "968533df",
+      "/images/Rami Baddour/23.jpg": "c21cd72b",
+      "/images/Rami Baddour/24.jpg": "4865497d",
+      "/images/Rami Baddour/25.jpg": "dc6b3b79",
+      "/images/Rami Baddour/26.png": "0f50d8be",
+      "/images/Rami Baddour/27.png": "629b8214",
+      "/images/Rami Baddour/28.png": "35222a19",
+      "/images/Rami Baddour/29.png": "b963932d",
+      "/images/Rami Baddour/3.png": "f6fa67aa",
+      "/images/Rami Baddour/4.png": "7f991fd2",
+      "/images/Rami Baddour/5.png": "3341f1c8",
+      "/images/Rami Baddour/6.png": "ceec296d",
+      "/images/Rami Baddour/7.png": "df3ed103",
+      "/images/Rami Baddour/8.jpg": "b4cf7e4a",
+      "/images/Rami Baddour/9.jpg": "4f981d61",
+    },
+    imageMeta: {
+      "/images/Rami Baddour/1.jpg": { width: 1920, height: 1080, color: "#f6f6f6", placeholder: "data:image/webp;base64,UklGRl4AAABXRUJQVlA4IFIAAAAwAgCdASoQAAkABABoJQBdgMXX325ilv/UAAD+4oyT1u/OfBCEhDtE/qauBFRWtR1RJe/NY84A00+L+CeRGqQOpVXUMv+RH5QEo0LM0ZWJwAAA" },
+      "/images/Rami Baddour/10.png": { width: 1920, height: 1080, color: "#a97d67", placeholder: "data:image/webp;base64,UklGRroAAABXRUJQVlA4WAoAAAAQAAAADwAACAAAQUxQSEAAAAABb6CmkRTojlcI2lFHTX02IiKgcZJNrv6AqI2kJPe/g/2iAgm4QAMCyDggZwcH6ENBRP9j5IKT9nSlJv/fmbAxVlA4IFQAAADwAQCdASoQAAkABABoJZgCdACpqkH3cEAA/Il8pFeJEzUVmVhC0iACbl+8gL4deqco8vhqoCnfCExBPTOi1kJC9ACCMUQhvqIf6AR9fVzwHCaAAAA=" },
+      "/images/Rami Baddour/11.jpg": { width: 1920, height: 1080, color: "#f6f6f6", placeholder: "data:image/webp;base64,UklGRl4AAABXRUJQVlA4IFIAAAAQAgCdASoQAAkABABoJQBOgCHw9CLf/5gAAP64RUXiNMU+TYx+0tNyl+Sx3ovNpvDiR2uctN/WlNzKgaVEI3A7QEhy36SuTr4MZJaED1pCGcAA" },
+      "/images/Rami Baddour/12.jpg": { width: 1920, height: 1080, color: "#f6f6f6", placeholder: "data:image/webp;base64,UklGRl4AAABXRUJQVlA4IFIAAAAQAgCdASoQAAkABABoJYgCdAEPg+mT/aAAAP4Lue3n69W82vYKyGqFqGQE/91MnDvxzOBqsoFuGTP5A4Q6+WJ73ZOAjiPz1OnPYcvEr86+qAAA" },
+      "/images/Rami Baddour/13.png": { width: 1920, height: 1080, color: "#f6f6f6", placeholder: "data:image/webp;base64,UklGRjAAAABXRUJQVlA4ICQAAABQAQCdASoQAAkABABoJaQABHQAAP7xNGYSDMh71r91rdsAAAA=" },
+      "/images/Rami Baddour/14.png": { width: 1920, height: 1080, color: "#f6f6f6", placeholder: "data:image/webp;base64,UklGRi4AAABXRUJQVlA4ICIAAABQAQCdASoQAAkABABoJaQABHQAAP7xM8iAUp/105bm+AAA" },
+      "/images/Rami Baddour/15.png": { width: 1920, height: 1080, color: "#004524", placeholder: "data:image/webp;base64,UklGRjgAAABXRUJQVlA4ICwAAABwAQCdASoQAAkABABoJaACdAFAAAD+73t7Gk68Au7oTo2JSY8O7m69KwAAAA==" },
+      "/images/Rami Baddour/16.png": { width: 1920, height: 1080, color: "#004524", placeholder: "data:image/webp;base64,UklGRjYAAABXRUJQVlA4ICoAAABwAQCdASoQAAkABABoJaACdAFAAAD+73sjZuzSlFo4aGZ/X160tzbiAAA=" },
+      "/images/Rami Baddour/17.png": { width: 1920, height: 1080, color: "#f6f6f6", placeholder: "data:image/webp;base64,UklGRjoAAABXRUJQVlA4IC4AAAAwAQCdASoQAAkABABoJaQAA3AA/vD0b53JFeuOJbw0gB7tt8fY6/9TvmOPAAAA" },
+      "/images/Rami Baddour/18.png": { width: 1920, height: 1080, color: "#f6f6f6", placeholder: "data:image/webp;base64,UklGRjYAAABXRUJQVlA4ICoAAACwAQCdASoQAAkABABoJaQAAudcyGgAAP702ld71Nv7/bnNNM+ojawAAAA=" },
+      "/images/Rami Baddour/19.png": { width: 1920, height: 1080, color: "#f6f6f6", placeholder: "data:image/webp;base64,UklGRkIAAABXRUJQVlA4IDYAAAAQAgCdASoQAAkABABoJZQC7AEPEHL/OqAAAP7wjh+SlY8RYybqLHUyEm4W0lBf2oU1B0esmAA=" },
+      "/images/Rami Baddour/2.jpg": { width: 1920, height: 1080, color: "#908468", placeholder: "data:image/webp;base64,UklGRlQAAABXRUJQVlA4IEgAAAAQAgCdASoQAAkABABoJaACdAED+NzqXppAAP5hT+RaSb7CWUKtzmeH3y0pdx1lqwQlEDaIeMWxVqScpZFjXbXfJVD4AXKAAAA=" },
+      "/images/Rami Baddour/20.jpg": { width: 1920, height: 1080, color: "#30231a", placeholder: "data:image/webp;base64,UklGRjYAAABXRUJQVlA4ICoAAACwAQCdASoQAAkABABoJZQCdAEO/gLsAP7ugLT7oJsBlxhpZftojjOkqAA=" },
+      "/images/Rami Baddour/21.jpg": { width: 1920, height: 1080, color: "#d0d0d2", placeholder: "data:image/webp;base64,UklGRkwAAABXRUJQVlA4IEAAAAAQAgCdASoQAAkABABoJYwC7AELztP7b4QAAP7vzyOO2ME7OfEYXfHn8XmKvH0Iz5jMq3r8NNhfLS465egCwAAA" },
+      "/images/Rami Baddour/22.jpg": { width: 1920, height: 1080, color: "#151513", placeholder: "data:image/webp;base64,UklGRkwAAABXRUJQVlA4IEAAAACQAQCdASoQAAkABABoJZwAAhad2wAA/vGZ22H3NDiNlfFqbtjfVrAizrP5Q8ef1pZdNt4aL07J0AVZGwE2AAAA" },
+      "/images/Rami Baddour/23.jpg": { width: 1920, height: 1080, color: "#4f4e4c", placeholder: "data:image/webp;base64,UklGRkoAAABXRUJQVlA4ID4AAADQAQCdASoQAAkABABoJaQAAwBOvTqoAAD+nv7dd9fVNi+1o493HgKOmkDRIUiUurRVcgUbKTNuaY2WPoIAAA==" },
+      "/images/Rami Baddour/24.jpg": { width: 1920, height: 1080, color: "#3b453e", placeholder: "data:image/webp;base64,UklGRjQAAABXRUJQVlA4ICgAAADwAQCdASoQAAkABABoJYwBTAA9EwGChAAA/p6CifDRhqGRpTUtJzgA" },
+      "/images/Rami Baddour/25.jpg": { width: 1920, height: 1080, color: "#b4a08f", placeholder: "data:image/webp;base64,UklGRlgAAABXRUJQVlA4IEwAAAAQAgCdASoQAAkABABoJYwCdADdKbA3/oAAAP7oAKP9aN5Zha7c/+265Zvu+sOGmPHGJEvKMeat25IVCSfVoESPe+X2QF430u9vQAAA" },
+      "/images/Rami Baddour/26.png": { width: 252, height: 144, color: "#f6f6f6", placeholder: "data:image/webp;base64,UklGRiwAAABXRUJQVlA4ICAAAACQAQCdASoQAAkABABoJaQAAudUwMAA/vTLkAmPMEAAAA==" },
+      "/images/Rami Baddour/27.png": { width: 252, height: 144, color: "#f6f6f6", placeholder: "data:image/webp;base64,UklGRjoAAABXRUJQVlA4IC4AAACwAQCdASoQAAkABABoJZwAAudc5lGAAP7zcLQEryul3/vWBPUBZ1WXpYfcAAAA" },
+      "/images/Rami Baddour/28.png": { width: 252, height: 144, color: "#004524", placeholder: "data:image/webp;base64,UklGRjgAAABXRUJQVlA4ICwAAABwAQCdASoQAAkABABoJaACdAFAAAD+73t7Gk66ybuNoTW6c369aW5txAAAAA==" },
+      "/images/Rami Baddour/29.png": { width: 252, height: 144, color: "#004524", placeholder: "data:image/webp;base64,UklGRkAAAABXRUJQVlA4IDQAAADQAQCdASoQAAkABABoJaACdAEO/yg8KAD+69vNWF9X020CGKXkEVmxkRrEdEU+vVLblbAA" },
+      "/images/Rami Baddour/3.png": { width: 1920, height: 1080, color: "#768292", placeholder: "data:image/webp;base64,UklGRlAAAABXRUJQVlA4IEQAAADwAQCdASoQAAkABABoJZgCdGuAArdSqDAA/ni77ohs6WnSoNkoY+tpfe7KcMvzYdBSWBOxRqHm7ycQkP+5XKiSLigAAA==" },
+      "/images/Rami Baddour/4.png": { width: 1920, height: 1080, color: "#7b8796", placeholder: "data:image/webp;base64,UklGRlAAAABXRUJQVlA4IEQAAAAwAgCdASoQAAkABABoJZACdGuAAs3Nf2bDAAD+eL5ouWsfNCCWTnNf4IWEq9mk9UUiPFpMY5SFGEUiagBbwQAGLvAwAA==" },
+      "/images/Rami Baddour/5.png": { width: 1920, height: 1080, color: "#7d765a", placeholder: "data:image/webp;base64,UklGRlYAAABXRUJQVlA4IEoAAADwAQCdASoQAAkABABoJZgC7ADp68Tf1QAA/t0YuP/W+BZN5r6lMhaM//pdVYkEckgiHxPm1icfv3SXWVsVeN6mVTFCDYMvjgAAAA==" },
+      "/images/Rami Baddour/6.png": { width: 1920, height: 1080, color: "#807a5c", placeholder: "data:image/webp;base64,UklGRlYAAABXRUJQVlA4IEoAAAAQAgCdASoQAAkABABoJZAC7ADMDLkLn3SAAP7dGLaP03QaPZb/2vP8YXfXDm4/hemICjDUwNUVb7Wz508Cxl2wHFaXc75CYk0AAA==" },
+      "/images/Rami Baddour/7.png": { width: 1920, height: 1080, color: "#f6f6f6", placeholder: "data:image/webp;base64,UklGRjQAAABXRUJQVlA4ICgAAACQAQCdASoQAAkABABoJaQAAuJPfwAA/vPDSsGOPu437XpE/xFT4AAA" },
+      "/images/Rami Baddour/8.jpg": { width: 1920, height: 1080, color: "#f6f6f6", placeholder: "data:image/webp;base64,UklGRkgAAABXRUJQVlA4IDwAAADwAQCdASoQAAkABABoJQBOgB6XF0p8AAAA/vBArBkm+9bBmEchrb+lAGItDTTWzQv4Ww5nGBFlTbRBsAA=" },
+      "/images/Rami Baddour/9.jpg": { width: 1920, height: 1080, color: "#f6f6f6", placeholder: "data:image/webp;base64,UklGRlwAAABXRUJQVlA4IFAAAAAQAgCdASoQAAkABABoJQBdgCKsS3Xwv5gAAP7KgKamOiz2SqIMKddCNv6yMt7V/ZW81owcX9e06wLgn3DfN5yRpT1fkCXdwKqKYVL/WJeAAA==" },
+    },
   },
   {
     id: "sifr",
     name: "Sifr",
     type: "Social Media + Branding",
     description: `Participated in creating the visual identity, adapting a powerful style of duotone and bitmap for image treatment, and conceptual graphics work. The aim was to create a unique to be stand out in the overwhelming timelines of today.`,
-    thumbnail: "/images/Sifr/A1.jpeg",
+    thumbnail: "/images/Sifr/A2.jpeg",
     images: [
       "/images/Sifr/A1.jpeg",
+      "/images/Sifr/A2.jpeg",
       "/images/Sifr/B1.jpg",
       "/images/Sifr/C1.jpeg",
       "/images/Sifr/G1.jpg",
-      "/images/Sifr/A2.jpeg",
       "/images/Sifr/G2.jpg",
       "/images/Sifr/G3.jpeg",
       "/images/Sifr/G4.jpeg",
     ],
+    hashes: {
+      "/images/Sifr/A1.jpeg": "62553cf4",
+      "/images/Sifr/A2.jpeg": "e20de32e",
+      "/images/Sifr/B1.jpg": "f382dd39",
+      "/images/Sifr/C1.jpeg": "73a9fcf0",
+      "/images/Sifr/G1.jpg": "2366fbb9",
+      "/images/Sifr/G2.jpg": "ad6326ab",
+      "/images/Sifr/G3.jpeg": "6898d4c9",
+      "/images/Sifr/G4.jpeg": "d22430df",
+    },
+    imageMeta: {
+      "/images/Sifr/A1.jpeg": { width: 1080, height: 1080, color: "#5b4557", placeholder: "data:image/webp;base64,UklGRkwAAABXRUJQVlA4IEAAAADwAQCdASoQABAABABoJYwAAlhQxs2vPgAA/qFmCkvEP/UmjLta91BgYlfyQwGw8P7iL+nNaLHc8rR57LVhAAAA" },
+      "/images/Sifr/A2.jpeg": { width: 1080, height: 1080, color: "#49460c", placeholder: "data:image/webp;base64,UklGRlgAAABXRUJQVlA4IEwAAADwAQCdASoQABAABABoJbACdAEUlo41dEAA/tqfKbaL6e34OtS49nB538Lwvja226UO/Uxa3xlhHmSLMH4R+vi2fV+1x3ZzcPKjQAAA" },
+      "/images/Sifr/B1.jpg": { width: 1200, height: 675, color: "#6b676c", placeholder: "data:image/webp;base64,UklGRjwAAABXRUJQVlA4IDAAAACwAQCdASoQAAkABABoJZwAAtq8qYMgAP7ypbxE7RPndPuNV2n+JeWyHEvRpekwAAA=" },
+      "/images/Sifr/C1.jpeg": { width: 1200, height: 675, color: "#886f77", placeholder: "data:image/webp;base64,UklGRjwAAABXRUJQVlA4IDAAAACQAQCdASoQAAkABABoJYwAAlHp49AA3FLxTssJrhCHuR5tbzcu7cp3oBfR3lML4gA=" },
+      "/images/Sifr/G1.jpg": { width: 1080, height: 1080, color: "#e8e8e8", placeholder: "data:image/webp;base64,UklGRkAAAABXRUJQVlA4IDQAAABwAQCdASoQABAABABoJaV/2AGIAAD+8EoF6Tj7IzB/pJXvXUP9ZpDXNEZU74V9jDh0twAA" },
+      "/images/Sifr/G2.jpg": { width: 1080, height: 1080, color: "#e8e8e8", placeholder: "data:image/webp;base64,UklGRkoAAABXRUJQVlA4ID4AAADwAQCdASoQABAABABoJaQAAvc4F/dRhAAA/vHbPqte28tl3t6d901WooQZf2zgM09xfKoGLnAmcpmVSyoAAA==" },
+      "/images/Sifr/G3.jpeg": { width: 1081, height: 1081, color: "#ededed", placeholder: "data:image/webp;base64,UklGRkoAAABXRUJQVlA4ID4AAADwAQCdASoQABAABABoJYwAAp2gPgWf7YAA/vH2guw5FfqIG9GL03YasF+clQfk9903CpxmUr1fT5UDfvqgAA==" },
+      "/images/Sifr/G4.jpeg": { width: 1081, height: 1081, color: "#ededed", placeholder: "data:image/webp;base64,UklGRkQAAABXRUJQVlA4IDgAAAAQAgCdASoQABAABABoJYwC7AD0Say5/SAAAP7x4MUoVRyeQgwaFqVtxxO2EDUQ351fY4Me+ekQAA==" },
+    },
   },
 ]
 
@@ -1,174 +1,463 @@
 import os
+import io
 import json
+import time
+import base64
+import argparse
+
+from media_fingerprint import Publisher
+from media_manifest import file_hash
+from media_scan import scan, scan_folders
+
+try:
+    from PIL import Image
+    from media_thumbs import ANALYSIS_SIZE, image_features, thumbnail_score
+except ImportError:
+    Image = None
 
 # Define the root path for images
 IMAGES_ROOT = "portfolio-react/public/images"
 OUTPUT_FILE = "portfolio-react/src/data/projects.js"
+# Lightweight card index + one lazily imported module per project
+INDEX_FILE = "portfolio-react/src/data/projects.index.js"
+CHUNKS_DIR = "portfolio-react/src/data/chunks"
+# Written by media_variants.py - maps each image to its srcset widths/formats
+VARIANTS_INDEX = "portfolio-react/public/variants/variants.json"
+# Per-image width/height/color/placeholder, keyed by web path + mtime/size
+META_CACHE = "portfolio-react/.cache/image-meta.json"
+# Thumbnail-scoring features (media_thumbs.py), keyed by SHA-256 of the file contents
+SCORE_CACHE = "portfolio-react/.cache/thumb-scores.json"
+# Per-client asset lists, keyed by the mtimes of every directory in the client's tree
+SCAN_CACHE = "portfolio-react/.cache/project-scan.json"
+# Written by media_dedup.py --collapse - original image path -> shared copy in _shared/
+ALIASES_FILE = "portfolio-react/public/images/_shared/aliases.json"
+PLACEHOLDER_WIDTH = 16
+# Written next to each video by optimize_media.py - not listed as media of their own
+POSTER_SUFFIX = '.poster.jpg'
+PREVIEW_SUFFIX = '.preview.mp4'
+# optimize_media.py / optimize_all.py --hls: <stem>.hls/master.m3u8 next to each video
+HLS_SUFFIX = '.hls'
+HLS_MASTER = 'master.m3u8'
+# Written by media_pdf.py - page counts and first-page thumbnails, keyed by PDF path
+PDF_INDEX = "portfolio-react/public/images/_pdf/pdfs.json"
 
 # Allowed extensions
 IMAGE_EXTS = {'.jpg', '.jpeg', '.png', '.gif', '.webp', '.svg'}
 VIDEO_EXTS = {'.mp4', '.mov', '.webm'}
 PDF_EXTS = {'.pdf'}
 
-# Priority order for projects (most important first)
-# Projects not in this list will appear alphabetically after these
-PRIORITY_ORDER = [
-    'McCafe',
-    'Mcdo',
-    'Popeyes',
-    'OPPO',
-    'CwF',
-    'MAC',
-    'Freshdays',
-    'Avene',
-    'La Roche',
-    'Gipsy',
-    'Handy',
-    'Cannelle',
-    'Happies',
-    'Al Hawari',
-    'Sofar',
-    'Sifr',
-    'Ethos',
-    'DGA',
-    'FFF',
-    'ASH',
-    'Private',
-]
-
-def get_project_type(name):
-    # Mapping for known projects based on previous file content
-    known_types = {
-        'avene': 'Skincare & Product Design',
-        'cannelle': 'Product Photography',
-        'ethos': 'Agency Branding',
-        'freshdays': 'Social Media & Video',
-        'gipsy': 'Restaurant Branding',
-        'handy': 'Product Marketing',
-        'cwf': 'Restaurant Branding',
-        'mac': 'Agency',
-        'la roche': 'Food & Beverage',
-        'mccafe': 'Food & Beverage',
-        'mcdo': 'Food & Beverage',
-        'popeyes': 'Food & Beverage',
-        'oppo': 'Tech & Electronics',
-        'happies': 'Social Media & Video',
-        'al hawari': 'Branding',
-        'sofar': 'Tech & Product',
-        'sifr': 'Branding',
-        'dga': 'Government & Corporate',
-        'fff': 'Food & Beverage',
-        'ash': 'Beverage Branding',
-        'private': 'Personal Projects',
-        'aalaqaat': 'Branding',
-        'ferra rawan': 'Branding',
-        'rami baddour': 'Branding',
-    }
-    key = name.lower()
-    return known_types.get(key, 'Portfolio Project')
+# Card types, modal descriptions and the priority order - shared with generate_projects.cjs
+DETAILS_FILE = "portfolio-react/project_details.json"
+DEFAULT_TYPE = 'Design'
+
+def load_details():
+    """The curated project details; generation still works (untyped, undescribed) without them."""
+    details = load_cache(DETAILS_FILE)
+    return {'order': details.get('order', []), 'projects': details.get('projects', {}),
+            'skills': details.get('skills', []), 'experience': details.get('experience', [])}
+
+def get_project_type(name, details):
+    return details['projects'].get(name, {}).get('type', DEFAULT_TYPE)
+
+def get_project_description(name, details):
+    return details['projects'].get(name, {}).get('description', '')
 
-def get_sort_key(client_name):
+def get_sort_key(client_name, order):
     """Return sort key - prioritized projects first, then alphabetical"""
     try:
-        return (0, PRIORITY_ORDER.index(client_name))
+        return (0, order.index(client_name))
     except ValueError:
         return (1, client_name.lower())
 
-def scan_projects():
+def listed_assets(client, files):
+    """
+    Assets of a project whose folder isn't in this checkout, from the file
+    names project_details.json lists for it (same shape as scan_client_tree).
+    """
+    assets = {'images': [], 'videos': [], 'pdfs': [], 'streams': []}
+    for name in sorted(files):
+        web_path = f"/images/{client}/{name}"
+        ext = os.path.splitext(name)[1].lower()
+        if ext in IMAGE_EXTS:
+            assets['images'].append(web_path)
+        elif ext in VIDEO_EXTS:
+            assets['videos'].append(web_path)
+        elif ext in PDF_EXTS:
+            assets['pdfs'].append(web_path)
+    return assets
+
+def load_variants():
+    """Load the srcset index from media_variants.py, if it has been run."""
+    try:
+        with open(VARIANTS_INDEX) as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+def load_aliases():
+    """Group media_dedup.py aliases by client folder, dropping any whose shared file is gone."""
+    by_client = {}
+    for original, shared in load_cache(ALIASES_FILE).items():
+        if os.path.exists(os.path.join(IMAGES_ROOT, shared[len('/images/'):])):
+            client = original.split('/')[2]
+            by_client.setdefault(client, {})[original] = shared
+    return by_client
+
+def merge_aliases(images, aliases):
+    """
+    Put images collapsed into _shared/ back into a client's list, in the
+    place their original filename sorts to.
+    """
+    present = set(images)
+    originals = sorted(present | {path for path in aliases if path not in present})
+    merged = []
+    for path in originals:
+        url = path if path in present else aliases[path]
+        if url not in merged:
+            merged.append(url)
+    return merged
+
+def load_cache(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+def save_cache(path, data):
+    payload = json.dumps(data, sort_keys=True).encode('utf-8')
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == payload:
+                return
+    except FileNotFoundError:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+def read_image_meta(full_path):
+    """
+    Width/height from the image header, plus a dominant color, a tiny
+    base64 placeholder and the thumbnail-scoring features. JPEGs use
+    draft() so only a reduced-scale DCT decode is needed for the rest.
+    Returns (meta, features).
+    """
+    with Image.open(full_path) as img:
+        # Header only - no pixel data decoded yet
+        width, height = img.size
+        if img.format == 'JPEG':
+            img.draft('RGB', (ANALYSIS_SIZE, ANALYSIS_SIZE))
+        tiny = img.convert('RGBA' if 'A' in img.getbands() or 'transparency' in img.info else 'RGB')
+    features = image_features(tiny)
+    features['aspect'] = round(width / height, 4)
+    tiny.thumbnail((PLACEHOLDER_WIDTH, PLACEHOLDER_WIDTH * 4), Image.Resampling.BOX)
+
+    # Most common color after reducing to a small palette
+    palette = tiny.convert('RGB').quantize(colors=5, method=Image.Quantize.MEDIANCUT)
+    count, index = max(palette.getcolors())
+    r, g, b = palette.getpalette()[index * 3:index * 3 + 3]
+
+    buffer = io.BytesIO()
+    tiny.save(buffer, 'WEBP', quality=30)
+    placeholder = 'data:image/webp;base64,' + base64.b64encode(buffer.getvalue()).decode('ascii')
+
+    meta = {
+        'width': width,
+        'height': height,
+        'color': f'#{r:02x}{g:02x}{b:02x}',
+        'placeholder': placeholder,
+    }
+    return meta, features
+
+def image_meta(full_path, web_path, cache, scores):
+    """
+    Cached read_image_meta - only files whose mtime/size changed are
+    reopened, and only those whose content changed are decoded again.
+    Features go to scores under the file's SHA-256.
+    """
+    st = os.stat(full_path)
+    entry = cache.get(web_path)
+    if entry and entry['mtime_ns'] == st.st_mtime_ns and entry['size'] == st.st_size:
+        return entry['meta']
+    try:
+        sha = file_hash(full_path)
+        if entry and entry.get('sha256') == sha and sha in scores:
+            # Touched (restored, checked out) but not changed
+            meta = entry['meta']
+        else:
+            meta, scores[sha] = read_image_meta(full_path)
+    except Exception as e:
+        print(f"  Could not read {web_path}: {e}")
+        return None
+    cache[web_path] = {'mtime_ns': st.st_mtime_ns, 'size': st.st_size, 'sha256': sha, 'meta': meta}
+    return meta
+
+def thumbnail_features(web_path, cache, scores):
+    """Scoring features for an image already in the meta cache, decoding it only if they're missing."""
+    entry = cache.get(web_path)
+    if entry is None:
+        return None
+    sha = entry.get('sha256')
+    if sha in scores:
+        return scores[sha]
+    full_path = os.path.join(IMAGES_ROOT, web_path[len('/images/'):])
+    try:
+        sha = file_hash(full_path)
+        if sha not in scores:
+            _, scores[sha] = read_image_meta(full_path)
+    except Exception as e:
+        print(f"  Could not score {web_path}: {e}")
+        return None
+    entry['sha256'] = sha
+    return scores[sha]
+
+def pick_thumbnail(images, cache, scores):
+    """
+    The image that makes the best card (media_thumbs.thumbnail_score);
+    SVGs and unreadable files come after every scored image, ties go to
+    filename order.
+    """
+    if len(images) == 1 or Image is None:
+        return images[0]
+    ranked = []
+    for web_path in images:
+        features = None if web_path.lower().endswith('.svg') else thumbnail_features(web_path, cache, scores)
+        ranked.append((features is None, -thumbnail_score(features) if features else 0.0, web_path))
+    return min(ranked)[2]
+
+def scan_client_tree(client_path):
+    """
+    Walk one client folder (media_scan.scan). Returns the mtime of every
+    directory in the tree (relative to client_path) plus the sorted web
+    paths of its images, videos and PDFs, and the master playlists of any
+    HLS packages.
+    """
+    dirs = {}
+    assets = {'images': [], 'videos': [], 'pdfs': [], 'streams': []}
+    # public/images is served at /images/, so web paths start there
+    prefix = '/images/' + os.path.basename(os.path.normpath(client_path)) + '/'
+    
+    for entry in scan(client_path, IMAGE_EXTS | VIDEO_EXTS | PDF_EXTS | {HLS_SUFFIX}, dirs=dirs):
+        web_path = prefix + entry.rel
+        if entry.suffix == HLS_SUFFIX:
+            # Segments aren't assets - just note the playlist (swapping a package in bumps this dir's mtime)
+            if os.path.exists(os.path.join(entry.entry.path, HLS_MASTER)):
+                assets['streams'].append(f"{web_path}/{HLS_MASTER}")
+        elif entry.suffix in IMAGE_EXTS:
+            assets['images'].append(web_path)
+        elif entry.suffix in VIDEO_EXTS:
+            assets['videos'].append(web_path)
+        else:
+            assets['pdfs'].append(web_path)
+    
+    # Sort assets to ensure consistent order
+    for paths in assets.values():
+        paths.sort()
+    return dirs, assets
+
+def tree_unchanged(client_path, dirs):
+    """
+    True if no directory in a previously scanned tree has a new mtime.
+    Adding, removing or renaming a file bumps its directory's mtime, so
+    this costs one stat per directory instead of a walk of every file.
+    """
+    for rel, mtime_ns in dirs.items():
+        try:
+            if os.stat(os.path.join(client_path, rel)).st_mtime_ns != mtime_ns:
+                return False
+        except OSError:
+            return False
+    return True
+
+def variant_url(img, width, fmt):
+    """"/images/Avene/A1.jpg" -> "/variants/Avene/A1.jpg-400.webp" (as ResponsiveImage.jsx builds them)."""
+    return '/variants/' + img[len('/images/'):] + f"-{width}.{fmt}"
+
+def split_video_artifacts(images, videos):
+    """
+    Pull optimize_media.py's poster frames and preview loops out of the
+    asset lists. Returns (images, videos, {video: poster}, {video: preview}).
+    """
+    artifacts = {p for p in images if p.endswith(POSTER_SUFFIX)} | {p for p in videos if p.endswith(PREVIEW_SUFFIX)}
+    videos = [v for v in videos if v not in artifacts]
+    posters = {}
+    previews = {}
+    for video in videos:
+        stem = os.path.splitext(video)[0]
+        if stem + POSTER_SUFFIX in artifacts:
+            posters[video] = stem + POSTER_SUFFIX
+        if stem + PREVIEW_SUFFIX in artifacts:
+            previews[video] = stem + PREVIEW_SUFFIX
+    return [i for i in images if i not in artifacts], videos, posters, previews
+
+def scan_projects(incremental=True):
     projects = []
+    variants = load_variants()
+    aliases = load_aliases()
+    scan_cache = load_cache(SCAN_CACHE) if incremental else {}
+    new_scan_cache = {}
+    rescanned = 0
+    meta_cache = load_cache(META_CACHE) if Image else {}
+    score_cache = load_cache(SCORE_CACHE) if Image else {}
+    pdf_index = load_cache(PDF_INDEX)
+    details = load_details()
+    if Image is None:
+        print("Pillow not installed - skipping image dimensions and placeholders.")
     
     # Get all subdirectories in IMAGES_ROOT
     try:
-        clients = [d for d in os.listdir(IMAGES_ROOT) if os.path.isdir(os.path.join(IMAGES_ROOT, d)) and not d.startswith('.')]
+        # _shared/ holds deduplicated files, reached through the aliases instead
+        clients = [e.name for e in scan_folders(IMAGES_ROOT)]
     except FileNotFoundError:
         print(f"Error: Directory {IMAGES_ROOT} not found.")
         return
+    
+    # Projects whose media is deployed without being checked in keep their listed files
+    listed = {name: d['files'] for name, d in details['projects'].items()
+              if d.get('files') and name not in clients}
+    clients += listed
 
     # Sort by priority order
-    clients.sort(key=get_sort_key)
+    clients.sort(key=lambda client: get_sort_key(client, details['order']))
 
     for client in clients:
         client_path = os.path.join(IMAGES_ROOT, client)
         
-        project_images = []
-        project_videos = []
-        project_pdfs = []
+        if client in listed:
+            # Nothing on disk to scan or cache
+            unchanged = False
+            assets = listed_assets(client, listed[client])
+        else:
+            cached = scan_cache.get(client)
+            unchanged = cached is not None and tree_unchanged(client_path, cached['dirs'])
+            if unchanged:
+                dirs, assets = cached['dirs'], cached['assets']
+            else:
+                dirs, assets = scan_client_tree(client_path)
+                rescanned += 1
+            new_scan_cache[client] = {'dirs': dirs, 'assets': assets}
         
-        # Walk through the client folder to find all assets
-        for root, dirs, files in os.walk(client_path):
-            for file in files:
-                if file.startswith('.'): continue
-                
-                ext = os.path.splitext(file)[1].lower()
-                full_path = os.path.join(root, file)
-                # Convert to web path: replace 'portfolio-react' with '' and ensure forward slashes
-                # Since public/images -> ../images, we can access via /images/Client/...
-                # But wait, the symlink is public/images -> images.
-                # So web path should start with /images/
-                
-                rel_path = os.path.relpath(full_path, IMAGES_ROOT)
-                web_path = f"/images/{rel_path}".replace(os.sep, '/')
-                
-                # Check for "optimized" logic: The user removed optimized folder, so we use files as is.
-                
-                if ext in IMAGE_EXTS:
-                    project_images.append(web_path)
-                elif ext in VIDEO_EXTS:
-                    project_videos.append(web_path)
-                elif ext in PDF_EXTS:
-                    project_pdfs.append(web_path)
-
-        # Sort assets to ensure consistent order
-        project_images.sort()
-        project_videos.sort()
-        project_pdfs.sort()
+        project_images, project_videos, posters, previews = split_video_artifacts(assets['images'], assets['videos'])
+        packaged = set(assets.get('streams', []))
+        streams = {video: f"{os.path.splitext(video)[0]}{HLS_SUFFIX}/{HLS_MASTER}" for video in project_videos}
+        streams = {video: master for video, master in streams.items() if master in packaged}
+        if client in aliases:
+            project_images = merge_aliases(project_images, aliases[client])
+        project_pdfs = assets['pdfs']
         
         if not project_images and not project_videos and not project_pdfs:
             continue
-
-        # Find best thumbnail - prioritize A1, then images without text/headlines
-        def get_thumbnail_priority(path):
-            filename = os.path.basename(path).lower()
-            # A1 files are highest priority
-            if filename.startswith('a1'):
-                return (0, path)
-            # B1, C1 etc are second priority
-            if filename[0:2] in ['b1', 'c1', 's1']:
-                return (1, path)
-            # "No Headline" or minimal text images
-            if 'no headline' in filename or 'grid' in filename:
-                return (2, path)
-            # Avoid images with obvious text markers
-            if any(word in filename for word in ['headline', 'hiring', 'needed', 'specialist', 'reel']):
-                return (5, path)
-            # Default priority
-            return (3, path)
+        
+        pdf_meta = {
+            pdf: {'pages': pdf_index[pdf]['pages'], 'thumbnail': pdf_index[pdf]['thumbnail']}
+            for pdf in project_pdfs if pdf in pdf_index
+        }
+        pdf_thumbs = [m['thumbnail'] for m in pdf_meta.values() if m['thumbnail']]
+        
+        image_meta_by_path = {}
+        if Image:
+            for web_path in project_images + pdf_thumbs:
+                if web_path.lower().endswith('.svg'):
+                    continue
+                cached_meta = meta_cache.get(web_path)
+                # PDF thumbnails live in _pdf/, so an untouched client folder says nothing about them
+                if unchanged and cached_meta and web_path not in pdf_thumbs:
+                    # Folder untouched since the last run - trust the cached entry
+                    meta = cached_meta['meta']
+                else:
+                    full_path = os.path.join(IMAGES_ROOT, web_path[len('/images/'):])
+                    meta = image_meta(full_path, web_path, meta_cache, score_cache)
+                if meta:
+                    image_meta_by_path[web_path] = meta
         
         # Determine thumbnail - prioritize images, then videos, then use 'pdf' as marker
         if project_images:
-            # Sort by priority and pick best
-            sorted_by_priority = sorted(project_images, key=get_thumbnail_priority)
-            thumbnail = sorted_by_priority[0]
+            # Sharpest, most colorful, least text-heavy image closest to the card's shape
+            thumbnail = pick_thumbnail(project_images, meta_cache, score_cache)
         elif project_videos:
-            thumbnail = project_videos[0]
+            # A ~50KB poster frame instead of the video itself
+            thumbnail = posters.get(project_videos[0], project_videos[0])
+        elif pdf_thumbs:
+            # First page of the deck, rendered by media_pdf.py
+            thumbnail = pdf_thumbs[0]
         elif project_pdfs:
-            thumbnail = 'pdf'  # Special marker for PDF-only projects
+            thumbnail = 'pdf'  # Special marker for PDF-only projects without a rendered page
         else:
             thumbnail = ""
         
         project = {
             'id': client.lower().replace(' ', '-'),
             'name': client,
-            'type': get_project_type(client),
+            'type': get_project_type(client, details),
+            'description': get_project_description(client, details),
             'thumbnail': thumbnail,
             'images': project_images,
             'videos': project_videos,
-            'pdfs': project_pdfs
+            'pdfs': project_pdfs,
+            'poster': posters.get(project_videos[0]) if project_videos else None,
+            'preview': previews.get(project_videos[0]) if project_videos else None,
+            'posters': posters,
+            'streams': streams,
+            'pdfMeta': pdf_meta,
+            'variants': {
+                img: {'widths': variants[img]['widths'], 'formats': variants[img]['formats']}
+                for img in project_images + pdf_thumbs if img in variants
+            },
+            'imageMeta': {img: image_meta_by_path[img] for img in project_images + pdf_thumbs
+                          if img in image_meta_by_path}
         }
         projects.append(project)
 
+    save_cache(SCAN_CACHE, new_scan_cache)
+    print(f"Scanned {rescanned} of {len(clients) - len(listed)} client folders (others unchanged).")
+    if listed:
+        print(f"Not in this checkout, listed from {os.path.basename(DETAILS_FILE)}: {', '.join(listed)}")
+
+    if Image:
+        # Forget files that no longer exist so the cache doesn't grow forever
+        seen = {img for p in projects for img in p['imageMeta']}
+        meta_cache = {k: v for k, v in meta_cache.items() if k in seen}
+        save_cache(META_CACHE, meta_cache)
+        hashes = {entry.get('sha256') for entry in meta_cache.values()}
+        save_cache(SCORE_CACHE, {k: v for k, v in score_cache.items() if k in hashes})
+
     return projects
 
+def fingerprint_projects(projects):
+    """
+    Content-hash everything the projects link to (media_fingerprint.py).
+    Adds a 'hashes' map (URL -> hash, HLS masters hashed by package) and a
+    hash per srcset ladder. The frontend swaps in the hashed URLs for
+    production builds, which `npm run build` publishes into dist/.
+    """
+    publisher = Publisher()
+    for p in projects:
+        urls = p['images'] + p['videos'] + p['pdfs'] + list(p['posters'].values())
+        urls += [p['preview']] if p.get('preview') else []
+        urls += [m['thumbnail'] for m in p['pdfMeta'].values() if m['thumbnail']]
+        hashes = {}
+        for url in dict.fromkeys(urls):
+            digest = publisher.publish(url)
+            if digest:
+                hashes[url] = digest
+        for master in p['streams'].values():
+            digest = publisher.publish_dir(os.path.dirname(master), HLS_MASTER)
+            if digest:
+                hashes[master] = digest
+        p['hashes'] = hashes
+        
+        for img, v in p['variants'].items():
+            ladder = [variant_url(img, width, fmt) for width in v['widths'] for fmt in v['formats']]
+            digest = publisher.publish_group(ladder)
+            if digest:
+                v['hash'] = digest
+    
+    assets, changed = publisher.finish()
+    if changed:
+        print(f"Hashed assets: {assets} listed in {os.path.basename(publisher.assets_file)}.")
+
 def escape_js_string(s):
     """Escape special characters for JavaScript strings."""
     # Escape backslashes first, then quotes
@@ -176,64 +465,276 @@ def escape_js_string(s):
     s = s.replace('"', '\\"')
     return s
 
-def generate_js(projects):
-    js_content = "// Portfolio Data - All projects with their images (Alphabetically sorted)\n"
-    js_content += "export const projects = [\n"
+def js_template_string(s):
+    """Escape text for a JavaScript template literal (used for descriptions)."""
+    return s.replace('\\', '\\\\').replace('`', '\\`').replace('${', '\\${')
+
+def project_body_js(p, out, indent="    "):
+    """Append the object-literal fields for one project to out (shared by projects.js and the chunks)."""
+    out.append(f'{indent}id: "{escape_js_string(p["id"])}",\n')
+    out.append(f'{indent}name: "{escape_js_string(p["name"])}",\n')
+    out.append(f'{indent}type: "{escape_js_string(p["type"])}",\n')
+    if p.get('description'):
+        out.append(f'{indent}description: `{js_template_string(p["description"])}`,\n')
+    out.append(f'{indent}thumbnail: "{escape_js_string(p["thumbnail"])}",\n')
+    
+    for field in ('images', 'videos', 'pdfs'):
+        if p[field]:
+            out.append(f"{indent}{field}: [\n")
+            out.extend(f'{indent}  "{escape_js_string(path)}",\n' for path in p[field])
+            out.append(f"{indent}],\n")
+    
+    video_fields_js(p, out, indent)
+    if p.get('pdfMeta'):
+        out.append(f"{indent}pdfMeta: {{\n")
+        for pdf, m in p['pdfMeta'].items():
+            thumb = f'"{escape_js_string(m["thumbnail"])}"' if m['thumbnail'] else 'null'
+            out.append(f'{indent}  "{escape_js_string(pdf)}": {{ pages: {json.dumps(m["pages"])}, thumbnail: {thumb} }},\n')
+        out.append(f"{indent}}},\n")
+    for field in ('posters', 'streams', 'hashes'):
+        if p.get(field):
+            out.append(f"{indent}{field}: {{\n")
+            out.extend(f'{indent}  "{escape_js_string(video)}": "{escape_js_string(url)}",\n'
+                       for video, url in p[field].items())
+            out.append(f"{indent}}},\n")
     
+    media_fields_js(p, out, indent)
+    return out
+
+def video_fields_js(p, out, indent="    "):
+    """Append the card video's poster frame and preview loop, if optimize_media.py made them."""
+    for field in ('poster', 'preview'):
+        if p.get(field):
+            out.append(f'{indent}{field}: "{escape_js_string(p[field])}",\n')
+    return out
+
+def media_fields_js(p, out, indent="    "):
+    """Append srcset variants and image metadata, keyed by image path."""
+    if p.get('variants'):
+        out.append(f"{indent}variants: {{\n")
+        for img, v in p['variants'].items():
+            digest = f', hash: "{v["hash"]}"' if v.get('hash') else ''
+            out.append(f'{indent}  "{escape_js_string(img)}": {{ widths: {json.dumps(v["widths"])}, '
+                       f'formats: {json.dumps(v["formats"])}{digest} }},\n')
+        out.append(f"{indent}}},\n")
+    
+    if p.get('imageMeta'):
+        out.append(f"{indent}imageMeta: {{\n")
+        for img, m in p['imageMeta'].items():
+            out.append(f'{indent}  "{escape_js_string(img)}": {{ width: {m["width"]}, height: {m["height"]}, '
+                       f'color: "{m["color"]}", placeholder: "{m["placeholder"]}" }},\n')
+        out.append(f"{indent}}},\n")
+    return out
+
+def js_literal(value):
+    """A small JSON value as a JavaScript literal with single-quoted strings ({ name: 'Figma', percent: 85 })."""
+    if isinstance(value, dict):
+        return '{ ' + ', '.join(f"{key}: {js_literal(v)}" for key, v in value.items()) + ' }'
+    if isinstance(value, str):
+        return "'" + value.replace('\\', '\\\\').replace("'", "\\'") + "'"
+    return json.dumps(value)
+
+def about_js(details):
+    """Skills and experience for the About section, from project_details.json."""
+    out = []
+    for field, label in (('skills', 'Skills'), ('experience', 'Experience')):
+        out.append(f"\n// {label} data for About section\nexport const {field} = [\n")
+        out.extend(f"  {js_literal(item)},\n" for item in details[field])
+        out.append("]\n")
+    return ''.join(out)
+
+def generate_js(projects, details):
+    out = ["// Portfolio Data - All projects with their images (Alphabetically sorted)\n",
+           "export const projects = [\n"]
     for p in projects:
-        js_content += "  {\n"
-        js_content += f'    id: "{escape_js_string(p["id"])}",\n'
-        js_content += f'    name: "{escape_js_string(p["name"])}",\n'
-        js_content += f'    type: "{escape_js_string(p["type"])}",\n'
-        js_content += f'    thumbnail: "{escape_js_string(p["thumbnail"])}",\n'
-        
-        if p['images']:
-            js_content += "    images: [\n"
-            for img in p['images']:
-                js_content += f'      "{escape_js_string(img)}",\n'
-            js_content += "    ],\n"
-        
-        if p['videos']:
-            js_content += "    videos: [\n"
-            for vid in p['videos']:
-                js_content += f'      "{escape_js_string(vid)}",\n'
-            js_content += "    ],\n"
-            
-        if p['pdfs']:
-            js_content += "    pdfs: [\n"
-            for pdf in p['pdfs']:
-                js_content += f'      "{escape_js_string(pdf)}",\n'
-            js_content += "    ]\n"
-        
-        js_content += "  },\n"
-        
-    js_content += "]\n"
-    
-    # Add skills and experience data for About section
-    js_content += """
-// Skills data for About section
-export const skills = [
-  { name: 'Adobe Photoshop', percent: 95, icon: 'fab fa-adobe' },
-  { name: 'Adobe Illustrator', percent: 90, icon: 'fab fa-adobe' },
-  { name: 'Adobe After Effects', percent: 80, icon: 'fab fa-adobe' },
-  { name: 'Figma', percent: 85, icon: 'fab fa-figma' },
-  { name: 'Social Media Marketing', percent: 90, icon: 'fas fa-bullhorn' },
-]
-
-// Experience data for About section
-export const experience = [
-  { date: '2023 - Present', title: 'Senior Graphic Designer', company: 'MAC Platforms' },
-  { date: '2021 - 2023', title: 'Graphic Designer', company: 'Ethos Agency (KSA)' },
-  { date: '2019 - 2021', title: 'Junior Designer', company: 'Freelance' },
-]
-"""
-    
-    return js_content
+        out.append("  {\n")
+        project_body_js(p, out)
+        out.append("  },\n")
+    out.append("]\n")
+    out.append(about_js(details))
+    return ''.join(out)
+
+def chunk_name(p):
+    return f"{p['id']}.js"
+
+def card_fields(p):
+    """The subset of a project the Work grid needs to draw its card."""
+    thumb = p['thumbnail']
+    video = p['videos'][0] if p['videos'] else None
+    card = {
+        'id': p['id'],
+        'name': p['name'],
+        'type': p['type'],
+        'thumbnail': thumb,
+        'imageCount': len(p['images']),
+        'videoCount': len(p['videos']),
+        'pdfCount': len(p['pdfs']),
+        'pageCount': sum(m['pages'] or 0 for m in p.get('pdfMeta', {}).values()),
+        'video': video,
+        'poster': p.get('poster'),
+        'preview': p.get('preview'),
+        'variants': {k: v for k, v in p.get('variants', {}).items() if k == thumb},
+        'imageMeta': {k: v for k, v in p.get('imageMeta', {}).items() if k == thumb},
+        'hashes': {k: v for k, v in p.get('hashes', {}).items()
+                   if k in (thumb, video, p.get('poster'), p.get('preview'))},
+    }
+    return card
+
+def generate_index_js(projects):
+    """Card-only project list plus a loader that imports each full project on demand."""
+    out = ["// Portfolio Index - card fields only; full projects load from ./chunks/<id>.js\n",
+           "export const projects = [\n"]
+    for p in projects:
+        card = card_fields(p)
+        out.append("  {\n")
+        for field in ('id', 'name', 'type', 'thumbnail'):
+            out.append(f'    {field}: "{escape_js_string(card[field])}",\n')
+        for field in ('imageCount', 'videoCount', 'pdfCount'):
+            out.append(f"    {field}: {card[field]},\n")
+        if card['pageCount']:
+            out.append(f"    pageCount: {card['pageCount']},\n")
+        if card['video']:
+            out.append(f'    video: "{escape_js_string(card["video"])}",\n')
+        video_fields_js(card, out)
+        media_fields_js(card, out)
+        if card['hashes']:
+            out.append("    hashes: {\n")
+            out.extend(f'      "{escape_js_string(url)}": "{digest}",\n' for url, digest in card['hashes'].items())
+            out.append("    },\n")
+        out.append("  },\n")
+    out.append("]\n\n")
+    
+    out.append("const loaders = {\n")
+    out.extend(f'  "{escape_js_string(p["id"])}": () => import("./chunks/{escape_js_string(chunk_name(p))}"),\n'
+               for p in projects)
+    out.append("}\n\n")
+    out.append("export const loadProject = (id) => loaders[id]().then(module => module.default)\n")
+    return ''.join(out)
+
+def generate_chunk_js(p):
+    out = [f"// Portfolio Data - {p['name']} (loaded on demand from projects.index.js)\n",
+           "export default {\n"]
+    project_body_js(p, out, indent="  ")
+    out.append("}\n")
+    return ''.join(out)
+
+def write_if_changed(path, data):
+    """
+    Write bytes to path only if they differ from what's there, so an
+    unchanged rerun doesn't touch the file and trigger a Vite reload.
+    Returns True if the file was written.
+    """
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return False
+    except FileNotFoundError:
+        pass
+    with open(path, 'wb') as f:
+        f.write(data)
+    return True
+
+def write_split(projects, index_file=None, chunks_dir=None):
+    """
+    Write projects.index.js and one module per project.
+    Returns (index bytes, chunk bytes, files written).
+    """
+    index_file = index_file or INDEX_FILE
+    chunks_dir = chunks_dir or CHUNKS_DIR
+    os.makedirs(chunks_dir, exist_ok=True)
+    
+    index_js = generate_index_js(projects).encode('utf-8')
+    written = int(write_if_changed(index_file, index_js))
+    
+    chunk_bytes = 0
+    current = set()
+    for p in projects:
+        name = chunk_name(p)
+        current.add(name)
+        data = generate_chunk_js(p).encode('utf-8')
+        chunk_bytes += len(data)
+        written += write_if_changed(os.path.join(chunks_dir, name), data)
+    
+    # Remove chunks for projects that no longer exist
+    for name in os.listdir(chunks_dir):
+        if name.endswith('.js') and name not in current:
+            os.remove(os.path.join(chunks_dir, name))
+            written += 1
+    
+    return len(index_js), chunk_bytes, written
+
+def print_size_report(monolithic_bytes, index_bytes, chunk_bytes, count):
+    print(f"  projects.js (monolithic): {monolithic_bytes / 1024:.1f}KB")
+    print(f"  projects.index.js:        {index_bytes / 1024:.1f}KB "
+          f"({index_bytes / monolithic_bytes * 100:.0f}% of monolithic)")
+    print(f"  {count} project chunks:      {chunk_bytes / 1024:.1f}KB total, "
+          f"{chunk_bytes / max(count, 1) / 1024:.1f}KB average")
+
+def regenerate(incremental=True, fingerprint=True):
+    """Scan the client folders and rewrite whichever data files changed."""
+    projects = scan_projects(incremental=incremental)
+    if not projects:
+        return
+    if fingerprint:
+        fingerprint_projects(projects)
+    js_code = generate_js(projects, load_details()).encode('utf-8')
+    written = int(write_if_changed(OUTPUT_FILE, js_code))
+    index_bytes, chunk_bytes, chunks_written = write_split(projects)
+    written += chunks_written
+    if written:
+        print(f"Successfully updated {OUTPUT_FILE} with {len(projects)} projects ({written} files written).")
+    else:
+        print(f"{OUTPUT_FILE} is up to date ({len(projects)} projects) - nothing written.")
+    print_size_report(len(js_code), index_bytes, chunk_bytes, len(projects))
+
+def optimize_changed(paths):
+    """
+    Run dropped or edited images through the 'media' profile (the size cap
+    optimize_media.py applies). Files the manifest already knows (including
+    the optimizer's own output showing up as a new event) are skipped.
+    """
+    from media_engine import ProfileRun, get_profile, optimize_file
+    
+    images = ProfileRun(get_profile('media'), IMAGES_ROOT)
+    try:
+        paths = [path for path in sorted(paths)
+                 if os.path.splitext(path)[1].lower() in images.extensions]
+        for i, path in enumerate(paths, 1):
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                images.manifest.forget(path)
+                continue
+            job = images.job_for(path, st)
+            if job:
+                images.report(i, len(paths), job, optimize_file(*job))
+    finally:
+        images.close()
+
+def watch_projects(fingerprint=True):
+    """Optimize and regenerate whenever files land in public/images."""
+    from media_watch import watch
+    
+    def on_change(paths):
+        started = time.monotonic()
+        print(f"\n{len(paths)} file(s) changed")
+        optimize_changed(paths)
+        regenerate(fingerprint=fingerprint)
+        print(f"Done in {time.monotonic() - started:.2f}s")
+    
+    regenerate(fingerprint=fingerprint)
+    watch(IMAGES_ROOT, on_change)
 
 if __name__ == "__main__":
-    projects = scan_projects()
-    if projects:
-        js_code = generate_js(projects)
-        with open(OUTPUT_FILE, 'w') as f:
-            f.write(js_code)
-        print(f"Successfully updated {OUTPUT_FILE} with {len(projects)} projects.")
+    parser = argparse.ArgumentParser(description="Regenerate src/data from the client folders in public/images.")
+    parser.add_argument('--full', action='store_true', help='rescan every client folder, ignoring the scan cache')
+    parser.add_argument('--watch', action='store_true',
+                        help='keep running: optimize new or changed images and regenerate on every change')
+    parser.add_argument('--no-fingerprint', action='store_true',
+                        help='link assets by their plain /images/ URLs only, even in production builds')
+    args = parser.parse_args()
+    
+    if args.watch:
+        watch_projects(fingerprint=not args.no_fingerprint)
+    else:
+        regenerate(incremental=not args.full, fingerprint=not args.no_fingerprint)